@@ -28,6 +28,12 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
   # Indicate that we do not want to run this plugin during regular extraction.
   ENABLE_IN_EXTRACTION = False
 
+  # Indicate that the plugin can run in a shared analysis process.
+  ENABLE_IN_SHARED_PROCESS = True
+
+  # Indicate that the plugin can continue the analysis of a previous run.
+  ENABLE_INCREMENTAL_ANALYSIS = True
+
   # TODO: use groups to build a single RE.
 
   # Here we define filters and callback methods for all hits on each filter.
@@ -326,5 +332,20 @@ class BrowserSearchPlugin(interface.AnalysisPlugin):
       self._search_term_timeline.append(
           SEARCH_OBJECT(timestamp, source, engine, search_query))
 
+  def MergeAnalysisReport(self, analysis_report):
+    """Merges the report of a previous run into the state of the plugin.
+
+    Args:
+      analysis_report (AnalysisReport): report of a previous run.
+    """
+    results = analysis_report.report_dict or {}
+    for search_engine, terms in iter(results.items()):
+      for search_term, count in iter(terms.items()):
+        self._counter[u'{0:s}:{1:s}'.format(search_engine, search_term)] += (
+            count)
+
+    for search_object in analysis_report.report_array or []:
+      self._search_term_timeline.append(SEARCH_OBJECT(*search_object))
+
 
 manager.AnalysisPluginManager.RegisterPlugin(BrowserSearchPlugin)
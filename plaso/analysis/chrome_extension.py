@@ -19,6 +19,14 @@ class ChromeExtensionPlugin(interface.AnalysisPlugin):
   # Indicate that we can run this plugin during regular extraction.
   ENABLE_IN_EXTRACTION = True
 
+  # Indicate that the plugin can run in a shared analysis process.
+  ENABLE_IN_SHARED_PROCESS = True
+
+  EVENT_DATA_TYPES = frozenset([u'fs:stat'])
+
+  # Indicate that the plugin can continue the analysis of a previous run.
+  ENABLE_INCREMENTAL_ANALYSIS = True
+
   _TITLE_RE = re.compile(r'<title>([^<]+)</title>')
   _WEB_STORE_URL = u'https://chrome.google.com/webstore/detail/{xid}?hl=en-US'
 
@@ -206,5 +214,21 @@ class ChromeExtensionPlugin(interface.AnalysisPlugin):
     if (extension_string, extension_identifier) not in self._results[user]:
       self._results[user].append((extension_string, extension_identifier))
 
+  def MergeAnalysisReport(self, analysis_report):
+    """Merges the report of a previous run into the state of the plugin.
+
+    Args:
+      analysis_report (AnalysisReport): report of a previous run.
+    """
+    results = analysis_report.report_dict or {}
+    for user, extensions in iter(results.items()):
+      self._results.setdefault(user, [])
+      for extension, extension_identifier in extensions:
+        # Previously looked up extensions do not need to be looked up again.
+        self._extensions.setdefault(extension_identifier, extension)
+
+        if (extension, extension_identifier) not in self._results[user]:
+          self._results[user].append((extension, extension_identifier))
+
 
 manager.AnalysisPluginManager.RegisterPlugin(ChromeExtensionPlugin)
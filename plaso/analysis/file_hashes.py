@@ -14,6 +14,9 @@ class FileHashesPlugin(interface.AnalysisPlugin):
   # Indicate that we can run this plugin during regular extraction.
   ENABLE_IN_EXTRACTION = True
 
+  # Indicate that the plugin can run in a shared analysis process.
+  ENABLE_IN_SHARED_PROCESS = True
+
   def __init__(self):
     """Initializes the unique hashes plugin."""
     super(FileHashesPlugin, self).__init__()
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""The hash labels cache.
+
+The hash labels cache stores the labels a hash analysis plugin generated
+for a hash in a SQLite database file, so that the hash does not need to be
+looked up again by subsequent runs of the plugin, for the same or another
+storage file. A cached entry expires after a configurable time to live.
+
+The labels are stored per name of the analysis plugin, since different
+plugins generate different labels for the same hash.
+"""
+
+import json
+import time
+
+try:
+  from pysqlite2 import dbapi2 as sqlite3  # pylint: disable=wrong-import-order
+except ImportError:
+  import sqlite3  # pylint: disable=wrong-import-order
+
+
+class HashLabelsCache(object):
+  """Class that implements a SQLite backed hash labels cache.
+
+  The database file is opened on first use, which allows the cache to be
+  configured before the analysis plugin is passed to an analysis process.
+
+  Attributes:
+    number_of_hits (int): number of hashes that were found in the cache.
+    number_of_misses (int): number of hashes that were not found in the cache
+        or of which the entry expired.
+  """
+
+  # The default time to live of a cached entry in seconds, which is 30 days.
+  DEFAULT_TIME_TO_LIVE = 30 * 24 * 60 * 60
+
+  # The number of seconds to wait for a lock on the database file that is
+  # held by another process.
+  _LOCK_TIMEOUT = 30.0
+
+  # The maximum number of updates before they are committed.
+  _MAXIMUM_NUMBER_OF_PENDING_UPDATES = 128
+
+  _CREATE_TABLE_QUERY = (
+      u'CREATE TABLE IF NOT EXISTS hash_labels ('
+      u'plugin_name TEXT NOT NULL, hash TEXT NOT NULL, labels TEXT NOT NULL, '
+      u'timestamp INTEGER NOT NULL, PRIMARY KEY (plugin_name, hash))')
+
+  _DELETE_EXPIRED_QUERY = (
+      u'DELETE FROM hash_labels WHERE timestamp < ?')
+
+  _INSERT_QUERY = (
+      u'INSERT OR REPLACE INTO hash_labels (plugin_name, hash, labels, '
+      u'timestamp) VALUES (?, ?, ?, ?)')
+
+  _SELECT_QUERY = (
+      u'SELECT labels, timestamp FROM hash_labels '
+      u'WHERE plugin_name = ? AND hash = ?')
+
+  def __init__(self, path, time_to_live=DEFAULT_TIME_TO_LIVE):
+    """Initializes a hash labels cache.
+
+    Args:
+      path (str): path of the database file.
+      time_to_live (Optional[int]): number of seconds a cached entry is valid.
+    """
+    super(HashLabelsCache, self).__init__()
+    self._connection = None
+    self._number_of_pending_updates = 0
+    self._path = path
+    self._time_to_live = time_to_live
+    self.number_of_hits = 0
+    self.number_of_misses = 0
+
+  def __getstate__(self):
+    """Retrieves the state of the cache for pickling.
+
+    The database connection cannot be pickled and is opened again by
+    the process the cache is passed to.
+
+    Returns:
+      dict[str, object]: state of the cache.
+    """
+    state = dict(self.__dict__)
+    state[u'_connection'] = None
+    state[u'_number_of_pending_updates'] = 0
+    return state
+
+  @property
+  def path(self):
+    """str: path of the database file."""
+    return self._path
+
+  @property
+  def time_to_live(self):
+    """int: number of seconds a cached entry is valid."""
+    return self._time_to_live
+
+  def _GetConnection(self):
+    """Retrieves the database connection and opens the database if needed.
+
+    Returns:
+      sqlite3.Connection: database connection.
+
+    Raises:
+      IOError: if the database file cannot be opened.
+    """
+    if not self._connection:
+      try:
+        connection = sqlite3.connect(self._path, timeout=self._LOCK_TIMEOUT)
+        connection.execute(self._CREATE_TABLE_QUERY)
+        connection.commit()
+
+      except sqlite3.Error as exception:
+        raise IOError((
+            u'Unable to open hash labels cache: {0:s} with error: '
+            u'{1!s}').format(self._path, exception))
+
+      self._connection = connection
+
+    return self._connection
+
+  def Close(self):
+    """Closes the cache and commits pending updates."""
+    if not self._connection:
+      return
+
+    if self._number_of_pending_updates:
+      self._connection.commit()
+      self._number_of_pending_updates = 0
+
+    self._connection.close()
+    self._connection = None
+
+  def DeleteExpired(self):
+    """Deletes the expired entries from the cache.
+
+    Returns:
+      int: number of entries that were deleted.
+
+    Raises:
+      IOError: if the database file cannot be opened.
+    """
+    connection = self._GetConnection()
+    expiration_time = int(time.time()) - self._time_to_live
+    cursor = connection.execute(
+        self._DELETE_EXPIRED_QUERY, (expiration_time, ))
+    connection.commit()
+    self._number_of_pending_updates = 0
+    return cursor.rowcount
+
+  def GetLabels(self, plugin_name, hash_value):
+    """Retrieves the cached labels of a hash.
+
+    Args:
+      plugin_name (str): name of the analysis plugin that generated the labels.
+      hash_value (str): hash.
+
+    Returns:
+      list[str]: labels or None if the hash is not cached or its entry expired.
+
+    Raises:
+      IOError: if the database file cannot be opened.
+    """
+    connection = self._GetConnection()
+    cursor = connection.execute(
+        self._SELECT_QUERY, (plugin_name, hash_value.lower()))
+    row = cursor.fetchone()
+
+    if row:
+      labels, timestamp = row
+      if timestamp + self._time_to_live >= int(time.time()):
+        self.number_of_hits += 1
+        return json.loads(labels)
+
+    self.number_of_misses += 1
+    return
+
+  def SetLabels(self, plugin_name, hash_value, labels):
+    """Caches the labels of a hash.
+
+    Args:
+      plugin_name (str): name of the analysis plugin that generated the labels.
+      hash_value (str): hash.
+      labels (list[str]): labels.
+
+    Raises:
+      IOError: if the database file cannot be opened.
+    """
+    connection = self._GetConnection()
+    connection.execute(self._INSERT_QUERY, (
+        plugin_name, hash_value.lower(), json.dumps(list(labels)),
+        int(time.time())))
+
+    self._number_of_pending_updates += 1
+    if (self._number_of_pending_updates >=
+        self._MAXIMUM_NUMBER_OF_PENDING_UPDATES):
+      connection.commit()
+      self._number_of_pending_updates = 0
@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+"""The hash set file.
+
+A hash set file contains a set of digests, such as the MD5 or SHA-1 digests
+of the NSRL reference data set (RDS), in a format that can be memory mapped
+and looked up without having to read the entire file into memory.
+
+The hash set file consists of:
+* the file header;
+* the fan-out table, which contains 256 64-bit integers where every integer
+  is the number of digests with a first byte less than or equal to the index
+  of the integer;
+* the Bloom filter, which is optional;
+* the sorted digests, which are stored in binary form.
+
+All integers are stored in little-endian.
+"""
+
+import binascii
+import mmap
+import os
+import struct
+
+
+class HashSetFile(object):
+  """Class that implements a memory mapped hash set file.
+
+  Attributes:
+    bloom_filter_size (int): size of the Bloom filter in bytes, where 0
+        represents that the hash set file has no Bloom filter.
+    digest_size (int): size of a digest in bytes.
+    number_of_bloom_filter_hashes (int): number of bit indexes of a digest
+        in the Bloom filter.
+    number_of_digests (int): number of digests.
+  """
+
+  SIGNATURE = b'PLSHSET\x00'
+
+  FORMAT_VERSION = 1
+
+  # The file header contains: signature, format version, digest size,
+  # number of digests, Bloom filter size, number of Bloom filter hashes and
+  # 4 bytes of padding.
+  _FILE_HEADER = struct.Struct(u'<8sIIQQI4x')
+
+  _FAN_OUT_TABLE = struct.Struct(u'<256Q')
+
+  # The first 8 bytes of a digest as an integer, which preserves the sort
+  # order of the digests.
+  _PREFIX = struct.Struct(u'>Q')
+
+  _SUPPORTED_DIGEST_SIZES = frozenset([16, 20, 32])
+
+  def __init__(self):
+    """Initializes a hash set file."""
+    super(HashSetFile, self).__init__()
+    self._bloom_filter_offset = 0
+    self._digests_offset = 0
+    self._fan_out_table = None
+    self._file_object = None
+    self._mmap = None
+    self.bloom_filter_size = 0
+    self.digest_size = 0
+    self.number_of_bloom_filter_hashes = 0
+    self.number_of_digests = 0
+
+  def __enter__(self):
+    """Make this work with the 'with' statement."""
+    return self
+
+  def __exit__(self, unused_type, unused_value, unused_traceback):
+    """Make this work with the 'with' statement."""
+    self.Close()
+
+  @classmethod
+  def GetBloomFilterIndexes(
+      cls, digest, number_of_bits, number_of_bloom_filter_hashes):
+    """Retrieves the bit indexes of a digest in a Bloom filter.
+
+    Since the digests are uniformly distributed the bit indexes are derived
+    from the first 16 bytes of the digest by double hashing.
+
+    Args:
+      digest (bytes): digest.
+      number_of_bits (int): number of bits in the Bloom filter.
+      number_of_bloom_filter_hashes (int): number of bit indexes.
+
+    Returns:
+      list[int]: bit indexes.
+    """
+    first_hash, second_hash = struct.unpack(u'<QQ', digest[:16])
+    second_hash |= 1
+    return [
+        (first_hash + index * second_hash) % number_of_bits
+        for index in range(number_of_bloom_filter_hashes)]
+
+  def _ContainsDigest(self, digest):
+    """Determines if the hash set contains a digest.
+
+    Since the digests are uniformly distributed the position of the digest
+    is estimated by interpolation on the first 8 bytes of the digests, which
+    requires significantly less reads than a binary search.
+
+    Args:
+      digest (bytes): digest.
+
+    Returns:
+      bool: True if the hash set contains the digest.
+    """
+    if self.bloom_filter_size:
+      bloom_filter_offset = self._bloom_filter_offset
+      for bit_index in self.GetBloomFilterIndexes(
+          digest, self.bloom_filter_size * 8,
+          self.number_of_bloom_filter_hashes):
+        byte_value = self._mmap[bloom_filter_offset + (bit_index >> 3)]
+        if not ord(byte_value) & (1 << (bit_index & 7)):
+          return False
+
+    first_byte = ord(digest[0])
+    lower_index = 0
+    if first_byte:
+      lower_index = self._fan_out_table[first_byte - 1]
+    upper_index = self._fan_out_table[first_byte]
+
+    # The prefix of the digest is within the lower bound (inclusive) and upper
+    # bound (exclusive) prefix of the digests in the search range.
+    prefix = self._PREFIX.unpack(digest[:8])[0]
+    lower_prefix = first_byte << 56
+    upper_prefix = (first_byte + 1) << 56
+
+    digest_size = self.digest_size
+    digests_offset = self._digests_offset
+    while lower_index < upper_index:
+      middle_index = lower_index + (
+          (prefix - lower_prefix) * (upper_index - lower_index) //
+          (upper_prefix - lower_prefix))
+
+      data_offset = digests_offset + (middle_index * digest_size)
+      middle_digest = self._mmap[data_offset:data_offset + digest_size]
+
+      if middle_digest == digest:
+        return True
+
+      middle_prefix = self._PREFIX.unpack(middle_digest[:8])[0]
+      if middle_digest < digest:
+        lower_index = middle_index + 1
+        lower_prefix = middle_prefix
+      else:
+        upper_index = middle_index
+        upper_prefix = middle_prefix + 1
+
+    return False
+
+  def Close(self):
+    """Closes the hash set file."""
+    if self._mmap:
+      self._mmap.close()
+      self._mmap = None
+
+    if self._file_object:
+      self._file_object.close()
+      self._file_object = None
+
+    self._fan_out_table = None
+
+  def Contains(self, hash_value):
+    """Determines if the hash set contains a hash.
+
+    Args:
+      hash_value (str): hash, formatted as a hexadecimal string.
+
+    Returns:
+      bool: True if the hash set contains the hash.
+
+    Raises:
+      IOError: if the hash set file is not opened.
+    """
+    if not self._mmap:
+      raise IOError(u'Hash set file not opened.')
+
+    if len(hash_value) != self.digest_size * 2:
+      return False
+
+    try:
+      digest = binascii.unhexlify(hash_value)
+    except (TypeError, ValueError):
+      return False
+
+    return self._ContainsDigest(digest)
+
+  def Open(self, path):
+    """Opens the hash set file.
+
+    Args:
+      path (str): path of the hash set file.
+
+    Raises:
+      IOError: if the hash set file cannot be opened or is not supported.
+    """
+    if self._mmap:
+      raise IOError(u'Hash set file already opened.')
+
+    file_object = open(path, u'rb')
+
+    try:
+      file_size = os.fstat(file_object.fileno()).st_size
+      header_size = self._FILE_HEADER.size + self._FAN_OUT_TABLE.size
+      if file_size < header_size:
+        raise IOError(u'Hash set file: {0:s} too small.'.format(path))
+
+      (signature, format_version, digest_size, number_of_digests,
+       bloom_filter_size, number_of_bloom_filter_hashes) = (
+           self._FILE_HEADER.unpack(file_object.read(self._FILE_HEADER.size)))
+
+      if signature != self.SIGNATURE:
+        raise IOError(u'Unsupported hash set file: {0:s} signature.'.format(
+            path))
+
+      if format_version != self.FORMAT_VERSION:
+        raise IOError(
+            u'Unsupported hash set file: {0:s} format version: {1:d}.'.format(
+                path, format_version))
+
+      if digest_size not in self._SUPPORTED_DIGEST_SIZES:
+        raise IOError(
+            u'Unsupported hash set file: {0:s} digest size: {1:d}.'.format(
+                path, digest_size))
+
+      expected_file_size = (
+          header_size + bloom_filter_size + (number_of_digests * digest_size))
+      if file_size < expected_file_size:
+        raise IOError(u'Hash set file: {0:s} is truncated.'.format(path))
+
+      fan_out_table = self._FAN_OUT_TABLE.unpack(
+          file_object.read(self._FAN_OUT_TABLE.size))
+      if fan_out_table[-1] != number_of_digests:
+        raise IOError(
+            u'Hash set file: {0:s} has an invalid fan-out table.'.format(path))
+
+      self._mmap = mmap.mmap(
+          file_object.fileno(), 0, access=mmap.ACCESS_READ)
+
+    except (IOError, struct.error, mmap.error) as exception:
+      file_object.close()
+      raise IOError((
+          u'Unable to open hash set file: {0:s} with error: {1!s}').format(
+              path, exception))
+
+    self._bloom_filter_offset = header_size
+    self._digests_offset = header_size + bloom_filter_size
+    self._fan_out_table = fan_out_table
+    self._file_object = file_object
+    self.bloom_filter_size = bloom_filter_size
+    self.digest_size = digest_size
+    self.number_of_bloom_filter_hashes = number_of_bloom_filter_hashes
+    self.number_of_digests = number_of_digests
+
+
+class HashSetFileWriter(object):
+  """Class that implements a hash set file writer.
+
+  The digests are kept in memory in binary form, grouped by their first byte,
+  and are sorted and deduplicated when the hash set file is written.
+  """
+
+  # The default number of Bloom filter hashes for 10 bits per digest, which
+  # results in a false positive rate of about 1 percent.
+  _DEFAULT_NUMBER_OF_BLOOM_FILTER_HASHES = 7
+
+  def __init__(self, digest_size, bloom_filter_bits_per_digest=0):
+    """Initializes a hash set file writer.
+
+    Args:
+      digest_size (int): size of a digest in bytes, such as 16 for MD5 and
+          20 for SHA-1.
+      bloom_filter_bits_per_digest (Optional[int]): number of bits of the Bloom
+          filter per digest, where 0 represents no Bloom filter.
+
+    Raises:
+      ValueError: if the digest size is not supported.
+    """
+    # pylint: disable=protected-access
+    if digest_size not in HashSetFile._SUPPORTED_DIGEST_SIZES:
+      raise ValueError(u'Unsupported digest size: {0:d}.'.format(digest_size))
+
+    super(HashSetFileWriter, self).__init__()
+    self._bloom_filter_bits_per_digest = bloom_filter_bits_per_digest
+    self._buckets = [bytearray() for _ in range(256)]
+    self._digest_size = digest_size
+
+  def _GetSortedDigests(self, bucket):
+    """Retrieves the sorted and deduplicated digests of a bucket.
+
+    Args:
+      bucket (bytearray): digests of the bucket.
+
+    Returns:
+      list[bytes]: sorted digests.
+    """
+    digest_size = self._digest_size
+    digests = set(
+        bytes(bucket[data_offset:data_offset + digest_size])
+        for data_offset in range(0, len(bucket), digest_size))
+    return sorted(digests)
+
+  def AddHash(self, hash_value):
+    """Adds a hash.
+
+    Args:
+      hash_value (str): hash, formatted as a hexadecimal string.
+
+    Returns:
+      bool: True if the hash was added, False if the hash is not valid.
+    """
+    if len(hash_value) != self._digest_size * 2:
+      return False
+
+    try:
+      digest = binascii.unhexlify(hash_value)
+    except (TypeError, ValueError):
+      return False
+
+    self._buckets[ord(digest[0])].extend(digest)
+    return True
+
+  def Write(self, path):
+    """Writes the hash set file.
+
+    Args:
+      path (str): path of the hash set file.
+
+    Returns:
+      int: number of digests written.
+    """
+    fan_out_table = []
+    sorted_buckets = []
+    number_of_digests = 0
+    for bucket_index, bucket in enumerate(self._buckets):
+      sorted_digests = self._GetSortedDigests(bucket)
+      self._buckets[bucket_index] = bytearray()
+
+      number_of_digests += len(sorted_digests)
+      fan_out_table.append(number_of_digests)
+      sorted_buckets.append(sorted_digests)
+
+    bloom_filter = bytearray()
+    number_of_bloom_filter_hashes = 0
+    if self._bloom_filter_bits_per_digest and number_of_digests:
+      bloom_filter_size = (
+          (number_of_digests * self._bloom_filter_bits_per_digest) + 7) // 8
+      bloom_filter = bytearray(bloom_filter_size)
+      number_of_bloom_filter_hashes = (
+          self._DEFAULT_NUMBER_OF_BLOOM_FILTER_HASHES)
+
+      for sorted_digests in sorted_buckets:
+        for digest in sorted_digests:
+          for bit_index in HashSetFile.GetBloomFilterIndexes(
+              digest, bloom_filter_size * 8, number_of_bloom_filter_hashes):
+            bloom_filter[bit_index >> 3] |= 1 << (bit_index & 7)
+
+    # pylint: disable=protected-access
+    file_header = HashSetFile._FILE_HEADER.pack(
+        HashSetFile.SIGNATURE, HashSetFile.FORMAT_VERSION, self._digest_size,
+        number_of_digests, len(bloom_filter), number_of_bloom_filter_hashes)
+
+    with open(path, u'wb') as file_object:
+      file_object.write(file_header)
+      file_object.write(HashSetFile._FAN_OUT_TABLE.pack(*fan_out_table))
+      file_object.write(bytes(bloom_filter))
+      for sorted_digests in sorted_buckets:
+        file_object.write(b''.join(sorted_digests))
+
+    return number_of_digests
@@ -2,6 +2,7 @@
 """This file contains the interface for analysis plugins."""
 
 import abc
+import array
 from collections import defaultdict
 import logging
 import Queue
@@ -47,6 +48,23 @@ class AnalysisPlugin(object):
   # should be able to run during the extraction phase.
   ENABLE_IN_EXTRACTION = False
 
+  # A flag indicating whether or not this plugin is lightweight enough to run
+  # in the same analysis process as other plugins, where the events are read
+  # and deserialized once for all the plugins in the process.
+  ENABLE_IN_SHARED_PROCESS = False
+
+  # The data types of the events the plugin examines, where an empty set
+  # represents that the plugin examines every event. The data types are used
+  # to only pass events to the plugins that examine them, when plugins run
+  # in a shared analysis process.
+  EVENT_DATA_TYPES = frozenset()
+
+  # A flag indicating whether or not this plugin can continue the analysis
+  # of a previous run. Such a plugin restores its state from the report of
+  # the previous run in MergeAnalysisReport and is only passed the events
+  # that were added to the storage since the previous run.
+  ENABLE_INCREMENTAL_ANALYSIS = False
+
   def __init__(self):
     """Initializes an analysis plugin."""
     super(AnalysisPlugin, self).__init__()
@@ -83,6 +101,102 @@ class AnalysisPlugin(object):
       event (EventObject): event.
     """
 
+  def MergeAnalysisReport(self, analysis_report):
+    """Merges the report of a previous run into the state of the plugin.
+
+    Args:
+      analysis_report (AnalysisReport): report of a previous run.
+
+    Raises:
+      NotImplementedError: if the plugin does not support incremental
+          analysis.
+    """
+    raise NotImplementedError()
+
+
+class _EventIdentifiersByPathSpec(object):
+  """Class that compactly tracks the identifiers of events per path spec.
+
+  Equal path specifications are interned and referred to by an integer index,
+  which prevents every event from keeping its own copy of the path
+  specification alive. Events read from a storage file are identified by
+  their store number and store index, which are stored as integers in an
+  array per path specification. Only events without a store number and
+  store index are identified by their UUID.
+  """
+
+  def __init__(self):
+    """Initializes the event identifiers by path specification."""
+    super(_EventIdentifiersByPathSpec, self).__init__()
+    self._event_uuids = []
+    self._path_spec_indexes = {}
+    self._path_specs = []
+    self._store_identifiers = []
+    self.number_of_events = 0
+
+  def AddEvent(self, event):
+    """Adds the identifier of an event.
+
+    Args:
+      event (EventObject): event.
+
+    Returns:
+      int: index of the path specification of the event.
+    """
+    path_spec = event.pathspec
+    path_spec_index = self._path_spec_indexes.get(path_spec, None)
+    if path_spec_index is None:
+      path_spec_index = len(self._path_specs)
+      self._path_spec_indexes[path_spec] = path_spec_index
+      self._path_specs.append(path_spec)
+      self._event_uuids.append(None)
+      self._store_identifiers.append(array.array(b'L'))
+
+    store_number = getattr(event, u'store_number', None)
+    store_index = getattr(event, u'store_index', None)
+    if store_number is not None and store_index is not None:
+      store_identifiers = self._store_identifiers[path_spec_index]
+      store_identifiers.append(store_number)
+      store_identifiers.append(store_index)
+
+    else:
+      event_uuids = self._event_uuids[path_spec_index]
+      if event_uuids is None:
+        event_uuids = []
+        self._event_uuids[path_spec_index] = event_uuids
+      event_uuids.append(event.uuid)
+
+    self.number_of_events += 1
+    return path_spec_index
+
+  def GetEventIdentifiers(self, path_spec_index):
+    """Retrieves the identifiers of the events of a path specification.
+
+    Args:
+      path_spec_index (int): index of the path specification.
+
+    Yields:
+      tuple[int, int, str]: store number, store index and UUID of an event,
+          where either the store number and index or the UUID are None.
+    """
+    store_identifiers = self._store_identifiers[path_spec_index]
+    for index in range(0, len(store_identifiers), 2):
+      yield store_identifiers[index], store_identifiers[index + 1], None
+
+    for event_uuid in self._event_uuids[path_spec_index] or []:
+      yield None, None, event_uuid
+
+  def GetPathSpec(self, path_spec_index):
+    """Retrieves a path specification.
+
+    Args:
+      path_spec_index (int): index of the path specification.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+    """
+    return self._path_specs[path_spec_index]
+
 
 class HashTaggingAnalysisPlugin(AnalysisPlugin):
   """An interface for plugins that tag events based on the source file hash.
@@ -110,6 +224,10 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
   DEFAULT_QUEUE_TIMEOUT = 4
   SECONDS_BETWEEN_STATUS_LOG_MESSAGES = 30
 
+  # Labels that indicate the analysis of a hash is not final, such as pending
+  # analysis results, and that should not be stored in the hash labels cache.
+  _UNCACHEABLE_LABELS = frozenset()
+
   def __init__(self, analyzer_class):
     """Initializes a hash tagging analysis plugin.
 
@@ -120,8 +238,10 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     super(HashTaggingAnalysisPlugin, self).__init__()
     self._analysis_queue_timeout = self.DEFAULT_QUEUE_TIMEOUT
     self._analyzer_started = False
-    self._event_uuids_by_pathspec = defaultdict(list)
-    self._hash_pathspecs = defaultdict(list)
+    self._cached_hash_labels = {}
+    self._event_identifiers = _EventIdentifiersByPathSpec()
+    self._hash_cache = None
+    self._hash_path_spec_indexes = defaultdict(set)
     self._requester_class = None
     self._time_of_last_status_log = time.time()
     self.hash_analysis_queue = Queue.Queue()
@@ -146,12 +266,18 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     display_name = mediator.GetDisplayName(pathspec)
     return u'{0:s}: {1:s}'.format(display_name, u', '.join(labels))
 
-  def _CreateTag(self, event_uuid, labels):
+  def _CreateTag(
+      self, event_uuid, labels, store_number=None, store_index=None):
     """Creates an event tag.
 
     Args:
-      event_uuid (uuid.UUID): identifier of the event that should be tagged.
+      event_uuid (uuid.UUID): identifier of the event that should be tagged
+          or None if the event is identified by its store number and index.
       labels (list[str]): labels for the gag.
+      store_number (Optional[int]): store number of the event that should be
+          tagged.
+      store_index (Optional[int]): store index of the event that should be
+          tagged.
 
     Returns:
       EventTag: event tag.
@@ -159,14 +285,44 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     event_tag = events.EventTag(
         comment=u'Tag applied by {0:s} analysis plugin'.format(self.NAME),
         event_uuid=event_uuid)
+    event_tag.store_number = store_number
+    event_tag.store_index = store_index
     event_tag.AddLabels(labels)
     return event_tag
 
+  def _CreateTagsForHash(self, subject_hash, labels):
+    """Creates event tags for all events derived from files with a hash.
+
+    Args:
+      subject_hash (str): hash that was looked up.
+      labels (list[str]): labels that correspond to the hash.
+
+    Returns:
+      tuple: containing:
+
+        list[dfvfs.PathSpec]: pathspecs that had the hash value looked up.
+        list[EventTag]: event tags for all events that were extracted from the
+            path specifications.
+    """
+    tags = []
+    pathspecs = []
+    for path_spec_index in sorted(self._hash_path_spec_indexes[subject_hash]):
+      pathspecs.append(self._event_identifiers.GetPathSpec(path_spec_index))
+
+      for store_number, store_index, event_uuid in (
+          self._event_identifiers.GetEventIdentifiers(path_spec_index)):
+        tag = self._CreateTag(
+            event_uuid, labels, store_number=store_number,
+            store_index=store_index)
+        tags.append(tag)
+    return pathspecs, tags
+
   def _HandleHashAnalysis(self, hash_analysis):
     """Deals with a the results of the analysis of a hash.
 
     This method ensures that labels are generated for the hash,
-    then tags all events derived from files with that hash.
+    then tags all events derived from files with that hash. The labels
+    are stored in the hash labels cache, if set.
 
     Args:
       hash_analysis (HashAnalysis): hash analysis plugin's results for a given
@@ -180,13 +336,13 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
         list[EventTag]: event tags for all events that were extracted from the
             path specifications.
     """
-    tags = []
     labels = self.GenerateLabels(hash_analysis.hash_information)
-    pathspecs = self._hash_pathspecs[hash_analysis.subject_hash]
-    for pathspec in pathspecs:
-      for event_uuid in self._event_uuids_by_pathspec[pathspec]:
-        tag = self._CreateTag(event_uuid, labels)
-        tags.append(tag)
+    if self._hash_cache and self._UNCACHEABLE_LABELS.isdisjoint(labels):
+      self._hash_cache.SetLabels(
+          self.NAME, hash_analysis.subject_hash, labels)
+
+    pathspecs, tags = self._CreateTagsForHash(
+        hash_analysis.subject_hash, labels)
     return pathspecs, labels, tags
 
   def _EnsureRequesterStarted(self):
@@ -204,26 +360,43 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
       event (EventObject): event.
     """
     self._EnsureRequesterStarted()
-    pathspec = event.pathspec
-    event_uuids = self._event_uuids_by_pathspec[pathspec]
-    event_uuids.append(event.uuid)
-    if event.data_type in self.DATA_TYPES:
-      for attribute in self.REQUIRED_HASH_ATTRIBUTES:
-        hash_for_lookup = getattr(event, attribute, None)
-        if not hash_for_lookup:
-          continue
-        pathspecs = self._hash_pathspecs[hash_for_lookup]
-        pathspecs.append(pathspec)
-        # There may be multiple pathspecs that have the same hash. We only
-        # want to look them up once.
-        if len(pathspecs) == 1:
-          self.hash_queue.put(hash_for_lookup)
-        return
-      warning_message = (
-          u'Event with ID {0:s} had none of the required attributes '
-          u'{1:s}.').format(
-              event.uuid, self.REQUIRED_HASH_ATTRIBUTES)
-      logging.warning(warning_message)
+
+    # The hash attributes are added to every event extracted from a file,
+    # hence events without hash attributes cannot be tagged and are not
+    # tracked.
+    hashes = [
+        getattr(event, attribute, None)
+        for attribute in self.REQUIRED_HASH_ATTRIBUTES]
+    if not any(hashes):
+      if event.data_type in self.DATA_TYPES:
+        warning_message = (
+            u'Event with ID {0:s} had none of the required attributes '
+            u'{1!s}.').format(event.uuid, self.REQUIRED_HASH_ATTRIBUTES)
+        logging.warning(warning_message)
+      return
+
+    path_spec_index = self._event_identifiers.AddEvent(event)
+    if event.data_type not in self.DATA_TYPES:
+      return
+
+    hash_for_lookup = [hash_value for hash_value in hashes if hash_value][0]
+    path_spec_indexes = self._hash_path_spec_indexes[hash_for_lookup]
+
+    # There may be multiple pathspecs that have the same hash. We only
+    # want to look them up once.
+    is_new_hash = not path_spec_indexes
+    path_spec_indexes.add(path_spec_index)
+    if not is_new_hash:
+      return
+
+    labels = None
+    if self._hash_cache:
+      labels = self._hash_cache.GetLabels(self.NAME, hash_for_lookup)
+
+    if labels is None:
+      self.hash_queue.put(hash_for_lookup)
+    else:
+      self._cached_hash_labels[hash_for_lookup] = labels
 
   def _ContinueReportCompilation(self):
     """Determines if the plugin should continue trying to compile the report.
@@ -265,6 +438,14 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     """
     tags = []
     lines_of_text = [u'{0:s} hash tagging Results'.format(self.NAME)]
+
+    for subject_hash, labels in sorted(self._cached_hash_labels.items()):
+      pathspecs, new_tags = self._CreateTagsForHash(subject_hash, labels)
+      tags.extend(new_tags)
+      for pathspec in pathspecs:
+        text_line = self._GenerateTextLine(mediator, pathspec, labels)
+        lines_of_text.append(text_line)
+
     while self._ContinueReportCompilation():
       try:
         self._LogProgressUpdateIfReasonable()
@@ -283,6 +464,12 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
 
     self._analyzer.SignalAbort()
 
+    if self._hash_cache:
+      lines_of_text.append(
+          u'{0:d} hashes were found in the hash labels cache.'.format(
+              len(self._cached_hash_labels)))
+      self._hash_cache.Close()
+
     lines_of_text.append(u'')
     report_text = u'\n'.join(lines_of_text)
     analysis_report = reports.AnalysisReport(
@@ -309,6 +496,18 @@ class HashTaggingAnalysisPlugin(AnalysisPlugin):
     estimated_seconds_per_batch = average_analysis_time + wait_time_per_batch
     return batches_remaining * estimated_seconds_per_batch
 
+  def SetHashCache(self, hash_cache):
+    """Sets the hash labels cache.
+
+    The cache is consulted before a hash is queued for analysis and the labels
+    of analyzed hashes are stored in the cache.
+
+    Args:
+      hash_cache (HashLabelsCache): hash labels cache or None to not use
+          a cache.
+    """
+    self._hash_cache = hash_cache
+
   @abc.abstractmethod
   def GenerateLabels(self, hash_information):
     """Generates a list of strings to tag events with.
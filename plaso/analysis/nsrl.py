@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Analysis plugin to look up files in a local NSRL hash set and tag events."""
+
+import logging
+
+from plaso.analysis import hash_set
+from plaso.analysis import interface
+from plaso.analysis import manager
+
+
+class NSRLAnalyzer(interface.HashAnalyzer):
+  """Class that analyzes file hashes by consulting a local NSRL hash set.
+
+  Attributes:
+    analyses_performed (int): number of analysis batches completed by this
+        analyzer.
+    hashes_per_batch (int): maximum number of hashes to analyze at once.
+    seconds_spent_analyzing (int): number of seconds this analyzer has spent
+        performing analysis (as opposed to waiting on queues, etc.)
+    wait_after_analysis (int): number of seconds the analyzer will sleep for
+        after analyzing a batch of hashes.
+  """
+
+  # The hash set file is consulted locally, hence there is no need to wait
+  # long for new hashes to be added to the input queue.
+  EMPTY_QUEUE_WAIT_TIME = 1
+
+  def __init__(self, hash_queue, hash_analysis_queue, **kwargs):
+    """Initializes a NSRL analyzer thread.
+
+    Args:
+      hash_queue (Queue.queue): contains hashes to be analyzed.
+      hash_analysis_queue (Queue.queue): that the analyzer will append
+          HashAnalysis objects this queue.
+    """
+    super(NSRLAnalyzer, self).__init__(
+        hash_queue, hash_analysis_queue, **kwargs)
+    self._hash_set_file = None
+    self._hash_set_path = None
+    self.hashes_per_batch = 10000
+
+  def Analyze(self, hashes):
+    """Looks up hashes in the NSRL hash set file.
+
+    Args:
+      hashes (list[str]): hash values to look up.
+
+    Returns:
+      list[HashAnalysis]: analysis results, or an empty list on error.
+    """
+    # The hash set file is opened by the analyzer thread, since the plugin
+    # can be created in a different process than the one that runs it.
+    if not self._hash_set_file:
+      hash_set_file = hash_set.HashSetFile()
+      try:
+        hash_set_file.Open(self._hash_set_path)
+      except IOError as exception:
+        logging.error((
+            u'Unable to open NSRL hash set file with error: {0!s}. NSRL '
+            u'plugin is aborting.').format(exception))
+        self.SignalAbort()
+        return []
+
+      self._hash_set_file = hash_set_file
+
+    return [
+        interface.HashAnalysis(digest, self._hash_set_file.Contains(digest))
+        for digest in hashes]
+
+  def SetHashSetPath(self, path):
+    """Sets the path of the NSRL hash set file.
+
+    Args:
+      path (str): path of the hash set file.
+    """
+    self._hash_set_path = path
+
+  # This method is part of the threading.Thread interface, hence its name does
+  # not follow the style guide.
+  def run(self):
+    """The method called by the threading library to start the thread."""
+    try:
+      super(NSRLAnalyzer, self).run()
+    finally:
+      if self._hash_set_file:
+        self._hash_set_file.Close()
+        self._hash_set_file = None
+
+
+class NSRLAnalysisPlugin(interface.HashTaggingAnalysisPlugin):
+  """An analysis plugin for looking up hashes in a local NSRL hash set."""
+
+  # The hash attribute per digest size of the hash set file.
+  _HASH_ATTRIBUTE_NAMES = {
+      16: u'md5_hash',
+      20: u'sha1_hash',
+      32: u'sha256_hash'}
+
+  # The NSRL RDS contains MD5 and SHA-1 hashes. The hash attribute that is
+  # looked up is determined by the digest size of the hash set file.
+  REQUIRED_HASH_ATTRIBUTES = [u'sha1_hash', u'md5_hash']
+
+  # The NSRL contains files of all different types and the hash set file
+  # is consulted locally, so look up all files.
+  DATA_TYPES = [u'fs:stat', u'fs:stat:ntfs']
+
+  URLS = [u'http://www.nsrl.nist.gov']
+
+  NAME = u'nsrl'
+
+  def __init__(self):
+    """Initializes a NSRL analysis plugin."""
+    super(NSRLAnalysisPlugin, self).__init__(NSRLAnalyzer)
+
+  def GenerateLabels(self, hash_information):
+    """Generates a list of strings that will be used in the event tag.
+
+    Args:
+      hash_information (bool): whether the hash was present in the NSRL
+          hash set file.
+
+    Returns:
+      list[str]: strings describing the results from the NSRL hash set.
+    """
+    if hash_information:
+      return [u'nsrl_present']
+    return [u'nsrl_not_present']
+
+  def SetHashSetPath(self, path):
+    """Sets the path of the NSRL hash set file.
+
+    Args:
+      path (str): path of the hash set file.
+
+    Raises:
+      IOError: if the hash set file cannot be opened or is not supported.
+    """
+    with hash_set.HashSetFile() as hash_set_file:
+      hash_set_file.Open(path)
+      digest_size = hash_set_file.digest_size
+
+    self.REQUIRED_HASH_ATTRIBUTES = [self._HASH_ATTRIBUTE_NAMES[digest_size]]
+    self._analyzer.SetHashSetPath(path)
+
+
+manager.AnalysisPluginManager.RegisterPlugin(NSRLAnalysisPlugin)
@@ -4,6 +4,7 @@
 import logging
 import re
 import os
+import time
 
 from efilter import ast as efilter_ast
 from efilter import api as efilter_api
@@ -19,6 +20,201 @@ from plaso.analysis import interface
 from plaso.analysis import manager
 from plaso.containers import events
 from plaso.containers import reports
+from plaso.lib import py2to3
+
+
+class _TaggingRule(object):
+  """Class that defines a tagging rule.
+
+  Attributes:
+    evaluation_time (float): number of seconds spent evaluating the rule.
+    label (str): name of the label the rule applies.
+    number_of_evaluations (int): number of times the rule was evaluated.
+    number_of_matches (int): number of times the rule matched.
+    query (efilter.query.Query): efilter query of the rule.
+    rule_index (int): index of the rule in the tag file.
+  """
+
+  def __init__(self, label, query, rule_index):
+    """Initializes a tagging rule.
+
+    Args:
+      label (str): name of the label the rule applies.
+      query (efilter.query.Query): efilter query of the rule.
+      rule_index (int): index of the rule in the tag file.
+    """
+    super(_TaggingRule, self).__init__()
+    self.evaluation_time = 0.0
+    self.label = label
+    self.number_of_evaluations = 0
+    self.number_of_matches = 0
+    self.query = query
+    self.rule_index = rule_index
+
+  def Matches(self, event):
+    """Determines if an event matches the rule.
+
+    Args:
+      event (EventObject): event.
+
+    Returns:
+      bool: True if the event matches the rule.
+    """
+    start_time = time.time()
+
+    try:
+      result = bool(efilter_api.apply(self.query, vars=event))
+    except efilter_errors.EfilterTypeError as exception:
+      logging.warning(
+          u'Unable to apply efilter query with error: {0:s}'.format(
+              exception))
+      result = False
+
+    self.evaluation_time += time.time() - start_time
+    self.number_of_evaluations += 1
+    if result:
+      self.number_of_matches += 1
+
+    return result
+
+
+class _TaggingRulesIndex(object):
+  """Class that indexes tagging rules.
+
+  Most tagging rules only match events of specific data types or parsers,
+  such as "data_type is 'windows:prefetch'". The rules are indexed by
+  the values of the data type or parser attribute they require, so that
+  only the rules that can match an event are evaluated. Rules that do not
+  require specific values are evaluated for every event.
+  """
+
+  _INDEXED_ATTRIBUTE_NAMES = (u'data_type', u'parser')
+
+  def __init__(self):
+    """Initializes a tagging rules index."""
+    super(_TaggingRulesIndex, self).__init__()
+    self._indexes = {
+        attribute_name: {} for attribute_name in self._INDEXED_ATTRIBUTE_NAMES}
+    self._labels = []
+    self._rules = []
+    self._unindexed_rules = []
+
+  @property
+  def labels(self):
+    """list[str]: names of the labels in order of definition."""
+    return self._labels
+
+  @property
+  def number_of_indexed_rules(self):
+    """int: number of rules that are indexed."""
+    return len(self._rules) - len(self._unindexed_rules)
+
+  @property
+  def rules(self):
+    """list[_TaggingRule]: rules in order of definition."""
+    return self._rules
+
+  def _GetRequiredValues(self, expression):
+    """Retrieves the attribute values an expression requires to match.
+
+    Args:
+      expression (efilter.ast.Expression): efilter expression.
+
+    Returns:
+      dict[str, frozenset[str]]: values of which the attribute must equal
+          one to match, per attribute name.
+    """
+    if isinstance(expression, efilter_ast.Intersection):
+      required_values = {}
+      for child_expression in expression.children:
+        for attribute_name, values in iter(
+            self._GetRequiredValues(child_expression).items()):
+          required_values.setdefault(attribute_name, values)
+
+      return required_values
+
+    if isinstance(expression, efilter_ast.Union):
+      required_values = None
+      for child_expression in expression.children:
+        child_required_values = self._GetRequiredValues(child_expression)
+        if required_values is None:
+          required_values = child_required_values
+          continue
+
+        required_values = {
+            attribute_name: values | child_required_values[attribute_name]
+            for attribute_name, values in iter(required_values.items())
+            if attribute_name in child_required_values}
+
+        if not required_values:
+          break
+
+      return required_values or {}
+
+    if (isinstance(expression, efilter_ast.Equivalence) and
+        len(expression.children) == 2):
+      variable, literal = expression.children
+      if isinstance(variable, efilter_ast.Literal):
+        literal, variable = variable, literal
+
+      if (isinstance(variable, efilter_ast.Var) and
+          isinstance(literal, efilter_ast.Literal) and
+          variable.value in self._INDEXED_ATTRIBUTE_NAMES and
+          isinstance(literal.value, py2to3.STRING_TYPES)):
+        return {variable.value: frozenset([literal.value])}
+
+    return {}
+
+  def AddRule(self, label, query):
+    """Adds a rule.
+
+    Args:
+      label (str): name of the label the rule applies.
+      query (efilter.query.Query): efilter query of the rule.
+    """
+    rule = _TaggingRule(label, query, len(self._rules))
+    self._rules.append(rule)
+
+    if label not in self._labels:
+      self._labels.append(label)
+
+    required_values = self._GetRequiredValues(query.root)
+    for attribute_name in self._INDEXED_ATTRIBUTE_NAMES:
+      values = required_values.get(attribute_name, None)
+      if values is None:
+        continue
+
+      index = self._indexes[attribute_name]
+      for value in values:
+        index.setdefault(value, []).append(rule)
+      return
+
+    self._unindexed_rules.append(rule)
+
+  def GetCandidateRules(self, event):
+    """Retrieves the rules that can match an event.
+
+    Args:
+      event (EventObject): event.
+
+    Returns:
+      list[_TaggingRule]: rules that can match the event in order of
+          definition.
+    """
+    candidate_rules = list(self._unindexed_rules)
+    for attribute_name in self._INDEXED_ATTRIBUTE_NAMES:
+      value = getattr(event, attribute_name, None)
+      if not isinstance(value, py2to3.STRING_TYPES):
+        continue
+
+      rules = self._indexes[attribute_name].get(value, None)
+      if rules:
+        candidate_rules.extend(rules)
+
+    if len(candidate_rules) > 1:
+      candidate_rules.sort(key=lambda rule: rule.rule_index)
+
+    return candidate_rules
 
 
 class TaggingPlugin(interface.AnalysisPlugin):
@@ -44,7 +240,7 @@ class TaggingPlugin(interface.AnalysisPlugin):
     """Initializes the tagging analysis plugin."""
     super(TaggingPlugin, self).__init__()
     self._autodetect_tag_file_attempt = False
-    self._tag_rules = None
+    self._tagging_rules = None
     self._tagging_file_name = None
     self._tags = []
 
@@ -143,27 +339,19 @@ class TaggingPlugin(interface.AnalysisPlugin):
       tag_file_path (str): path to the tag file.
 
     Returns:
-      efilter.ast.Expression: efilter abstract syntax tree (AST), containing the
-          tagging rules.
+      _TaggingRulesIndex: tagging rules index, containing the tagging rules.
     """
-    tags = []
+    tagging_rules = _TaggingRulesIndex()
     for label_name, rules in self._ParseDefinitions(tag_file_path):
       if not rules:
         logging.warning(u'All rules for label "{0:s}" are invalid.'.format(
             label_name))
         continue
 
-      tag = efilter_ast.IfElse(
-          # Union will be true if any of the 'rules' match.
-          efilter_ast.Union(*[rule.root for rule in rules]),
-          # If so then evaluate to a string with the name of the tag.
-          efilter_ast.Literal(label_name),
-          # Otherwise don't return anything.
-          efilter_ast.Literal(None))
-      tags.append(tag)
+      for rule in rules:
+        tagging_rules.AddRule(label_name, rule)
 
-    # Generate a repeated value with all the tags (None will be skipped).
-    return efilter_ast.Repeat(*tags)
+    return tagging_rules
 
   def CompileReport(self, mediator):
     """Compiles an analysis report.
@@ -175,8 +363,24 @@ class TaggingPlugin(interface.AnalysisPlugin):
     Returns:
       AnalysisReport: analysis report.
     """
-    report_text = u'Tagging plugin produced {0:d} tags.\n'.format(
-        len(self._tags))
+    lines_of_text = [u'Tagging plugin produced {0:d} tags.'.format(
+        len(self._tags))]
+
+    if self._tagging_rules:
+      lines_of_text.extend([
+          u'',
+          u'Tag file contains {0:d} rules of which {1:d} are indexed.'.format(
+              len(self._tagging_rules.rules),
+              self._tagging_rules.number_of_indexed_rules),
+          u'Label\tEvaluations\tMatches\tTime (s)\tRule'])
+
+      for rule in self._tagging_rules.rules:
+        lines_of_text.append(u'{0:s}\t{1:d}\t{2:d}\t{3:.3f}\t{4:s}'.format(
+            rule.label, rule.number_of_evaluations, rule.number_of_matches,
+            rule.evaluation_time, rule.query.source))
+
+    lines_of_text.append(u'')
+    report_text = u'\n'.join(lines_of_text)
     analysis_report = reports.AnalysisReport(
         plugin_name=self.NAME, text=report_text)
     analysis_report.SetTags(self._tags)
@@ -190,7 +394,7 @@ class TaggingPlugin(interface.AnalysisPlugin):
           plugins and other components, such as storage and dfvfs.
       event (EventObject): event to examine.
     """
-    if self._tag_rules is None:
+    if self._tagging_rules is None:
       if self._autodetect_tag_file_attempt:
         # There's nothing to tag with, and we've already tried to find a good
         # tag file, so there's nothing we can do with this event (or any other).
@@ -202,12 +406,13 @@ class TaggingPlugin(interface.AnalysisPlugin):
             u'no events will be tagged.')
         return
 
-    try:
-      matched_labels = efilter_api.apply(self._tag_rules, vars=event)
-    except efilter_errors.EfilterTypeError as exception:
-      logging.warning(u'Unable to apply efilter query with error: {0:s}'.format(
-          exception))
-      matched_labels = None
+    matched_labels = []
+    for rule in self._tagging_rules.GetCandidateRules(event):
+      if rule.label in matched_labels:
+        continue
+
+      if rule.Matches(event):
+        matched_labels.append(rule.label)
 
     if not matched_labels:
       return
@@ -217,7 +422,7 @@ class TaggingPlugin(interface.AnalysisPlugin):
         comment=u'Tag applied by tagging analysis plugin.',
         event_uuid=event_uuid)
 
-    for label in efilter_api.getvalues(matched_labels):
+    for label in matched_labels:
       event_tag.AddLabel(label)
 
     logging.debug(u'Tagging event: {0!s}'.format(event_uuid))
@@ -230,7 +435,7 @@ class TaggingPlugin(interface.AnalysisPlugin):
       tagging_file_path (str): path of the tagging file.
     """
     self._tagging_file_name = tagging_file_path
-    self._tag_rules = self._ParseTaggingFile(self._tagging_file_name)
+    self._tagging_rules = self._ParseTaggingFile(self._tagging_file_name)
 
 
 manager.AnalysisPluginManager.RegisterPlugin(TaggingPlugin)
@@ -21,11 +21,17 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
   # Indicate that we can run this plugin during regular extraction.
   ENABLE_IN_EXTRACTION = True
 
-  _DATATYPES = [
+  # Indicate that the plugin can run in a shared analysis process.
+  ENABLE_IN_SHARED_PROCESS = True
+
+  # Indicate that the plugin can continue the analysis of a previous run.
+  ENABLE_INCREMENTAL_ANALYSIS = True
+
+  EVENT_DATA_TYPES = frozenset([
       u'chrome:history:file_downloaded', u'chrome:history:page_visited',
       u'firefox:places:page_visited', u'firefox:downloads:download',
       u'macosx:lsquarantine', u'msiecf:redirected', u'msiecf:url',
-      u'msie:webcache:container', u'opera:history', u'safari:history:visit']
+      u'msie:webcache:container', u'opera:history', u'safari:history:visit'])
 
   def __init__(self):
     """Initializes the domains visited plugin."""
@@ -43,7 +49,7 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
           analysis plugins and other components, such as storage and dfvfs.
       event (EventObject): event to examine.
     """
-    if event.data_type not in self._DATATYPES:
+    if event.data_type not in self.EVENT_DATA_TYPES:
       return
 
     url = getattr(event, u'url', None)
@@ -72,7 +78,20 @@ class UniqueDomainsVisitedPlugin(interface.AnalysisPlugin):
 
     lines_of_text.append(u'')
     report_text = u'\n'.join(lines_of_text)
-    return reports.AnalysisReport(plugin_name=self.NAME, text=report_text)
+    analysis_report = reports.AnalysisReport(
+        plugin_name=self.NAME, text=report_text)
+    analysis_report.report_array = sorted(self._domains)
+    return analysis_report
+
+  def MergeAnalysisReport(self, analysis_report):
+    """Merges the report of a previous run into the state of the plugin.
+
+    Args:
+      analysis_report (AnalysisReport): report of a previous run.
+    """
+    for domain in analysis_report.report_array or []:
+      if domain not in self._domains:
+        self._domains.append(domain)
 
 
 manager.AnalysisPluginManager.RegisterPlugin(UniqueDomainsVisitedPlugin)
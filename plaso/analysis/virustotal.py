@@ -97,6 +97,9 @@ class VirusTotalAnalysisPlugin(interface.HashTaggingAnalysisPlugin):
   _VIRUSTOTAL_PRESENT_RESPONSE_CODE = 1
   _VIRUSTOTAL_ANALYSIS_PENDING_RESPONSE_CODE = -2
 
+  # The analysis of a hash is pending until VirusTotal has scanned the file.
+  _UNCACHEABLE_LABELS = frozenset([u'virustotal_analysis_pending'])
+
   def __init__(self):
     """Initializes a VirusTotal analysis plugin."""
     super(VirusTotalAnalysisPlugin, self).__init__(VirusTotalAnalyzer)
@@ -197,6 +197,11 @@ class WindowsServicesPlugin(interface.AnalysisPlugin):
   # Indicate that we can run this plugin during regular extraction.
   ENABLE_IN_EXTRACTION = True
 
+  # Indicate that the plugin can run in a shared analysis process.
+  ENABLE_IN_SHARED_PROCESS = True
+
+  EVENT_DATA_TYPES = frozenset([u'windows:registry:service'])
+
   def __init__(self):
     """Initializes the Windows Services plugin."""
     super(WindowsServicesPlugin, self).__init__()
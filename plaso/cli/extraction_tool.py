@@ -314,7 +314,8 @@ class ExtractionTool(storage_media_tool.StorageMediaTool):
             u'The profiling sample rate (defaults to a sample every {0:d} '
             u'files).').format(self._DEFAULT_PROFILING_SAMPLE_RATE))
 
-    profiling_types = [u'all', u'parsers', u'processing', u'serializers']
+    profiling_types = [
+        u'all', u'parsers', u'processing', u'serializers', u'tracing']
     if engine.BaseEngine.SupportsMemoryProfiling():
       profiling_types.append(u'memory')
 
@@ -322,8 +323,8 @@ class ExtractionTool(storage_media_tool.StorageMediaTool):
         u'--profiling_type', u'--profiling-type', dest=u'profiling_type',
         choices=sorted(profiling_types), action=u'store',
         metavar=u'TYPE', default=None, help=(
-            u'The profiling type: "all", "memory", "parsers", "processing" '
-            u'or "serializers".'))
+            u'The profiling type: "all", "memory", "parsers", "processing", '
+            u'"serializers" or "tracing". Tracing is not part of "all".'))
 
   def ParseOptions(self, options):
     """Parses tool specific options.
@@ -3,8 +3,11 @@
 
 from plaso.cli.helpers import dynamic_output
 from plaso.cli.helpers import elastic_output
+from plaso.cli.helpers import hash_cache_analysis
 from plaso.cli.helpers import mysql_4n6time_output
+from plaso.cli.helpers import nsrl_analysis
 from plaso.cli.helpers import nsrlsvr_analysis
+from plaso.cli.helpers import parquet_output
 from plaso.cli.helpers import sqlite_4n6time_output
 from plaso.cli.helpers import tagging_analysis
 from plaso.cli.helpers import timesketch_out
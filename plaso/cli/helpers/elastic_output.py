@@ -26,7 +26,9 @@ class ElasticOutputHelper(interface.ArgumentsHelper):
 
   _DEFAULT_INDEX_NAME = uuid4().hex
   _DEFAULT_DOC_TYPE = u'plaso_event'
+  _DEFAULT_BULK_SIZE = 5 * 1024 * 1024
   _DEFAULT_FLUSH_INTERVAL = 1000
+  _DEFAULT_NUMBER_OF_THREADS = 4
   _DEFAULT_RAW_FIELDS = False
 
   @classmethod
@@ -56,6 +58,15 @@ class ElasticOutputHelper(interface.ArgumentsHelper):
         u'--raw_fields', dest=u'raw_fields', action=u'store_true',
         default=cls._DEFAULT_RAW_FIELDS, help=(
             u'Export string fields that will not be analyzed by Lucene.'))
+    argument_group.add_argument(
+        u'--bulk_size', u'--bulk-size', dest=u'bulk_size', type=int,
+        action=u'store', default=cls._DEFAULT_BULK_SIZE, help=(
+            u'Maximum size in bytes of a bulk insert request to '
+            u'ElasticSearch.'))
+    argument_group.add_argument(
+        u'--indexer_threads', u'--indexer-threads', dest=u'indexer_threads',
+        type=int, action=u'store', default=cls._DEFAULT_NUMBER_OF_THREADS,
+        help=u'Number of concurrent bulk insert requests to ElasticSearch.')
 
     ElasticServer.AddArguments(argument_group)
 
@@ -88,12 +99,19 @@ class ElasticOutputHelper(interface.ArgumentsHelper):
         options, u'flush_interval', default_value=cls._DEFAULT_FLUSH_INTERVAL)
     raw_fields = getattr(
         options, u'raw_fields', cls._DEFAULT_RAW_FIELDS)
+    bulk_size = cls._ParseIntegerOption(
+        options, u'bulk_size', default_value=cls._DEFAULT_BULK_SIZE)
+    number_of_threads = cls._ParseIntegerOption(
+        options, u'indexer_threads',
+        default_value=cls._DEFAULT_NUMBER_OF_THREADS)
 
     ElasticServer.ParseOptions(options, output_module)
     output_module.SetIndexName(index_name)
     output_module.SetDocType(doc_type)
     output_module.SetFlushInterval(flush_interval)
     output_module.SetRawFields(raw_fields)
+    output_module.SetBulkSize(bulk_size)
+    output_module.SetNumberOfThreads(number_of_threads)
 
 
 manager.ArgumentHelperManager.RegisterHelper(ElasticOutputHelper)
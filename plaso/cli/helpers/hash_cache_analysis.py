@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""Arguments helper for the hash labels cache of hash analysis plugins."""
+
+from plaso.analysis import hash_cache
+from plaso.analysis import interface as analysis_interface
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class HashCacheAnalysisHelper(interface.ArgumentsHelper):
+  """CLI arguments helper class for the hash labels cache."""
+
+  NAME = u'hash_cache_analysis'
+  CATEGORY = u'analysis'
+  DESCRIPTION = (
+      u'Argument helper for the hash labels cache of hash analysis plugins.')
+
+  _DEFAULT_TIME_TO_LIVE_DAYS = 30
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Add command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser): group
+          to append arguments to.
+    """
+    argument_group.add_argument(
+        u'--hash-cache', dest=u'hash_cache', type=str, action='store',
+        default=None, metavar=u'PATH', help=(
+            u'Path of a SQLite database file to cache the results of hash '
+            u'lookups in. The cache is consulted before a hash is looked up '
+            u'and can be shared between runs and storage files.'))
+    argument_group.add_argument(
+        u'--hash-cache-ttl', dest=u'hash_cache_ttl', type=int, action='store',
+        default=cls._DEFAULT_TIME_TO_LIVE_DAYS, metavar=u'DAYS', help=(
+            u'Number of days a cached hash lookup result is valid, the '
+            u'default is {0:d} days.').format(cls._DEFAULT_TIME_TO_LIVE_DAYS))
+
+  @classmethod
+  def ParseOptions(cls, options, analysis_plugin):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options object.
+      analysis_plugin (HashTaggingAnalysisPlugin): analysis plugin to
+          configure.
+
+    Raises:
+      BadConfigObject: when the analysis plugin is the wrong type.
+      BadConfigOption: when a configuration parameter fails validation.
+    """
+    if not isinstance(
+        analysis_plugin, analysis_interface.HashTaggingAnalysisPlugin):
+      raise errors.BadConfigObject(
+          u'Analysis plugin is not an instance of HashTaggingAnalysisPlugin')
+
+    path = cls._ParseStringOption(options, u'hash_cache')
+    if not path:
+      return
+
+    time_to_live_days = cls._ParseIntegerOption(
+        options, u'hash_cache_ttl',
+        default_value=cls._DEFAULT_TIME_TO_LIVE_DAYS)
+    if time_to_live_days < 0:
+      raise errors.BadConfigOption(
+          u'Invalid hash cache time to live: {0:d} days.'.format(
+              time_to_live_days))
+
+    analysis_plugin.SetHashCache(hash_cache.HashLabelsCache(
+        path, time_to_live=time_to_live_days * 24 * 60 * 60))
+
+
+manager.ArgumentHelperManager.RegisterHelper(HashCacheAnalysisHelper)
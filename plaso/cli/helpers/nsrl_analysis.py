@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Arguments helper for the NSRL hash set analysis plugin."""
+
+from plaso.analysis import nsrl
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.lib import errors
+
+
+class NSRLAnalysisHelper(interface.ArgumentsHelper):
+  """CLI arguments helper class for the NSRL hash set analysis plugin."""
+
+  NAME = u'nsrl_analysis'
+  CATEGORY = u'analysis'
+  DESCRIPTION = u'Argument helper for the NSRL hash set analysis plugin.'
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Add command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser): group
+          to append arguments to.
+    """
+    argument_group.add_argument(
+        u'--nsrl-hash-set', dest=u'nsrl_hash_set', type=str, action='store',
+        default=None, metavar=u'PATH', help=(
+            u'Path of the NSRL hash set file, as created by '
+            u'utils/create_hash_set.py from the NSRL RDS.'))
+
+  @classmethod
+  def ParseOptions(cls, options, analysis_plugin):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options object.
+      analysis_plugin (NSRLAnalysisPlugin): analysis plugin to configure.
+
+    Raises:
+      BadConfigObject: when the analysis plugin is the wrong type.
+      BadConfigOption: when a configuration parameter fails validation.
+    """
+    if not isinstance(analysis_plugin, nsrl.NSRLAnalysisPlugin):
+      raise errors.BadConfigObject(
+          u'Analysis plugin is not an instance of NSRLAnalysisPlugin')
+
+    path = cls._ParseStringOption(options, u'nsrl_hash_set')
+    if not path:
+      raise errors.BadConfigOption(
+          u'NSRL hash set file not specified. Try again with '
+          u'--nsrl-hash-set.')
+
+    try:
+      analysis_plugin.SetHashSetPath(path)
+    except IOError as exception:
+      raise errors.BadConfigOption(
+          u'Unable to open NSRL hash set file with error: {0!s}'.format(
+              exception))
+
+
+manager.ArgumentHelperManager.RegisterHelper(NSRLAnalysisHelper)
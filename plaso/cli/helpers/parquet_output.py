@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""The arguments helper for the Parquet output module."""
+
+from plaso.lib import errors
+from plaso.cli.helpers import interface
+from plaso.cli.helpers import manager
+from plaso.output import parquet
+
+
+class ParquetOutputHelper(interface.ArgumentsHelper):
+  """CLI arguments helper class for the Parquet output module."""
+
+  NAME = u'parquet'
+  CATEGORY = u'output'
+  DESCRIPTION = u'Argument helper for the Parquet output module.'
+
+  _DEFAULT_COMPRESSION = u'snappy'
+  _DEFAULT_ROW_GROUP_SIZE = 65536
+
+  @classmethod
+  def AddArguments(cls, argument_group):
+    """Add command line arguments the helper supports to an argument group.
+
+    This function takes an argument parser or an argument group object and adds
+    to it all the command line arguments this helper supports.
+
+    Args:
+      argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
+          argparse group.
+    """
+    argument_group.add_argument(
+        u'--parquet_compression', dest=u'parquet_compression', type=str,
+        action=u'store', default=cls._DEFAULT_COMPRESSION, help=(
+            u'Compression codec of the Parquet file, such as snappy, gzip '
+            u'or none.'))
+    argument_group.add_argument(
+        u'--row_group_size', dest=u'row_group_size', type=int,
+        action=u'store', default=cls._DEFAULT_ROW_GROUP_SIZE, help=(
+            u'Number of events to buffer before they are written as a row '
+            u'group.'))
+
+  @classmethod
+  def ParseOptions(cls, options, output_module):
+    """Parses and validates options.
+
+    Args:
+      options (argparse.Namespace): parser options.
+      output_module (ParquetOutputModule): output module to configure.
+
+    Raises:
+      BadConfigObject: when the output module object is of the wrong type.
+      BadConfigOption: when the output filename was not provided.
+    """
+    if not isinstance(output_module, parquet.ParquetOutputModule):
+      raise errors.BadConfigObject(
+          u'Output module is not an instance of ParquetOutputModule')
+
+    filename = getattr(options, u'write', None)
+    if not filename:
+      raise errors.BadConfigOption(
+          u'Output filename was not provided use "-w filename" to specify.')
+
+    compression = cls._ParseStringOption(
+        options, u'parquet_compression',
+        default_value=cls._DEFAULT_COMPRESSION)
+    row_group_size = cls._ParseIntegerOption(
+        options, u'row_group_size', default_value=cls._DEFAULT_ROW_GROUP_SIZE)
+
+    if row_group_size < 1:
+      raise errors.BadConfigOption(
+          u'Invalid row group size: {0:d}.'.format(row_group_size))
+
+    output_module.SetCompression(compression)
+    output_module.SetFilename(filename)
+    output_module.SetRowGroupSize(row_group_size)
+
+
+manager.ArgumentHelperManager.RegisterHelper(ParquetOutputHelper)
@@ -17,7 +17,9 @@ class TimesketchOutputHelper(interface.ArgumentsHelper):
   DESCRIPTION = u'Argument helper for the timesketch output module.'
 
   _DEFAULT_DOC_TYPE = u'plaso_event'
+  _DEFAULT_BULK_SIZE = 5 * 1024 * 1024
   _DEFAULT_FLUSH_INTERVAL = 1000
+  _DEFAULT_NUMBER_OF_THREADS = 4
   _DEFAULT_NAME = u''
   _DEFAULT_USERNAME = None
   _DEFAULT_UUID = u'{0:s}'.format(uuid.uuid4().hex)
@@ -59,6 +61,17 @@ class TimesketchOutputHelper(interface.ArgumentsHelper):
         action=u'store', default=cls._DEFAULT_DOC_TYPE, help=(
             u'Name of the document type that will be used in ElasticSearch.'))
 
+    argument_group.add_argument(
+        u'--bulk_size', u'--bulk-size', dest=u'bulk_size', type=int,
+        action=u'store', default=cls._DEFAULT_BULK_SIZE, help=(
+            u'Maximum size in bytes of a bulk insert request to '
+            u'ElasticSearch.'))
+
+    argument_group.add_argument(
+        u'--indexer_threads', u'--indexer-threads', dest=u'indexer_threads',
+        type=int, action=u'store', default=cls._DEFAULT_NUMBER_OF_THREADS,
+        help=u'Number of concurrent bulk insert requests to ElasticSearch.')
+
     argument_group.add_argument(
         u'--username', dest=u'username', type=str,
         action=u'store', default=cls._DEFAULT_USERNAME, help=(
@@ -92,6 +105,15 @@ class TimesketchOutputHelper(interface.ArgumentsHelper):
         options, u'flush_interval', default_value=cls._DEFAULT_FLUSH_INTERVAL)
     output_module.SetFlushInterval(flush_interval)
 
+    bulk_size = cls._ParseIntegerOption(
+        options, u'bulk_size', default_value=cls._DEFAULT_BULK_SIZE)
+    output_module.SetBulkSize(bulk_size)
+
+    number_of_threads = cls._ParseIntegerOption(
+        options, u'indexer_threads',
+        default_value=cls._DEFAULT_NUMBER_OF_THREADS)
+    output_module.SetNumberOfThreads(number_of_threads)
+
     index = cls._ParseStringOption(
         options, u'index', default_value=cls._DEFAULT_UUID)
     output_module.SetIndexName(index)
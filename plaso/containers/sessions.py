@@ -15,6 +15,10 @@ class Session(interface.AttributeContainer):
 
   Attributes:
     aborted (bool): True if the session was aborted.
+    analysis_high_water_marks (dict[str, list[int]]): number of events
+        per event stream that were analyzed per analysis plugin, where
+        the first number is that of the first event stream. An empty list
+        indicates that the events analyzed by the plugin are not known.
     analysis_reports_counter (collections.Counter): number of analysis reports
         per analysis plugin.
     command_line_arguments (str): command line arguments.
@@ -44,6 +48,7 @@ class Session(interface.AttributeContainer):
     """Initializes a session attribute container."""
     super(Session, self).__init__()
     self.aborted = False
+    self.analysis_high_water_marks = {}
     self.analysis_reports_counter = collections.Counter()
     self.command_line_arguments = None
     self.completion_time = None
@@ -77,6 +82,10 @@ class Session(interface.AttributeContainer):
 
     self.aborted = session_completion.aborted
 
+    if session_completion.analysis_high_water_marks:
+      self.analysis_high_water_marks = (
+          session_completion.analysis_high_water_marks)
+
     if session_completion.analysis_reports_counter:
       self.analysis_reports_counter = (
           session_completion.analysis_reports_counter)
@@ -117,6 +126,8 @@ class Session(interface.AttributeContainer):
 
     session_completion = SessionCompletion()
     session_completion.aborted = self.aborted
+    session_completion.analysis_high_water_marks = (
+        self.analysis_high_water_marks)
     session_completion.analysis_reports_counter = self.analysis_reports_counter
     session_completion.event_labels_counter = self.event_labels_counter
     session_completion.identifier = self.identifier
@@ -150,6 +161,8 @@ class SessionCompletion(interface.AttributeContainer):
 
   Attributes:
     aborted (bool): True if the session was aborted.
+    analysis_high_water_marks (dict[str, list[int]]): number of events
+        per event stream that were analyzed per analysis plugin.
     analysis_reports_counter (collections.Counter): number of analysis reports
         per analysis plugin.
     event_labels_counter (collections.Counter): number of event tags per label.
@@ -171,6 +184,7 @@ class SessionCompletion(interface.AttributeContainer):
     """
     super(SessionCompletion, self).__init__()
     self.aborted = False
+    self.analysis_high_water_marks = None
     self.analysis_reports_counter = None
     self.event_labels_counter = None
     self.identifier = identifier
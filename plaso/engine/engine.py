@@ -47,6 +47,9 @@ class BaseEngine(object):
             the processing;
           * 'serializers' to profile CPU time consumed by individual
             serializers.
+          * 'tracing' to record the time spent per task, file and parser
+            as a Chrome trace. Tracing is not part of 'all' and records every
+            file regardless of the sample rate.
     """
     super(BaseEngine, self).__init__()
     self._abort = False
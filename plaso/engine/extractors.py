@@ -53,6 +53,7 @@ class EventExtractor(object):
     self._parsers_profiler = None
     self._resolver_context = resolver_context
     self._specification_store = None
+    self._tracing_profiler = None
     self._usnjrnl_parser = None
 
     self._InitializeParserObjects()
@@ -178,6 +179,10 @@ class EventExtractor(object):
     if self._parsers_profiler:
       self._parsers_profiler.StartTiming(parser.NAME)
 
+    if self._tracing_profiler:
+      tracing_span = self._tracing_profiler.StartSpan(parser.NAME, u'parser')
+      number_of_events = parser_mediator.number_of_produced_events
+
     try:
       if isinstance(parser, parsers_interface.FileEntryParser):
         parser.Parse(parser_mediator)
@@ -201,6 +206,16 @@ class EventExtractor(object):
       if self._parsers_profiler:
         self._parsers_profiler.StopTiming(parser.NAME)
 
+      if self._tracing_profiler:
+        arguments = {
+            u'events': (
+                parser_mediator.number_of_produced_events - number_of_events),
+            u'file': parser_mediator.GetDisplayName(file_entry)}
+        if file_object:
+          arguments[u'bytes'] = file_object.get_size()
+
+        self._tracing_profiler.StopSpan(tracing_span, arguments=arguments)
+
       if reference_count != self._resolver_context.GetFileObjectReferenceCount(
           file_entry.path_spec):
         display_name = parser_mediator.GetDisplayName(file_entry)
@@ -299,17 +314,37 @@ class EventExtractor(object):
     """
     self._parsers_profiler = parsers_profiler
 
+  def SetTracingProfiler(self, tracing_profiler):
+    """Sets the tracing profiler.
+
+    Args:
+      tracing_profiler (TracingProfiler): tracing profiler.
+    """
+    self._tracing_profiler = tracing_profiler
+
 
 class PathSpecExtractor(object):
   """Class that implements a path specification extractor object.
 
   A path specification extractor extracts path specification from a source
   directory, file or storage media device or image.
+
+  In VSS differencing mode an index of the file entries is built for every
+  file system in a volume, that maps the file reference of a file entry to
+  a hash of its timestamps and size. Of a file system in a VSS store only
+  the file entries are extracted that are not in the index of the file
+  system that was previously processed in the same volume, such as the
+  previous VSS store.
   """
 
+  # The number of bits of the MFT entry number in a NTFS file reference.
+  _FILE_REFERENCE_MFT_ENTRY_BITS = 48
+
   _MAXIMUM_DEPTH = 255
 
-  def __init__(self, resolver_context, duplicate_file_check=False):
+  def __init__(
+      self, resolver_context, duplicate_file_check=False,
+      vss_differencing=False):
     """Initializes a path specification extractor object.
 
     The source collector discovers all the file entries in the source.
@@ -320,11 +355,19 @@ class PathSpecExtractor(object):
       resolver_context (dfvfs.Context): resolver context.
       duplicate_file_check (Optional[bool]):
           True if duplicate files should be ignored.
+      vss_differencing (Optional[bool]): True if only the file entries of
+          a VSS store should be extracted that differ from the file system
+          that was previously processed in the same volume.
     """
     super(PathSpecExtractor, self).__init__()
     self._duplicate_file_check = duplicate_file_check
     self._hashlist = {}
+    self._previous_snapshot_index = None
     self._resolver_context = resolver_context
+    self._snapshot_index = None
+    self._snapshot_indexes = {}
+    self._snapshot_volume = None
+    self._vss_differencing = vss_differencing
 
   def _CalculateNTFSTimeHash(self, file_entry):
     """Returns a hash value calculated from a NTFS file entry.
@@ -364,6 +407,17 @@ class PathSpecExtractor(object):
 
     return ret_hash.hexdigest()
 
+  def _CloseSnapshotIndex(self):
+    """Closes the snapshot index of the file system being processed."""
+    if self._snapshot_index is not None:
+      # Only the index of the most recently processed file system is kept
+      # per volume.
+      self._snapshot_indexes[self._snapshot_volume] = self._snapshot_index
+
+    self._previous_snapshot_index = None
+    self._snapshot_index = None
+    self._snapshot_volume = None
+
   def _ExtractPathSpecs(
       self, path_spec, find_specs=None, recurse_file_system=True):
     """Extracts path specification from a specific source.
@@ -461,6 +515,15 @@ class PathSpecExtractor(object):
 
           self._hashlist.setdefault(inode, []).append(hash_value)
 
+        if self._snapshot_index is not None:
+          file_reference, hash_value = self._GetSnapshotIndexEntry(
+              sub_file_entry)
+          self._snapshot_index[file_reference] = hash_value
+
+          if (self._previous_snapshot_index and
+              self._previous_snapshot_index.get(file_reference) == hash_value):
+            continue
+
       for path_spec in self._ExtractPathSpecsFromFile(sub_file_entry):
         yield path_spec
 
@@ -535,8 +598,15 @@ class PathSpecExtractor(object):
       elif recurse_file_system:
         file_entry = file_system.GetFileEntryByPathSpec(path_spec)
         if file_entry:
-          for path_spec in self._ExtractPathSpecsFromDirectory(file_entry):
-            yield path_spec
+          if self._vss_differencing:
+            self._OpenSnapshotIndex(path_spec)
+
+          try:
+            for path_spec in self._ExtractPathSpecsFromDirectory(file_entry):
+              yield path_spec
+
+          finally:
+            self._CloseSnapshotIndex()
 
       else:
         yield path_spec
@@ -549,6 +619,76 @@ class PathSpecExtractor(object):
     finally:
       file_system.Close()
 
+  def _GetSnapshotIndexEntry(self, file_entry):
+    """Retrieves the snapshot index entry of a file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      tuple[int, int]: file reference, which consists of the MFT entry and
+          sequence number, and hash of the timestamps and size of the file
+          entry.
+    """
+    stat_object = file_entry.GetStat()
+
+    file_reference = None
+    if file_entry.type_indicator == dfvfs_definitions.TYPE_INDICATOR_NTFS:
+      fsntfs_file_entry = file_entry.GetNTFSFileEntry()
+      if fsntfs_file_entry:
+        file_reference = fsntfs_file_entry.file_reference
+
+    elif file_entry.type_indicator == dfvfs_definitions.TYPE_INDICATOR_TSK:
+      tsk_file = file_entry.GetTSKFile()
+      tsk_meta = getattr(tsk_file.info, u'meta', None)
+      if tsk_meta:
+        file_reference = tsk_meta.addr | (
+            getattr(tsk_meta, u'seq', 0) << self._FILE_REFERENCE_MFT_ENTRY_BITS)
+
+    if file_reference is None:
+      file_reference = getattr(stat_object, u'ino', None) or 0
+
+    hash_value = hash((
+        getattr(stat_object, u'size', None),
+        getattr(stat_object, u'atime', None),
+        getattr(stat_object, u'atime_nano', None),
+        getattr(stat_object, u'crtime', None),
+        getattr(stat_object, u'crtime_nano', None),
+        getattr(stat_object, u'mtime', None),
+        getattr(stat_object, u'mtime_nano', None),
+        getattr(stat_object, u'ctime', None),
+        getattr(stat_object, u'ctime_nano', None)))
+
+    return file_reference, hash_value
+
+  def _OpenSnapshotIndex(self, path_spec):
+    """Opens the snapshot index of a file system.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the root of
+          the file system.
+    """
+    volume_path_spec = path_spec.parent
+    is_vss_store = False
+    if (volume_path_spec and volume_path_spec.type_indicator ==
+        dfvfs_definitions.TYPE_INDICATOR_VSHADOW):
+      volume_path_spec = volume_path_spec.parent
+      is_vss_store = True
+
+    # A file system that is not stored in a volume, such as a directory,
+    # is not indexed.
+    if not volume_path_spec:
+      return
+
+    self._snapshot_index = {}
+    self._snapshot_volume = volume_path_spec.comparable
+
+    # Only the file entries of a VSS store are compared against the index
+    # of the previous file system.
+    if is_vss_store:
+      self._previous_snapshot_index = self._snapshot_indexes.get(
+          self._snapshot_volume, None)
+
   def ExtractPathSpecs(
       self, path_specs, find_specs=None, recurse_file_system=True):
     """Extracts path specification from a specific source.
@@ -247,6 +247,32 @@ class ProcessStatus(object):
     return consumed_sources_delta > 0 or produced_sources_delta > 0
 
 
+class EventsStatus(object):
+  """The status of the events of an export or analysis.
+
+  Attributes:
+    number_of_duplicate_events (int): number of duplicate events removed.
+    number_of_events_from_time_slice (int): number of events from the time
+        slice.
+    number_of_filtered_events (int): number of events that were filtered.
+    number_of_spilled_events (int): number of events that were spilled to
+        a temporary file by the event buffer.
+    peak_number_of_buffered_events (int): largest number of events that were
+        buffered in memory by the event buffer.
+    total_number_of_events (int): total number of events processed.
+  """
+
+  def __init__(self):
+    """Initializes the events status object."""
+    super(EventsStatus, self).__init__()
+    self.number_of_duplicate_events = 0
+    self.number_of_events_from_time_slice = 0
+    self.number_of_filtered_events = 0
+    self.number_of_spilled_events = 0
+    self.peak_number_of_buffered_events = 0
+    self.total_number_of_events = 0
+
+
 class ProcessingStatus(object):
   """The status of the overall extraction process (processing).
 
@@ -254,6 +280,7 @@ class ProcessingStatus(object):
     aborted (bool): True if processing was aborted.
     error_path_specs (list[str]): path specification strings that caused
         critical errors during processing.
+    events_status (EventsStatus): status of the exported events.
     foreman_status (ProcessingStatus): foreman processing status.
   """
 
@@ -264,6 +291,7 @@ class ProcessingStatus(object):
 
     self.aborted = False
     self.error_path_specs = []
+    self.events_status = None
     self.foreman_status = None
 
   @property
@@ -406,3 +434,32 @@ class ProcessingStatus(object):
         number_of_consumed_events, number_of_produced_events,
         number_of_consumed_errors, number_of_produced_errors,
         number_of_consumed_reports, number_of_produced_reports)
+
+  def UpdateEventsStatus(
+      self, number_of_duplicate_events, number_of_events_from_time_slice,
+      number_of_filtered_events, number_of_spilled_events,
+      peak_number_of_buffered_events, total_number_of_events):
+    """Updates the status of the exported events.
+
+    Args:
+      number_of_duplicate_events (int): number of duplicate events removed.
+      number_of_events_from_time_slice (int): number of events from the time
+          slice.
+      number_of_filtered_events (int): number of events that were filtered.
+      number_of_spilled_events (int): number of events that were spilled to
+          a temporary file by the event buffer.
+      peak_number_of_buffered_events (int): largest number of events that
+          were buffered in memory by the event buffer.
+      total_number_of_events (int): total number of events processed.
+    """
+    if not self.events_status:
+      self.events_status = EventsStatus()
+
+    self.events_status.number_of_duplicate_events = number_of_duplicate_events
+    self.events_status.number_of_events_from_time_slice = (
+        number_of_events_from_time_slice)
+    self.events_status.number_of_filtered_events = number_of_filtered_events
+    self.events_status.number_of_spilled_events = number_of_spilled_events
+    self.events_status.peak_number_of_buffered_events = (
+        peak_number_of_buffered_events)
+    self.events_status.total_number_of_events = total_number_of_events
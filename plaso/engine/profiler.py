@@ -2,6 +2,7 @@
 """The profiler classes."""
 
 import abc
+import json
 import os
 import time
 
@@ -233,3 +234,136 @@ class SerializersProfiler(CPUTimeProfiler):
   """The serializers profiler."""
 
   _FILENAME_PREFIX = u'serializers'
+
+
+class TracingSpan(object):
+  """The tracing span.
+
+  Attributes:
+    category (str): category of the span, such as "parser".
+    name (str): name of the span, such as the name of a parser.
+    start_time (float): POSIX timestamp of the start of the span.
+  """
+
+  def __init__(self, name, category, start_time):
+    """Initializes the tracing span object.
+
+    Args:
+      name (str): name of the span.
+      category (str): category of the span.
+      start_time (float): POSIX timestamp of the start of the span.
+    """
+    super(TracingSpan, self).__init__()
+    self.category = category
+    self.name = name
+    self.start_time = start_time
+
+
+class TracingProfiler(object):
+  """The tracing profiler.
+
+  The tracing profiler records spans, such as parsing a file with a specific
+  parser, with their start time, duration and arguments, such as the number
+  of bytes and events, as trace events in the Chrome trace event format.
+  The sample file can be viewed with chrome://tracing.
+
+  Trace events are written as they are recorded. Since the closing bracket
+  of the JSON array format is optional, the sample file of a process that
+  did not stop normally can be viewed as well.
+  """
+
+  _FILENAME_PREFIX = u'tracing'
+
+  def __init__(self, identifier, path=None):
+    """Initializes the tracing profiler object.
+
+    Args:
+      identifier (str): identifier of the profiling session used to create
+          the sample filename and as name of the process in the trace.
+      path (Optional[str]): path to write the sample file.
+    """
+    super(TracingProfiler, self).__init__()
+    self._file_object = None
+    self._identifier = identifier
+    self._number_of_trace_events = 0
+    self._pid = None
+    self._sample_file = u'{0:s}-{1!s}.json'.format(
+        self._FILENAME_PREFIX, identifier)
+
+    if path:
+      self._sample_file = os.path.join(path, self._sample_file)
+
+  def _WriteTraceEvent(self, trace_event):
+    """Writes a trace event to the sample file.
+
+    Args:
+      trace_event (dict[str, object]): trace event.
+    """
+    if not self._file_object:
+      return
+
+    json_string = json.dumps(trace_event, sort_keys=True)
+    if self._number_of_trace_events:
+      line = u',\n{0:s}'.format(json_string)
+    else:
+      line = u'{0:s}'.format(json_string)
+
+    self._file_object.write(line.encode(u'utf-8'))
+    self._number_of_trace_events += 1
+
+  def Start(self):
+    """Starts the profiler."""
+    self._pid = os.getpid()
+    self._number_of_trace_events = 0
+
+    self._file_object = open(self._sample_file, 'wb')
+    self._file_object.write(b'[\n')
+
+    self._WriteTraceEvent({
+        u'args': {u'name': self._identifier},
+        u'name': u'process_name',
+        u'ph': u'M',
+        u'pid': self._pid,
+        u'tid': self._pid})
+
+  def StartSpan(self, name, category):
+    """Starts a span.
+
+    Args:
+      name (str): name of the span, such as the name of a parser.
+      category (str): category of the span, such as "parser".
+
+    Returns:
+      TracingSpan: span.
+    """
+    return TracingSpan(name, category, time.time())
+
+  def Stop(self):
+    """Stops the profiler."""
+    if not self._file_object:
+      return
+
+    self._file_object.write(b'\n]\n')
+    self._file_object.close()
+    self._file_object = None
+
+  def StopSpan(self, span, arguments=None):
+    """Stops a span and writes it as a trace event.
+
+    Args:
+      span (TracingSpan): span.
+      arguments (Optional[dict[str, object]]): arguments of the span, such as
+          the number of bytes and events.
+    """
+    duration = time.time() - span.start_time
+
+    # The trace event timestamps and durations are in microseconds.
+    self._WriteTraceEvent({
+        u'args': arguments or {},
+        u'cat': span.category,
+        u'dur': int(duration * 1000000),
+        u'name': span.name,
+        u'ph': u'X',
+        u'pid': self._pid,
+        u'tid': self._pid,
+        u'ts': int(span.start_time * 1000000)})
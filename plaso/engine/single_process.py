@@ -42,6 +42,9 @@ class SingleProcessEngine(engine.BaseEngine):
             the processing;
           * 'serializers' to profile CPU time consumed by individual
             serializers.
+          * 'tracing' to record the time spent per task, file and parser
+            as a Chrome trace. Tracing is not part of 'all' and records every
+            file regardless of the sample rate.
     """
     super(SingleProcessEngine, self).__init__(
         debug_output=debug_output, enable_profiling=enable_profiling,
@@ -57,6 +60,7 @@ class SingleProcessEngine(engine.BaseEngine):
     self._processing_profiler = None
     self._serializers_profiler = None
     self._status_update_callback = None
+    self._tracing_profiler = None
     self._yara_rules_string = None
 
   def _ProcessPathSpec(self, extraction_worker, parser_mediator, path_spec):
@@ -230,6 +234,13 @@ class SingleProcessEngine(engine.BaseEngine):
       self._serializers_profiler = profiler.SerializersProfiler(
           identifier, path=self._profiling_directory)
 
+    if self._profiling_type == u'tracing':
+      identifier = u'{0:s}-tracing'.format(self._name)
+      self._tracing_profiler = profiler.TracingProfiler(
+          identifier, path=self._profiling_directory)
+      self._tracing_profiler.Start()
+      extraction_worker.SetTracingProfiler(self._tracing_profiler)
+
   def _StopProfiling(self, extraction_worker):
     """Stops profiling.
 
@@ -257,6 +268,11 @@ class SingleProcessEngine(engine.BaseEngine):
       self._serializers_profiler.Write()
       self._serializers_profiler = None
 
+    if self._profiling_type == u'tracing':
+      extraction_worker.SetTracingProfiler(None)
+      self._tracing_profiler.Stop()
+      self._tracing_profiler = None
+
   def _UpdateStatus(
       self, status, display_name, number_of_consumed_sources, storage_writer,
       force=False):
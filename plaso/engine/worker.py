@@ -108,6 +108,7 @@ class EventExtractionWorker(object):
     self._process_archive_files = process_archive_files
     self._processing_profiler = None
     self._resolver_context = resolver_context
+    self._tracing_profiler = None
 
     self.last_activity_timestamp = 0.0
     self.processing_status = definitions.PROCESSING_STATUS_IDLE
@@ -733,6 +734,19 @@ class EventExtractionWorker(object):
       self.processing_status = definitions.PROCESSING_STATUS_IDLE
       return
 
+    if self._tracing_profiler:
+      # The size is determined before processing, since an error determining
+      # it should not mask an error raised while processing the file entry.
+      try:
+        stat_object = file_entry.GetStat()
+        file_size = getattr(stat_object, u'size', None)
+      except (IOError, dfvfs_errors.BackEndError):
+        file_size = None
+
+      display_name = mediator.GetDisplayName(file_entry)
+      tracing_span = self._tracing_profiler.StartSpan(display_name, u'file')
+      number_of_events = mediator.number_of_produced_events
+
     mediator.SetFileEntry(file_entry)
 
     try:
@@ -743,6 +757,12 @@ class EventExtractionWorker(object):
     finally:
       mediator.ResetFileEntry()
 
+      if self._tracing_profiler:
+        arguments = {
+            u'bytes': file_size,
+            u'events': mediator.number_of_produced_events - number_of_events}
+        self._tracing_profiler.StopSpan(tracing_span, arguments=arguments)
+
       # Make sure frame.f_locals does not keep a reference to file_entry.
       file_entry = None
 
@@ -777,6 +797,15 @@ class EventExtractionWorker(object):
     """
     self._processing_profiler = processing_profiler
 
+  def SetTracingProfiler(self, tracing_profiler):
+    """Sets the tracing profiler.
+
+    Args:
+      tracing_profiler (TracingProfiler): tracing profiler.
+    """
+    self._event_extractor.SetTracingProfiler(tracing_profiler)
+    self._tracing_profiler = tracing_profiler
+
   def SetYaraRules(self, yara_rules_string):
     """Sets the Yara rules.
 
@@ -2,11 +2,18 @@
 """ZeroMQ implementations of the Plaso queue interface."""
 
 import abc
+import collections
 import errno
 import logging
 import threading
 import time
 
+# The 'cPickle' module was merged into 'pickle' in Python 3
+try:
+  import cPickle as pickle
+except ImportError:
+  import pickle
+
 # The 'Queue' module was renamed to 'queue' in Python 3
 try:
   import Queue
@@ -15,14 +22,25 @@ except ImportError:
 
 import zmq
 
+from plaso.containers import interface as containers_interface
 from plaso.engine import plaso_queue
 from plaso.lib import errors
+from plaso.lib import py2to3
+from plaso.serializer import json_serializer
 
 
 class ZeroMQQueue(plaso_queue.Queue):
   """Class that defines an interfaces for ZeroMQ backed Plaso queues.
 
+  Items are sent in batches, where every batch is a multipart ZeroMQ message
+  with a frame per item. A batch is sent when it contains the maximum number
+  of items, when its first item was pushed longer than the batch latency ago,
+  when it contains a queue abort item or when the queue is closed. Note that
+  the batch latency is only checked when an item is pushed.
+
   Attributes:
+    host (str): host name or IP address that the queue binds or connects to,
+        where "*" represents all interfaces when binding.
     name (str): name to identify the queue.
     port (int): TCP port that the queue is connected or bound to. If the queue
         is not yet bound or connected to a port, this value will be None.
@@ -30,7 +48,15 @@ class ZeroMQQueue(plaso_queue.Queue):
         may block for, before returning queue.QueueEmpty.
   """
 
-  _SOCKET_ADDRESS = u'tcp://127.0.0.1'
+  # The default host, which limits the queue to the local machine.
+  _DEFAULT_HOST = u'127.0.0.1'
+
+  # The frame type indicators of the serialized items.
+  _FRAME_TYPE_JSON = b'J'
+  _FRAME_TYPE_PICKLE = b'P'
+
+  _JSON_SERIALIZER = json_serializer.JSONAttributeContainerSerializer
+
   _SOCKET_TYPE = None
 
   _ZMQ_SOCKET_SEND_TIMEOUT_MILLISECONDS = 1500
@@ -40,16 +66,27 @@ class ZeroMQQueue(plaso_queue.Queue):
   SOCKET_CONNECTION_CONNECT = 2
   SOCKET_CONNECTION_TYPE = None
 
+  SERIALIZER_JSON = u'json'
+  SERIALIZER_PICKLE = u'pickle'
+
   def __init__(
-      self, delay_open=True, linger_seconds=10, maximum_items=1000,
-      name=u'Unnamed', port=None, timeout_seconds=5):
+      self, batch_latency_seconds=0.1, batch_size=1, delay_open=True,
+      host=None, linger_seconds=10, maximum_items=1000, name=u'Unnamed',
+      port=None, serializer=SERIALIZER_PICKLE, timeout_seconds=5):
     """Initializes a ZeroMQ backed queue.
 
     Args:
+      batch_latency_seconds (Optional[float]): maximum number of seconds
+          pushed items are held back to be sent in a batch.
+      batch_size (Optional[int]): maximum number of items sent in a single
+          ZeroMQ message, where 1 represents that items are not batched.
       delay_open (Optional[bool]): whether a ZeroMQ socket should be created
           the first time the queue is pushed to or popped from, rather than at
           queue object initialization. This is useful if a queue needs to be
           passed to a child process from a parent process.
+      host (Optional[str]): host name or IP address that the queue binds or
+          connects to, where "*" represents all interfaces when binding and
+          None represents the local machine (127.0.0.1).
       linger_seconds (Optional[int]): number of seconds that the underlying
           ZeroMQ socket can remain open after the queue has been closed,
           to allow queued items to be transferred to other ZeroMQ sockets.
@@ -61,25 +98,42 @@ class ZeroMQQueue(plaso_queue.Queue):
       port (Optional[int]): The TCP port to use for the queue. The default is
           None, which indicates that the queue should choose a random port to
           bind to.
+      serializer (Optional[str]): serializer of the items, either "pickle" or
+          "json". Note that the JSON serializer only applies to attribute
+          containers, other items are always pickled.
       timeout_seconds (Optional[int]): number of seconds that calls to PopItem
           and PushItem may block for, before returning queue.QueueEmpty.
 
     Raises:
       ValueError: If the queue is configured to connect to an endpoint,
-          but no port is specified.
+          but no port is specified, if the batch size is smaller than 1 or
+          if the serializer is not supported.
     """
     if (self.SOCKET_CONNECTION_TYPE == self.SOCKET_CONNECTION_CONNECT
         and not port):
       raise ValueError(u'No port specified to connect to.')
 
+    if batch_size < 1:
+      raise ValueError(u'Unsupported batch size: {0:d}.'.format(batch_size))
+
+    if serializer not in (self.SERIALIZER_JSON, self.SERIALIZER_PICKLE):
+      raise ValueError(u'Unsupported serializer: {0!s}.'.format(serializer))
+
     super(ZeroMQQueue, self).__init__()
+    self._batch_latency_seconds = batch_latency_seconds
+    self._batch_size = batch_size
     self._closed_event = None
     self._high_water_mark = maximum_items
     self._linger_seconds = linger_seconds
+    self._pending_items = []
+    self._pending_items_timestamp = 0.0
+    self._received_items = collections.deque()
+    self._serializer = serializer
     self._terminate_event = None
     self._zmq_context = None
     self._zmq_socket = None
 
+    self.host = host or self._DEFAULT_HOST
     self.name = name
     self.port = port
     self.timeout_seconds = timeout_seconds
@@ -87,23 +141,81 @@ class ZeroMQQueue(plaso_queue.Queue):
     if not delay_open:
       self._CreateZMQSocket()
 
-  def _SendItem(self, zmq_socket, item, block=True):
-    """Attempts to send an item to a ZeroMQ socket.
+  def _AddPendingItem(self, item):
+    """Adds an item to the batch of items pending to be sent.
+
+    Args:
+      item (object): item to push on the queue.
+
+    Returns:
+      bool: True if the pending items should be sent.
+    """
+    if not self._pending_items:
+      self._pending_items_timestamp = time.time()
+
+    self._pending_items.append(item)
+
+    if len(self._pending_items) >= self._batch_size:
+      return True
+
+    # A queue abort item should not be held back since the consumer
+    # is expected to stop after it.
+    if isinstance(item, plaso_queue.QueueAbort):
+      return True
+
+    batch_latency = time.time() - self._pending_items_timestamp
+    return batch_latency >= self._batch_latency_seconds
+
+  def _DeserializeItems(self, frames):
+    """Deserializes items from the frames of a ZeroMQ message.
 
     Args:
-      zmq_socket (zmq.Socket): used to the send the item.
-      item (object): sent on the queue. Will be pickled prior to sending.
+      frames (list[bytes]): frames of the ZeroMQ message.
 
     Returns:
-      bool: whether the item was sent successfully.
+      list[object]: items.
+
+    Raises:
+      ValueError: if the frame type is not supported.
     """
+    items = []
+    for frame in frames:
+      frame_type = frame[:1]
+      if frame_type == self._FRAME_TYPE_PICKLE:
+        item = pickle.loads(frame[1:])
+
+      elif frame_type == self._FRAME_TYPE_JSON:
+        item = self._JSON_SERIALIZER.ReadSerialized(frame[1:].decode(u'utf-8'))
+
+      else:
+        raise ValueError(u'Unsupported frame type: {0!r}.'.format(frame_type))
+
+      items.append(item)
+
+    return items
+
+  def _SendItems(self, zmq_socket, items, block=True):
+    """Attempts to send items to a ZeroMQ socket.
+
+    Args:
+      zmq_socket (zmq.Socket): used to the send the items.
+      items (list[object]): sent on the queue. Will be serialized prior to
+          sending.
+      block (Optional[bool]): whether the send should be performed in blocking
+          or non-block mode.
+
+    Returns:
+      bool: whether the items were sent successfully.
+    """
+    frames = self._SerializeItems(items)
+
     try:
-      logging.debug(u'{0:s} sending item'.format(self.name))
+      logging.debug(u'{0:s} sending {1:d} items'.format(self.name, len(items)))
       if block:
-        zmq_socket.send_pyobj(item)
+        zmq_socket.send_multipart(frames)
       else:
-        zmq_socket.send_pyobj(item, zmq.DONTWAIT)
-      logging.debug(u'{0:s} sent item'.format(self.name))
+        zmq_socket.send_multipart(frames, zmq.DONTWAIT)
+      logging.debug(u'{0:s} sent items'.format(self.name))
       return True
 
     except zmq.error.Again:
@@ -117,14 +229,14 @@ class ZeroMQQueue(plaso_queue.Queue):
 
     return False
 
-  def _ReceiveItemOnActivity(self, zmq_socket):
-    """Attempts to receive an item from a ZeroMQ socket.
+  def _ReceiveItemsOnActivity(self, zmq_socket):
+    """Attempts to receive items from a ZeroMQ socket.
 
     Args:
-      zmq_socket (zmq.Socket): used to the receive the item.
+      zmq_socket (zmq.Socket): used to the receive the items.
 
     Returns:
-      object: item from the socket.
+      list[object]: items from the socket.
 
     Raises:
       QueueEmpty: if no item could be received within the timeout.
@@ -134,8 +246,8 @@ class ZeroMQQueue(plaso_queue.Queue):
         self._ZMQ_SOCKET_RECEIVE_TIMEOUT_MILLISECONDS)
     if events:
       try:
-        received_object = self._zmq_socket.recv_pyobj()
-        return received_object
+        frames = self._zmq_socket.recv_multipart()
+        return self._DeserializeItems(frames)
 
       except zmq.error.Again:
         logging.error(
@@ -152,6 +264,33 @@ class ZeroMQQueue(plaso_queue.Queue):
 
     raise errors.QueueEmpty
 
+  def _SerializeItems(self, items):
+    """Serializes items into the frames of a ZeroMQ message.
+
+    Args:
+      items (list[object]): items.
+
+    Returns:
+      list[bytes]: frames of the ZeroMQ message.
+    """
+    frames = []
+    for item in items:
+      if (self._serializer == self.SERIALIZER_JSON and
+          isinstance(item, containers_interface.AttributeContainer)):
+        json_string = self._JSON_SERIALIZER.WriteSerialized(item)
+        if isinstance(json_string, py2to3.UNICODE_TYPE):
+          json_string = json_string.encode(u'utf-8')
+        frame = b''.join([self._FRAME_TYPE_JSON, json_string])
+
+      else:
+        frame = b''.join([
+            self._FRAME_TYPE_PICKLE,
+            pickle.dumps(item, pickle.HIGHEST_PROTOCOL)])
+
+      frames.append(frame)
+
+    return frames
+
   def _SetSocketTimeouts(self):
     """Sets the timeouts for socket send and receive."""
     receive_timeout = min(
@@ -199,8 +338,9 @@ class ZeroMQQueue(plaso_queue.Queue):
     self._SetSocketTimeouts()
     self._SetSocketHighWaterMark()
 
+    socket_address = u'tcp://{0:s}'.format(self.host)
     if self.port:
-      address = u'{0:s}:{1:d}'.format(self._SOCKET_ADDRESS, self.port)
+      address = u'{0:s}:{1:d}'.format(socket_address, self.port)
       if self.SOCKET_CONNECTION_TYPE == self.SOCKET_CONNECTION_CONNECT:
         self._zmq_socket.connect(address)
         logging.debug(u'{0:s} connected to {1:s}'.format(self.name, address))
@@ -209,7 +349,7 @@ class ZeroMQQueue(plaso_queue.Queue):
         logging.debug(
             u'{0:s} bound to specified port {1:s}'.format(self.name, address))
     else:
-      self.port = self._zmq_socket.bind_to_random_port(self._SOCKET_ADDRESS)
+      self.port = self._zmq_socket.bind_to_random_port(socket_address)
       logging.debug(
           u'{0:s} bound to random port {1:d}'.format(self.name, self.port))
 
@@ -340,6 +480,9 @@ class ZeroMQPullQueue(ZeroMQQueue):
       RuntimeError: if closed or terminate event is missing.
       zmq.error.ZMQError: If a ZeroMQ error occurs.
     """
+    if self._received_items:
+      return self._received_items.popleft()
+
     if not self._zmq_socket:
       self._CreateZMQSocket()
 
@@ -352,7 +495,9 @@ class ZeroMQPullQueue(ZeroMQQueue):
     last_retry_timestamp = time.time() + self.timeout_seconds
     while not self._closed_event.is_set() or not self._terminate_event.is_set():
       try:
-        return self._ReceiveItemOnActivity(self._zmq_socket)
+        items = self._ReceiveItemsOnActivity(self._zmq_socket)
+        self._received_items.extend(items)
+        return self._received_items.popleft()
 
       except errors.QueueEmpty:
         if time.time() > last_retry_timestamp:
@@ -378,6 +523,14 @@ class ZeroMQPullQueue(ZeroMQQueue):
     raise errors.WrongQueueType()
 
 
+class ZeroMQPullBindQueue(ZeroMQPullQueue):
+  """A Plaso queue backed by a ZeroMQ PULL socket that binds to a port.
+
+  This queue may only be used to pop items, not to push.
+  """
+  SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_BIND
+
+
 class ZeroMQPullConnectQueue(ZeroMQPullQueue):
   """A Plaso queue backed by a ZeroMQ PULL socket that connects to a port.
 
@@ -408,6 +561,64 @@ class ZeroMQPushQueue(ZeroMQQueue):
     """
     raise errors.WrongQueueType()
 
+  def _SendPendingItems(self, block=True):
+    """Sends the items pending to be sent.
+
+    Args:
+      block (Optional[bool]): whether the send should be performed in blocking
+          or non-block mode.
+
+    Raises:
+      KeyboardInterrupt: if the process is sent a KeyboardInterrupt while
+          sending the items.
+      QueueFull: if it was not possible to send the items within the timeout.
+    """
+    last_retry_timestamp = time.time() + self.timeout_seconds
+    while not self._terminate_event.is_set():
+      try:
+        send_successful = self._SendItems(
+            self._zmq_socket, self._pending_items, block)
+        if send_successful:
+          # The items are only removed after they were sent, so that items
+          # that could not be sent within the timeout are not lost.
+          self._pending_items = []
+          break
+
+        if time.time() > last_retry_timestamp:
+          logging.error(u'{0:s} unable to push item, raising.'.format(
+              self.name))
+          raise errors.QueueFull
+
+      except KeyboardInterrupt:
+        self.Close(abort=True)
+        raise
+
+  def Close(self, abort=False):
+    """Closes the queue.
+
+    Items that are pending to be sent are sent first, unless the close
+    is the result of an abort.
+
+    Args:
+      abort (Optional[bool]): whether the Close is the result of an abort
+          condition. If True, queue contents may be lost.
+
+    Raises:
+      QueueAlreadyClosed: If the queue is not started, or has already been
+          closed.
+      RuntimeError: if closed or terminate event is missing.
+    """
+    if (not abort and self._pending_items and self._zmq_socket and
+        self._closed_event and not self._closed_event.is_set()):
+      number_of_pending_items = len(self._pending_items)
+      try:
+        self._SendPendingItems()
+      except errors.QueueFull:
+        logging.error(u'{0:s} unable to send {1:d} pending items.'.format(
+            self.name, number_of_pending_items))
+
+    super(ZeroMQPushQueue, self).Close(abort=abort)
+
   def PushItem(self, item, block=True):
     """Push an item on to the queue.
 
@@ -436,21 +647,8 @@ class ZeroMQPushQueue(ZeroMQQueue):
     logging.debug(
         u'Push on {0:s} queue, port {1:d}'.format(self.name, self.port))
 
-    last_retry_timestamp = time.time() + self.timeout_seconds
-    while not self._terminate_event.is_set():
-      try:
-        send_successful = self._SendItem(self._zmq_socket, item, block)
-        if send_successful:
-          break
-
-        if time.time() > last_retry_timestamp:
-          logging.error(u'{0:s} unable to push item, raising.'.format(
-              self.name))
-          raise errors.QueueFull
-
-      except KeyboardInterrupt:
-        self.Close(abort=True)
-        raise
+    if self._AddPendingItem(item):
+      self._SendPendingItems(block=block)
 
 
 class ZeroMQPushBindQueue(ZeroMQPushQueue):
@@ -461,6 +659,14 @@ class ZeroMQPushBindQueue(ZeroMQPushQueue):
   SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_BIND
 
 
+class ZeroMQPushConnectQueue(ZeroMQPushQueue):
+  """A Plaso queue backed by a ZeroMQ PUSH socket that connects to a port.
+
+  This queue may only be used to push items, not to pop.
+  """
+  SOCKET_CONNECTION_TYPE = ZeroMQQueue.SOCKET_CONNECTION_CONNECT
+
+
 class ZeroMQRequestQueue(ZeroMQQueue):
   """Parent class for Plaso queues backed by ZeroMQ REQ sockets.
 
@@ -490,6 +696,9 @@ class ZeroMQRequestQueue(ZeroMQQueue):
       RuntimeError: if terminate event is missing.
       zmq.error.ZMQError: if an error occurs in ZeroMQ.
     """
+    if self._received_items:
+      return self._received_items.popleft()
+
     if not self._zmq_socket:
       self._CreateZMQSocket()
 
@@ -499,10 +708,12 @@ class ZeroMQRequestQueue(ZeroMQQueue):
     logging.debug(u'Pop on {0:s} queue, port {1:d}'.format(
         self.name, self.port))
 
+    request_frames = self._SerializeItems([None])
+
     last_retry_time = time.time() + self.timeout_seconds
     while not self._terminate_event.is_set():
       try:
-        self._zmq_socket.send_pyobj(None)
+        self._zmq_socket.send_multipart(request_frames)
         break
 
       except zmq.error.Again:
@@ -516,7 +727,10 @@ class ZeroMQRequestQueue(ZeroMQQueue):
 
     while not self._terminate_event.is_set():
       try:
-        return self._ReceiveItemOnActivity(self._zmq_socket)
+        items = self._ReceiveItemsOnActivity(self._zmq_socket)
+        self._received_items.extend(items)
+        return self._received_items.popleft()
+
       except errors.QueueEmpty:
         continue
 
@@ -559,12 +773,17 @@ class ZeroMQBufferedQueue(ZeroMQQueue):
   """
 
   def __init__(
-      self, buffer_timeout_seconds=2, buffer_max_size=10000, delay_open=True,
-      linger_seconds=10, maximum_items=1000, name=u'Unnamed', port=None,
-      timeout_seconds=5):
+      self, batch_latency_seconds=0.1, batch_size=1, buffer_timeout_seconds=2,
+      buffer_max_size=10000, delay_open=True, host=None, linger_seconds=10,
+      maximum_items=1000, name=u'Unnamed', port=None,
+      serializer=ZeroMQQueue.SERIALIZER_PICKLE, timeout_seconds=5):
     """Initializes a buffered, ZeroMQ backed queue.
 
     Args:
+      batch_latency_seconds (Optional[float]): maximum number of seconds
+          buffered items are held back to be sent in a batch.
+      batch_size (Optional[int]): maximum number of items sent in a single
+          ZeroMQ message, where 1 represents that items are not batched.
       buffer_max_size (Optional[int]): maximum number of items to store in
           the buffer, before or after they are sent/received via ZeroMQ.
       buffer_timeout_seconds(Optional[int]): number of seconds to wait when
@@ -573,6 +792,9 @@ class ZeroMQBufferedQueue(ZeroMQQueue):
           the first time the queue is pushed to or popped from, rather than at
           queue object initialization. This is useful if a queue needs to be
           passed to a child process from a parent process.
+      host (Optional[str]): host name or IP address that the queue binds or
+          connects to, where "*" represents all interfaces when binding and
+          None represents the local machine (127.0.0.1).
       linger_seconds (Optional[int]): number of seconds that the underlying
           ZeroMQ socket can remain open after the queue object has been closed,
           to allow queued items to be transferred to other ZeroMQ sockets.
@@ -583,6 +805,8 @@ class ZeroMQBufferedQueue(ZeroMQQueue):
       name (Optional[str]): name to identify the queue.
       port (Optional[int]): The TCP port to use for the queue. None indicates
           that the queue should choose a random port to bind to.
+      serializer (Optional[str]): serializer of the items, either "pickle" or
+          "json".
       timeout_seconds (Optional[int]): number of seconds that calls to PopItem
           and PushItem may block for, before returning queue.QueueEmpty.
     """
@@ -593,9 +817,10 @@ class ZeroMQBufferedQueue(ZeroMQQueue):
     # We need to set up the internal buffer queue before we call super, so that
     # if the call to super opens the ZMQSocket, the backing thread will work.
     super(ZeroMQBufferedQueue, self).__init__(
-        delay_open=delay_open, linger_seconds=linger_seconds,
+        batch_latency_seconds=batch_latency_seconds, batch_size=batch_size,
+        delay_open=delay_open, host=host, linger_seconds=linger_seconds,
         maximum_items=maximum_items, name=name, port=port,
-        timeout_seconds=timeout_seconds)
+        serializer=serializer, timeout_seconds=timeout_seconds)
 
   def _CreateZMQSocket(self):
     """Creates a ZeroMQ socket as well as a regular queue and a thread."""
@@ -688,24 +913,53 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
 
     logging.debug(u'{0:s} responder thread started'.format(self.name))
 
-    item = None
+    items = []
+    next_item = None
     while not self._terminate_event.is_set():
-      if not item:
-        try:
-          if self._closed_event.is_set():
-            item = source_queue.get_nowait()
-          else:
-            item = source_queue.get(True, self._buffer_timeout_seconds)
-
-        except Queue.Empty:
-          if self._closed_event.is_set():
+      if not items:
+        if next_item:
+          item = next_item
+          next_item = None
+
+        else:
+          try:
+            if self._closed_event.is_set():
+              item = source_queue.get_nowait()
+            else:
+              item = source_queue.get(True, self._buffer_timeout_seconds)
+
+          except Queue.Empty:
+            if self._closed_event.is_set():
+              break
+
+            continue
+
+        items.append(item)
+
+        # A queue abort item is sent by itself since every requester
+        # is expected to receive one.
+        last_batch_time = time.time() + self._batch_latency_seconds
+        while (len(items) < self._batch_size and
+               not isinstance(items[0], plaso_queue.QueueAbort)):
+          try:
+            batch_timeout = last_batch_time - time.time()
+            if self._closed_event.is_set() or batch_timeout <= 0:
+              item = source_queue.get_nowait()
+            else:
+              item = source_queue.get(True, batch_timeout)
+
+          except Queue.Empty:
+            break
+
+          if isinstance(item, plaso_queue.QueueAbort):
+            next_item = item
             break
 
-          continue
+          items.append(item)
 
       try:
-        # We need to receive a request before we can reply with the item.
-        self._ReceiveItemOnActivity(self._zmq_socket)
+        # We need to receive a request before we can reply with the items.
+        self._ReceiveItemsOnActivity(self._zmq_socket)
 
       except errors.QueueEmpty:
         logging.warn(u'{0:s} timeout waiting for a request.'.format(self.name))
@@ -714,8 +968,8 @@ class ZeroMQBufferedReplyQueue(ZeroMQBufferedQueue):
 
         continue
 
-      sent_successfully = self._SendItem(self._zmq_socket, item)
-      item = None
+      sent_successfully = self._SendItems(self._zmq_socket, items)
+      items = []
       if not sent_successfully:
         logging.error(u'Queue {0:s} unable to send item.'.format(self.name))
         break
@@ -4,6 +4,7 @@
 import abc
 
 from plaso.lib import errors
+from plaso.lib import filter_compiler
 from plaso.lib import pfilter
 
 
@@ -37,6 +38,11 @@ class FilterObject(object):
     """The row limit."""
     return 0
 
+  @property
+  def matcher(self):
+    """CompiledFilter: compiled filter or None if not compiled."""
+    return self._matcher
+
   @property
   def separator(self):
     """The output field separator value."""
@@ -49,11 +55,12 @@ class FilterObject(object):
       filter_expression: string that contains the filter expression.
 
     Returns:
-      A filter object (instance of objectfilter.TODO) or None.
+      CompiledFilter: compiled filter or None.
     """
     try:
       parser = pfilter.BaseParser(filter_expression).Parse()
-      return parser.Compile(pfilter.PlasoAttributeFilterImplementation)
+      filter_object = parser.Compile(pfilter.PlasoAttributeFilterImplementation)
+      return filter_compiler.CompiledFilter(filter_object)
 
     except errors.ParseError:
       pass
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""The formatted strings cache."""
+
+import weakref
+
+
+class _FormattedStrings(object):
+  """Class that contains the formatted strings of an event.
+
+  Attributes:
+    formatter_mediator (FormatterMediator): formatter mediator used to
+        format the messages.
+    messages (tuple[str, str]): message and short message or None if not
+        formatted.
+    sources (tuple[str, str]): short and long source or None if not
+        formatted.
+    weak_reference (weakref.ref): weak reference to the event.
+  """
+
+  def __init__(self, weak_reference):
+    """Initializes the formatted strings.
+
+    Args:
+      weak_reference (weakref.ref): weak reference to the event.
+    """
+    super(_FormattedStrings, self).__init__()
+    self.formatter_mediator = None
+    self.messages = None
+    self.sources = None
+    self.weak_reference = weak_reference
+
+
+class FormattedStringsCache(object):
+  """Class that caches the formatted strings of events.
+
+  The formatted messages and sources are cached per event for as long as
+  the event exists. This prevents that the event filter, the event buffer
+  and the output module format the same event more than once.
+
+  The cache is keyed by the identity of the event, since events that are
+  equal can have different messages. The cached strings are removed when
+  the event is garbage collected.
+  """
+
+  _formatted_strings = {}
+
+  @classmethod
+  def _GetFormattedStrings(cls, event):
+    """Retrieves the formatted strings of an event.
+
+    Args:
+      event (EventObject): event.
+
+    Returns:
+      _FormattedStrings: formatted strings or None if the event does not
+          support weak references.
+    """
+    identifier = id(event)
+    formatted_strings = cls._formatted_strings.get(identifier, None)
+    if formatted_strings and formatted_strings.weak_reference() is event:
+      return formatted_strings
+
+    formatted_strings_dict = cls._formatted_strings
+
+    def _RemoveFormattedStrings(unused_weak_reference):
+      """Removes the formatted strings once the event is garbage collected."""
+      formatted_strings_dict.pop(identifier, None)
+
+    try:
+      weak_reference = weakref.ref(event, _RemoveFormattedStrings)
+    except TypeError:
+      return
+
+    formatted_strings = _FormattedStrings(weak_reference)
+    cls._formatted_strings[identifier] = formatted_strings
+    return formatted_strings
+
+  @classmethod
+  def GetMessageStrings(cls, event_formatter, formatter_mediator, event):
+    """Retrieves the formatted message strings of an event.
+
+    Args:
+      event_formatter (EventFormatter): event formatter.
+      formatter_mediator (FormatterMediator): mediates the interactions between
+          formatters and other components, such as storage and Windows EventLog
+          resources.
+      event (EventObject): event.
+
+    Returns:
+      tuple[str, str]: message and short message.
+
+    Raises:
+      WrongFormatter: if the event cannot be formatted by the formatter.
+    """
+    formatted_strings = cls._GetFormattedStrings(event)
+    if not formatted_strings:
+      return event_formatter.GetMessages(formatter_mediator, event)
+
+    if (formatted_strings.messages is None or
+        formatted_strings.formatter_mediator is not formatter_mediator):
+      formatted_strings.messages = event_formatter.GetMessages(
+          formatter_mediator, event)
+      formatted_strings.formatter_mediator = formatter_mediator
+
+    return formatted_strings.messages
+
+  @classmethod
+  def GetSourceStrings(cls, event_formatter, event):
+    """Retrieves the formatted source strings of an event.
+
+    Args:
+      event_formatter (EventFormatter): event formatter.
+      event (EventObject): event.
+
+    Returns:
+      tuple[str, str]: short and long source.
+
+    Raises:
+      WrongFormatter: if the event cannot be formatted by the formatter.
+    """
+    formatted_strings = cls._GetFormattedStrings(event)
+    if not formatted_strings:
+      return event_formatter.GetSources(event)
+
+    if formatted_strings.sources is None:
+      formatted_strings.sources = event_formatter.GetSources(event)
+
+    return formatted_strings.sources
+
+  @classmethod
+  def Invalidate(cls, event):
+    """Invalidates the formatted strings of an event.
+
+    The formatted strings should be invalidated when the attributes of
+    the event are changed.
+
+    Args:
+      event (EventObject): event.
+    """
+    formatted_strings = cls._formatted_strings.get(id(event), None)
+    if formatted_strings and formatted_strings.weak_reference() is event:
+      formatted_strings.formatter_mediator = None
+      formatted_strings.messages = None
+      formatted_strings.sources = None
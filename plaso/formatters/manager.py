@@ -3,6 +3,7 @@
 
 import logging
 
+from plaso.formatters import cache
 from plaso.formatters import default
 
 
@@ -66,6 +67,8 @@ class FormattersManager(object):
   def GetMessageStrings(cls, formatter_mediator, event):
     """Retrieves the formatted message strings for a specific event object.
 
+    The formatted message strings are cached for as long as the event exists.
+
     Args:
       formatter_mediator (FormatterMediator): mediates the interactions between
           formatters and other components, such as storage and Windows EventLog
@@ -76,12 +79,15 @@ class FormattersManager(object):
       list[str, str]: long and short version of the message string.
     """
     formatter_object = cls.GetFormatterObject(event.data_type)
-    return formatter_object.GetMessages(formatter_mediator, event)
+    return cache.FormattedStringsCache.GetMessageStrings(
+        formatter_object, formatter_mediator, event)
 
   @classmethod
   def GetSourceStrings(cls, event):
     """Retrieves the formatted source strings for a specific event object.
 
+    The formatted source strings are cached for as long as the event exists.
+
     Args:
       event (EventObject): event.
 
@@ -91,7 +97,7 @@ class FormattersManager(object):
     # TODO: change this to return the long variant first so it is consistent
     # with GetMessageStrings.
     formatter_object = cls.GetFormatterObject(event.data_type)
-    return formatter_object.GetSources(event)
+    return cache.FormattedStringsCache.GetSourceStrings(formatter_object, event)
 
   @classmethod
   def RegisterFormatter(cls, formatter_class):
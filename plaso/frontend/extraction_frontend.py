@@ -15,6 +15,7 @@ from plaso.engine import utils as engine_utils
 from plaso.frontend import frontend
 from plaso.lib import definitions
 from plaso.lib import errors
+from plaso.multi_processing import remote_worker
 from plaso.multi_processing import task_engine as multi_process_engine
 from plaso.parsers import manager as parsers_manager
 from plaso.parsers import presets as parsers_presets
@@ -39,14 +40,18 @@ class ExtractionFrontend(frontend.Frontend):
     self._enable_profiling = False
     self._filter_expression = None
     self._filter_object = None
+    self._metrics_port = None
     self._mount_path = None
     self._parser_names = None
     self._profiling_directory = None
     self._profiling_sample_rate = self._DEFAULT_PROFILING_SAMPLE_RATE
     self._profiling_type = u'all'
+    self._remote_workers_host = None
     self._use_zeromq = True
     self._resolver_context = context.Context()
     self._show_worker_memory_information = False
+    self._task_queue_port = None
+    self._task_storage_queue_port = None
     self._text_prepend = None
 
   def _CheckStorageFile(self, storage_file_path):
@@ -97,9 +102,14 @@ class ExtractionFrontend(frontend.Frontend):
       engine = multi_process_engine.TaskMultiProcessEngine(
           debug_output=self._debug_mode,
           enable_profiling=self._enable_profiling,
+          metrics_port=self._metrics_port,
           profiling_directory=self._profiling_directory,
           profiling_sample_rate=self._profiling_sample_rate,
-          profiling_type=self._profiling_type, use_zeromq=self._use_zeromq)
+          profiling_type=self._profiling_type,
+          remote_workers_host=self._remote_workers_host,
+          task_queue_port=self._task_queue_port,
+          task_storage_queue_port=self._task_storage_queue_port,
+          use_zeromq=self._use_zeromq)
 
     return engine
 
@@ -165,6 +175,47 @@ class ExtractionFrontend(frontend.Frontend):
 
     return
 
+  def _PrepareEngine(
+      self, engine, session, source_path_specs, source_type,
+      force_preprocessing=False, timezone=u'UTC'):
+    """Prepares the knowledge base of the engine and the session.
+
+    Args:
+      engine (BaseEngine): engine to prepare.
+      session (Session): session the storage changes are part of.
+      source_path_specs (list[dfvfs.PathSpec]): path specifications of
+          the sources to process.
+      source_type (str): the dfVFS source type definition.
+      force_preprocessing (Optional[bool]): True if preprocessing should be
+          forced.
+      timezone (Optional[str]): timezone.
+    """
+    # If the source is a directory or a storage media image
+    # run pre-processing.
+    if force_preprocessing or source_type in self._SOURCE_TYPES_TO_PREPROCESS:
+      self._PreprocessSources(engine, source_path_specs)
+
+    if not session.parser_filter_expression:
+      operating_system = engine.knowledge_base.GetValue(
+          u'operating_system')
+      operating_system_product = engine.knowledge_base.GetValue(
+          u'operating_system_product')
+      operating_system_version = engine.knowledge_base.GetValue(
+          u'operating_system_version')
+      session.parser_filter_expression = self._GetParserFilterPreset(
+          operating_system, operating_system_product, operating_system_version)
+
+      if session.parser_filter_expression:
+        logging.info(u'Parser filter expression changed to: {0:s}'.format(
+            session.parser_filter_expression))
+
+    self._parser_names = []
+    for _, parser_class in parsers_manager.ParsersManager.GetParsers(
+        parser_filter_expression=session.parser_filter_expression):
+      self._parser_names.append(parser_class.NAME)
+
+    self._SetTimezone(engine.knowledge_base, timezone)
+
   def _PreprocessSources(self, engine, source_path_specs):
     """Preprocesses the sources.
 
@@ -294,6 +345,9 @@ class ExtractionFrontend(frontend.Frontend):
             the processing;
           * 'serializers' to profile CPU time consumed by individual
             serializers.
+          * 'tracing' to record the time spent per task, file and parser
+            as a Chrome trace. Tracing is not part of 'all' and records every
+            file regardless of the sample rate.
     """
     self._enable_profiling = True
     self._profiling_directory = profiling_directory
@@ -361,13 +415,71 @@ class ExtractionFrontend(frontend.Frontend):
     """
     return parsers_manager.ParsersManager.GetNamesOfParsersWithPlugins()
 
+  def ProcessRemoteTasks(
+      self, session, source_path_specs, source_type, foreman_host,
+      task_queue_port, task_storage_queue_port, force_preprocessing=False,
+      hasher_names_string=None, number_of_extraction_workers=1,
+      process_archive_files=False, temporary_directory=None, timezone=u'UTC',
+      yara_rules_string=None):
+    """Processes tasks of a remote foreman.
+
+    The sources must be the same as those processed by the foreman, since
+    the path specifications of the tasks must resolve on this host.
+
+    Args:
+      session (Session): session the storage changes are part of.
+      source_path_specs (list[dfvfs.PathSpec]): path specifications of
+          the sources processed by the foreman.
+      source_type (str): the dfVFS source type definition.
+      foreman_host (str): host name or IP address of the foreman.
+      task_queue_port (int): TCP port of the task queue of the foreman.
+      task_storage_queue_port (int): TCP port of the task storage queue of
+          the foreman.
+      force_preprocessing (Optional[bool]): True if preprocessing should be
+          forced.
+      hasher_names_string (Optional[str]): comma separated string of names
+          of hashers to use during processing.
+      number_of_extraction_workers (Optional[int]): number of extraction
+          workers to run.
+      process_archive_files (Optional[bool]): True if archive files should be
+          scanned for file entries.
+      temporary_directory (Optional[str]): path of the directory for temporary
+          files.
+      timezone (Optional[str]): timezone.
+      yara_rules_string (Optional[str]): unparsed yara rule definitions.
+    """
+    # The engine is only used to preprocess the sources.
+    engine = self._CreateEngine(True)
+
+    self._PrepareEngine(
+        engine, session, source_path_specs, source_type,
+        force_preprocessing=force_preprocessing, timezone=timezone)
+
+    worker_host = remote_worker.RemoteWorkerHost(
+        foreman_host, task_queue_port, task_storage_queue_port,
+        debug_output=self._debug_mode)
+
+    logging.debug(u'Starting remote extraction workers.')
+
+    worker_host.ProcessTasks(
+        session.identifier, engine.knowledge_base,
+        filter_object=self._filter_object,
+        hasher_names_string=hasher_names_string, mount_path=self._mount_path,
+        number_of_worker_processes=number_of_extraction_workers,
+        parser_filter_expression=session.parser_filter_expression,
+        preferred_year=session.preferred_year,
+        process_archive_files=process_archive_files,
+        temporary_directory=temporary_directory,
+        text_prepend=self._text_prepend, yara_rules_string=yara_rules_string)
+
   def ProcessSources(
       self, session, storage_writer, source_path_specs, source_type,
       enable_sigsegv_handler=False, force_preprocessing=False,
-      hasher_names_string=None, number_of_extraction_workers=0,
+      hasher_names_string=None, maximum_number_of_extraction_workers=0,
+      number_of_extraction_workers=0, number_of_remote_extraction_workers=0,
       process_archive_files=False, single_process_mode=False,
       status_update_callback=None, temporary_directory=None, timezone=u'UTC',
-      yara_rules_string=None):
+      worker_memory_limit=None, yara_rules_string=None):
     """Processes the sources.
 
     Args:
@@ -382,8 +494,13 @@ class ExtractionFrontend(frontend.Frontend):
           forced.
       hasher_names_string (Optional[str]): comma separated string of names
           of hashers to use during processing.
+      maximum_number_of_extraction_workers (Optional[int]): maximum number of
+          extraction workers to run. If larger than the number of extraction
+          workers, the number is adjusted during processing.
       number_of_extraction_workers (Optional[int]): number of extraction
           workers to run. If 0, the number will be selected automatically.
+      number_of_remote_extraction_workers (Optional[int]): number of
+          extraction workers that run on remote worker hosts.
       process_archive_files (Optional[bool]): True if archive files should be
           scanned for file entries.
       single_process_mode (Optional[bool]): True if the front-end should
@@ -393,6 +510,9 @@ class ExtractionFrontend(frontend.Frontend):
       temporary_directory (Optional[str]): path of the directory for temporary
           files.
       timezone (Optional[datetime.tzinfo]): timezone.
+      worker_memory_limit (Optional[int]): maximum amount of resident memory,
+          in bytes, an extraction worker can use before it is replaced,
+          where None represents no limit.
       yara_rules_string (Optional[str]): unparsed yara rule definitions.
 
     Returns:
@@ -403,37 +523,17 @@ class ExtractionFrontend(frontend.Frontend):
                           file system.
       UserAbort: if the user initiated an abort.
     """
-    if source_type == dfvfs_definitions.SOURCE_TYPE_FILE:
-      # No need to multi process a single file source.
+    # No need to multi process a single file source, unless remote worker
+    # processes are waiting for its tasks.
+    if (source_type == dfvfs_definitions.SOURCE_TYPE_FILE and
+        not self._remote_workers_host):
       single_process_mode = True
 
     engine = self._CreateEngine(single_process_mode)
 
-    # If the source is a directory or a storage media image
-    # run pre-processing.
-    if force_preprocessing or source_type in self._SOURCE_TYPES_TO_PREPROCESS:
-      self._PreprocessSources(engine, source_path_specs)
-
-    if not session.parser_filter_expression:
-      operating_system = engine.knowledge_base.GetValue(
-          u'operating_system')
-      operating_system_product = engine.knowledge_base.GetValue(
-          u'operating_system_product')
-      operating_system_version = engine.knowledge_base.GetValue(
-          u'operating_system_version')
-      session.parser_filter_expression = self._GetParserFilterPreset(
-          operating_system, operating_system_product, operating_system_version)
-
-      if session.parser_filter_expression:
-        logging.info(u'Parser filter expression changed to: {0:s}'.format(
-            session.parser_filter_expression))
-
-    self._parser_names = []
-    for _, parser_class in parsers_manager.ParsersManager.GetParsers(
-        parser_filter_expression=session.parser_filter_expression):
-      self._parser_names.append(parser_class.NAME)
-
-    self._SetTimezone(engine.knowledge_base, timezone)
+    self._PrepareEngine(
+        engine, session, source_path_specs, source_type,
+        force_preprocessing=force_preprocessing, timezone=timezone)
 
     if session.filter_file:
       path_attributes = engine.knowledge_base.GetPathAttributes()
@@ -471,7 +571,11 @@ class ExtractionFrontend(frontend.Frontend):
           filter_find_specs=filter_find_specs,
           filter_object=self._filter_object,
           hasher_names_string=hasher_names_string,
+          maximum_number_of_worker_processes=(
+              maximum_number_of_extraction_workers),
           mount_path=self._mount_path,
+          number_of_remote_worker_processes=(
+              number_of_remote_extraction_workers),
           number_of_worker_processes=number_of_extraction_workers,
           parser_filter_expression=session.parser_filter_expression,
           preferred_year=session.preferred_year,
@@ -480,6 +584,7 @@ class ExtractionFrontend(frontend.Frontend):
           show_memory_usage=self._show_worker_memory_information,
           temporary_directory=temporary_directory,
           text_prepend=self._text_prepend,
+          worker_memory_limit=worker_memory_limit,
           yara_rules_string=yara_rules_string)
 
     return processing_status
@@ -492,6 +597,34 @@ class ExtractionFrontend(frontend.Frontend):
     """
     self._debug_mode = enable_debug
 
+  def SetMetricsPort(self, metrics_port):
+    """Sets the port of the processing metrics HTTP server.
+
+    Args:
+      metrics_port (int): TCP port of the local HTTP server that exposes
+          processing metrics, where 0 represents a random port and None
+          represents that the metrics are not exposed.
+    """
+    self._metrics_port = metrics_port
+
+  def SetRemoteWorkers(
+      self, remote_workers_host, task_queue_port=None,
+      task_storage_queue_port=None):
+    """Sets the host and ports remote worker processes connect to.
+
+    Args:
+      remote_workers_host (str): host name or IP address the task and task
+          storage queues bind to, where "*" represents all interfaces and
+          None represents that remote worker processes are not used.
+      task_queue_port (Optional[int]): TCP port of the task queue, where None
+          represents a random port.
+      task_storage_queue_port (Optional[int]): TCP port of the task storage
+          queue, where None represents a random port.
+    """
+    self._remote_workers_host = remote_workers_host
+    self._task_queue_port = task_queue_port
+    self._task_storage_queue_port = task_storage_queue_port
+
   def SetShowMemoryInformation(self, show_memory=True):
     """Sets a flag telling the worker monitor to show memory information.
 
@@ -4,11 +4,19 @@
 import abc
 import collections
 import logging
+import multiprocessing
 import os
+import uuid
+
+try:
+  from pysqlite2 import dbapi2 as sqlite3
+except ImportError:
+  import sqlite3
 
 import pysigscan
 
 from dfvfs.helpers import file_system_searcher
+from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
@@ -419,8 +427,266 @@ class FileEntryFilterCollection(object):
         file_entry_filter.Print(output_writer)
 
 
+class ExportedFileInformation(object):
+  """Class that contains the information of an exported file.
+
+  Attributes:
+    inode (int): inode of the file.
+    mtime (int): last modification time of the file, in number of seconds
+        since January 1, 1970 00:00:00 UTC.
+    mtime_nano (int): fraction of the last modification time of the file,
+        in number of 100 nano seconds.
+    path (str): path of the file within the source.
+    size (int): size of the file content.
+    source (str): location of the source, such as the path of the storage
+        media image, the file is exported from.
+    volume (str): comparable of the path specification of the volume,
+        such as a partition, the file is exported from or None if the file
+        is not exported from a volume. The volume shadow snapshot layer is
+        not part of the volume.
+    vss_store_number (int): number of the volume shadow snapshot store
+        the file is exported from or None if the file is not exported
+        from a volume shadow snapshot.
+  """
+
+  def __init__(
+      self, inode=0, mtime=None, mtime_nano=None, path=None, size=None,
+      source=None, volume=None, vss_store_number=None):
+    """Initializes the exported file information.
+
+    Args:
+      inode (Optional[int]): inode of the file.
+      mtime (Optional[int]): last modification time of the file, in number
+          of seconds since January 1, 1970 00:00:00 UTC.
+      mtime_nano (Optional[int]): fraction of the last modification time
+          of the file, in number of 100 nano seconds.
+      path (Optional[str]): path of the file within the source.
+      size (Optional[int]): size of the file content.
+      source (Optional[str]): location of the source the file is exported
+          from.
+      volume (Optional[str]): comparable of the path specification of
+          the volume the file is exported from.
+      vss_store_number (Optional[int]): number of the volume shadow snapshot
+          store the file is exported from.
+    """
+    super(ExportedFileInformation, self).__init__()
+    self.inode = inode
+    self.mtime = mtime
+    self.mtime_nano = mtime_nano
+    self.path = path
+    self.size = size
+    self.source = source
+    self.volume = volume
+    self.vss_store_number = vss_store_number
+
+
+class ContentAddressedExportStore(object):
+  """Class that implements a content-addressed export store.
+
+  The content of an exported file is stored once, under its SHA-256 digest
+  hash, in: content/<first 2 characters of the hash>/<hash>. An SQLite
+  database, index.db, maps the source, volume, path, volume shadow snapshot
+  store and inode of every exported file to the digest hash of its content.
+
+  Since the index is persistent, content that was stored by a previous
+  export, for example of another volume shadow snapshot or another storage
+  media image, is not stored again. A file of which the source, volume, path,
+  inode, size and last modification time are already in the index, is not
+  read at all.
+  """
+
+  _CREATE_FILES_TABLE_QUERY = (
+      u'CREATE TABLE IF NOT EXISTS files ('
+      u'source TEXT, volume TEXT, path TEXT, vss_store_number INTEGER, '
+      u'inode INTEGER, size INTEGER, mtime INTEGER, mtime_nano INTEGER, '
+      u'digest_hash TEXT, '
+      u'UNIQUE (source, volume, path, vss_store_number, inode))')
+
+  _CREATE_FILES_INDEX_QUERY = (
+      u'CREATE INDEX IF NOT EXISTS files_digest_hash ON files (digest_hash)')
+
+  _INSERT_FILE_QUERY = (
+      u'INSERT OR REPLACE INTO files (source, volume, path, vss_store_number, '
+      u'inode, size, mtime, mtime_nano, digest_hash) '
+      u'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)')
+
+  _SELECT_DIGEST_HASH_QUERY = (
+      u'SELECT digest_hash FROM files WHERE source = ? AND volume = ? AND '
+      u'path = ? AND inode = ? AND size = ? AND mtime = ? AND '
+      u'mtime_nano = ? LIMIT 1')
+
+  _SELECT_FILES_QUERY = (
+      u'SELECT source, volume, path, vss_store_number, inode FROM files '
+      u'WHERE digest_hash = ? '
+      u'ORDER BY source, volume, path, vss_store_number')
+
+  # Number of changes to the index after which the changes are committed.
+  _MAXIMUM_NUMBER_OF_UNCOMMITTED_CHANGES = 1000
+
+  def __init__(self, path):
+    """Initializes the content-addressed export store.
+
+    Args:
+      path (str): path of the directory of the export store.
+    """
+    super(ContentAddressedExportStore, self).__init__()
+    self._connection = None
+    self._content_path = os.path.join(path, u'content')
+    self._index_path = os.path.join(path, u'index.db')
+    self._number_of_uncommitted_changes = 0
+    self.temporary_directory = os.path.join(path, u'tmp')
+
+  def AddContent(self, path, digest_hash):
+    """Adds content to the store.
+
+    Args:
+      path (str): path of the file that contains the content, which is moved
+          into the store or removed if the store already contains the content.
+      digest_hash (str): hexadecimal representation of the SHA-256 hash of
+          the content.
+
+    Returns:
+      bool: True if the content was added or False if the store already
+          contains the content.
+    """
+    content_path = self.GetContentPath(digest_hash)
+    if os.path.exists(content_path):
+      os.remove(path)
+      return False
+
+    content_directory = os.path.dirname(content_path)
+    if not os.path.isdir(content_directory):
+      os.makedirs(content_directory)
+
+    os.rename(path, content_path)
+    return True
+
+  def AddFile(self, digest_hash, file_information):
+    """Adds a file to the index.
+
+    Args:
+      digest_hash (str): hexadecimal representation of the SHA-256 hash of
+          the file content.
+      file_information (ExportedFileInformation): exported file information.
+    """
+    # Unique constraints do not apply to NULL values, hence a file that is
+    # not exported from a volume is stored with an empty volume and a file
+    # that is not exported from a volume shadow snapshot with number 0.
+    self._connection.execute(self._INSERT_FILE_QUERY, (
+        file_information.source, file_information.volume or u'',
+        file_information.path, file_information.vss_store_number or 0,
+        file_information.inode or 0,
+        file_information.size, file_information.mtime,
+        file_information.mtime_nano or 0, digest_hash))
+
+    self._number_of_uncommitted_changes += 1
+    if (self._number_of_uncommitted_changes >=
+        self._MAXIMUM_NUMBER_OF_UNCOMMITTED_CHANGES):
+      self._connection.commit()
+      self._number_of_uncommitted_changes = 0
+
+  def Close(self):
+    """Closes the export store."""
+    if not self._connection:
+      return
+
+    self._connection.commit()
+    self._connection.close()
+    self._connection = None
+    self._number_of_uncommitted_changes = 0
+
+  def GetContentPath(self, digest_hash):
+    """Retrieves the path of content in the store.
+
+    Args:
+      digest_hash (str): hexadecimal representation of the SHA-256 hash of
+          the content.
+
+    Returns:
+      str: path of the content.
+    """
+    return os.path.join(self._content_path, digest_hash[:2], digest_hash)
+
+  def GetDigestHash(self, file_information):
+    """Retrieves the digest hash of a file that was exported before.
+
+    Args:
+      file_information (ExportedFileInformation): exported file information.
+
+    Returns:
+      str: hexadecimal representation of the SHA-256 hash of the file content
+          or None if a file with the same source, volume, path, inode, size
+          and last modification time was not exported before.
+    """
+    if file_information.mtime is None or file_information.size is None:
+      return
+
+    cursor = self._connection.execute(self._SELECT_DIGEST_HASH_QUERY, (
+        file_information.source, file_information.volume or u'',
+        file_information.path, file_information.inode or 0,
+        file_information.size,
+        file_information.mtime, file_information.mtime_nano or 0))
+
+    row = cursor.fetchone()
+    if not row:
+      return
+
+    digest_hash = row[0]
+    if not os.path.exists(self.GetContentPath(digest_hash)):
+      return
+
+    return digest_hash
+
+  def GetFiles(self, digest_hash):
+    """Retrieves the files with specific content.
+
+    Args:
+      digest_hash (str): hexadecimal representation of the SHA-256 hash of
+          the content.
+
+    Returns:
+      list[tuple[str, str, str, int, int]]: source, volume, path, volume
+          shadow snapshot store number and inode of the files, where an empty
+          volume represents a file that is not exported from a volume and
+          store number 0 a file that is not exported from a volume shadow
+          snapshot.
+    """
+    cursor = self._connection.execute(self._SELECT_FILES_QUERY, (digest_hash, ))
+    return cursor.fetchall()
+
+  def Open(self):
+    """Opens the export store.
+
+    Raises:
+      IOError: if the export store is already opened.
+    """
+    if self._connection:
+      raise IOError(u'Export store already opened.')
+
+    for path in (self._content_path, self.temporary_directory):
+      if not os.path.isdir(path):
+        os.makedirs(path)
+
+    self._connection = sqlite3.connect(self._index_path)
+    self._connection.execute(self._CREATE_FILES_TABLE_QUERY)
+    self._connection.execute(self._CREATE_FILES_INDEX_QUERY)
+    self._connection.commit()
+
+
 class FileSaver(object):
-  """Class that is used to save files."""
+  """Class that is used to save files.
+
+  The content of a file is read once, the digest hash used to detect
+  duplicate files is calculated while the content is copied to a temporary
+  file. The temporary file is renamed to the target file or removed if
+  the file is a duplicate.
+
+  Files can be exported concurrently by worker processes, in which case
+  the files are saved when the worker processes are done with them.
+
+  If an export store is used, the content of the files is saved in the
+  content-addressed export store instead of in a directory hierarchy.
+  """
 
   _BAD_CHARACTERS = frozenset([
       u'\x00', u'\x01', u'\x02', u'\x03', u'\x04', u'\x05', u'\x06', u'\x07',
@@ -431,66 +697,125 @@ class FileSaver(object):
       u'?', u'@', u'|', u'~', u'\x7f'])
 
   _COPY_BUFFER_SIZE = 32768
-  _READ_BUFFER_SIZE = 4096
 
-  def __init__(self, skip_duplicates=False):
+  # Maximum number of files, per worker process, that are queued for export.
+  _MAXIMUM_NUMBER_OF_QUEUED_FILES_PER_WORKER = 16
+
+  # Prefix of the name of the temporary file the content is copied to.
+  _TEMPORARY_FILENAME_PREFIX = u'.image_export-'
+
+  def __init__(
+      self, export_store=None, number_of_workers=0, skip_duplicates=False):
     """Initializes the file saver object.
 
     Args:
-      skip_duplicates (bool): True if duplicate file content should be skipped.
+      export_store (Optional[ContentAddressedExportStore]): content-addressed
+          export store, where None represents files are saved in
+          the destination directory.
+      number_of_workers (Optional[int]): number of worker processes to export
+          files concurrently, where 0 represents files are exported by
+          the current process.
+      skip_duplicates (Optional[bool]): True if duplicate file content should
+          be skipped.
     """
     super(FileSaver, self).__init__()
     self._digest_hashes = {}
+    self._export_store = export_store
+    self._number_of_workers = number_of_workers
+    self._queued_exports = collections.deque()
     self._skip_duplicates = skip_duplicates
+    self._worker_pool = None
 
-  def _CalculateHash(self, file_object):
-    """Calculates a MD5 hash of the contents of given file object.
+  @classmethod
+  def _CopyFileObject(
+      cls, input_file_object, output_path, calculate_hash=False):
+    """Copies the content of a file-like object to a file.
 
     Args:
-      file_object (file): file-like object.
+      input_file_object (file): input file-like object.
+      output_path (str): path of the output file.
+      calculate_hash (Optional[bool]): True if the digest hash of the content
+          should be calculated while it is copied.
 
     Returns:
-      str: hexadecimal representation of the MD5 hash.
+      str: hexadecimal representation of the SHA-256 hash of the content or
+          None if the hash was not calculated.
     """
-    hasher_object = hashers_manager.HashersManager.GetHasher(u'sha256')
-    file_object.seek(0, os.SEEK_SET)
+    hasher_object = None
+    if calculate_hash:
+      hasher_object = hashers_manager.HashersManager.GetHasher(u'sha256')
+
+    with open(output_path, 'wb') as output_file_object:
+      input_file_object.seek(0, os.SEEK_SET)
 
-    data = file_object.read(self._READ_BUFFER_SIZE)
-    while data:
-      hasher_object.Update(data)
-      data = file_object.read(self._READ_BUFFER_SIZE)
+      data = input_file_object.read(cls._COPY_BUFFER_SIZE)
+      while data:
+        if hasher_object:
+          hasher_object.Update(data)
+        output_file_object.write(data)
+        data = input_file_object.read(cls._COPY_BUFFER_SIZE)
+
+    if not hasher_object:
+      return
 
     return hasher_object.GetStringDigest()
 
-  def _CopyFileObject(self, input_file_object, output_path):
-    """Copies the content of a file-like object to a file.
+  def _GetFileInformation(self, file_entry):
+    """Retrieves the exported file information of a file entry.
 
     Args:
-      input_file_object (file): input file-like object.
-      output_path (str): path of the output file.
+      file_entry (dfvfs.FileEntry): file entry of the source file.
+
+    Returns:
+      ExportedFileInformation: exported file information.
     """
-    with open(output_path, 'wb') as output_file_object:
-      input_file_object.seek(0, os.SEEK_SET)
+    volume = None
+    vss_store_number = None
+
+    # The volume is identified by the path specification just above the file
+    # system, without the volume shadow snapshot, since the same path and
+    # inode can exist in multiple partitions of a storage media image.
+    path_spec = file_entry.path_spec
+    if path_spec.HasParent():
+      volume_path_spec = path_spec.parent
+      if (volume_path_spec.type_indicator ==
+          dfvfs_definitions.TYPE_INDICATOR_VSHADOW and
+          volume_path_spec.HasParent()):
+        volume_path_spec = volume_path_spec.parent
+      volume = volume_path_spec.comparable
+
+    while path_spec.HasParent():
+      if path_spec.type_indicator == dfvfs_definitions.TYPE_INDICATOR_VSHADOW:
+        store_index = getattr(path_spec, u'store_index', None)
+        if store_index is not None:
+          vss_store_number = store_index + 1
+
+      path_spec = path_spec.parent
 
-      data = input_file_object.read(self._COPY_BUFFER_SIZE)
-      while data:
-        output_file_object.write(data)
-        data = input_file_object.read(self._COPY_BUFFER_SIZE)
+    stat_object = file_entry.GetStat()
 
-  def WriteFile(self, source_path_spec, destination_path, filename_prefix=u''):
-    """Writes the contents of the source to the destination file.
+    return ExportedFileInformation(
+        inode=getattr(stat_object, u'ino', 0),
+        mtime=getattr(stat_object, u'mtime', None),
+        mtime_nano=getattr(stat_object, u'mtime_nano', None),
+        path=getattr(file_entry.path_spec, u'location', None),
+        size=getattr(stat_object, u'size', None),
+        source=getattr(path_spec, u'location', None), volume=volume,
+        vss_store_number=vss_store_number)
+
+  def _GetTargetPath(self, file_entry, destination_path, filename_prefix):
+    """Retrieves the path of the target file and creates its directory.
 
     Args:
-      source_path_spec (dfvfs.PathSpec): path specification of the source file.
-      destination_path (str): path of the destination file.
-      filename_prefix (Optional[str]): filename prefix.
-    """
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(source_path_spec)
-    if not file_entry.IsFile():
-      return
+      file_entry (dfvfs.FileEntry): file entry of the source file.
+      destination_path (str): path of the destination directory.
+      filename_prefix (str): filename prefix.
 
+    Returns:
+      str: path of the target file.
+    """
     file_system = file_entry.GetFileSystem()
-    path = getattr(source_path_spec, u'location', None)
+    path = getattr(file_entry.path_spec, u'location', None)
     path_segments = file_system.SplitPath(path)
 
     # Sanitize each path segment.
@@ -513,45 +838,232 @@ class FileSaver(object):
     elif not os.path.isdir(target_directory):
       os.makedirs(target_directory)
 
-    if self._skip_duplicates and file_entry.IsFile():
-      file_object = file_entry.GetFileObject()
-      if not file_object:
-        return
+    return os.path.join(target_directory, target_filename)
 
-      try:
-        digest_hash = self._CalculateHash(file_object)
-      except IOError as exception:
-        logging.error((
-            u'[skipping] unable to calculate MD5 of file: {0:s} '
-            u'with error: {1:s}').format(path, exception))
-        return
-      finally:
-        file_object.close()
+  def _SaveExportedFile(self, exported_file, target_path, file_information):
+    """Saves an exported file as the target file or in the export store.
 
-      stat = file_entry.GetStat()
-      inode = getattr(stat, u'ino', 0)
+    Args:
+      exported_file (tuple[str, str, int]): path of the written file, digest
+          hash of the file content and inode of the source file or None if
+          the file could not be exported.
+      target_path (str): path of the target file or None if the file is
+          saved in the export store.
+      file_information (ExportedFileInformation): exported file information
+          or None if the file is not saved in the export store.
+    """
+    if not exported_file:
+      return
 
-      if inode in self._digest_hashes:
-        if digest_hash in self._digest_hashes[inode]:
-          return
-        self._digest_hashes[inode].append(digest_hash)
-      else:
-        self._digest_hashes[inode] = [digest_hash]
+    output_path, digest_hash, inode = exported_file
+    if file_information:
+      self._export_store.AddContent(output_path, digest_hash)
+      self._export_store.AddFile(digest_hash, file_information)
+      return
+
+    if output_path == target_path:
+      return
+
+    digest_hashes = self._digest_hashes.setdefault(inode, set())
+    if digest_hash in digest_hashes:
+      os.remove(output_path)
+      return
+
+    digest_hashes.add(digest_hash)
+
+    try:
+      os.rename(output_path, target_path)
+    except OSError:
+      # On Windows an existing file cannot be replaced by rename.
+      os.remove(target_path)
+      os.rename(output_path, target_path)
+
+  def _SaveQueuedExport(self):
+    """Saves the file of the oldest queued export once it is exported."""
+    result, target_path, file_information = self._queued_exports.popleft()
+    self._SaveExportedFile(result.get(), target_path, file_information)
+
+  @classmethod
+  def ExportFile(
+      cls, source_path_spec, target_path, calculate_hash=False,
+      resolver_context=None, temporary_directory=None):
+    """Exports the content of a source file.
+
+    If the digest hash of the content is calculated, the content is written
+    to a temporary file, otherwise to the target file.
+
+    Args:
+      source_path_spec (dfvfs.PathSpec): path specification of the source file.
+      target_path (str): path of the target file or None if the content is
+          only written to a temporary file.
+      calculate_hash (Optional[bool]): True if the digest hash of the content
+          should be calculated.
+      resolver_context (Optional[dfvfs.Context]): resolver context, where
+          None represents the built in context.
+      temporary_directory (Optional[str]): path of the directory of
+          the temporary file, where None represents the directory of
+          the target file.
+
+    Returns:
+      tuple[str, str, int]: path of the written file, digest hash of the file
+          content and inode of the source file or None if the file could not
+          be exported.
+    """
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        source_path_spec, resolver_context=resolver_context)
+    if not file_entry:
+      return
 
     file_object = file_entry.GetFileObject()
     if not file_object:
       return
 
+    output_path = target_path
+    if calculate_hash:
+      if not temporary_directory:
+        temporary_directory = os.path.dirname(target_path)
+
+      # The temporary file is created by open() under a unique name instead
+      # of by tempfile.mkstemp(), which restricts the mode of the file to
+      # the owner. The exported file is created with the mode the umask allows.
+      temporary_filename = u'{0:s}{1:s}'.format(
+          cls._TEMPORARY_FILENAME_PREFIX, uuid.uuid4().get_hex())
+      output_path = os.path.join(temporary_directory, temporary_filename)
+
     try:
-      target_path = os.path.join(target_directory, target_filename)
-      self._CopyFileObject(file_object, target_path)
+      digest_hash = cls._CopyFileObject(
+          file_object, output_path, calculate_hash=calculate_hash)
+
     except IOError as exception:
+      path = getattr(source_path_spec, u'location', None)
       logging.error(
           u'[skipping] unable to export file: {0:s} with error: {1:s}'.format(
               path, exception))
+
+      if output_path != target_path and os.path.exists(output_path):
+        os.remove(output_path)
+      return
+
     finally:
       file_object.close()
 
+    stat = file_entry.GetStat()
+    inode = getattr(stat, u'ino', 0)
+
+    return output_path, digest_hash, inode
+
+  def Close(self):
+    """Saves the remaining queued exports and stops the worker processes."""
+    if not self._worker_pool:
+      return
+
+    try:
+      while self._queued_exports:
+        self._SaveQueuedExport()
+
+    finally:
+      # If saving is interrupted the worker processes are stopped without
+      # waiting for the remaining queued exports.
+      self._worker_pool.terminate()
+      self._worker_pool.join()
+      self._worker_pool = None
+      self._queued_exports.clear()
+
+  def WriteFile(self, source_path_spec, destination_path, filename_prefix=u''):
+    """Writes the contents of the source to the destination file.
+
+    Args:
+      source_path_spec (dfvfs.PathSpec): path specification of the source file.
+      destination_path (str): path of the destination file.
+      filename_prefix (Optional[str]): filename prefix.
+    """
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(source_path_spec)
+    if not file_entry.IsFile():
+      return
+
+    if self._export_store:
+      file_information = self._GetFileInformation(file_entry)
+
+      # A file that was exported before is not read again.
+      digest_hash = self._export_store.GetDigestHash(file_information)
+      if digest_hash:
+        self._export_store.AddFile(digest_hash, file_information)
+        return
+
+      calculate_hash = True
+      target_path = None
+      temporary_directory = self._export_store.temporary_directory
+
+    else:
+      file_information = None
+      calculate_hash = self._skip_duplicates
+      target_path = self._GetTargetPath(
+          file_entry, destination_path, filename_prefix)
+      temporary_directory = None
+
+    if self._number_of_workers < 1:
+      exported_file = self.ExportFile(
+          source_path_spec, target_path, calculate_hash=calculate_hash,
+          temporary_directory=temporary_directory)
+      self._SaveExportedFile(exported_file, target_path, file_information)
+      return
+
+    if not self._worker_pool:
+      self._worker_pool = multiprocessing.Pool(
+          processes=self._number_of_workers, initializer=_InitializeWorker)
+
+    maximum_number_of_queued_files = (
+        self._number_of_workers *
+        self._MAXIMUM_NUMBER_OF_QUEUED_FILES_PER_WORKER)
+
+    # Save the queued exports in order, so that of duplicate files the same
+    # file is saved as when the files are exported by the current process.
+    while len(self._queued_exports) >= maximum_number_of_queued_files:
+      self._SaveQueuedExport()
+
+    result = self._worker_pool.apply_async(
+        _ExportFileInWorker, ((
+            source_path_spec, target_path, calculate_hash,
+            temporary_directory), ))
+    self._queued_exports.append((result, target_path, file_information))
+
+
+# The resolver context of the worker process.
+_worker_resolver_context = None
+
+
+def _ExportFileInWorker(arguments):
+  """Exports a file in a worker process.
+
+  Args:
+    arguments (tuple[dfvfs.PathSpec, str, bool, str]): path specification
+        of the source file, path of the target file, value to indicate
+        the digest hash of the file content should be calculated and path
+        of the directory of the temporary file.
+
+  Returns:
+    tuple[str, str, int]: path of the written file, digest hash of the file
+        content and inode of the source file or None if the file could not
+        be exported.
+  """
+  source_path_spec, target_path, calculate_hash, temporary_directory = (
+      arguments)
+  return FileSaver.ExportFile(
+      source_path_spec, target_path, calculate_hash=calculate_hash,
+      resolver_context=_worker_resolver_context,
+      temporary_directory=temporary_directory)
+
+
+def _InitializeWorker():
+  """Initializes a worker process."""
+  # pylint: disable=global-statement
+  global _worker_resolver_context
+
+  # The worker process uses its own resolver context since the cached file
+  # objects, inherited from the parent process, share file offsets with
+  # the parent process.
+  _worker_resolver_context = context.Context()
+
 
 class ImageExportFrontend(frontend.Frontend):
   """Class that implements the image export front-end."""
@@ -565,23 +1077,39 @@ class ImageExportFrontend(frontend.Frontend):
 
   # TODO: merge with collector and/or engine.
   def _Extract(
-      self, source_path_specs, destination_path, remove_duplicates=True):
+      self, source_path_specs, destination_path, export_store=None,
+      number_of_workers=0, remove_duplicates=True, vss_differencing=False):
     """Extracts files.
 
     Args:
       source_path_specs (list[dfvfs.PathSpec]): path specifications to process.
       destination_path (str): path where the extracted files should be stored.
+      export_store (Optional[ContentAddressedExportStore]): content-addressed
+          export store, where None represents files are stored in
+          the destination path.
+      number_of_workers (Optional[int]): number of worker processes to export
+          files concurrently, where 0 represents no worker processes.
       remove_duplicates (Optional[bool]): True if files with duplicate content
           should be removed.
+      vss_differencing (Optional[bool]): True if only the files of a VSS store
+          should be extracted that differ from the previously processed VSS
+          store or volume.
     """
     if not os.path.isdir(destination_path):
       os.makedirs(destination_path)
 
-    path_spec_extractor = extractors.PathSpecExtractor(self._resolver_context)
-    file_saver = FileSaver(skip_duplicates=remove_duplicates)
+    path_spec_extractor = extractors.PathSpecExtractor(
+        self._resolver_context, vss_differencing=vss_differencing)
+    file_saver = FileSaver(
+        export_store=export_store, number_of_workers=number_of_workers,
+        skip_duplicates=remove_duplicates)
 
-    for path_spec in path_spec_extractor.ExtractPathSpecs(source_path_specs):
-      self._ExtractFile(file_saver, path_spec, destination_path)
+    try:
+      for path_spec in path_spec_extractor.ExtractPathSpecs(source_path_specs):
+        self._ExtractFile(file_saver, path_spec, destination_path)
+
+    finally:
+      file_saver.Close()
 
   def _ExtractFile(self, file_saver, path_spec, destination_path):
     """Extracts a file.
@@ -607,7 +1135,7 @@ class ImageExportFrontend(frontend.Frontend):
   # TODO: merge with collector and/or engine.
   def _ExtractWithFilter(
       self, source_path_specs, destination_path, filter_file_path,
-      remove_duplicates=True):
+      export_store=None, number_of_workers=0, remove_duplicates=True):
     """Extracts files using a filter expression.
 
     This method runs the file extraction process on the image and
@@ -618,6 +1146,11 @@ class ImageExportFrontend(frontend.Frontend):
       destination_path (str): path where the extracted files should be stored.
       filter_file_path (str): path of the file that contains the filter
           expressions.
+      export_store (Optional[ContentAddressedExportStore]): content-addressed
+          export store, where None represents files are stored in
+          the destination path.
+      number_of_workers (Optional[int]): number of worker processes to export
+          files concurrently, where 0 represents no worker processes.
       remove_duplicates (Optional[bool]): True if files with duplicate content
           should be removed.
     """
@@ -636,12 +1169,19 @@ class ImageExportFrontend(frontend.Frontend):
           filter_file_path, path_attributes=path_attributes)
 
       # Save the regular files.
-      file_saver = FileSaver(skip_duplicates=remove_duplicates)
+      file_saver = FileSaver(
+          export_store=export_store, number_of_workers=number_of_workers,
+          skip_duplicates=remove_duplicates)
 
       searcher = file_system_searcher.FileSystemSearcher(
           file_system, mount_point)
-      for path_spec in searcher.Find(find_specs=find_specs):
-        self._ExtractFile(file_saver, path_spec, destination_path)
+
+      try:
+        for path_spec in searcher.Find(find_specs=find_specs):
+          self._ExtractFile(file_saver, path_spec, destination_path)
+
+      finally:
+        file_saver.Close()
 
       file_system.Close()
 
@@ -834,25 +1374,48 @@ class ImageExportFrontend(frontend.Frontend):
     self._filter_collection.Print(output_writer)
 
   def ProcessSources(
-      self, source_path_specs, destination_path, filter_file=None,
-      remove_duplicates=True):
+      self, source_path_specs, destination_path, content_addressed=False,
+      filter_file=None, number_of_workers=0, remove_duplicates=True,
+      vss_differencing=False):
     """Processes the sources.
 
     Args:
       source_path_specs (list[dfvfs.PathSpec]): path specifications to process.
       destination_path (str): path where the extracted files should be stored.
+      content_addressed (Optional[bool]): True if the extracted files should
+          be stored in a content-addressed export store in the destination
+          path, where the content of every file is stored once.
       filter_file (Optional[str]): name of of the filter file.
+      number_of_workers (Optional[int]): number of worker processes to export
+          files concurrently, where 0 represents no worker processes.
       remove_duplicates (Optional[bool]): True if files with duplicate content
           should be removed.
+      vss_differencing (Optional[bool]): True if only the files of a VSS store
+          should be extracted that differ from the previously processed VSS
+          store or volume. VSS differencing does not apply when a filter file
+          is used.
     """
-    if filter_file:
-      self._ExtractWithFilter(
-          source_path_specs, destination_path, filter_file,
-          remove_duplicates=remove_duplicates)
-    else:
-      self._Extract(
-          source_path_specs, destination_path,
-          remove_duplicates=remove_duplicates)
+    export_store = None
+    if content_addressed:
+      export_store = ContentAddressedExportStore(destination_path)
+      export_store.Open()
+
+    try:
+      if filter_file:
+        self._ExtractWithFilter(
+            source_path_specs, destination_path, filter_file,
+            export_store=export_store, number_of_workers=number_of_workers,
+            remove_duplicates=remove_duplicates)
+      else:
+        self._Extract(
+            source_path_specs, destination_path, export_store=export_store,
+            number_of_workers=number_of_workers,
+            remove_duplicates=remove_duplicates,
+            vss_differencing=vss_differencing)
+
+    finally:
+      if export_store:
+        export_store.Close()
 
   def ReadSpecificationFile(self, path):
     """Reads the format specification file.
@@ -13,6 +13,7 @@ from plaso.engine import knowledge_base
 from plaso.formatters import mediator as formatters_mediator
 from plaso.frontend import analysis_frontend
 from plaso.lib import errors
+from plaso.lib import pfilter
 from plaso.multi_processing import psort
 from plaso.output import manager as output_manager
 from plaso.output import mediator as output_mediator
@@ -41,6 +42,7 @@ class PsortFrontend(analysis_frontend.AnalysisFrontend):
     self._profiling_sample_rate = self._DEFAULT_PROFILING_SAMPLE_RATE
     self._profiling_type = u'all'
     self._quiet_mode = False
+    self._use_shared_analysis_process = False
     self._use_zeromq = True
 
   def _CheckStorageFile(self, storage_file_path):
@@ -79,7 +81,9 @@ class PsortFrontend(analysis_frontend.AnalysisFrontend):
         enable_profiling=self._enable_profiling,
         profiling_directory=self._profiling_directory,
         profiling_sample_rate=self._profiling_sample_rate,
-        profiling_type=self._profiling_type, use_zeromq=self._use_zeromq)
+        profiling_type=self._profiling_type,
+        use_shared_analysis_process=self._use_shared_analysis_process,
+        use_zeromq=self._use_zeromq)
 
   def AnalyzeEvents(
       self, storage_writer, analysis_plugins, status_update_callback=None):
@@ -128,6 +132,10 @@ class PsortFrontend(analysis_frontend.AnalysisFrontend):
     except (KeyError, TypeError) as exception:
       raise RuntimeError(exception)
 
+    # Share the formatter mediator with the event filter so that the formatted
+    # message strings of an event only need to be determined once.
+    pfilter.PlasoValueExpander.SetFormatterMediator(formatter_mediator)
+
     output_mediator_object = output_mediator.OutputMediator(
         self._knowledge_base, formatter_mediator,
         preferred_encoding=preferred_encoding)
@@ -311,6 +319,16 @@ class PsortFrontend(analysis_frontend.AnalysisFrontend):
     """
     self._quiet_mode = quiet_mode
 
+  def SetUseSharedAnalysisProcess(self, use_shared_analysis_process=False):
+    """Sets whether analysis plugins should share an analysis process or not.
+
+    Args:
+      use_shared_analysis_process (Optional[bool]): True if the analysis
+          plugins that support it should run in a single shared analysis
+          process instead of a process per plugin.
+    """
+    self._use_shared_analysis_process = use_shared_analysis_process
+
   def SetUseZeroMQ(self, use_zeromq=True):
     """Sets whether ZeroMQ should be used for queueing or not.
 
@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+"""Compiler of object filters into generated Python functions.
+
+The object filter evaluates a filter by walking the tree of filter objects
+for every event, where every leaf expands the values of the attribute using
+the value expander generators and calls the operation of the operator.
+
+The compiler generates the source of a Python function from the same tree,
+where the operations with known semantics are inlined, the value expansion
+of single attribute names is replaced by direct attribute access, the AND
+and OR filters are short-circuited Python boolean expressions and the right
+operands, such as regular expressions and parser sets, are pre-computed.
+
+Operations that cannot be evaluated in a single Python expression, since
+the object filter ignores ValueError and TypeError raised by the operation
+of an individual value, are generated as separate helper functions.
+
+Filter objects that are not known to the compiler, such as Context, are
+evaluated by their Matches method.
+"""
+
+import logging
+
+from plaso.lib import objectfilter
+from plaso.lib import pfilter
+from plaso.lib import py2to3
+
+
+# Value expanders of which _GetValue() returns the value of getattr() as-is
+# if the value is set and not a dictionary.
+_ATTRIBUTE_VALUE_EXPANDERS = frozenset([
+    objectfilter.AttributeValueExpander,
+    objectfilter.LowercaseAttributeValueExpander,
+    pfilter.PlasoValueExpander])
+
+# Attribute names of which PlasoValueExpander._GetValue() does not return
+# the value of getattr() as-is.
+_PLASO_SPECIAL_ATTRIBUTE_NAMES = frozenset([u'tag'])
+
+_COMPARISON_OPERATORS = {
+    objectfilter.Equals: u'==',
+    objectfilter.Greater: u'>',
+    objectfilter.GreaterEqual: u'>=',
+    objectfilter.Less: u'<',
+    objectfilter.LessEqual: u'<=',
+    objectfilter.NotEquals: u'=='}
+
+
+class _FilterCodeGenerator(object):
+  """Class that generates the source of a filter function."""
+
+  _MATCH_FUNCTION_NAME = u'_Matches'
+
+  def __init__(self):
+    """Initializes a filter code generator."""
+    super(_FilterCodeGenerator, self).__init__()
+    self._functions = []
+    self._namespace = {
+        u'_get_unicode_string': objectfilter.GetUnicodeString,
+        u'_integer_types': py2to3.INTEGER_TYPES,
+        u'_string_types': py2to3.STRING_TYPES,
+        u'_unicode_type': py2to3.UNICODE_TYPE}
+    self._number_of_names = 0
+
+  def _AddName(self, prefix, value):
+    """Adds a value to the namespace of the generated function.
+
+    Args:
+      prefix (str): prefix of the name.
+      value (object): value.
+
+    Returns:
+      str: name of the value in the namespace.
+    """
+    name = self._GetUniqueName(prefix)
+    self._namespace[name] = value
+    return name
+
+  # pylint: disable=protected-access
+  def _GenerateBinaryOperator(self, binary_operator):
+    """Generates the source of a binary operator.
+
+    Args:
+      binary_operator (GenericBinaryOperator): binary operator.
+
+    Returns:
+      str: Python expression that calls the generated helper function.
+    """
+    expander = binary_operator.value_expander
+    path = binary_operator.left_operand
+    if isinstance(path, py2to3.STRING_TYPES):
+      path = path.split(expander.FIELD_SEPARATOR)
+
+    operation = self._GenerateOperation(binary_operator)
+
+    function_name = self._GetUniqueName(u'leaf')
+    lines = [u'def {0:s}(event):'.format(function_name)]
+
+    if len(path) == 1 and expander.__class__ in _ATTRIBUTE_VALUE_EXPANDERS:
+      attribute_name = expander._GetAttributeName(path)
+      get_value = self._AddName(u'get_value', expander._GetValue)
+
+      if (isinstance(expander, pfilter.PlasoValueExpander) and
+          attribute_name in _PLASO_SPECIAL_ATTRIBUTE_NAMES):
+        lines.extend([
+            u'  value = {0:s}(event, {1!r})'.format(get_value, attribute_name),
+            u'  if value is None:',
+            u'    return {0!s}'.format(not binary_operator.bool_value)])
+
+      else:
+        lines.extend([
+            u'  value = getattr(event, {0!r}, None)'.format(attribute_name),
+            u'  if not value or isinstance(value, dict):',
+            u'    value = {0:s}(event, {1!r})'.format(
+                get_value, attribute_name),
+            u'    if value is None:',
+            u'      return {0!s}'.format(not binary_operator.bool_value)])
+
+      lines.extend([
+          u'  try:',
+          u'    if {0:s}:'.format(operation),
+          u'      return {0!s}'.format(binary_operator.bool_value),
+          u'  except (ValueError, TypeError):',
+          u'    pass'])
+
+    else:
+      expand = self._AddName(u'expand', expander.Expand)
+      path_name = self._AddName(u'path', path)
+      lines.extend([
+          u'  for value in {0:s}(event, {1:s}):'.format(expand, path_name),
+          u'    try:',
+          u'      if {0:s}:'.format(operation),
+          u'        return {0!s}'.format(binary_operator.bool_value),
+          u'    except (ValueError, TypeError):',
+          u'      pass'])
+
+    lines.append(u'  return {0!s}'.format(not binary_operator.bool_value))
+
+    self._functions.append(u'\n'.join(lines))
+    return u'{0:s}(event)'.format(function_name)
+
+  def _GenerateExpression(self, filter_object):
+    """Generates the Python expression of a filter object.
+
+    Args:
+      filter_object (objectfilter.Filter): filter object.
+
+    Returns:
+      str: Python expression that evaluates to True if the event matches.
+    """
+    filter_class = filter_object.__class__
+
+    if filter_class in (objectfilter.AndFilter, objectfilter.OrFilter):
+      if not filter_object.args:
+        return u'True'
+
+      expressions = [
+          self._GenerateExpression(child_filter)
+          for child_filter in self._GetFlattenedArguments(filter_object)]
+      if len(expressions) == 1:
+        return expressions[0]
+
+      if filter_class == objectfilter.AndFilter:
+        separator = u' and '
+      else:
+        separator = u' or '
+
+      return u'({0:s})'.format(separator.join(expressions))
+
+    if filter_class == objectfilter.IdentityFilter:
+      return u'True'
+
+    if isinstance(filter_object, objectfilter.GenericBinaryOperator):
+      return self._GenerateBinaryOperator(filter_object)
+
+    matches = self._AddName(u'matches', filter_object.Matches)
+    return u'{0:s}(event)'.format(matches)
+
+  def _GenerateOperation(self, binary_operator):
+    """Generates the Python expression of the operation of a binary operator.
+
+    Args:
+      binary_operator (GenericBinaryOperator): binary operator.
+
+    Returns:
+      str: Python expression that evaluates the operation against "value".
+    """
+    operator_class = binary_operator.__class__
+    right_operand = binary_operator.right_operand
+
+    comparison_operator = _COMPARISON_OPERATORS.get(operator_class, None)
+    if comparison_operator:
+      right_operand_name = self._AddName(u'right_operand', right_operand)
+      expression = u'value {0:s} {1:s}'.format(
+          comparison_operator, right_operand_name)
+
+      if isinstance(right_operand, pfilter.DateCompareObject):
+        # Comparing an integer against a date compare object is equivalent
+        # to comparing it against the timestamp of the date compare object.
+        timestamp_name = self._AddName(u'timestamp', right_operand.data)
+        expression = (
+            u'(value {0:s} {1:s} if isinstance(value, _integer_types) '
+            u'else {2:s})').format(
+                comparison_operator, timestamp_name, expression)
+
+      return expression
+
+    if (operator_class == objectfilter.Contains and
+        isinstance(right_operand, py2to3.STRING_TYPES)):
+      right_operand_name = self._AddName(u'right_operand', right_operand)
+      lower_name = self._AddName(u'lower', right_operand.lower())
+      return (
+          u'({0:s} in value.lower() if isinstance(value, _string_types) '
+          u'else {1:s} in value)').format(lower_name, right_operand_name)
+
+    if operator_class in (objectfilter.Regexp, objectfilter.RegexpInsensitive):
+      search = self._AddName(u'search', binary_operator.compiled_re.search)
+      return (
+          u'{0:s}(value if isinstance(value, _unicode_type) '
+          u'else _get_unicode_string(value))').format(search)
+
+    if (operator_class == pfilter.ParserList and
+        binary_operator.left_operand == u'parser'):
+      parsers_name = self._AddName(
+          u'parsers', frozenset(binary_operator.compiled_list))
+      return u'value in {0:s}'.format(parsers_name)
+
+    operation = self._AddName(u'operation', binary_operator.Operation)
+    right_operand_name = self._AddName(u'right_operand', right_operand)
+    return u'{0:s}(value, {1:s})'.format(operation, right_operand_name)
+
+  # pylint: enable=protected-access
+
+  def _GetFlattenedArguments(self, filter_object):
+    """Retrieves the arguments of nested filters of the same class.
+
+    Args:
+      filter_object (AndFilter|OrFilter): filter object.
+
+    Returns:
+      list[objectfilter.Filter]: arguments, where the arguments of nested
+          filters of the same class are included instead of the nested filter.
+    """
+    arguments = []
+    for child_filter in filter_object.args:
+      if (child_filter.__class__ == filter_object.__class__ and
+          child_filter.args):
+        arguments.extend(self._GetFlattenedArguments(child_filter))
+      else:
+        arguments.append(child_filter)
+
+    return arguments
+
+  def _GetUniqueName(self, prefix):
+    """Retrieves a unique name in the namespace of the generated function.
+
+    Args:
+      prefix (str): prefix of the name.
+
+    Returns:
+      str: unique name.
+    """
+    name = u'_{0:s}_{1:d}'.format(prefix, self._number_of_names)
+    self._number_of_names += 1
+    return name
+
+  def GenerateFunction(self, filter_object):
+    """Generates the source of the filter function.
+
+    Args:
+      filter_object (objectfilter.Filter): filter object.
+
+    Returns:
+      tuple[str, str, dict[str, object]]: name of the function, source of
+          the function and namespace the function should be executed in.
+    """
+    self._functions = []
+
+    expression = self._GenerateExpression(filter_object)
+
+    self._functions.append(u'\n'.join([
+        u'def {0:s}(event):'.format(self._MATCH_FUNCTION_NAME),
+        u'  return {0:s}'.format(expression)]))
+
+    source = u'\n\n'.join(self._functions)
+    return self._MATCH_FUNCTION_NAME, source, dict(self._namespace)
+
+
+class CompiledFilter(object):
+  """Class that defines a filter compiled into a Python function.
+
+  The compiled filter provides the same Filter interface as the filter object
+  it was compiled from.
+
+  Attributes:
+    filter_object (objectfilter.Filter): filter object the compiled filter
+        was generated from.
+    source (str): source of the generated Python function or None if
+        the filter could not be compiled.
+  """
+
+  def __init__(self, filter_object):
+    """Initializes a compiled filter.
+
+    Args:
+      filter_object (objectfilter.Filter): filter object.
+    """
+    super(CompiledFilter, self).__init__()
+    self._match_function = None
+    self.filter_object = filter_object
+    self.source = None
+
+    self._Compile()
+
+  def __getstate__(self):
+    """Retrieves the state for pickling, without the generated function.
+
+    Returns:
+      dict[str, object]: state.
+    """
+    return {u'filter_object': self.filter_object}
+
+  def __setstate__(self, state):
+    """Sets the state when unpickling and regenerates the function.
+
+    Args:
+      state (dict[str, object]): state.
+    """
+    self._match_function = None
+    self.filter_object = state[u'filter_object']
+    self.source = None
+
+    self._Compile()
+
+  def __str__(self):
+    """Retrieves a string representation of the filter."""
+    return u'{0!s}'.format(self.filter_object)
+
+  def _Compile(self):
+    """Compiles the filter object into a Python function.
+
+    If the filter object cannot be compiled the Matches method of the filter
+    object is used instead.
+    """
+    code_generator = _FilterCodeGenerator()
+    function_name, source, namespace = code_generator.GenerateFunction(
+        self.filter_object)
+
+    try:
+      code = compile(source, u'<compiled filter>', u'exec')
+      exec(code, namespace)  # pylint: disable=exec-used
+
+    except (MemoryError, RuntimeError, SyntaxError) as exception:
+      logging.debug(
+          u'Unable to compile filter: {0!s} with error: {1!s}'.format(
+              self.filter_object, exception))
+      self._match_function = self.filter_object.Matches
+      return
+
+    self._match_function = namespace[function_name]
+    self.source = source
+
+  def Filter(self, objects):
+    """Filters objects.
+
+    Args:
+      objects (iterable[object]): objects.
+
+    Returns:
+      list[object]: objects that match the filter.
+    """
+    match_function = self._match_function
+    return [obj for obj in objects if match_function(obj)]
+
+  def Matches(self, obj):
+    """Determines if an object matches the filter.
+
+    Args:
+      obj (object): object, such as an event.
+
+    Returns:
+      bool: True if the object matches the filter.
+    """
+    return self._match_function(obj)
@@ -0,0 +1,300 @@
+# -*- coding: utf-8 -*-
+"""Planner that derives storage predicates from object filters.
+
+The planner walks the tree of filter objects and extracts the conditions
+an event must meet to be able to match the filter, which the storage can
+evaluate without having to read and deserialize the events.
+
+The conditions are derived from the comparisons of the data type and parser
+attributes, such as "data_type is 'fs:stat'", "parser contains 'winreg'" or
+"parser inlist 'webhist'". The conditions of an AND filter are combined,
+the conditions of an OR filter are only used when every argument of the OR
+filter has a condition on the same attribute. Negated comparisons and other
+filter objects do not contribute conditions, which makes that the derived
+conditions never exclude events that match the filter.
+
+The time range is derived from the comparisons of the timestamp attribute,
+such as "date > '2016-01-01'". The time range of an AND filter is the
+intersection and the time range of an OR filter the union of the time ranges
+of its arguments, where arguments without comparisons of the timestamp
+attribute are unbounded.
+"""
+
+from plaso.lib import objectfilter
+from plaso.lib import pfilter
+from plaso.lib import py2to3
+from plaso.storage import event_predicate
+from plaso.storage import time_range as storage_time_range
+
+
+# Value expanders of which Expand() yields the value of getattr() for
+# a single attribute name.
+_ATTRIBUTE_VALUE_EXPANDERS = frozenset([
+    objectfilter.AttributeValueExpander,
+    objectfilter.LowercaseAttributeValueExpander,
+    pfilter.PlasoValueExpander])
+
+# Names of the attributes that are summarized by the storage.
+_SUMMARIZED_ATTRIBUTE_NAMES = frozenset([u'data_type', u'parser'])
+
+# Comparison operators that define a lower and/or upper bound of the value.
+_LOWER_BOUND_OPERATORS = frozenset([
+    objectfilter.Equals, objectfilter.Greater, objectfilter.GreaterEqual])
+
+_UPPER_BOUND_OPERATORS = frozenset([
+    objectfilter.Equals, objectfilter.Less, objectfilter.LessEqual])
+
+
+class FilterPlanner(object):
+  """Class that derives storage predicates from object filters."""
+
+  # The timestamps that represent an unbounded time range, which are
+  # the minimum and maximum value of a signed 64-bit integer.
+  _MINIMUM_TIMESTAMP = -(2 ** 63)
+  _MAXIMUM_TIMESTAMP = (2 ** 63) - 1
+
+  # pylint: disable=protected-access
+  def _GetAttributeName(self, binary_operator):
+    """Retrieves the name of the attribute a binary operator compares.
+
+    Args:
+      binary_operator (GenericBinaryOperator): binary operator.
+
+    Returns:
+      str: name of the attribute or None if the binary operator does not
+          compare the value of a single attribute.
+    """
+    expander = binary_operator.value_expander
+    if expander.__class__ not in _ATTRIBUTE_VALUE_EXPANDERS:
+      return
+
+    path = binary_operator.left_operand
+    if isinstance(path, py2to3.STRING_TYPES):
+      path = path.split(expander.FIELD_SEPARATOR)
+
+    if len(path) != 1:
+      return
+
+    return expander._GetAttributeName(path)
+
+  # pylint: enable=protected-access
+
+  def _GetBinaryOperatorCondition(self, binary_operator):
+    """Retrieves the condition of a binary operator.
+
+    Args:
+      binary_operator (GenericBinaryOperator): binary operator.
+
+    Returns:
+      tuple[str, frozenset[str], frozenset[str]]: attribute name, values and
+          substrings of the condition or None if the binary operator does not
+          define a condition on a summarized attribute.
+    """
+    if not binary_operator.bool_value:
+      return
+
+    attribute_name = self._GetAttributeName(binary_operator)
+    if attribute_name not in _SUMMARIZED_ATTRIBUTE_NAMES:
+      return
+
+    operator_class = binary_operator.__class__
+    right_operand = binary_operator.right_operand
+
+    if (operator_class == pfilter.ParserList and
+        binary_operator.left_operand == u'parser'):
+      return attribute_name, frozenset(binary_operator.compiled_list), None
+
+    if not isinstance(right_operand, py2to3.STRING_TYPES):
+      return
+
+    if operator_class == objectfilter.Equals:
+      return attribute_name, frozenset([right_operand]), None
+
+    if operator_class == objectfilter.Contains:
+      return attribute_name, None, frozenset([right_operand.lower()])
+
+  def _GetBinaryOperatorTimestamps(self, binary_operator):
+    """Retrieves the timestamps that bound a binary operator.
+
+    Args:
+      binary_operator (GenericBinaryOperator): binary operator.
+
+    Returns:
+      tuple[int, int]: lower and upper bound timestamp.
+    """
+    unbounded_timestamps = (self._MINIMUM_TIMESTAMP, self._MAXIMUM_TIMESTAMP)
+
+    if not binary_operator.bool_value:
+      return unbounded_timestamps
+
+    if self._GetAttributeName(binary_operator) != u'timestamp':
+      return unbounded_timestamps
+
+    right_operand = binary_operator.right_operand
+    if isinstance(right_operand, pfilter.DateCompareObject):
+      timestamp = right_operand.data
+    elif (isinstance(right_operand, py2to3.INTEGER_TYPES) and
+          not isinstance(right_operand, bool)):
+      timestamp = right_operand
+    else:
+      return unbounded_timestamps
+
+    lower_timestamp, upper_timestamp = unbounded_timestamps
+
+    operator_class = binary_operator.__class__
+    if operator_class in _LOWER_BOUND_OPERATORS:
+      lower_timestamp = timestamp
+    if operator_class in _UPPER_BOUND_OPERATORS:
+      upper_timestamp = timestamp
+
+    return lower_timestamp, upper_timestamp
+
+  def _GetConditions(self, filter_object):
+    """Retrieves the conditions of a filter object.
+
+    Args:
+      filter_object (objectfilter.Filter): filter object.
+
+    Returns:
+      dict[str, tuple[frozenset[str], frozenset[str]]]: values and substrings
+          of the condition per attribute name.
+    """
+    filter_class = filter_object.__class__
+
+    if filter_class == objectfilter.AndFilter:
+      conditions = {}
+      for child_filter in filter_object.args:
+        for attribute_name, condition in iter(
+            self._GetConditions(child_filter).items()):
+          conditions.setdefault(attribute_name, condition)
+
+      return conditions
+
+    if filter_class == objectfilter.OrFilter:
+      if not filter_object.args:
+        return {}
+
+      conditions = None
+      for child_filter in filter_object.args:
+        child_conditions = self._GetConditions(child_filter)
+        if conditions is None:
+          conditions = child_conditions
+          continue
+
+        merged_conditions = {}
+        for attribute_name, condition in iter(conditions.items()):
+          child_condition = child_conditions.get(attribute_name, None)
+          if child_condition:
+            merged_conditions[attribute_name] = (
+                condition[0] | child_condition[0],
+                condition[1] | child_condition[1])
+
+        conditions = merged_conditions
+        if not conditions:
+          break
+
+      return conditions
+
+    if isinstance(filter_object, objectfilter.GenericBinaryOperator):
+      condition = self._GetBinaryOperatorCondition(filter_object)
+      if condition:
+        attribute_name, values, substrings = condition
+        return {attribute_name: (
+            values or frozenset(), substrings or frozenset())}
+
+    return {}
+
+  def _GetTimestamps(self, filter_object):
+    """Retrieves the timestamps that bound a filter object.
+
+    Args:
+      filter_object (objectfilter.Filter): filter object.
+
+    Returns:
+      tuple[int, int]: lower and upper bound timestamp.
+    """
+    filter_class = filter_object.__class__
+
+    if filter_class == objectfilter.AndFilter:
+      lower_timestamp = self._MINIMUM_TIMESTAMP
+      upper_timestamp = self._MAXIMUM_TIMESTAMP
+      for child_filter in filter_object.args:
+        child_lower_timestamp, child_upper_timestamp = self._GetTimestamps(
+            child_filter)
+        lower_timestamp = max(lower_timestamp, child_lower_timestamp)
+        upper_timestamp = min(upper_timestamp, child_upper_timestamp)
+
+      return lower_timestamp, upper_timestamp
+
+    if filter_class == objectfilter.OrFilter and filter_object.args:
+      lower_timestamp = self._MAXIMUM_TIMESTAMP
+      upper_timestamp = self._MINIMUM_TIMESTAMP
+      for child_filter in filter_object.args:
+        child_lower_timestamp, child_upper_timestamp = self._GetTimestamps(
+            child_filter)
+
+        # An argument that cannot match does not widen the time range.
+        if child_lower_timestamp > child_upper_timestamp:
+          continue
+
+        lower_timestamp = min(lower_timestamp, child_lower_timestamp)
+        upper_timestamp = max(upper_timestamp, child_upper_timestamp)
+
+      return lower_timestamp, upper_timestamp
+
+    if isinstance(filter_object, objectfilter.GenericBinaryOperator):
+      return self._GetBinaryOperatorTimestamps(filter_object)
+
+    return self._MINIMUM_TIMESTAMP, self._MAXIMUM_TIMESTAMP
+
+  def GetEventPredicate(self, filter_object):
+    """Retrieves the event predicate of a filter object.
+
+    Args:
+      filter_object (objectfilter.Filter): filter object.
+
+    Returns:
+      EventPredicate: event predicate or None if no conditions could be
+          derived from the filter object.
+    """
+    conditions = self._GetConditions(filter_object)
+    if not conditions:
+      return
+
+    predicate = event_predicate.EventPredicate()
+    for attribute_name, condition in iter(conditions.items()):
+      values, substrings = condition
+      predicate.AddCondition(
+          attribute_name, values=values, substrings=substrings)
+
+    return predicate
+
+  def GetTimeRange(self, filter_object, time_range=None):
+    """Retrieves the time range of a filter object.
+
+    Args:
+      filter_object (objectfilter.Filter): filter object.
+      time_range (Optional[TimeRange]): time range the time range of
+          the filter object should be limited to.
+
+    Returns:
+      TimeRange: time range that contains the timestamps of all the events
+          that can match the filter object or None if the time range is not
+          bounded.
+    """
+    lower_timestamp, upper_timestamp = self._GetTimestamps(filter_object)
+
+    if time_range:
+      lower_timestamp = max(lower_timestamp, time_range.start_timestamp)
+      upper_timestamp = min(upper_timestamp, time_range.end_timestamp)
+
+    if (lower_timestamp == self._MINIMUM_TIMESTAMP and
+        upper_timestamp == self._MAXIMUM_TIMESTAMP):
+      return
+
+    # If no event can match, the filter still needs a valid time range.
+    # A time range of a single timestamp limits the events that are read
+    # to those with the lower bound timestamp.
+    upper_timestamp = max(lower_timestamp, upper_timestamp)
+
+    return storage_time_range.TimeRange(lower_timestamp, upper_timestamp)
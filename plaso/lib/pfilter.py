@@ -71,48 +71,66 @@ class DictObject(object):
 
 
 class PlasoValueExpander(objectfilter.AttributeValueExpander):
-  """An expander that gives values based on object attribute names."""
+  """An expander that gives values based on object attribute names.
+
+  The formatted message and source strings are retrieved from the formatters
+  manager, which caches them per event. The formatter mediator is shared by
+  all expanders, so that the formatted strings can also be shared with
+  the output module when it uses the same formatter mediator.
+  """
+
+  _formatter_mediator = None
 
   def __init__(self):
     """Initialize an attribute value expander."""
     super(PlasoValueExpander, self).__init__()
 
-  def _GetMessage(self, event_object):
-    """Returns a properly formatted message string.
+  @classmethod
+  def _GetFormatterMediator(cls):
+    """Retrieves the formatter mediator.
+
+    Returns:
+      FormatterMediator: formatter mediator.
+    """
+    if not cls._formatter_mediator:
+      cls._formatter_mediator = formatters_mediator.FormatterMediator()
+
+    return cls._formatter_mediator
+
+  def _GetMessages(self, event_object):
+    """Returns properly formatted message strings.
 
     Args:
       event_object: the event object (instance od EventObject).
 
     Returns:
-      A formatted message string.
+      A tuple of the formatted message string and short message string.
     """
-    # TODO: move this somewhere where the mediator can be instantiated once.
-    formatter_mediator = formatters_mediator.FormatterMediator()
-
-    result = u''
     try:
-      result, _ = formatters_manager.FormattersManager.GetMessageStrings(
-          formatter_mediator, event_object)
+      return formatters_manager.FormattersManager.GetMessageStrings(
+          self._GetFormatterMediator(), event_object)
     except KeyError as exception:
       logging.warning(u'Unable to correctly assemble event: {0:s}'.format(
           exception))
 
-    return result
+    return u'', u''
 
   def _GetSources(self, event_object):
     """Returns properly formatted source strings.
 
     Args:
       event_object: the event object (instance od EventObject).
+
+    Returns:
+      A tuple of the short and long source string.
     """
     try:
-      source_short, source_long = (
-          formatters_manager.FormattersManager.GetSourceStrings(event_object))
+      return formatters_manager.FormattersManager.GetSourceStrings(event_object)
     except KeyError as exception:
       logging.warning(u'Unable to correctly assemble event: {0:s}'.format(
           exception))
 
-    return source_short, source_long
+    return None, None
 
   def _GetValue(self, obj, attr_name):
     ret = getattr(obj, attr_name, None)
@@ -128,7 +146,13 @@ class PlasoValueExpander(objectfilter.AttributeValueExpander):
 
     # Check if this is a message request and we have a regular EventObject.
     if attr_name == 'message':
-      return self._GetMessage(obj)
+      message, _ = self._GetMessages(obj)
+      return message
+
+    # Check if this is a message_short request.
+    if attr_name == 'message_short':
+      _, message_short = self._GetMessages(obj)
+      return message_short
 
     # Check if this is a source_short request.
     if attr_name in ('source', 'source_short'):
@@ -143,6 +167,16 @@ class PlasoValueExpander(objectfilter.AttributeValueExpander):
   def _GetAttributeName(self, path):
     return path[0].lower()
 
+  @classmethod
+  def SetFormatterMediator(cls, formatter_mediator):
+    """Sets the formatter mediator used to format the message strings.
+
+    Args:
+      formatter_mediator (FormatterMediator): formatter mediator or None
+          to use a default formatter mediator.
+    """
+    cls._formatter_mediator = formatter_mediator
+
 
 class PlasoExpression(objectfilter.BasicExpression):
   """A Plaso specific expression."""
@@ -9,6 +9,7 @@ It also contains various functions to represent timestamps in a more
 human readable form.
 """
 
+import bisect
 import calendar
 import datetime
 import logging
@@ -890,6 +891,165 @@ class Timestamp(object):
     return int(scrubbed + rounded * cls.MICRO_SECONDS_PER_SECOND)
 
 
+class TimezoneConverter(object):
+  """Class for converting timestamps to date and time values in a timezone.
+
+  Converting a timestamp with Timestamp.CopyToDatetime localizes the
+  datetime object with pytz for every timestamp. The converter instead
+  precomputes a table of the UTC offset transitions of the timezone and
+  resolves the UTC offset of a timestamp by a binary search in the table.
+  Since consecutive timestamps typically fall within the same period
+  between two transitions, the last period is cached.
+  """
+
+  _EPOCH = datetime.datetime(1970, 1, 1, 0, 0, 0, 0)
+
+  _EPOCH_UTC = datetime.datetime(1970, 1, 1, 0, 0, 0, 0, tzinfo=pytz.UTC)
+
+  def __init__(self, timezone=pytz.UTC):
+    """Initializes the timezone converter.
+
+    Args:
+      timezone (Optional[pytz.timezone]): timezone.
+    """
+    super(TimezoneConverter, self).__init__()
+    self._cached_period = None
+    self._timezone = timezone
+    self._transition_periods = []
+    self._transition_timestamps = []
+
+    self._BuildTransitionTable()
+
+  @property
+  def timezone(self):
+    """pytz.timezone: timezone."""
+    return self._timezone
+
+  def _BuildTransitionTable(self):
+    """Builds the UTC offset transition table of the timezone."""
+    utc_transition_times = getattr(
+        self._timezone, u'_utc_transition_times', None)
+
+    if not utc_transition_times:
+      # The timezone has a fixed UTC offset, such as UTC or a pytz.FixedOffset.
+      utc_offset = self._timezone.utcoffset(self._EPOCH)
+      self._transition_timestamps = [Timestamp.TIMESTAMP_MIN_MICRO_SECONDS]
+      self._transition_periods = [(
+          Timestamp.TIMESTAMP_MIN_MICRO_SECONDS,
+          Timestamp.TIMESTAMP_MAX_MICRO_SECONDS,
+          self._GetMicroseconds(utc_offset), self._timezone)]
+      return
+
+    # pylint: disable=protected-access
+    transition_info = self._timezone._transition_info
+    tzinfos = self._timezone._tzinfos
+
+    for index, utc_transition_time in enumerate(utc_transition_times):
+      transition_timestamp = self._GetMicroseconds(
+          utc_transition_time - self._EPOCH)
+      if index == 0:
+        # The first transition is the start of the datetime range.
+        transition_timestamp = Timestamp.TIMESTAMP_MIN_MICRO_SECONDS
+
+      if index + 1 < len(utc_transition_times):
+        end_timestamp = self._GetMicroseconds(
+            utc_transition_times[index + 1] - self._EPOCH)
+      else:
+        end_timestamp = Timestamp.TIMESTAMP_MAX_MICRO_SECONDS
+
+      utc_offset = transition_info[index][0]
+      tzinfo = tzinfos[transition_info[index]]
+
+      self._transition_timestamps.append(transition_timestamp)
+      self._transition_periods.append((
+          transition_timestamp, end_timestamp,
+          self._GetMicroseconds(utc_offset), tzinfo))
+
+  def _GetMicroseconds(self, timedelta_object):
+    """Retrieves the number of micro seconds of a time delta.
+
+    Args:
+      timedelta_object (datetime.timedelta): time delta.
+
+    Returns:
+      int: number of micro seconds.
+    """
+    return (
+        ((timedelta_object.days * 86400) + timedelta_object.seconds) *
+        Timestamp.MICRO_SECONDS_PER_SECOND) + timedelta_object.microseconds
+
+  def _GetTransitionPeriod(self, timestamp):
+    """Retrieves the transition period that contains the timestamp.
+
+    Args:
+      timestamp (int): number of micro seconds since January 1, 1970,
+          00:00:00 UTC.
+
+    Returns:
+      tuple[int, int, int, datetime.tzinfo]: start and end timestamp of
+          the period, UTC offset in micro seconds and tzinfo of the period.
+    """
+    index = bisect.bisect_right(self._transition_timestamps, timestamp) - 1
+    period = self._transition_periods[max(0, index)]
+    self._cached_period = period
+    return period
+
+  def CopyToDatetime(self, timestamp, raise_error=False):
+    """Copies the timestamp to a datetime object.
+
+    Args:
+      timestamp (int): number of micro seconds since January 1, 1970,
+          00:00:00 UTC.
+      raise_error (Optional[bool]): True if an OverflowError should be raised
+          if the timestamp is out of bounds.
+
+    Returns:
+      datetime.datetime: date and time in the timezone. January 1, 1970
+          00:00:00 UTC is returned on error if raise_error is not set.
+
+    Raises:
+      OverflowError: if raise_error is set and the timestamp is out of bounds.
+    """
+    period = self._cached_period
+    if not period or not period[0] <= timestamp < period[1]:
+      period = self._GetTransitionPeriod(timestamp)
+
+    _, _, utc_offset, tzinfo = period
+
+    try:
+      datetime_object = self._EPOCH + datetime.timedelta(
+          microseconds=timestamp + utc_offset)
+      return datetime_object.replace(tzinfo=tzinfo)
+
+    except OverflowError as exception:
+      if raise_error:
+        raise
+
+      logging.error((
+          u'Unable to copy {0:d} to a datetime object with error: '
+          u'{1:s}').format(timestamp, exception))
+
+    return self._EPOCH_UTC
+
+  def CopyToIsoFormat(self, timestamp, raise_error=False):
+    """Copies the timestamp to an ISO 8601 formatted string.
+
+    Args:
+      timestamp (int): number of micro seconds since January 1, 1970,
+          00:00:00 UTC.
+      raise_error (Optional[bool]): True if an OverflowError should be raised
+          if the timestamp is out of bounds.
+
+    Returns:
+      str: ISO 8601 formatted date and time.
+
+    Raises:
+      OverflowError: if raise_error is set and the timestamp is out of bounds.
+    """
+    datetime_object = self.CopyToDatetime(timestamp, raise_error=raise_error)
+    return datetime_object.isoformat()
+
+
 def GetCurrentYear():
   """Determines the current year."""
   datetime_object = datetime.datetime.now()
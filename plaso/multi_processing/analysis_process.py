@@ -12,10 +12,15 @@ from plaso.multi_processing import base_process
 
 
 class AnalysisProcess(base_process.MultiProcessBaseProcess):
-  """Class that defines a multi-processing analysis process."""
+  """Class that defines a multi-processing analysis process.
+
+  An analysis process runs one or more analysis plugins. When multiple plugins
+  run in the same process every event is read once and only passed to the
+  plugins that examine events of its data type.
+  """
 
   def __init__(
-      self, event_queue, storage_writer, knowledge_base, analysis_plugin,
+      self, event_queue, storage_writer, knowledge_base, analysis_plugins,
       data_location=None, event_filter_expression=None, **kwargs):
     """Initializes an analysis process.
 
@@ -27,7 +32,7 @@ class AnalysisProcess(base_process.MultiProcessBaseProcess):
       storage_writer (StorageWriter): storage writer for a session storage.
       knowledge_base (KnowledgeBase): contains information from the source
           data needed for analysis.
-      plugin (AnalysisProcess): plugin running in the process.
+      analysis_plugins (list[AnalysisPlugin]): plugins running in the process.
       data_location (Optional[str]): path to the location that data files
           should be loaded from.
       event_filter_expression (Optional[str]): event filter expression.
@@ -35,7 +40,8 @@ class AnalysisProcess(base_process.MultiProcessBaseProcess):
     super(AnalysisProcess, self).__init__(**kwargs)
     self._abort = False
     self._analysis_mediator = None
-    self._analysis_plugin = analysis_plugin
+    self._analysis_plugins = analysis_plugins or []
+    self._analysis_plugins_per_data_type = {}
     self._data_location = data_location
     self._debug_output = False
     self._event_filter_expression = event_filter_expression
@@ -85,7 +91,7 @@ class AnalysisProcess(base_process.MultiProcessBaseProcess):
 
     task = tasks.Task()
     # TODO: temporary solution.
-    task.identifier = self._analysis_plugin.plugin_name
+    task.identifier = self._name
 
     self._task_identifier = task.identifier
 
@@ -135,7 +141,8 @@ class AnalysisProcess(base_process.MultiProcessBaseProcess):
       if not self._abort:
         self._status = definitions.PROCESSING_STATUS_REPORTING
 
-        self._analysis_mediator.ProduceAnalysisReport(self._analysis_plugin)
+        for analysis_plugin in self._analysis_plugins:
+          self._analysis_mediator.ProduceAnalysisReport(analysis_plugin)
 
     # All exceptions need to be caught here to prevent the process
     # from being killed by an uncaught exception.
@@ -171,6 +178,27 @@ class AnalysisProcess(base_process.MultiProcessBaseProcess):
     except errors.QueueAlreadyClosed:
       logging.error(u'Queue for {0:s} was already closed.'.format(self.name))
 
+  def _GetAnalysisPluginsForDataType(self, data_type):
+    """Retrieves the analysis plugins that examine events of a data type.
+
+    Args:
+      data_type (str): event data type.
+
+    Returns:
+      list[AnalysisPlugin]: analysis plugins that examine events of the data
+          type.
+    """
+    analysis_plugins = self._analysis_plugins_per_data_type.get(
+        data_type, None)
+    if analysis_plugins is None:
+      analysis_plugins = [
+          analysis_plugin for analysis_plugin in self._analysis_plugins
+          if not analysis_plugin.EVENT_DATA_TYPES or
+          data_type in analysis_plugin.EVENT_DATA_TYPES]
+      self._analysis_plugins_per_data_type[data_type] = analysis_plugins
+
+    return analysis_plugins
+
   def _ProcessEvent(self, mediator, event):
     """Processes an event.
 
@@ -179,15 +207,19 @@ class AnalysisProcess(base_process.MultiProcessBaseProcess):
           analysis plugins and other components, such as storage and dfvfs.
       event (EventObject): event.
     """
-    try:
-      self._analysis_plugin.ExamineEvent(mediator, event)
-
-    except Exception as exception:  # pylint: disable=broad-except
-      # TODO: write analysis error.
-
-      if self._debug_output:
-        logging.warning(u'Unhandled exception while processing event object.')
-        logging.exception(exception)
+    data_type = getattr(event, u'data_type', None)
+    for analysis_plugin in self._GetAnalysisPluginsForDataType(data_type):
+      try:
+        analysis_plugin.ExamineEvent(mediator, event)
+
+      except Exception as exception:  # pylint: disable=broad-except
+        # TODO: write analysis error.
+
+        if self._debug_output:
+          logging.warning((
+              u'Unhandled exception while processing event object in '
+              u'analysis plugin: {0:s}.').format(analysis_plugin.plugin_name))
+          logging.exception(exception)
 
   def SignalAbort(self):
     """Signals the process to abort."""
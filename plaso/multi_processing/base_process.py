@@ -10,6 +10,7 @@ import signal
 import time
 
 from plaso.multi_processing import xmlrpc
+from plaso.multi_processing import zeromq_status
 
 
 class MultiProcessBaseProcess(multiprocessing.Process):
@@ -22,12 +23,17 @@ class MultiProcessBaseProcess(multiprocessing.Process):
   _NUMBER_OF_RPC_SERVER_START_ATTEMPTS = 14
   _PROCESS_JOIN_TIMEOUT = 5.0
 
-  def __init__(self, enable_sigsegv_handler=False, **kwargs):
+  def __init__(
+      self, enable_sigsegv_handler=False, status_subscriber_port=None,
+      **kwargs):
     """Initializes a process object.
 
     Args:
       enable_sigsegv_handler (Optional[bool]): True if the SIGSEGV handler
           should be enabled.
+      status_subscriber_port (Optional[int]): port of the process status
+          subscriber of the engine, where None represents the process status
+          is requested by the engine via the process status RPC server.
       kwargs (dict[str,object]): keyword arguments to pass to
           multiprocessing.Process.
     """
@@ -39,6 +45,7 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     self._pid = None
     self._rpc_server = None
     self._status_is_running = False
+    self._status_subscriber_port = status_subscriber_port
 
     # We need to share the RPC port number with the engine process.
     self.rpc_port = multiprocessing.Value(u'I', 0)
@@ -107,10 +114,26 @@ class MultiProcessBaseProcess(multiprocessing.Process):
     if self._rpc_server:
       return
 
-    self._rpc_server = xmlrpc.XMLProcessStatusRPCServer(self._GetStatus)
-
     hostname = u'localhost'
 
+    if self._status_subscriber_port:
+      self._rpc_server = zeromq_status.ZeroMQProcessStatusPublisher(
+          self._GetStatus, self._pid)
+
+      if not self._rpc_server.Start(hostname, self._status_subscriber_port):
+        logging.error((
+            u'Unable to start a process status publisher for {0!s} '
+            u'(PID: {1:d})').format(self._name, self._pid))
+        self._rpc_server = None
+        return
+
+      logging.debug(
+          u'Process: {0!s} process status publisher started'.format(
+              self._name))
+      return
+
+    self._rpc_server = xmlrpc.XMLProcessStatusRPCServer(self._GetStatus)
+
     # Try the PID as port number first otherwise pick something random
     # between 1024 and 60000.
     if self._pid < 1024 or self._pid > 60000:
@@ -145,8 +168,10 @@ class MultiProcessBaseProcess(multiprocessing.Process):
       return
 
     # Make sure the engine gets one more status update so it knows
-    # the worker has completed.
-    self._WaitForStatusNotRunning()
+    # the worker has completed. The process status publisher publishes
+    # the status a last time when it is stopped.
+    if not self._status_subscriber_port:
+      self._WaitForStatusNotRunning()
 
     self._rpc_server.Stop()
     self._rpc_server = None
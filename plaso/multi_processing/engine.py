@@ -14,6 +14,7 @@ from plaso.engine import engine
 from plaso.lib import definitions
 from plaso.multi_processing import process_info
 from plaso.multi_processing import xmlrpc
+from plaso.multi_processing import zeromq_status
 
 
 class MultiProcessEngine(engine.BaseEngine):
@@ -21,7 +22,8 @@ class MultiProcessEngine(engine.BaseEngine):
 
   This class contains functionality to:
   * monitor and manage worker processes;
-  * retrieve a process status information via RPC;
+  * retrieve a process status information via RPC or a process status
+    subscriber;
   * manage the status update thread.
   """
 
@@ -53,6 +55,9 @@ class MultiProcessEngine(engine.BaseEngine):
             the processing;
           * 'serializers' to profile CPU time consumed by individual
             serializers.
+          * 'tracing' to record the time spent per task, file and parser
+            as a Chrome trace. Tracing is not part of 'all' and records every
+            file regardless of the sample rate.
     """
     super(MultiProcessEngine, self).__init__(
         debug_output=debug_output, enable_profiling=enable_profiling,
@@ -66,6 +71,7 @@ class MultiProcessEngine(engine.BaseEngine):
     self._rpc_clients_per_pid = {}
     self._rpc_errors_per_pid = {}
     self._show_memory_usage = False
+    self._status_subscriber = None
     self._status_update_active = False
     self._status_update_callback = None
     self._status_update_thread = None
@@ -124,10 +130,7 @@ class MultiProcessEngine(engine.BaseEngine):
     process = self._processes_per_pid[pid]
 
     process_status = self._GetProcessStatus(process)
-    if process_status is None:
-      process_is_alive = False
-    else:
-      process_is_alive = True
+    process_is_alive = process.is_alive()
 
     if isinstance(process_status, dict):
       self._rpc_errors_per_pid[pid] = 0
@@ -140,13 +143,19 @@ class MultiProcessEngine(engine.BaseEngine):
       if rpc_errors > self._MAXIMUM_RPC_ERRORS:
         process_is_alive = False
 
-      if process_is_alive:
+      if process_is_alive and self._status_subscriber:
+        logging.warning((
+            u'No recent status received from process: {0:s} '
+            u'(PID: {1:d}).').format(process.name, pid))
+
+      elif process_is_alive:
         rpc_port = process.rpc_port.value
         logging.warning((
             u'Unable to retrieve process: {0:s} (PID: {1:d}) status via '
             u'RPC socket: http://localhost:{2:d}').format(
                 process.name, pid, rpc_port))
 
+      if process_is_alive:
         processing_status_string = u'RPC error'
         status_indicator = definitions.PROCESSING_STATUS_RUNNING
       else:
@@ -182,10 +191,13 @@ class MultiProcessEngine(engine.BaseEngine):
       process (MultiProcessBaseProcess): process to query for its status.
 
     Returns:
-      dict[str, str]: status values received from the worker process.
+      dict[str, str]: status values received from the worker process or None
+          if no (recent) status could be retrieved.
     """
     process_is_alive = process.is_alive()
-    if process_is_alive:
+    if process_is_alive and self._status_subscriber:
+      process_status = self._status_subscriber.GetStatus(process.pid)
+    elif process_is_alive:
       rpc_client = self._rpc_clients_per_pid.get(process.pid, None)
       process_status = rpc_client.CallFunction()
     else:
@@ -302,6 +314,11 @@ class MultiProcessEngine(engine.BaseEngine):
       raise KeyError(
           u'RPC client (PID: {0:d}) already exists'.format(pid))
 
+    if self._status_subscriber:
+      self._process_information_per_pid[pid] = process_info.ProcessInfo(pid)
+      self._status_subscriber.ResetStatus(pid)
+      return
+
     process = self._processes_per_pid[pid]
     rpc_client = xmlrpc.XMLProcessStatusRPCClient()
 
@@ -329,6 +346,19 @@ class MultiProcessEngine(engine.BaseEngine):
     self._rpc_clients_per_pid[pid] = rpc_client
     self._process_information_per_pid[pid] = process_info.ProcessInfo(pid)
 
+  def _StartProcessStatusSubscriber(self):
+    """Starts the process status subscriber.
+
+    When the process status subscriber is running, processes started with
+    its port publish their status instead of being queried via RPC.
+
+    Returns:
+      int: port of the process status subscriber.
+    """
+    self._status_subscriber = zeromq_status.ZeroMQProcessStatusSubscriber()
+    self._status_subscriber.Start()
+    return self._status_subscriber.port
+
   def _StartStatusUpdateThread(self):
     """Starts the status update thread."""
     self._status_update_active = True
@@ -364,6 +394,9 @@ class MultiProcessEngine(engine.BaseEngine):
     if pid in self._rpc_errors_per_pid:
       del self._rpc_errors_per_pid[pid]
 
+    if self._status_subscriber:
+      self._status_subscriber.RemoveStatus(pid)
+
     logging.debug((
         u'Process: {0:s} (PID: {1:d}) has been removed from the monitoring '
         u'list.').format(process.name, pid))
@@ -373,6 +406,14 @@ class MultiProcessEngine(engine.BaseEngine):
     for pid in iter(self._process_information_per_pid.keys()):
       self._StopMonitoringProcess(pid)
 
+  def _StopProcessStatusSubscriber(self):
+    """Stops the process status subscriber."""
+    if not self._status_subscriber:
+      return
+
+    self._status_subscriber.Stop()
+    self._status_subscriber = None
+
   def _StopStatusUpdateThread(self):
     """Stops the status update thread."""
     self._status_update_active = False
@@ -0,0 +1,321 @@
+# -*- coding: utf-8 -*-
+"""Processing metrics and a HTTP server that exposes them.
+
+The metrics are formatted in the Prometheus text exposition format,
+so that they can be scraped while processing.
+"""
+
+import BaseHTTPServer
+import logging
+import SocketServer
+import threading
+import time
+
+
+class ProcessingMetrics(object):
+  """Class that contains processing metrics."""
+
+  _CONTENT_TYPE = u'text/plain; version=0.0.4; charset=utf-8'
+
+  # Prefix of the metric names.
+  _METRIC_NAME_PREFIX = u'plaso'
+
+  def __init__(self):
+    """Initializes processing metrics."""
+    super(ProcessingMetrics, self).__init__()
+    self._events_per_parser = {}
+    self._events_per_second_per_parser = {}
+    self._last_update_timestamp = None
+    self._lock = threading.Lock()
+    self._text = u''
+
+  @property
+  def content_type(self):
+    """str: content type of the metrics text."""
+    return self._CONTENT_TYPE
+
+  def _EscapeLabelValue(self, value):
+    """Escapes a label value.
+
+    Args:
+      value (str): label value.
+
+    Returns:
+      str: escaped label value.
+    """
+    value = u'{0!s}'.format(value)
+    value = value.replace(u'\\', u'\\\\')
+    value = value.replace(u'"', u'\\"')
+    return value.replace(u'\n', u'\\n')
+
+  def _FormatMetric(self, name, metric_type, help_text, samples):
+    """Formats a metric.
+
+    Args:
+      name (str): name of the metric without prefix.
+      metric_type (str): type of the metric, such as "counter" or "gauge".
+      help_text (str): description of the metric.
+      samples (list[tuple[dict[str, str], float]]): labels and values of
+          the samples of the metric.
+
+    Returns:
+      list[str]: lines of the formatted metric.
+    """
+    name = u'{0:s}_{1:s}'.format(self._METRIC_NAME_PREFIX, name)
+
+    lines = [
+        u'# HELP {0:s} {1:s}'.format(name, help_text),
+        u'# TYPE {0:s} {1:s}'.format(name, metric_type)]
+
+    for labels, value in samples:
+      if labels:
+        labels_string = u','.join([
+            u'{0:s}="{1:s}"'.format(key, self._EscapeLabelValue(labels[key]))
+            for key in sorted(labels.keys())])
+        labels_string = u'{{{0:s}}}'.format(labels_string)
+      else:
+        labels_string = u''
+
+      lines.append(u'{0:s}{1:s} {2!r}'.format(
+          name, labels_string, float(value or 0)))
+
+    return lines
+
+  def _UpdateEventsPerParser(self, events_per_parser, timestamp):
+    """Updates the number of events and event rate per parser.
+
+    Args:
+      events_per_parser (dict[str, int]): number of events per parser.
+      timestamp (float): POSIX timestamp of the update.
+    """
+    if self._last_update_timestamp is not None:
+      elapsed_time = timestamp - self._last_update_timestamp
+      if elapsed_time > 0.0:
+        self._events_per_second_per_parser = {}
+        for parser_name, number_of_events in events_per_parser.items():
+          number_of_events -= self._events_per_parser.get(parser_name, 0)
+          self._events_per_second_per_parser[parser_name] = (
+              number_of_events / elapsed_time)
+
+    self._events_per_parser = dict(events_per_parser)
+    self._last_update_timestamp = timestamp
+
+  def GetText(self):
+    """Retrieves the metrics text.
+
+    Returns:
+      str: metrics in the Prometheus text exposition format.
+    """
+    with self._lock:
+      return self._text
+
+  def Update(
+      self, processing_status, events_per_parser=None, memory_per_pid=None,
+      number_of_processing_tasks=0, number_of_queued_tasks=0,
+      number_of_tasks_ready_for_merge=0, timestamp=None):
+    """Updates the metrics.
+
+    Args:
+      processing_status (ProcessingStatus): processing status.
+      events_per_parser (Optional[dict[str, int]]): number of events merged
+          into the session storage per parser.
+      memory_per_pid (Optional[dict[int, int]]): resident memory, in bytes,
+          per process identifier (PID).
+      number_of_processing_tasks (Optional[int]): number of tasks being
+          processed by worker processes.
+      number_of_queued_tasks (Optional[int]): number of scheduled tasks that
+          are waiting for a worker process.
+      number_of_tasks_ready_for_merge (Optional[int]): number of tasks of
+          which the task storage is waiting to be merged.
+      timestamp (Optional[float]): POSIX timestamp of the update, where None
+          represents the current time.
+    """
+    if timestamp is None:
+      timestamp = time.time()
+
+    events_per_parser = dict(events_per_parser or {})
+    # The total is exposed as a separate metric.
+    events_per_parser.pop(u'total', None)
+
+    memory_per_pid = memory_per_pid or {}
+
+    self._UpdateEventsPerParser(events_per_parser, timestamp)
+
+    processes_status = []
+    if processing_status.foreman_status:
+      processes_status.append(processing_status.foreman_status)
+    processes_status.extend(processing_status.workers_status)
+
+    lines = []
+    lines.extend(self._FormatMetric(
+        u'parser_events_total', u'counter',
+        u'Number of events produced per parser.',
+        [({u'parser': parser_name}, number_of_events)
+         for parser_name, number_of_events in sorted(
+             self._events_per_parser.items())]))
+
+    lines.extend(self._FormatMetric(
+        u'parser_events_per_second', u'gauge',
+        u'Number of events produced per parser per second.',
+        [({u'parser': parser_name}, events_per_second)
+         for parser_name, events_per_second in sorted(
+             self._events_per_second_per_parser.items())]))
+
+    lines.extend(self._FormatMetric(
+        u'process_consumed_sources_total', u'counter',
+        u'Number of event sources consumed per process.',
+        [({u'process': process_status.identifier},
+          process_status.number_of_consumed_sources)
+         for process_status in processes_status]))
+
+    lines.extend(self._FormatMetric(
+        u'process_produced_events_total', u'counter',
+        u'Number of events produced per process.',
+        [({u'process': process_status.identifier},
+          process_status.number_of_produced_events)
+         for process_status in processes_status]))
+
+    lines.extend(self._FormatMetric(
+        u'process_resident_memory_bytes', u'gauge',
+        u'Resident memory size per process in bytes.',
+        [({u'process': process_status.identifier},
+          memory_per_pid[process_status.pid])
+         for process_status in processes_status
+         if process_status.pid in memory_per_pid]))
+
+    lines.extend(self._FormatMetric(
+        u'tasks_queued', u'gauge',
+        u'Number of tasks waiting for a worker process.',
+        [(None, number_of_queued_tasks)]))
+
+    lines.extend(self._FormatMetric(
+        u'tasks_processing', u'gauge',
+        u'Number of tasks being processed by worker processes.',
+        [(None, number_of_processing_tasks)]))
+
+    lines.extend(self._FormatMetric(
+        u'merge_backlog_tasks', u'gauge',
+        u'Number of task storage files waiting to be merged.',
+        [(None, number_of_tasks_ready_for_merge)]))
+
+    lines.append(u'')
+
+    with self._lock:
+      self._text = u'\n'.join(lines)
+
+
+class _MetricsHTTPRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+  """Class that defines the metrics HTTP request handler."""
+
+  _METRICS_PATH = u'/metrics'
+
+  # pylint: disable=invalid-name
+  def do_GET(self):
+    """Handles a GET request."""
+    path, _, _ = self.path.partition(u'?')
+    if path != self._METRICS_PATH:
+      self.send_error(404)
+      return
+
+    metrics = self.server.metrics
+    data = metrics.GetText().encode(u'utf-8')
+
+    self.send_response(200)
+    self.send_header(u'Content-Type', metrics.content_type)
+    self.send_header(u'Content-Length', u'{0:d}'.format(len(data)))
+    self.end_headers()
+    self.wfile.write(data)
+
+  # pylint: disable=redefined-builtin
+  def log_message(self, format, *args):
+    """Logs a request.
+
+    Args:
+      format (str): format string of the message.
+      args (list[object]): values of the message.
+    """
+    logging.debug(format % args)
+
+
+class _MetricsHTTPServer(
+    SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+  """Class that defines the threaded metrics HTTP server.
+
+  Attributes:
+    metrics (ProcessingMetrics): processing metrics.
+  """
+
+  daemon_threads = True
+
+  def __init__(self, server_address, metrics):
+    """Initializes the metrics HTTP server.
+
+    Args:
+      server_address (tuple[str, int]): hostname and port to bind to.
+      metrics (ProcessingMetrics): processing metrics.
+    """
+    BaseHTTPServer.HTTPServer.__init__(
+        self, server_address, _MetricsHTTPRequestHandler)
+    self.metrics = metrics
+
+
+class MetricsHTTPServer(object):
+  """Class that defines a HTTP server that exposes processing metrics.
+
+  Attributes:
+    port (int): port the HTTP server is bound to.
+  """
+
+  _THREAD_NAME = u'metrics_http_server'
+
+  def __init__(self, metrics):
+    """Initializes the metrics HTTP server.
+
+    Args:
+      metrics (ProcessingMetrics): processing metrics.
+    """
+    super(MetricsHTTPServer, self).__init__()
+    self._http_server = None
+    self._http_thread = None
+    self._metrics = metrics
+
+    self.port = None
+
+  def Start(self, hostname, port):
+    """Starts the metrics HTTP server.
+
+    Args:
+      hostname (str): hostname or IP address to bind to.
+      port (int): port to bind to, where 0 represents a random port.
+
+    Returns:
+      bool: True if the HTTP server was successfully started.
+    """
+    try:
+      self._http_server = _MetricsHTTPServer((hostname, port), self._metrics)
+    except SocketServer.socket.error as exception:
+      logging.warning((
+          u'Unable to bind a metrics HTTP server on {0:s}:{1:d} with error: '
+          u'{2!s}').format(hostname, port, exception))
+      return False
+
+    _, self.port = self._http_server.server_address
+
+    self._http_thread = threading.Thread(
+        name=self._THREAD_NAME, target=self._http_server.serve_forever)
+    self._http_thread.daemon = True
+    self._http_thread.start()
+    return True
+
+  def Stop(self):
+    """Stops the metrics HTTP server."""
+    if not self._http_server:
+      return
+
+    self._http_server.shutdown()
+    self._http_server.server_close()
+    self._http_server = None
+
+    if self._http_thread.isAlive():
+      self._http_thread.join()
+    self._http_thread = None
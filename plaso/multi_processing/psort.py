@@ -11,6 +11,7 @@ from plaso.engine import plaso_queue
 from plaso.engine import zeromq_queue
 from plaso.lib import bufferlib
 from plaso.lib import definitions
+from plaso.lib import filter_planner
 from plaso.multi_processing import analysis_process
 from plaso.multi_processing import engine as multi_process_engine
 from plaso.multi_processing import multi_process_queue
@@ -28,10 +29,15 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
   # The number of seconds to wait for analysis plugins to compile their reports.
   _ANALYSIS_PLUGIN_TIMEOUT = 60
 
+  # The maximum number of events sent to an analysis process in a single
+  # ZeroMQ message.
+  _ZEROMQ_EVENT_QUEUE_BATCH_SIZE = 100
+
   def __init__(
       self, debug_output=False, enable_profiling=False,
       profiling_directory=None, profiling_sample_rate=1000,
-      profiling_type=u'all', use_zeromq=True):
+      profiling_type=u'all', use_shared_analysis_process=False,
+      use_zeromq=True):
     """Initializes an engine object.
 
     Args:
@@ -50,6 +56,9 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
             the processing;
           * 'serializers' to profile CPU time consumed by individual
             serializers.
+      use_shared_analysis_process (Optional[bool]): True if the analysis
+          plugins that support it should run in a single shared analysis
+          process instead of a process per plugin.
       use_zeromq (Optional[bool]): True if ZeroMQ should be used for queuing
           instead of Python's multiprocessing queue.
     """
@@ -58,6 +67,8 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
         profiling_directory=profiling_directory,
         profiling_sample_rate=profiling_sample_rate,
         profiling_type=profiling_type)
+    self._analysis_high_water_marks = {}
+    self._event_queue_high_water_marks = []
     self._event_queues = []
     self._merge_task_identifier = u''
     self._number_of_consumed_errors = 0
@@ -70,6 +81,7 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     self._number_of_produced_sources = 0
     self._status = definitions.PROCESSING_STATUS_IDLE
     self._status_update_callback = None
+    self._use_shared_analysis_process = use_shared_analysis_process
     self._use_zeromq = use_zeromq
 
   def _AnalyzeEvents(self, storage_writer, analysis_plugins, event_filter=None):
@@ -96,10 +108,22 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     number_of_filtered_events = 0
 
+    # Until the analysis completes the events analyzed by the plugins in this
+    # session are not known.
+    for analysis_plugin in analysis_plugins:
+      storage_writer.SetAnalysisHighWaterMarks(analysis_plugin.plugin_name, [])
+
+    # The number of events per event stream, which are the high-water marks
+    # of the analysis plugins after the events have been analyzed.
+    event_stream_sizes = []
+
     logging.debug(u'Processing events.')
 
     filter_limit = getattr(event_filter, u'limit', None)
 
+    event_queues = list(zip(
+        self._event_queues, self._event_queue_high_water_marks))
+
     for event in storage_writer.GetEvents():
       if event_filter:
         filter_match = event_filter.Match(event)
@@ -111,7 +135,22 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
         number_of_filtered_events += 1
         continue
 
-      for event_queue in self._event_queues:
+      store_number = getattr(event, u'store_number', None)
+      store_index = getattr(event, u'store_index', None)
+      if store_number is not None and store_index is not None:
+        if store_number > len(event_stream_sizes):
+          event_stream_sizes.extend(
+              [0] * (store_number - len(event_stream_sizes)))
+        if store_index >= event_stream_sizes[store_number - 1]:
+          event_stream_sizes[store_number - 1] = store_index + 1
+
+      for event_queue, high_water_marks in event_queues:
+        # Skip events that were analyzed by a previous run of the plugins.
+        if (high_water_marks and store_number is not None and
+            0 < store_number <= len(high_water_marks) and
+            store_index < high_water_marks[store_number - 1]):
+          continue
+
         event_queue.PushItem(event)
 
       self._number_of_consumed_events += 1
@@ -123,20 +162,26 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     logging.debug(u'Processing analysis plugin results.')
 
     # TODO: use a task based approach.
-    plugin_names = [plugin.plugin_name for plugin in analysis_plugins]
-    while plugin_names:
-      for plugin_name in list(plugin_names):
+    task_identifiers = [
+        self._GetAnalysisTaskIdentifier(analysis_plugin_group)
+        for analysis_plugin_group in self._GetAnalysisPluginGroups(
+            analysis_plugins)]
+    while task_identifiers:
+      for task_identifier in list(task_identifiers):
         if self._abort:
           break
 
-        # TODO: temporary solution.
-        task_identifier = plugin_name
-
         if storage_writer.CheckTaskStorageReadyForMerge(task_identifier):
           storage_writer.MergeTaskStorage(task_identifier)
 
           # TODO: temporary solution.
-          plugin_names.remove(plugin_name)
+          task_identifiers.remove(task_identifier)
+
+    # The high-water marks are only known if every event was analyzed.
+    if not event_filter and not self._abort:
+      for analysis_plugin in analysis_plugins:
+        storage_writer.SetAnalysisHighWaterMarks(
+            analysis_plugin.plugin_name, event_stream_sizes)
 
     storage_writer.StopTaskStorage(abort=self._abort)
 
@@ -237,13 +282,38 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       if use_time_slicer:
         time_slice_buffer = bufferlib.CircularBuffer(time_slice.duration)
 
+    # The time slicer also exports the events that do not match the filter,
+    # hence the storage can only skip events if the time slicer is not used.
+    filter_object = None
+    if event_filter and not time_slice_buffer:
+      filter_object = self._GetFilterObject(event_filter)
+
+    event_predicate = None
+    time_range = time_slice
+    if filter_object:
+      planner = filter_planner.FilterPlanner()
+      event_predicate = planner.GetEventPredicate(filter_object)
+      time_range = planner.GetTimeRange(filter_object, time_range=time_slice)
+
     filter_limit = getattr(event_filter, u'limit', None)
     forward_entries = 0
 
     number_of_filtered_events = 0
     number_of_events_from_time_slice = 0
 
-    for event in storage_reader.GetEvents(time_range=time_slice):
+    last_status_update_time = time.time()
+
+    for event in storage_reader.GetEvents(
+        time_range=time_range, event_predicate=event_predicate):
+      if self._status_update_callback:
+        current_time = time.time()
+        if (current_time - last_status_update_time >=
+            self._STATUS_UPDATE_INTERVAL):
+          self._UpdateEventsStatus(
+              event_buffer, number_of_filtered_events,
+              number_of_events_from_time_slice)
+          last_status_update_time = current_time
+
       if event_filter:
         filter_match = event_filter.Match(event)
       else:
@@ -299,11 +369,133 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       events_counter[u'Duplicate events removed'] = (
           event_buffer.duplicate_counter)
 
+    if event_buffer.number_of_spilled_events:
+      events_counter[u'Events spilled to disk'] = (
+          event_buffer.number_of_spilled_events)
+
+    if self._status_update_callback:
+      self._UpdateEventsStatus(
+          event_buffer, number_of_filtered_events,
+          number_of_events_from_time_slice)
+
     if filter_limit:
       events_counter[u'Limited By'] = filter_limit
 
     return events_counter
 
+  def _GetAnalysisPluginGroups(self, analysis_plugins):
+    """Groups the analysis plugins per analysis process.
+
+    Args:
+      analysis_plugins (list[AnalysisPlugin]): analysis plugins that should
+          be run.
+
+    Returns:
+      list[list[AnalysisPlugin]]: analysis plugins per analysis process.
+    """
+    if not self._use_shared_analysis_process:
+      return [[analysis_plugin] for analysis_plugin in analysis_plugins]
+
+    # Plugins only share an analysis process with plugins that have the same
+    # high-water marks, since the process is passed the same events.
+    shared_analysis_plugin_groups = collections.OrderedDict()
+    analysis_plugin_groups = []
+    for analysis_plugin in analysis_plugins:
+      if analysis_plugin.ENABLE_IN_SHARED_PROCESS:
+        high_water_marks = tuple(self._analysis_high_water_marks.get(
+            analysis_plugin.plugin_name, []))
+        shared_analysis_plugin_groups.setdefault(high_water_marks, [])
+        shared_analysis_plugin_groups[high_water_marks].append(
+            analysis_plugin)
+      else:
+        analysis_plugin_groups.append([analysis_plugin])
+
+    return list(shared_analysis_plugin_groups.values()) + analysis_plugin_groups
+
+  def _GetAnalysisTaskIdentifier(self, analysis_plugins):
+    """Retrieves the task identifier of an analysis process.
+
+    Args:
+      analysis_plugins (list[AnalysisPlugin]): analysis plugins that run
+          in the analysis process.
+
+    Returns:
+      str: task identifier, which is also used as the name of the process.
+    """
+    # TODO: temporary solution.
+    return u'+'.join([
+        analysis_plugin.plugin_name for analysis_plugin in analysis_plugins])
+
+  def _GetFilterObject(self, event_filter):
+    """Retrieves the object filter of an event filter.
+
+    Args:
+      event_filter (FilterObject): event filter.
+
+    Returns:
+      objectfilter.Filter: filter object the event filter was compiled from
+          or None if not available.
+    """
+    matcher = getattr(event_filter, u'matcher', None)
+    return getattr(matcher, u'filter_object', None)
+
+  def _ReadAnalysisHighWaterMarks(self, storage_writer, analysis_plugins):
+    """Reads the analysis high-water marks of previous runs.
+
+    The reports of the previous runs of the analysis plugins that support
+    incremental analysis are merged into the state of the plugins.
+
+    Args:
+      storage_writer (StorageWriter): storage writer.
+      analysis_plugins (list[AnalysisPlugin]): analysis plugins that should
+          be run.
+
+    Returns:
+      dict[str, list[int]]: number of events per event stream that were
+          analyzed by a previous run per analysis plugin.
+    """
+    incremental_analysis_plugins = {}
+    for analysis_plugin in analysis_plugins:
+      if analysis_plugin.ENABLE_INCREMENTAL_ANALYSIS:
+        incremental_analysis_plugins[analysis_plugin.plugin_name] = (
+            analysis_plugin)
+
+    if not incremental_analysis_plugins:
+      return {}
+
+    # The storage writer is closed again before the analysis processes are
+    # started, otherwise the processes would inherit the open storage file.
+    storage_writer.Open()
+
+    try:
+      previous_high_water_marks = storage_writer.GetAnalysisHighWaterMarks()
+
+      previous_analysis_reports = {}
+      for analysis_report in storage_writer.GetAnalysisReports():
+        if analysis_report.plugin_name in incremental_analysis_plugins:
+          previous_analysis_reports[analysis_report.plugin_name] = (
+              analysis_report)
+
+    finally:
+      storage_writer.Close()
+
+    analysis_high_water_marks = {}
+    for plugin_name, analysis_plugin in iter(
+        incremental_analysis_plugins.items()):
+      high_water_marks = previous_high_water_marks.get(plugin_name, None)
+      analysis_report = previous_analysis_reports.get(plugin_name, None)
+      if not high_water_marks or not analysis_report:
+        continue
+
+      logging.info((
+          u'Analysis plugin: {0:s} only analyzes events added since its '
+          u'previous run.').format(plugin_name))
+
+      analysis_plugin.MergeAnalysisReport(analysis_report)
+      analysis_high_water_marks[plugin_name] = high_water_marks
+
+    return analysis_high_water_marks
+
   def _StartAnalysisProcesses(
       self, knowledge_base_object, storage_writer, analysis_plugins,
       data_location, event_filter_expression=None):
@@ -321,9 +513,13 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
     """
     logging.info(u'Starting analysis plugins.')
 
-    for analysis_plugin in analysis_plugins:
+    for analysis_plugin_group in self._GetAnalysisPluginGroups(
+        analysis_plugins):
+      task_identifier = self._GetAnalysisTaskIdentifier(analysis_plugin_group)
+
       if self._use_zeromq:
-        output_event_queue = zeromq_queue.ZeroMQPushBindQueue()
+        output_event_queue = zeromq_queue.ZeroMQPushBindQueue(
+            batch_size=self._ZEROMQ_EVENT_QUEUE_BATCH_SIZE)
         # Open the queue so it can bind to a random port, and we can get the
         # port number to use in the input queue.
         output_event_queue.Open()
@@ -334,6 +530,11 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
       self._event_queues.append(output_event_queue)
 
+      # The plugins in a group have the same high-water marks.
+      self._event_queue_high_water_marks.append(
+          self._analysis_high_water_marks.get(
+              analysis_plugin_group[0].plugin_name, []))
+
       if self._use_zeromq:
         input_event_queue = zeromq_queue.ZeroMQPullConnectQueue(
             delay_open=True, port=output_event_queue.port)
@@ -343,14 +544,14 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
       process = analysis_process.AnalysisProcess(
           input_event_queue, storage_writer, knowledge_base_object,
-          analysis_plugin, data_location=data_location,
+          analysis_plugin_group, data_location=data_location,
           event_filter_expression=event_filter_expression,
-          name=analysis_plugin.plugin_name)
+          name=task_identifier)
 
       process.start()
 
-      logging.info(u'Started analysis plugin: {0:s} (PID: {1:d}).'.format(
-          analysis_plugin.plugin_name, process.pid))
+      logging.info(u'Started analysis plugins: {0:s} (PID: {1:d}).'.format(
+          task_identifier, process.pid))
 
       self._RegisterProcess(process)
       self._StartMonitoringProcess(process.pid)
@@ -420,6 +621,25 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
       for event_queue in self._event_queues:
         event_queue.Close(abort=True)
 
+  def _UpdateEventsStatus(
+      self, event_buffer, number_of_filtered_events,
+      number_of_events_from_time_slice):
+    """Updates the events status and calls the status update callback.
+
+    Args:
+      event_buffer (EventBuffer): event buffer.
+      number_of_filtered_events (int): number of events that were filtered.
+      number_of_events_from_time_slice (int): number of events from the time
+          slice.
+    """
+    self._processing_status.UpdateEventsStatus(
+        event_buffer.duplicate_counter, number_of_events_from_time_slice,
+        number_of_filtered_events, event_buffer.number_of_spilled_events,
+        event_buffer.peak_number_of_buffered_events,
+        self._number_of_consumed_events)
+
+    self._status_update_callback(self._processing_status)
+
   def _UpdateProcessingStatus(self, pid, process_status):
     """Updates the processing status.
 
@@ -505,6 +725,13 @@ class PsortMultiProcessEngine(multi_process_engine.MultiProcessEngine):
 
     self._status_update_callback = status_update_callback
 
+    # Events are only skipped based on the high-water marks of a previous
+    # run if all events are analyzed.
+    self._analysis_high_water_marks = {}
+    if not event_filter:
+      self._analysis_high_water_marks = self._ReadAnalysisHighWaterMarks(
+          storage_writer, analysis_plugins)
+
     # Set up the storage writer before the analysis processes.
     storage_writer.StartTaskStorage()
 
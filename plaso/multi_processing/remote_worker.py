@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""The remote worker host, which runs worker processes for a remote foreman."""
+
+import logging
+import os
+import shutil
+import tempfile
+
+from plaso.containers import sessions
+from plaso.engine import zeromq_queue
+from plaso.multi_processing import worker_process
+from plaso.storage import zip_file as storage_zip_file
+
+
+class RemoteWorkerHost(object):
+  """Class that runs extraction worker processes for a remote foreman.
+
+  The worker processes request tasks from the task queue of the foreman and
+  send their task storage back over the task storage queue of the foreman,
+  hence the worker host does not need to share a file system with the
+  foreman. Note that the path specifications of the tasks must resolve on
+  the worker host.
+  """
+
+  _PROCESS_JOIN_TIMEOUT = 5.0
+
+  def __init__(
+      self, foreman_host, task_queue_port, task_storage_queue_port,
+      debug_output=False):
+    """Initializes a remote worker host.
+
+    Args:
+      foreman_host (str): host name or IP address of the foreman.
+      task_queue_port (int): TCP port of the task queue of the foreman.
+      task_storage_queue_port (int): TCP port of the task storage queue of
+          the foreman.
+      debug_output (Optional[bool]): True if debug output should be enabled.
+    """
+    super(RemoteWorkerHost, self).__init__()
+    self._debug_output = debug_output
+    self._foreman_host = foreman_host
+    self._processes = []
+    self._task_queue_port = task_queue_port
+    self._task_storage_queue_port = task_storage_queue_port
+
+  def _StartWorkerProcess(
+      self, process_name, storage_writer, knowledge_base, session_identifier,
+      **kwargs):
+    """Creates and starts a worker process.
+
+    Args:
+      process_name (str): name of the process.
+      storage_writer (StorageWriter): storage writer used to create the task
+          storage on the worker host.
+      knowledge_base (KnowledgeBase): knowledge base which contains
+          information from the source data needed for parsing.
+      session_identifier (str): identifier of the session.
+      kwargs: keyword arguments to pass to the worker process.
+
+    Returns:
+      WorkerProcess: worker process.
+    """
+    logging.debug(u'Starting remote worker process {0:s}'.format(process_name))
+
+    task_queue = zeromq_queue.ZeroMQRequestConnectQueue(
+        delay_open=True, host=self._foreman_host, linger_seconds=0,
+        name=u'{0:s} task queue'.format(process_name),
+        port=self._task_queue_port, timeout_seconds=2)
+
+    task_storage_queue = zeromq_queue.ZeroMQPushConnectQueue(
+        delay_open=True, host=self._foreman_host,
+        name=u'{0:s} task storage queue'.format(process_name),
+        port=self._task_storage_queue_port)
+
+    process = worker_process.WorkerProcess(
+        task_queue, storage_writer, knowledge_base, session_identifier,
+        debug_output=self._debug_output, name=process_name,
+        task_storage_queue=task_storage_queue, **kwargs)
+
+    process.start()
+
+    return process
+
+  def ProcessTasks(
+      self, session_identifier, knowledge_base, filter_object=None,
+      hasher_names_string=None, mount_path=None, number_of_worker_processes=1,
+      parser_filter_expression=None, preferred_year=None,
+      process_archive_files=False, temporary_directory=None, text_prepend=None,
+      yara_rules_string=None):
+    """Processes tasks of the foreman until the foreman signals completion.
+
+    The extraction options should be the same as those used by the foreman.
+
+    Args:
+      session_identifier (str): identifier of the session.
+      knowledge_base (KnowledgeBase): knowledge base which contains
+          information from the source data needed for parsing.
+      filter_object (Optional[objectfilter.Filter]): filter object.
+      hasher_names_string (Optional[str]): comma separated string of names
+          of hashers to use during processing.
+      mount_path (Optional[str]): mount path.
+      number_of_worker_processes (Optional[int]): number of worker processes.
+      parser_filter_expression (Optional[str]): parser filter expression,
+          where None represents all parsers and plugins.
+      preferred_year (Optional[int]): preferred year.
+      process_archive_files (Optional[bool]): True if archive files should be
+          scanned for file entries.
+      temporary_directory (Optional[str]): path of the directory for temporary
+          files.
+      text_prepend (Optional[str]): text to prepend to every event.
+      yara_rules_string (Optional[str]): unparsed yara rule definitions.
+    """
+    task_storage_directory = tempfile.mkdtemp(dir=temporary_directory)
+
+    # The storage writer is only used to store the task storage on the worker
+    # host until it is sent to the foreman.
+    session = sessions.Session()
+    storage_file_path = os.path.join(task_storage_directory, u'remote.plaso')
+    storage_writer = storage_zip_file.ZIPStorageFileWriter(
+        session, storage_file_path)
+    storage_writer.StartTaskStorage()
+
+    try:
+      for worker_number in range(number_of_worker_processes):
+        process_name = u'Remote_Worker_{0:02d}'.format(worker_number)
+        process = self._StartWorkerProcess(
+            process_name, storage_writer, knowledge_base, session_identifier,
+            filter_object=filter_object,
+            hasher_names_string=hasher_names_string, mount_path=mount_path,
+            parser_filter_expression=parser_filter_expression,
+            preferred_year=preferred_year,
+            process_archive_files=process_archive_files,
+            temporary_directory=temporary_directory,
+            text_prepend=text_prepend, yara_rules_string=yara_rules_string)
+        self._processes.append(process)
+
+      for process in self._processes:
+        process.join()
+
+    except KeyboardInterrupt:
+      for process in self._processes:
+        process.terminate()
+        process.join(timeout=self._PROCESS_JOIN_TIMEOUT)
+
+    finally:
+      self._processes = []
+
+      storage_writer.StopTaskStorage(abort=True)
+      shutil.rmtree(task_storage_directory, True)
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """The task multi-process processing engine."""
 
+import collections
 import logging
 import multiprocessing
 import os
+import threading
 # The 'Queue' module was renamed to 'queue' in Python 3
 try:
   import Queue
@@ -19,9 +21,13 @@ from plaso.engine import plaso_queue
 from plaso.engine import profiler
 from plaso.engine import zeromq_queue
 from plaso.lib import definitions
+from plaso.lib import errors
 from plaso.multi_processing import engine
+from plaso.multi_processing import metrics
 from plaso.multi_processing import multi_process_queue
+from plaso.multi_processing import process_info
 from plaso.multi_processing import task_manager
+from plaso.multi_processing import worker_pool
 from plaso.multi_processing import worker_process
 
 
@@ -31,8 +37,26 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
   This class contains functionality to:
   * monitor and manage extraction tasks;
   * merge results returned by extraction workers.
+
+  When a remote workers host is set, the task queue is also served to worker
+  processes on other hosts, which send their task storage back over a task
+  storage queue instead of via the (shared) file system.
+
+  When a maximum number of worker processes is set, the number of local
+  worker processes is adjusted to the event rate and memory usage of
+  the worker processes. When a worker memory limit is set, worker processes
+  that exceed it are replaced after completing their task. The task of
+  a worker process that stopped functioning is rescheduled.
+
+  When ZeroMQ is used, local worker processes publish their status to
+  the engine instead of being queried via RPC. When a metrics port is set,
+  processing metrics are exposed via HTTP in the Prometheus text format.
   """
 
+  # Maximum percentage of the total physical memory the worker processes can
+  # use combined, when the number of worker processes is adjusted.
+  _MAXIMUM_MEMORY_USAGE = 80.0
+
   # Maximum number of concurrent tasks.
   _MAXIMUM_NUMBER_OF_TASKS = 10000
 
@@ -46,9 +70,10 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
   def __init__(
       self, debug_output=False, enable_profiling=False,
-      maximum_number_of_tasks=_MAXIMUM_NUMBER_OF_TASKS,
+      maximum_number_of_tasks=_MAXIMUM_NUMBER_OF_TASKS, metrics_port=None,
       profiling_directory=None, profiling_sample_rate=1000,
-      profiling_type=u'all', use_zeromq=True):
+      profiling_type=u'all', remote_workers_host=None, task_queue_port=None,
+      task_storage_queue_port=None, use_zeromq=True):
     """Initializes an engine object.
 
     Args:
@@ -56,6 +81,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       enable_profiling (Optional[bool]): True if profiling should be enabled.
       maximum_number_of_tasks (Optional[int]): maximum number of concurrent
           tasks, where 0 represents no limit.
+      metrics_port (Optional[int]): TCP port of the local HTTP server that
+          exposes processing metrics, where 0 represents a random port and
+          None represents that the metrics are not exposed.
       profiling_directory (Optional[str]): path to the directory where
           the profiling sample files should be stored.
       profiling_sample_rate (Optional[int]): the profiling sample rate.
@@ -69,14 +97,32 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
             the processing;
           * 'serializers' to profile CPU time consumed by individual
             serializers.
+          * 'tracing' to record the time spent per task, file and parser
+            as a Chrome trace. Tracing is not part of 'all' and records every
+            file regardless of the sample rate.
+      remote_workers_host (Optional[str]): host name or IP address the task
+          and task storage queues bind to, so that worker processes on remote
+          hosts can connect to them, where "*" represents all interfaces.
+          None represents that only local worker processes are used.
+      task_queue_port (Optional[int]): TCP port of the task queue, where None
+          represents a random port.
+      task_storage_queue_port (Optional[int]): TCP port of the task storage
+          queue, where None represents a random port.
       use_zeromq (Optional[bool]): True if ZeroMQ should be used for queuing
           instead of Python's multiprocessing queue.
+
+    Raises:
+      ValueError: if remote workers are requested without ZeroMQ.
     """
+    if remote_workers_host and not use_zeromq:
+      raise ValueError(u'Remote workers require ZeroMQ.')
+
     super(TaskMultiProcessEngine, self).__init__(
         debug_output=debug_output, enable_profiling=enable_profiling,
         profiling_directory=profiling_directory,
         profiling_sample_rate=profiling_sample_rate,
         profiling_type=profiling_type)
+    self._completed_worker_pids = set()
     self._enable_sigsegv_handler = False
     self._filter_find_specs = None
     self._filter_object = None
@@ -85,6 +131,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._maximum_number_of_tasks = maximum_number_of_tasks
     self._memory_profiler = None
     self._merge_task_identifier = u''
+    self._metrics = None
+    self._metrics_http_server = None
+    self._metrics_port = metrics_port
     self._mount_path = None
     self._number_of_consumed_errors = 0
     self._number_of_consumed_events = 0
@@ -94,25 +143,105 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     self._number_of_produced_events = 0
     self._number_of_produced_reports = 0
     self._number_of_produced_sources = 0
+    self._number_of_remote_worker_processes = 0
+    self._number_of_tasks_ready_for_merge = 0
     self._number_of_worker_processes = 0
     self._parser_filter_expression = None
     self._preferred_year = None
     self._process_archive_files = False
+    self._process_information = None
     self._processing_profiler = None
+    self._remote_workers_host = remote_workers_host
     self._resolver_context = context.Context()
     self._serializers_profiler = None
     self._session_identifier = None
     self._status = definitions.PROCESSING_STATUS_IDLE
+    self._status_subscriber_port = None
     self._storage_writer = None
     self._task_queue = None
-    self._task_queue_port = None
+    self._task_queue_port = task_queue_port
     self._task_manager = task_manager.TaskManager(
         maximum_number_of_tasks=maximum_number_of_tasks)
+    self._task_storage_queue = None
+    self._task_storage_queue_port = task_storage_queue_port
+    self._task_storage_receiver_active = False
+    self._task_storage_receiver_thread = None
+    self._task_identifier_per_pid = {}
+    self._tasks_to_reschedule = collections.deque()
     self._temporary_directory = None
     self._text_prepend = None
+    self._tracing_profiler = None
     self._use_zeromq = use_zeromq
+    self._worker_memory_limit = None
+    self._worker_pool_controller = None
     self._yara_rules_string = None
 
+  def _AdjustNumberOfWorkerProcesses(self):
+    """Adjusts the number of worker processes.
+
+    Worker processes are added by starting them and removed by queuing
+    a queue abort, which is dequeued by a worker process after completing
+    its current task.
+    """
+    number_of_worker_processes = (
+        self._worker_pool_controller.GetNumberOfWorkerProcesses())
+
+    while self._number_of_worker_processes < number_of_worker_processes:
+      logging.info(u'Increasing number of worker processes to: {0:d}'.format(
+          self._number_of_worker_processes + 1))
+
+      extraction_process = self._StartExtractionWorkerProcess(
+          self._storage_writer)
+      self._StartMonitoringProcess(extraction_process.pid)
+      self._number_of_worker_processes += 1
+
+    while self._number_of_worker_processes > number_of_worker_processes:
+      try:
+        self._task_queue.PushItem(plaso_queue.QueueAbort(), block=False)
+      except Queue.Full:
+        break
+
+      logging.info(u'Decreasing number of worker processes to: {0:d}'.format(
+          self._number_of_worker_processes - 1))
+
+      self._number_of_worker_processes -= 1
+
+  def _CheckStoppedWorkerProcess(self, pid):
+    """Checks a worker process that stopped normally.
+
+    A worker process stops normally after it dequeued a queue abort, such as
+    when the number of worker processes was decreased, or when it exceeded
+    its memory limit after completing a task. A replacement process is started
+    if fewer worker processes are running than intended.
+
+    Args:
+      pid (int): process identifier (PID) of a registered worker process.
+
+    Raises:
+      KeyError: if the process is not registered with the engine.
+    """
+    self._RaiseIfNotRegistered(pid)
+
+    process = self._processes_per_pid[pid]
+
+    logging.debug(u'Process {0:s} (PID: {1:d}) stopped.'.format(
+        process.name, pid))
+
+    self._StopMonitoringProcess(pid)
+    self._completed_worker_pids.discard(pid)
+    self._task_identifier_per_pid.pop(pid, None)
+
+    if self._worker_pool_controller:
+      self._worker_pool_controller.RemoveWorkerProcess(process.name)
+
+    if len(self._process_information_per_pid) < (
+        self._number_of_worker_processes):
+      logging.info(u'Starting replacement worker process for {0:s}'.format(
+          process.name))
+      replacement_process = self._StartExtractionWorkerProcess(
+          self._storage_writer)
+      self._StartMonitoringProcess(replacement_process.pid)
+
   def _MergeTaskStorage(self, storage_writer):
     """Merges a task storage with the session storage.
 
@@ -129,6 +258,7 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     # GetScheduledTaskIdentifiers makes a copy of the keys since we are
     # changing the dictionary inside the loop.
+    number_of_tasks_ready_for_merge = 0
     task_storage_merged = False
     for task_identifier in self._task_manager.GetScheduledTaskIdentifiers():
       if self._abort:
@@ -139,6 +269,7 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         # Make sure completed tasks are not considered idle when not
         # yet merged.
         self._task_manager.UpdateTask(task_identifier)
+        number_of_tasks_ready_for_merge += 1
 
       # Merge only one task-based storage file per loop to keep tasks flowing.
       if task_storage_merged:
@@ -150,11 +281,22 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       if self._processing_profiler:
         self._processing_profiler.StartTiming(u'merge')
 
+      if self._tracing_profiler:
+        tracing_span = self._tracing_profiler.StartSpan(u'merge', u'merge')
+        number_of_events = storage_writer.number_of_events
+
       # TODO: look into time slicing merge.
       if storage_writer.MergeTaskStorage(task_identifier):
         self._task_manager.CompleteTask(task_identifier)
+        number_of_tasks_ready_for_merge -= 1
         task_storage_merged = True
 
+        if self._tracing_profiler:
+          arguments = {
+              u'events': storage_writer.number_of_events - number_of_events,
+              u'task': task_identifier}
+          self._tracing_profiler.StopSpan(tracing_span, arguments=arguments)
+
       if self._processing_profiler:
         self._processing_profiler.StopTiming(u'merge')
 
@@ -165,6 +307,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       self._number_of_produced_sources = (
           storage_writer.number_of_event_sources)
 
+    self._number_of_tasks_ready_for_merge = number_of_tasks_ready_for_merge
+
     if self._processing_profiler:
       self._processing_profiler.StopTiming(u'merge_check')
 
@@ -227,6 +371,54 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     if self._memory_profiler:
       self._memory_profiler.Sample()
 
+  def _ReceiveTaskStorage(self, task_identifier, task_storage_data):
+    """Handles an item received on the task storage queue.
+
+    Args:
+      task_identifier (str): identifier of the task.
+      task_storage_data (bytes): task storage data, where None represents
+          a heartbeat of a task that is being processed.
+    """
+    # Updating the task also schedules an abandoned task again, so that
+    # task storage received after the task was abandoned is still merged.
+    try:
+      self._task_manager.UpdateTask(task_identifier)
+    except KeyError:
+      # A heartbeat can be received after the task storage was merged.
+      if task_storage_data is not None:
+        logging.warning(
+            u'Received task storage of untracked task: {0:s}.'.format(
+                task_identifier))
+      return
+
+    if task_storage_data is None:
+      return
+
+    self._storage_writer.PrepareMergeTaskStorageData(
+        task_identifier, task_storage_data)
+
+  def _RescheduleTaskOfWorkerProcess(self, pid):
+    """Reschedules the task of a worker process that stopped functioning.
+
+    Args:
+      pid (int): process identifier (PID) of the worker process.
+    """
+    task_identifier = self._task_identifier_per_pid.pop(pid, None)
+    if not task_identifier:
+      return
+
+    task = self._task_manager.GetScheduledTask(task_identifier)
+    if not task:
+      return
+
+    # The worker process could have completed the task before it stopped
+    # functioning.
+    if self._storage_writer.CheckTaskStorageReadyForMerge(task_identifier):
+      return
+
+    logging.warning(u'Rescheduling task: {0:s}'.format(task_identifier))
+    self._tasks_to_reschedule.append(task)
+
   def _ScheduleTask(self, task):
     """Schedules a task.
 
@@ -241,7 +433,11 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     try:
       self._task_queue.PushItem(task, block=False)
-      self._task_manager.ScheduleTask(task.identifier)
+
+      if self._task_manager.GetScheduledTask(task.identifier):
+        self._task_manager.UpdateTask(task.identifier)
+      else:
+        self._task_manager.ScheduleTask(task.identifier)
       is_scheduled = True
 
     except Queue.Full:
@@ -282,6 +478,14 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         break
 
       try:
+        if not task and self._tasks_to_reschedule:
+          task = self._tasks_to_reschedule.popleft()
+
+          # The task could have been completed while waiting to be
+          # rescheduled.
+          if not self._task_manager.GetScheduledTask(task.identifier):
+            task = None
+
         if event_source and not task:
           task = self._task_manager.CreateTask(self._session_identifier)
           task.path_spec = event_source.path_spec
@@ -317,6 +521,8 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     for task in self._task_manager.GetAbandonedTasks():
       self._processing_status.error_path_specs.append(task.path_spec)
 
+    self._tasks_to_reschedule.clear()
+
     self._status = definitions.PROCESSING_STATUS_IDLE
 
     if self._abort:
@@ -338,8 +544,16 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     logging.debug(u'Starting worker process {0:s}'.format(process_name))
 
     if self._use_zeromq:
+      # Local worker processes cannot connect to all interfaces, hence they
+      # connect to the local machine instead.
+      if self._remote_workers_host == u'*':
+        task_queue_host = None
+      else:
+        task_queue_host = self._remote_workers_host
+
       task_queue = zeromq_queue.ZeroMQRequestConnectQueue(
-          delay_open=True, name=u'{0:s} task queue'.format(process_name),
+          delay_open=True, host=task_queue_host,
+          name=u'{0:s} task queue'.format(process_name),
           linger_seconds=0, port=self._task_queue_port,
           timeout_seconds=2)
     else:
@@ -352,13 +566,15 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         enable_sigsegv_handler=self._enable_sigsegv_handler,
         filter_object=self._filter_object,
         hasher_names_string=self._hasher_names_string,
-        mount_path=self._mount_path, name=process_name,
+        memory_limit=self._worker_memory_limit, mount_path=self._mount_path,
+        name=process_name,
         parser_filter_expression=self._parser_filter_expression,
         preferred_year=self._preferred_year,
         process_archive_files=self._process_archive_files,
         profiling_directory=self._profiling_directory,
         profiling_sample_rate=self._profiling_sample_rate,
         profiling_type=self._profiling_type,
+        status_subscriber_port=self._status_subscriber_port,
         temporary_directory=self._temporary_directory,
         text_prepend=self._text_prepend,
         yara_rules_string=self._yara_rules_string)
@@ -370,6 +586,24 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     return process
 
+  def _StartMetricsHTTPServer(self):
+    """Starts the metrics HTTP server."""
+    self._metrics = metrics.ProcessingMetrics()
+    self._process_information = process_info.ProcessInfo(self._pid)
+
+    self._metrics_http_server = metrics.MetricsHTTPServer(self._metrics)
+    if not self._metrics_http_server.Start(u'localhost', self._metrics_port):
+      logging.error(u'Unable to start the metrics HTTP server.')
+      self._metrics_http_server = None
+      self._metrics = None
+      self._process_information = None
+      return
+
+    logging.info((
+        u'Processing metrics available at: '
+        u'http://localhost:{0:d}/metrics').format(
+            self._metrics_http_server.port))
+
   def _StartProfiling(self):
     """Starts profiling."""
     if not self._enable_profiling:
@@ -392,13 +626,43 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       self._serializers_profiler = profiler.SerializersProfiler(
           identifier, path=self._profiling_directory)
 
+    if self._profiling_type == u'tracing':
+      identifier = u'{0:s}-tracing'.format(self._name)
+      self._tracing_profiler = profiler.TracingProfiler(
+          identifier, path=self._profiling_directory)
+      self._tracing_profiler.Start()
+
+  def _StartTaskStorageReceiverThread(self):
+    """Starts the task storage receiver thread."""
+    self._task_storage_receiver_active = True
+    self._task_storage_receiver_thread = threading.Thread(
+        name=u'Task storage receiver',
+        target=self._TaskStorageReceiverThreadMain)
+    self._task_storage_receiver_thread.start()
+
   def _StatusUpdateThreadMain(self):
     """Main function of the status update thread."""
     while self._status_update_active:
       # Make a local copy of the PIDs in case the dict is changed by
       # the main thread.
       for pid in list(self._process_information_per_pid.keys()):
-        self._CheckStatusWorkerProcess(pid)
+        # A worker process that reported it completed stops its RPC server
+        # before it exits, hence its status is no longer retrieved.
+        process = self._processes_per_pid[pid]
+        if pid in self._completed_worker_pids:
+          if not process.is_alive():
+            self._CheckStoppedWorkerProcess(pid)
+
+        elif process.exitcode == 0:
+          self._CheckStoppedWorkerProcess(pid)
+
+        else:
+          self._CheckStatusWorkerProcess(pid)
+
+      if self._worker_pool_controller and self._status in (
+          definitions.PROCESSING_STATUS_MERGING,
+          definitions.PROCESSING_STATUS_RUNNING):
+        self._AdjustNumberOfWorkerProcesses()
 
       self._processing_status.UpdateForemanStatus(
           self._name, self._status, self._pid, self._merge_task_identifier,
@@ -407,6 +671,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
           self._number_of_consumed_errors, self._number_of_produced_errors,
           self._number_of_consumed_reports, self._number_of_produced_reports)
 
+      if self._metrics:
+        self._UpdateMetrics()
+
       if self._status_update_callback:
         self._status_update_callback(self._processing_status)
 
@@ -434,8 +701,13 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       self._task_queue.Empty()
 
     # Wake the processes to make sure that they are not blocking
-    # waiting for the queue new items.
-    for _ in range(self._number_of_worker_processes):
+    # waiting for the queue new items. Remote worker processes are not
+    # managed by the engine but are signaled by the same means.
+    number_of_worker_processes = self._number_of_remote_worker_processes
+    for process in self._processes_per_pid.values():
+      if process.is_alive():
+        number_of_worker_processes += 1
+    for _ in range(number_of_worker_processes):
       self._task_queue.PushItem(plaso_queue.QueueAbort(), block=False)
 
     # Try waiting for the processes to exit normally.
@@ -452,6 +724,16 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
       self._task_queue.Close(abort=True)
 
+  def _StopMetricsHTTPServer(self):
+    """Stops the metrics HTTP server."""
+    if not self._metrics_http_server:
+      return
+
+    self._metrics_http_server.Stop()
+    self._metrics_http_server = None
+    self._metrics = None
+    self._process_information = None
+
   def _StopProfiling(self):
     """Stops profiling."""
     if not self._enable_profiling:
@@ -469,6 +751,85 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       self._serializers_profiler.Write()
       self._serializers_profiler = None
 
+    if self._profiling_type == u'tracing':
+      self._tracing_profiler.Stop()
+      self._tracing_profiler = None
+
+  def _StopTaskStorageReceiverThread(self):
+    """Stops the task storage receiver thread."""
+    self._task_storage_receiver_active = False
+    if self._task_storage_receiver_thread.isAlive():
+      self._task_storage_receiver_thread.join()
+    self._task_storage_receiver_thread = None
+
+  def _TaskStorageReceiverThreadMain(self):
+    """Main function of the task storage receiver thread.
+
+    The task storage received from remote worker processes is prepared for
+    merging, which is done by the task scheduling loop in the main thread.
+    Remote worker processes also send heartbeats, without task storage data,
+    while processing a task, since they do not report their status.
+    """
+    while self._task_storage_receiver_active:
+      try:
+        item = self._task_storage_queue.PopItem()
+      except (errors.QueueClose, errors.QueueEmpty):
+        continue
+
+      if not item:
+        continue
+
+      task_identifier, task_storage_data = item
+
+      # All exceptions need to be caught here to prevent the thread from
+      # being stopped by an uncaught exception, after which the task storage
+      # of remote worker processes would no longer be merged.
+      try:
+        self._ReceiveTaskStorage(task_identifier, task_storage_data)
+
+      except Exception as exception:  # pylint: disable=broad-except
+        logging.error((
+            u'Unable to process task storage item of task: {0!s} with '
+            u'error: {1!s}').format(task_identifier, exception))
+        logging.exception(exception)
+
+  def _UpdateMetrics(self):
+    """Updates the processing metrics."""
+    memory_per_pid = {}
+    for pid, process_information in list(
+        self._process_information_per_pid.items()):
+      memory_information = process_information.GetMemoryInformation()
+      if memory_information:
+        memory_per_pid[pid] = memory_information.rss
+
+    if self._process_information:
+      memory_information = self._process_information.GetMemoryInformation()
+      if memory_information:
+        memory_per_pid[self._pid] = memory_information.rss
+
+    number_of_processing_tasks = len([
+        task_identifier
+        for task_identifier in list(self._task_identifier_per_pid.values())
+        if task_identifier])
+
+    # Note that tasks processed by remote worker processes are considered
+    # queued.
+    number_of_queued_tasks = (
+        len(self._task_manager.GetScheduledTaskIdentifiers()) -
+        number_of_processing_tasks - self._number_of_tasks_ready_for_merge)
+
+    events_per_parser = None
+    if self._storage_writer:
+      events_per_parser = self._storage_writer.GetNumberOfEventsPerParser()
+
+    self._metrics.Update(
+        self._processing_status, events_per_parser=events_per_parser,
+        memory_per_pid=memory_per_pid,
+        number_of_processing_tasks=number_of_processing_tasks,
+        number_of_queued_tasks=max(0, number_of_queued_tasks),
+        number_of_tasks_ready_for_merge=(
+            self._number_of_tasks_ready_for_merge))
+
   def _UpdateProcessingStatus(self, pid, process_status):
     """Updates the processing status.
 
@@ -491,6 +852,12 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     self._RaiseIfNotMonitored(pid)
 
+    if processing_status == definitions.PROCESSING_STATUS_COMPLETED:
+      self._completed_worker_pids.add(pid)
+
+    if u'task_identifier' in process_status:
+      self._task_identifier_per_pid[pid] = process_status[u'task_identifier']
+
     display_name = process_status.get(u'display_name', u'')
     number_of_consumed_errors = process_status.get(
         u'number_of_consumed_errors', None)
@@ -530,6 +897,22 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
         number_of_consumed_errors, number_of_produced_errors,
         number_of_consumed_reports, number_of_produced_reports)
 
+    if processing_status in definitions.PROCESSING_ERROR_STATUS:
+      self._RescheduleTaskOfWorkerProcess(pid)
+
+      if self._worker_pool_controller:
+        self._worker_pool_controller.RemoveWorkerProcess(process.name)
+
+      return
+
+    if self._worker_pool_controller:
+      process_information = self._process_information_per_pid[pid]
+      memory_information = process_information.GetMemoryInformation()
+      if memory_information:
+        self._worker_pool_controller.SampleWorkerProcess(
+            process.name, number_of_produced_events,
+            memory_information.percent)
+
     task_identifier = process_status.get(u'task_identifier', u'')
     if task_identifier:
       try:
@@ -541,11 +924,13 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
   def ProcessSources(
       self, session_identifier, source_path_specs, storage_writer,
       enable_sigsegv_handler=False, filter_find_specs=None,
-      filter_object=None, hasher_names_string=None, mount_path=None,
-      number_of_worker_processes=0, parser_filter_expression=None,
-      preferred_year=None, process_archive_files=False,
-      status_update_callback=None, show_memory_usage=False,
-      temporary_directory=None, text_prepend=None, yara_rules_string=None):
+      filter_object=None, hasher_names_string=None,
+      maximum_number_of_worker_processes=0, mount_path=None,
+      number_of_remote_worker_processes=0, number_of_worker_processes=0,
+      parser_filter_expression=None, preferred_year=None,
+      process_archive_files=False, status_update_callback=None,
+      show_memory_usage=False, temporary_directory=None, text_prepend=None,
+      worker_memory_limit=None, yara_rules_string=None):
     """Processes the sources and extract event objects.
 
     Args:
@@ -560,7 +945,14 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       filter_object (Optional[objectfilter.Filter]): filter object.
       hasher_names_string (Optional[str]): comma separated string of names
           of hashers to use during processing.
+      maximum_number_of_worker_processes (Optional[int]): maximum number of
+          worker processes. If larger than the number of worker processes,
+          the number of worker processes is adjusted to the event rate and
+          memory usage of the worker processes.
       mount_path (Optional[str]): mount path.
+      number_of_remote_worker_processes (Optional[int]): number of worker
+          processes on remote hosts, which is used to signal them when
+          processing has completed.
       number_of_worker_processes (Optional[int]): number of worker processes.
       parser_filter_expression (Optional[str]): parser filter expression,
           where None represents all parsers and plugins.
@@ -574,6 +966,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       temporary_directory (Optional[str]): path of the directory for temporary
           files.
       text_prepend (Optional[str]): text to prepend to every event.
+      worker_memory_limit (Optional[int]): maximum amount of resident memory,
+          in bytes, a worker process can use before it is replaced after
+          completing a task, where None represents no limit.
       yara_rules_string (Optional[str]): unparsed yara rule definitions.
 
     Returns:
@@ -605,8 +1000,24 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       number_of_worker_processes = cpu_count
 
     self._enable_sigsegv_handler = enable_sigsegv_handler
+    self._number_of_remote_worker_processes = number_of_remote_worker_processes
     self._number_of_worker_processes = number_of_worker_processes
     self._show_memory_usage = show_memory_usage
+    self._worker_memory_limit = worker_memory_limit
+
+    # The number of worker processes is decreased by queuing a queue abort,
+    # which could also be dequeued by a remote worker process.
+    if self._remote_workers_host and maximum_number_of_worker_processes:
+      logging.warning((
+          u'The number of worker processes is not adjusted when remote '
+          u'worker processes are used.'))
+
+    elif maximum_number_of_worker_processes > number_of_worker_processes:
+      self._worker_pool_controller = worker_pool.WorkerPoolController(
+          number_of_worker_processes,
+          maximum_number_of_worker_processes=(
+              maximum_number_of_worker_processes),
+          maximum_memory_usage=self._MAXIMUM_MEMORY_USAGE)
 
     # Keep track of certain values so we can spawn new extraction workers.
     self._filter_find_specs = filter_find_specs
@@ -630,8 +1041,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     else:
       task_outbound_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
-          delay_open=True, linger_seconds=0, maximum_items=1,
-          name=u'main_task_queue',
+          delay_open=True, host=self._remote_workers_host, linger_seconds=0,
+          maximum_items=1, name=u'main_task_queue',
+          port=self._task_queue_port,
           timeout_seconds=self._ZEROMQ_NO_WORKER_REQUEST_TIME_SECONDS)
       self._task_queue = task_outbound_queue
 
@@ -641,6 +1053,25 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
       self._task_queue.Open()
       self._task_queue_port = self._task_queue.port
 
+    if self._remote_workers_host:
+      self._task_storage_queue = zeromq_queue.ZeroMQPullBindQueue(
+          delay_open=True, host=self._remote_workers_host, linger_seconds=0,
+          name=u'main_task_storage_queue', port=self._task_storage_queue_port,
+          timeout_seconds=1)
+      self._task_storage_queue.Open()
+      self._task_storage_queue_port = self._task_storage_queue.port
+
+      logging.info((
+          u'Remote worker processes can connect to task queue port: {0:d} '
+          u'and task storage queue port: {1:d}').format(
+              self._task_queue_port, self._task_storage_queue_port))
+
+    if self._use_zeromq:
+      self._status_subscriber_port = self._StartProcessStatusSubscriber()
+
+    if self._metrics_port is not None:
+      self._StartMetricsHTTPServer()
+
     self._StartProfiling()
 
     if self._serializers_profiler:
@@ -649,6 +1080,9 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # Set up the storage writer before the worker processes.
     storage_writer.StartTaskStorage()
 
+    if self._task_storage_queue:
+      self._StartTaskStorageReceiverThread()
+
     for _ in range(number_of_worker_processes):
       extraction_process = self._StartExtractionWorkerProcess(storage_writer)
       self._StartMonitoringProcess(extraction_process.pid)
@@ -699,6 +1133,19 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
     # blocking behaviour.
     self._task_queue.Close(abort=True)
 
+    if self._task_storage_queue:
+      self._StopTaskStorageReceiverThread()
+
+      self._task_storage_queue.Close(abort=True)
+      self._task_storage_queue = None
+
+    # Stop the process status subscriber after the worker processes stopped
+    # so that they can publish their final status.
+    self._StopProcessStatusSubscriber()
+    self._status_subscriber_port = None
+
+    self._StopMetricsHTTPServer()
+
     if self._processing_status.error_path_specs:
       task_storage_abort = True
     else:
@@ -714,8 +1161,13 @@ class TaskMultiProcessEngine(engine.MultiProcessEngine):
 
     # Reset values.
     self._enable_sigsegv_handler = None
+    self._number_of_remote_worker_processes = None
     self._number_of_worker_processes = None
     self._show_memory_usage = None
+    self._completed_worker_pids = set()
+    self._task_identifier_per_pid = {}
+    self._worker_memory_limit = None
+    self._worker_pool_controller = None
 
     self._filter_find_specs = None
     self._filter_object = None
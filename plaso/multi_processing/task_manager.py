@@ -1,13 +1,23 @@
 # -*- coding: utf-8 -*-
 """The task manager."""
 
+import threading
 import time
 
 from plaso.containers import tasks
 
 
 class TaskManager(object):
-  """Class that manages tasks and tracks their completion and status."""
+  """Class that manages tasks and tracks their completion and status.
+
+  A task is abandoned when there has been no activity for the inactive time.
+  An abandoned task becomes active again when it is updated, for example
+  when its task storage is received after all.
+
+  Tasks are updated by multiple threads, such as the status update thread
+  and the task storage receiver thread of the engine, hence access to
+  the tasks is serialized.
+  """
 
   # Consider a task inactive after 5 minutes of no activity.
   _TASK_INACTIVE_TIME = 5 * 60 * 1000000
@@ -22,6 +32,7 @@ class TaskManager(object):
     super(TaskManager, self).__init__()
     self._abandoned_tasks = {}
     self._active_tasks = {}
+    self._lock = threading.Lock()
     self._maximum_number_of_tasks = maximum_number_of_tasks
     self._scheduled_tasks = {}
 
@@ -34,11 +45,12 @@ class TaskManager(object):
     Raises:
       KeyError: if the task is not scheduled.
     """
-    if task_identifier not in self._scheduled_tasks:
-      raise KeyError(u'Task not scheduled')
+    with self._lock:
+      if task_identifier not in self._scheduled_tasks:
+        raise KeyError(u'Task not scheduled')
 
-    del self._active_tasks[task_identifier]
-    del self._scheduled_tasks[task_identifier]
+      del self._active_tasks[task_identifier]
+      del self._scheduled_tasks[task_identifier]
 
   # TODO: add support for task types.
   def CreateTask(self, session_identifier):
@@ -52,7 +64,8 @@ class TaskManager(object):
       Task: task attribute container.
     """
     task = tasks.Task(session_identifier)
-    self._active_tasks[task.identifier] = task
+    with self._lock:
+      self._active_tasks[task.identifier] = task
     return task
 
   def GetAbandonedTasks(self):
@@ -61,7 +74,23 @@ class TaskManager(object):
     Returns:
       list[task]: task.
     """
-    return self._abandoned_tasks.values()
+    with self._lock:
+      return list(self._abandoned_tasks.values())
+
+  def GetScheduledTask(self, task_identifier):
+    """Retrieves a scheduled task.
+
+    Args:
+      task_identifier (str): unique identifier of the task.
+
+    Returns:
+      Task: task or None if the task is not scheduled.
+    """
+    with self._lock:
+      if task_identifier not in self._scheduled_tasks:
+        return
+
+      return self._active_tasks.get(task_identifier, None)
 
   def GetScheduledTaskIdentifiers(self):
     """Retrieves all scheduled task identifiers.
@@ -69,7 +98,8 @@ class TaskManager(object):
     Returns:
       list[str]: unique identifiers of the tasks.
     """
-    return list(self._scheduled_tasks.keys())
+    with self._lock:
+      return list(self._scheduled_tasks.keys())
 
   def HasScheduledTasks(self):
     """Determines if there are scheduled tasks.
@@ -79,22 +109,23 @@ class TaskManager(object):
     Returns:
       bool: True if there are scheduled active tasks.
     """
-    if not self._scheduled_tasks:
-      return False
+    with self._lock:
+      if not self._scheduled_tasks:
+        return False
 
-    inactive_time = int(time.time() * 1000000) - self._TASK_INACTIVE_TIME
+      inactive_time = int(time.time() * 1000000) - self._TASK_INACTIVE_TIME
 
-    has_active_tasks = False
-    for task_identifier, last_update in iter(self._scheduled_tasks.items()):
-      if last_update > inactive_time:
-        has_active_tasks = True
-      else:
-        del self._scheduled_tasks[task_identifier]
-        task = self._active_tasks[task_identifier]
-        self._abandoned_tasks[task_identifier] = task
-        del self._active_tasks[task_identifier]
+      has_active_tasks = False
+      for task_identifier, last_update in list(self._scheduled_tasks.items()):
+        if last_update > inactive_time:
+          has_active_tasks = True
+        else:
+          del self._scheduled_tasks[task_identifier]
+          task = self._active_tasks[task_identifier]
+          self._abandoned_tasks[task_identifier] = task
+          del self._active_tasks[task_identifier]
 
-    return has_active_tasks
+      return has_active_tasks
 
   def ScheduleTask(self, task_identifier):
     """Schedules a task.
@@ -105,22 +136,30 @@ class TaskManager(object):
     Raises:
       KeyError: if the task is already scheduled.
     """
-    if task_identifier in self._scheduled_tasks:
-      raise KeyError(u'Task already scheduled')
+    with self._lock:
+      if task_identifier in self._scheduled_tasks:
+        raise KeyError(u'Task already scheduled')
 
-    # TODO: add check for maximum_number_of_tasks.
-    self._scheduled_tasks[task_identifier] = int(time.time() * 1000000)
+      # TODO: add check for maximum_number_of_tasks.
+      self._scheduled_tasks[task_identifier] = int(time.time() * 1000000)
 
   def UpdateTask(self, task_identifier):
     """Updates a task.
 
+    An abandoned task is scheduled again.
+
     Args:
       task_identifier (str): unique identifier of the task.
 
     Raises:
-      KeyError: if the task is not scheduled.
+      KeyError: if the task is not scheduled or abandoned.
     """
-    if task_identifier not in self._scheduled_tasks:
-      raise KeyError(u'Task not scheduled')
+    with self._lock:
+      if task_identifier in self._abandoned_tasks:
+        task = self._abandoned_tasks.pop(task_identifier)
+        self._active_tasks[task_identifier] = task
+
+      elif task_identifier not in self._scheduled_tasks:
+        raise KeyError(u'Task not scheduled')
 
-    self._scheduled_tasks[task_identifier] = int(time.time() * 1000000)
+      self._scheduled_tasks[task_identifier] = int(time.time() * 1000000)
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""The adaptive worker pool controller."""
+
+import time
+
+
+class WorkerPoolController(object):
+  """Class that determines the number of extraction worker processes.
+
+  The controller is periodically provided with the number of events produced
+  by and the memory usage of every worker process. From these samples
+  it determines the combined event rate and memory usage of the worker
+  processes and adjusts the number of worker processes one at a time:
+
+  * down when the combined memory usage exceeds the maximum;
+  * down when the previous increase did not improve the event rate;
+  * up when an additional worker process is expected to fit within
+    the maximum memory usage.
+
+  The event rate and memory usage are determined once per adjustment
+  interval, to give the worker processes time to show the effect of
+  the previous adjustment on the event rate.
+  """
+
+  # Number of seconds between adjustments.
+  _ADJUSTMENT_INTERVAL = 30.0
+
+  # Minimum relative event rate improvement to keep an added worker process.
+  _MINIMUM_EVENT_RATE_IMPROVEMENT = 0.05
+
+  # Number of adjustment intervals an increase is not retried after it did
+  # not improve the event rate.
+  _SCALE_UP_BACKOFF_INTERVALS = 10
+
+  def __init__(
+      self, number_of_worker_processes, minimum_number_of_worker_processes=1,
+      maximum_number_of_worker_processes=None, maximum_memory_usage=80.0):
+    """Initializes a worker pool controller.
+
+    Args:
+      number_of_worker_processes (int): initial number of worker processes.
+      minimum_number_of_worker_processes (Optional[int]): minimum number of
+          worker processes.
+      maximum_number_of_worker_processes (Optional[int]): maximum number of
+          worker processes, where None represents the initial number.
+      maximum_memory_usage (Optional[float]): maximum percentage of the total
+          physical memory used by the worker processes combined.
+
+    Raises:
+      ValueError: if the number of worker processes is out of bounds.
+    """
+    if maximum_number_of_worker_processes is None:
+      maximum_number_of_worker_processes = number_of_worker_processes
+
+    if minimum_number_of_worker_processes < 1:
+      raise ValueError(u'Minimum number of worker processes must be 1 or more.')
+
+    if not (minimum_number_of_worker_processes <= number_of_worker_processes <=
+            maximum_number_of_worker_processes):
+      raise ValueError((
+          u'Number of worker processes: {0:d} out of bounds: {1:d} - '
+          u'{2:d}.').format(
+              number_of_worker_processes, minimum_number_of_worker_processes,
+              maximum_number_of_worker_processes))
+
+    super(WorkerPoolController, self).__init__()
+    self._event_rate_before_scale_up = None
+    self._last_adjustment_timestamp = None
+    self._maximum_memory_usage = maximum_memory_usage
+    self._maximum_number_of_worker_processes = (
+        maximum_number_of_worker_processes)
+    self._minimum_number_of_worker_processes = (
+        minimum_number_of_worker_processes)
+    self._scale_up_backoff_timestamp = None
+    self._worker_samples = {}
+
+    self.number_of_worker_processes = number_of_worker_processes
+
+  def _GetEventRateAndMemoryUsage(self):
+    """Determines the combined event rate and memory usage.
+
+    The event rate of a worker process is determined over the samples since
+    the previous determination.
+
+    Returns:
+      tuple[float, float, int]: combined number of events produced per second,
+          combined memory usage as a percentage of the total physical memory
+          and number of sampled worker processes.
+    """
+    event_rate = 0.0
+    memory_usage = 0.0
+    for worker_sample in self._worker_samples.values():
+      elapsed_time = (
+          worker_sample[u'timestamp'] - worker_sample[u'first_timestamp'])
+      if elapsed_time > 0.0:
+        number_of_events = (
+            worker_sample[u'number_of_produced_events'] -
+            worker_sample[u'first_number_of_produced_events'])
+        event_rate += number_of_events / elapsed_time
+
+      memory_usage += worker_sample[u'memory_usage']
+
+      worker_sample[u'first_number_of_produced_events'] = (
+          worker_sample[u'number_of_produced_events'])
+      worker_sample[u'first_timestamp'] = worker_sample[u'timestamp']
+
+    return event_rate, memory_usage, len(self._worker_samples)
+
+  def GetNumberOfWorkerProcesses(self, timestamp=None):
+    """Determines the number of worker processes.
+
+    Args:
+      timestamp (Optional[float]): POSIX timestamp, where None represents
+          the current time.
+
+    Returns:
+      int: number of worker processes.
+    """
+    if timestamp is None:
+      timestamp = time.time()
+
+    if self._last_adjustment_timestamp is None:
+      self._last_adjustment_timestamp = timestamp
+
+    if (timestamp - self._last_adjustment_timestamp <
+        self._ADJUSTMENT_INTERVAL):
+      return self.number_of_worker_processes
+
+    event_rate, memory_usage, number_of_samples = (
+        self._GetEventRateAndMemoryUsage())
+    if not number_of_samples:
+      return self.number_of_worker_processes
+
+    self._last_adjustment_timestamp = timestamp
+
+    event_rate_before_scale_up = self._event_rate_before_scale_up
+    self._event_rate_before_scale_up = None
+
+    if memory_usage > self._maximum_memory_usage:
+      if (self.number_of_worker_processes >
+          self._minimum_number_of_worker_processes):
+        self.number_of_worker_processes -= 1
+
+    elif event_rate_before_scale_up is not None and event_rate < (
+        event_rate_before_scale_up * (
+            1.0 + self._MINIMUM_EVENT_RATE_IMPROVEMENT)):
+      self._scale_up_backoff_timestamp = timestamp + (
+          self._ADJUSTMENT_INTERVAL * self._SCALE_UP_BACKOFF_INTERVALS)
+
+      if (self.number_of_worker_processes >
+          self._minimum_number_of_worker_processes):
+        self.number_of_worker_processes -= 1
+
+    # Idle worker processes do not benefit from additional worker processes.
+    elif (event_rate > 0.0 and self.number_of_worker_processes <
+          self._maximum_number_of_worker_processes and (
+              self._scale_up_backoff_timestamp is None or
+              timestamp >= self._scale_up_backoff_timestamp)):
+      # Estimate the memory usage of the additional worker process from
+      # the average memory usage of the sampled worker processes.
+      memory_usage_per_worker = memory_usage / number_of_samples
+      if (memory_usage + memory_usage_per_worker <=
+          self._maximum_memory_usage):
+        self._event_rate_before_scale_up = event_rate
+        self.number_of_worker_processes += 1
+
+    return self.number_of_worker_processes
+
+  def RemoveWorkerProcess(self, identifier):
+    """Removes the samples of a worker process that stopped.
+
+    Args:
+      identifier (str): identifier of the worker process.
+    """
+    self._worker_samples.pop(identifier, None)
+
+  def SampleWorkerProcess(
+      self, identifier, number_of_produced_events, memory_usage,
+      timestamp=None):
+    """Samples the status of a worker process.
+
+    Args:
+      identifier (str): identifier of the worker process, such as its name.
+      number_of_produced_events (int): number of events produced by the worker
+          process since it started.
+      memory_usage (float): memory usage of the worker process as a percentage
+          of the total physical memory.
+      timestamp (Optional[float]): POSIX timestamp of the sample, where None
+          represents the current time.
+    """
+    if timestamp is None:
+      timestamp = time.time()
+
+    number_of_produced_events = number_of_produced_events or 0
+
+    worker_sample = self._worker_samples.get(identifier, None)
+    if (not worker_sample or number_of_produced_events <
+        worker_sample[u'first_number_of_produced_events']):
+      worker_sample = {
+          u'first_number_of_produced_events': number_of_produced_events,
+          u'first_timestamp': timestamp}
+      self._worker_samples[identifier] = worker_sample
+
+    worker_sample[u'memory_usage'] = memory_usage
+    worker_sample[u'number_of_produced_events'] = number_of_produced_events
+    worker_sample[u'timestamp'] = timestamp
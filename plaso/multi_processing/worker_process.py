@@ -2,6 +2,7 @@
 """The multi-process worker process."""
 
 import logging
+import threading
 
 from dfvfs.lib import errors as dfvfs_errors
 from dfvfs.resolver import context
@@ -12,19 +13,25 @@ from plaso.engine import worker
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.multi_processing import base_process
+from plaso.multi_processing import process_info
 from plaso.parsers import mediator as parsers_mediator
 
 
 class WorkerProcess(base_process.MultiProcessBaseProcess):
   """Class that defines a multi-processing worker process."""
 
+  # Interval in seconds between the heartbeats of the task being processed,
+  # that are sent over the task storage queue.
+  _TASK_HEARTBEAT_INTERVAL = 30.0
+
   def __init__(
       self, task_queue, storage_writer, knowledge_base, session_identifier,
       debug_output=False, enable_profiling=False, filter_object=None,
-      hasher_names_string=None, mount_path=None, parser_filter_expression=None,
-      preferred_year=None, process_archive_files=False,
-      profiling_directory=None, profiling_sample_rate=1000,
-      profiling_type=u'all', temporary_directory=None, text_prepend=None,
+      hasher_names_string=None, memory_limit=None, mount_path=None,
+      parser_filter_expression=None, preferred_year=None,
+      process_archive_files=False, profiling_directory=None,
+      profiling_sample_rate=1000, profiling_type=u'all',
+      task_storage_queue=None, temporary_directory=None, text_prepend=None,
       yara_rules_string=None, **kwargs):
     """Initializes a worker process.
 
@@ -42,6 +49,10 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       filter_object (Optional[objectfilter.Filter]): filter object.
       hasher_names_string (Optional[str]): comma separated string of names
           of hashers to use during processing.
+      memory_limit (Optional[int]): maximum amount of resident memory, in
+          bytes, the worker process can use before it stops after completing
+          a task, where None represents no limit. This allows the engine to
+          replace worker processes that leak memory.
       mount_path (Optional[str]): mount path.
       parser_filter_expression (Optional[str]): parser filter expression,
           where None represents all parsers and plugins.
@@ -61,6 +72,13 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
             the processing;
           * 'serializers' to profile CPU time consumed by individual
             serializers.
+          * 'tracing' to record the time spent per task, file and parser
+            as a Chrome trace. Tracing is not part of 'all' and records every
+            file regardless of the sample rate.
+      task_storage_queue (Optional[PlasoQueue]): queue to send the task
+          storage data and the heartbeats of the task being processed to,
+          where None represents that task storage is merged via the (shared)
+          file system.
       temporary_directory (Optional[str]): path of the directory for temporary
           files.
       text_prepend (Optional[str]): text to prepend to every event.
@@ -77,6 +95,7 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     self._filter_object = filter_object
     self._hasher_names_string = hasher_names_string
     self._knowledge_base = knowledge_base
+    self._memory_limit = memory_limit
     self._memory_profiler = None
     self._mount_path = mount_path
     self._number_of_consumed_events = 0
@@ -94,10 +113,15 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     self._session_identifier = session_identifier
     self._status = definitions.PROCESSING_STATUS_INITIALIZED
     self._storage_writer = storage_writer
+    self._task_heartbeat_event = None
+    self._task_heartbeat_thread = None
     self._task_identifier = u''
     self._task_queue = task_queue
+    self._task_storage_queue = task_storage_queue
+    self._task_storage_queue_lock = None
     self._temporary_directory = temporary_directory
     self._text_prepend = text_prepend
+    self._tracing_profiler = None
     self._yara_rules_string = yara_rules_string
 
   def _GetStatus(self):
@@ -140,6 +164,19 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
     return status
 
+  def _IsMemoryLimitExceeded(self):
+    """Determines if the resident memory of the process exceeds the limit.
+
+    Returns:
+      bool: True if the memory limit is exceeded.
+    """
+    memory_information = process_info.ProcessInfo(
+        self._pid).GetMemoryInformation()
+    if not memory_information:
+      return False
+
+    return memory_information.rss > self._memory_limit
+
   def _Main(self):
     """The main loop."""
     self._parser_mediator = parsers_mediator.ParserMediator(
@@ -175,6 +212,9 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
     self._StartProfiling()
 
+    if self._task_storage_queue:
+      self._StartTaskHeartbeatThread()
+
     logging.debug(u'Worker: {0!s} (PID: {1:d}) started'.format(
         self._name, self._pid))
 
@@ -199,6 +239,13 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
         self._ProcessTask(task)
 
+        if self._memory_limit and self._IsMemoryLimitExceeded():
+          logging.info((
+              u'{0!s} (PID: {1:d}) exceeded memory limit, stopping to be '
+              u'replaced by a new worker process.').format(
+                  self._name, self._pid))
+          break
+
       logging.debug(
           u'{0!s} (PID: {1:d}) stopped monitoring task queue.'.format(
               self._name, self._pid))
@@ -231,6 +278,16 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     except errors.QueueAlreadyClosed:
       logging.error(u'Queue for {0:s} was already closed.'.format(self.name))
 
+    if self._task_storage_queue:
+      self._StopTaskHeartbeatThread()
+
+      try:
+        self._task_storage_queue.Close(abort=self._abort)
+      except errors.QueueAlreadyClosed:
+        logging.error(
+            u'Task storage queue for {0:s} was already closed.'.format(
+                self.name))
+
   def _ProcessPathSpec(self, extraction_worker, parser_mediator, path_spec):
     """Processes a path specification.
 
@@ -263,6 +320,19 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
                 self._current_display_name))
         logging.exception(exception)
 
+  def _PushTaskStorageItem(self, item):
+    """Pushes an item onto the task storage queue.
+
+    The task storage queue is used by both the main thread and the task
+    heartbeat thread, hence pushing items is serialized.
+
+    Args:
+      item (tuple[str, bytes]): task identifier and task storage data, where
+          the task storage data is None for a heartbeat.
+    """
+    with self._task_storage_queue_lock:
+      self._task_storage_queue.PushItem(item)
+
   def _ProcessTask(self, task):
     """Processes a task.
 
@@ -271,6 +341,14 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
     """
     self._task_identifier = task.identifier
 
+    # Let the foreman know the task is being processed.
+    if self._task_storage_queue:
+      self._PushTaskStorageItem((task.identifier, None))
+
+    if self._tracing_profiler:
+      tracing_span = self._tracing_profiler.StartSpan(u'task', u'task')
+      number_of_events = self._parser_mediator.number_of_produced_events
+
     storage_writer = self._storage_writer.CreateTaskStorage(task)
 
     if self._serializers_profiler:
@@ -298,7 +376,20 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
 
       storage_writer.Close()
 
-    self._storage_writer.PrepareMergeTaskStorage(task.identifier)
+    if self._task_storage_queue:
+      task_storage_data = self._storage_writer.GetTaskStorageData(
+          task.identifier)
+      self._PushTaskStorageItem((task.identifier, task_storage_data))
+    else:
+      self._storage_writer.PrepareMergeTaskStorage(task.identifier)
+
+    if self._tracing_profiler:
+      arguments = {
+          u'events': (
+              self._parser_mediator.number_of_produced_events -
+              number_of_events),
+          u'task': task.identifier}
+      self._tracing_profiler.StopSpan(tracing_span, arguments=arguments)
 
     self._task_identifier = u''
 
@@ -331,6 +422,13 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       self._serializers_profiler = profiler.SerializersProfiler(
           identifier, path=self._profiling_directory)
 
+    if self._profiling_type == u'tracing':
+      identifier = u'{0:s}-tracing'.format(self._name)
+      self._tracing_profiler = profiler.TracingProfiler(
+          identifier, path=self._profiling_directory)
+      self._tracing_profiler.Start()
+      self._extraction_worker.SetTracingProfiler(self._tracing_profiler)
+
   def _StopProfiling(self):
     """Stops profiling."""
     if not self._enable_profiling:
@@ -354,6 +452,42 @@ class WorkerProcess(base_process.MultiProcessBaseProcess):
       self._serializers_profiler.Write()
       self._serializers_profiler = None
 
+    if self._profiling_type == u'tracing':
+      self._extraction_worker.SetTracingProfiler(None)
+      self._tracing_profiler.Stop()
+      self._tracing_profiler = None
+
+  def _StartTaskHeartbeatThread(self):
+    """Starts the task heartbeat thread."""
+    self._task_heartbeat_event = threading.Event()
+    self._task_storage_queue_lock = threading.Lock()
+    self._task_heartbeat_thread = threading.Thread(
+        name=u'Task heartbeat', target=self._TaskHeartbeatThreadMain)
+    self._task_heartbeat_thread.daemon = True
+    self._task_heartbeat_thread.start()
+
+  def _StopTaskHeartbeatThread(self):
+    """Stops the task heartbeat thread."""
+    if not self._task_heartbeat_thread:
+      return
+
+    self._task_heartbeat_event.set()
+    self._task_heartbeat_thread.join(timeout=self._PROCESS_JOIN_TIMEOUT)
+    self._task_heartbeat_thread = None
+
+  def _TaskHeartbeatThreadMain(self):
+    """Main function of the task heartbeat thread.
+
+    A worker process that sends its task storage over the task storage queue,
+    such as a remote worker process, does not report its status to
+    the foreman. The heartbeats prevent the foreman from considering
+    a long running task abandoned.
+    """
+    while not self._task_heartbeat_event.wait(self._TASK_HEARTBEAT_INTERVAL):
+      task_identifier = self._task_identifier
+      if task_identifier:
+        self._PushTaskStorageItem((task_identifier, None))
+
   def SignalAbort(self):
     """Signals the process to abort."""
     self._abort = True
@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+"""ZeroMQ process status publisher and subscriber.
+
+Instead of the engine requesting the status of every process via RPC,
+the processes periodically publish their status to a subscriber of
+the engine, which keeps the most recent status per process.
+"""
+
+import logging
+import threading
+import time
+
+import zmq
+
+from plaso.multi_processing import rpc
+
+
+class ZeroMQProcessStatusPublisher(rpc.RPCServer):
+  """Class that defines a ZeroMQ process status publisher.
+
+  The publisher runs in the process and publishes the status, as returned
+  by the callback, in a separate thread.
+  """
+
+  # Number of seconds between publications of the status.
+  _PUBLISH_INTERVAL = 0.5
+
+  # Number of seconds to wait for the final status to be sent when
+  # the publisher is stopped.
+  _LINGER_SECONDS = 2
+
+  _THREAD_NAME = u'process_status_publisher'
+
+  def __init__(self, callback, pid):
+    """Initializes the process status publisher.
+
+    Args:
+      callback (function): callback function to retrieve the status.
+      pid (int): process identifier (PID) of the process.
+    """
+    super(ZeroMQProcessStatusPublisher, self).__init__(callback)
+    self._pid = pid
+    self._publisher_thread = None
+    self._stop_event = None
+    self._zmq_context = None
+    self._zmq_socket = None
+
+  def _PublisherThreadMain(self):
+    """Main function of the publisher thread."""
+    while not self._stop_event.wait(self._PUBLISH_INTERVAL):
+      self._Publish()
+
+  def _Publish(self):
+    """Publishes the status."""
+    status = self._callback()
+    try:
+      self._zmq_socket.send_json([self._pid, status], zmq.NOBLOCK)
+    except zmq.error.Again:
+      # The status is superseded by the next publication.
+      logging.debug(
+          u'Unable to publish status of process (PID: {0:d}).'.format(
+              self._pid))
+
+  def Start(self, hostname, port):
+    """Starts the process status publisher.
+
+    Args:
+      hostname (str): hostname or IP address of the subscriber.
+      port (int): port of the subscriber.
+
+    Returns:
+      bool: True if the publisher was successfully started.
+    """
+    self._zmq_context = zmq.Context()
+    self._zmq_socket = self._zmq_context.socket(zmq.PUB)
+    self._zmq_socket.setsockopt(zmq.LINGER, self._LINGER_SECONDS * 1000)
+
+    address = u'tcp://{0:s}:{1:d}'.format(hostname, port)
+    try:
+      self._zmq_socket.connect(address)
+    except zmq.error.ZMQError as exception:
+      logging.warning((
+          u'Unable to connect process status publisher to {0:s} with error: '
+          u'{1!s}').format(address, exception))
+      self._zmq_socket.close()
+      self._zmq_socket = None
+      self._zmq_context.term()
+      self._zmq_context = None
+      return False
+
+    # The threading event needs to be created when the publisher is started,
+    # since threading events cannot be pickled.
+    self._stop_event = threading.Event()
+    self._publisher_thread = threading.Thread(
+        name=self._THREAD_NAME, target=self._PublisherThreadMain)
+    self._publisher_thread.daemon = True
+    self._publisher_thread.start()
+    return True
+
+  def Stop(self):
+    """Stops the process status publisher.
+
+    The status is published a last time, so the subscriber receives
+    the final status of the process.
+    """
+    if not self._zmq_socket:
+      return
+
+    self._stop_event.set()
+    if self._publisher_thread.isAlive():
+      self._publisher_thread.join()
+    self._publisher_thread = None
+
+    self._Publish()
+
+    self._zmq_socket.close()
+    self._zmq_socket = None
+    self._zmq_context.term()
+    self._zmq_context = None
+
+
+class ZeroMQProcessStatusSubscriber(object):
+  """Class that defines a ZeroMQ process status subscriber.
+
+  The subscriber runs in the engine and receives the status published by
+  the processes in a separate thread.
+
+  Attributes:
+    port (int): port the subscriber is bound to.
+  """
+
+  # Number of seconds after which the most recent status of a process is
+  # considered outdated, which happens when the process stopped publishing.
+  _MAXIMUM_STATUS_AGE = 4 * ZeroMQProcessStatusPublisher._PUBLISH_INTERVAL
+
+  # Number of milliseconds to wait for a status before checking if
+  # the subscriber was stopped.
+  _RECEIVE_TIMEOUT = 500
+
+  _THREAD_NAME = u'process_status_subscriber'
+
+  def __init__(self, port=None):
+    """Initializes the process status subscriber.
+
+    Args:
+      port (Optional[int]): port to bind to, where None represents
+          a random port.
+    """
+    super(ZeroMQProcessStatusSubscriber, self).__init__()
+    self._lock = threading.Lock()
+    self._receive_time_per_pid = {}
+    self._status_per_pid = {}
+    self._stop_event = threading.Event()
+    self._subscriber_thread = None
+    self._zmq_context = None
+    self._zmq_socket = None
+
+    self.port = port
+
+  def _SubscriberThreadMain(self):
+    """Main function of the subscriber thread."""
+    while not self._stop_event.is_set():
+      if not self._zmq_socket.poll(timeout=self._RECEIVE_TIMEOUT):
+        continue
+
+      try:
+        pid, status = self._zmq_socket.recv_json(zmq.NOBLOCK)
+      except zmq.error.Again:
+        continue
+
+      except ValueError as exception:
+        logging.warning(
+            u'Unable to decode process status with error: {0!s}'.format(
+                exception))
+        continue
+
+      with self._lock:
+        self._receive_time_per_pid[pid] = time.time()
+        self._status_per_pid[pid] = status
+
+  def GetStatus(self, pid):
+    """Retrieves the most recent status of a process.
+
+    Args:
+      pid (int): process identifier (PID).
+
+    Returns:
+      dict[str, object]: status attributes, indexed by name, or None if no
+          status was received from the process within the maximum status
+          age. The status is empty if the process was reset recently and
+          has not published its status yet.
+    """
+    with self._lock:
+      receive_time = self._receive_time_per_pid.get(pid, None)
+      if receive_time is None:
+        return
+
+      if time.time() - receive_time > self._MAXIMUM_STATUS_AGE:
+        return
+
+      return self._status_per_pid.get(pid, {})
+
+  def RemoveStatus(self, pid):
+    """Removes the status of a process.
+
+    Args:
+      pid (int): process identifier (PID).
+    """
+    with self._lock:
+      self._receive_time_per_pid.pop(pid, None)
+      self._status_per_pid.pop(pid, None)
+
+  def ResetStatus(self, pid):
+    """Resets the status of a process.
+
+    The process is given the maximum status age to publish its first status.
+
+    Args:
+      pid (int): process identifier (PID).
+    """
+    with self._lock:
+      self._receive_time_per_pid[pid] = time.time()
+      self._status_per_pid.pop(pid, None)
+
+  def Start(self):
+    """Starts the process status subscriber."""
+    self._zmq_context = zmq.Context()
+    self._zmq_socket = self._zmq_context.socket(zmq.SUB)
+    self._zmq_socket.setsockopt(zmq.LINGER, 0)
+    self._zmq_socket.setsockopt(zmq.SUBSCRIBE, b'')
+
+    # Only processes on the local host publish their status.
+    socket_address = u'tcp://127.0.0.1'
+    if self.port:
+      self._zmq_socket.bind(u'{0:s}:{1:d}'.format(socket_address, self.port))
+    else:
+      self.port = self._zmq_socket.bind_to_random_port(socket_address)
+
+    self._stop_event.clear()
+    self._subscriber_thread = threading.Thread(
+        name=self._THREAD_NAME, target=self._SubscriberThreadMain)
+    # Do not keep the engine alive when it exits without stopping
+    # the subscriber.
+    self._subscriber_thread.daemon = True
+    self._subscriber_thread.start()
+
+  def Stop(self):
+    """Stops the process status subscriber."""
+    if not self._zmq_socket:
+      return
+
+    self._stop_event.set()
+    if self._subscriber_thread.isAlive():
+      self._subscriber_thread.join()
+    self._subscriber_thread = None
+
+    self._zmq_socket.close()
+    self._zmq_socket = None
+    self._zmq_context.term()
+    self._zmq_context = None
+
+    with self._lock:
+      self._receive_time_per_pid = {}
+      self._status_per_pid = {}
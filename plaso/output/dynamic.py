@@ -5,7 +5,6 @@ import logging
 
 from plaso.lib import errors
 from plaso.lib import py2to3
-from plaso.lib import timelib
 from plaso.output import interface
 from plaso.output import manager
 
@@ -57,9 +56,8 @@ class DynamicFieldsHelper(object):
       str: date field.
     """
     try:
-      date_use = timelib.Timestamp.CopyToDatetime(
-          event.timestamp, self._output_mediator.timezone,
-          raise_error=True)
+      date_use = self._output_mediator.CopyTimestampToDatetime(
+          event.timestamp, raise_error=True)
     except OverflowError as exception:
       self._ReportEventError(event, (
           u'unable to copy timestamp: {0:d} to a human readable date '
@@ -81,9 +79,8 @@ class DynamicFieldsHelper(object):
       str: date and time field.
     """
     try:
-      return timelib.Timestamp.CopyToIsoFormat(
-          event.timestamp, timezone=self._output_mediator.timezone,
-          raise_error=True)
+      return self._output_mediator.CopyTimestampToIsoFormat(
+          event.timestamp, raise_error=True)
 
     except OverflowError as exception:
       self._ReportEventError(event, (
@@ -244,9 +241,8 @@ class DynamicFieldsHelper(object):
       str: time field.
     """
     try:
-      date_use = timelib.Timestamp.CopyToDatetime(
-          event.timestamp, self._output_mediator.timezone,
-          raise_error=True)
+      date_use = self._output_mediator.CopyTimestampToDatetime(
+          event.timestamp, raise_error=True)
     except OverflowError as exception:
       self._ReportEventError(event, (
           u'unable to copy timestamp: {0:d} to a human readable time '
@@ -2,9 +2,19 @@
 """An output module that saves events to Elasticsearch."""
 
 from collections import Counter
+import json
 import logging
+import threading
+import time
+
+# The 'Queue' module was renamed to 'queue' in Python 3
+try:
+  import Queue
+except ImportError:
+  import queue as Queue  # pylint: disable=import-error
 
 from dfvfs.serializer.json_serializer import JsonPathSpecSerializer
+import requests
 
 try:
   from elasticsearch import Elasticsearch
@@ -22,21 +32,378 @@ elastic_logger = logging.getLogger(u'elasticsearch.trace')
 elastic_logger.setLevel(logging.WARNING)
 
 
+class ElasticSearchBulkIndexer(object):
+  """Pipelined Elasticsearch bulk indexer.
+
+  Documents are serialized into newline delimited JSON bulk request bodies
+  that are sent to the Elasticsearch bulk API by a pool of worker threads.
+  This allows multiple bulk requests to be in flight while new documents
+  are being formatted. The bulk requests are bounded in size by the number
+  of bytes rather than the number of documents and the number of pending
+  bulk requests is bounded, which makes AddDocument block when the cluster
+  cannot keep up.
+
+  Bulk requests, or individual documents, that are rejected with HTTP
+  status 429 (Too Many Requests) or 503 (Service Unavailable) are retried
+  with an exponential back off.
+  """
+
+  _BULK_API_PATH = u'/_bulk'
+
+  _HTTP_HEADERS = {u'Content-Type': u'application/x-ndjson'}
+
+  _RETRY_HTTP_STATUS_CODES = frozenset([429, 503])
+
+  # The default maximum size of a bulk request body in bytes.
+  DEFAULT_BULK_SIZE = 5 * 1024 * 1024
+
+  DEFAULT_MAXIMUM_RETRIES = 8
+  DEFAULT_NUMBER_OF_PENDING_REQUESTS = 8
+  DEFAULT_NUMBER_OF_THREADS = 4
+  DEFAULT_REQUEST_TIMEOUT = 120
+
+  # The initial and maximum number of seconds to wait before retrying.
+  DEFAULT_RETRY_DELAY = 0.5
+  MAXIMUM_RETRY_DELAY = 60.0
+
+  def __init__(
+      self, url, bulk_size=None, maximum_number_of_documents=None,
+      maximum_number_of_pending_requests=None, maximum_retries=None,
+      number_of_threads=None, request_timeout=None, retry_delay=None):
+    """Initializes a bulk indexer.
+
+    Args:
+      url (str): URL of the Elasticsearch server, for example
+          "http://127.0.0.1:9200".
+      bulk_size (Optional[int]): maximum size of a bulk request body in bytes.
+      maximum_number_of_documents (Optional[int]): maximum number of
+          documents in a bulk request, where None represents no limit.
+      maximum_number_of_pending_requests (Optional[int]): maximum number of
+          bulk requests that are waiting to be sent.
+      maximum_retries (Optional[int]): maximum number of times a bulk
+          request is retried.
+      number_of_threads (Optional[int]): number of threads that concurrently
+          send bulk requests.
+      request_timeout (Optional[int]): number of seconds to wait for
+          a response of the server.
+      retry_delay (Optional[float]): number of seconds to wait before the
+          first retry, which is doubled for every subsequent retry.
+    """
+    super(ElasticSearchBulkIndexer, self).__init__()
+    self._bulk_size = bulk_size or self.DEFAULT_BULK_SIZE
+    self._bulk_url = u'{0:s}{1:s}'.format(
+        url.rstrip(u'/'), self._BULK_API_PATH)
+    self._lock = threading.Lock()
+    self._maximum_number_of_documents = maximum_number_of_documents
+    self._maximum_retries = maximum_retries
+    self._number_of_threads = (
+        number_of_threads or self.DEFAULT_NUMBER_OF_THREADS)
+    self._pending_documents = []
+    self._pending_documents_size = 0
+    self._request_queue = Queue.Queue(
+        maxsize=(maximum_number_of_pending_requests or
+                 self.DEFAULT_NUMBER_OF_PENDING_REQUESTS))
+    self._request_timeout = request_timeout or self.DEFAULT_REQUEST_TIMEOUT
+    self._retry_delay = retry_delay or self.DEFAULT_RETRY_DELAY
+    self._start_time = None
+    self._threads = []
+
+    if self._maximum_retries is None:
+      self._maximum_retries = self.DEFAULT_MAXIMUM_RETRIES
+
+    self.number_of_bulk_requests = 0
+    self.number_of_bytes_sent = 0
+    self.number_of_documents_failed = 0
+    self.number_of_documents_indexed = 0
+    self.number_of_retries = 0
+
+  def _GetRetryDelay(self, number_of_retries):
+    """Determines the number of seconds to wait before retrying.
+
+    Args:
+      number_of_retries (int): number of retries done so far.
+
+    Returns:
+      float: number of seconds to wait.
+    """
+    return min(
+        self._retry_delay * (2 ** number_of_retries), self.MAXIMUM_RETRY_DELAY)
+
+  def _PostBulkRequest(self, session, documents):
+    """Posts a bulk request.
+
+    Args:
+      session (requests.Session): HTTP session.
+      documents (list[tuple[str, str]]): serialized action and source lines
+          of the documents.
+
+    Returns:
+      requests.Response: response or None if the server could not be reached.
+    """
+    lines = []
+    for action_line, source_line in documents:
+      lines.append(action_line)
+      lines.append(source_line)
+    lines.append(u'')
+    body = u'\n'.join(lines).encode(u'utf-8')
+
+    with self._lock:
+      self.number_of_bulk_requests += 1
+      self.number_of_bytes_sent += len(body)
+
+    try:
+      return session.post(
+          self._bulk_url, data=body, headers=self._HTTP_HEADERS,
+          timeout=self._request_timeout)
+    except requests.RequestException as exception:
+      logging.warning(
+          u'Unable to send bulk request to: {0:s} with error: {1!s}'.format(
+              self._bulk_url, exception))
+
+    return
+
+  def _SendBulkRequest(self, session, documents):
+    """Sends a bulk request and retries rejected documents.
+
+    Args:
+      session (requests.Session): HTTP session.
+      documents (list[tuple[str, str]]): serialized action and source lines
+          of the documents.
+    """
+    number_of_retries = 0
+    while documents:
+      response = self._PostBulkRequest(session, documents)
+
+      retry_documents = []
+      if response is None or response.status_code in (
+          self._RETRY_HTTP_STATUS_CODES):
+        retry_documents = documents
+
+      elif response.status_code >= 400:
+        logging.error(
+            u'Bulk request failed with HTTP status: {0:d}'.format(
+                response.status_code))
+        with self._lock:
+          self.number_of_documents_failed += len(documents)
+        return
+
+      else:
+        retry_documents = self._ProcessBulkResponse(response, documents)
+
+      if retry_documents and number_of_retries >= self._maximum_retries:
+        logging.error(
+            u'Unable to index {0:d} documents after {1:d} retries.'.format(
+                len(retry_documents), number_of_retries))
+        with self._lock:
+          self.number_of_documents_failed += len(retry_documents)
+        return
+
+      if retry_documents:
+        time.sleep(self._GetRetryDelay(number_of_retries))
+        number_of_retries += 1
+        with self._lock:
+          self.number_of_retries += 1
+
+      documents = retry_documents
+
+  def _ProcessBulkResponse(self, response, documents):
+    """Processes the response of a bulk request.
+
+    Args:
+      response (requests.Response): response.
+      documents (list[tuple[str, str]]): serialized action and source lines
+          of the documents in the bulk request.
+
+    Returns:
+      list[tuple[str, str]]: serialized action and source lines of
+          the documents that were rejected and should be retried.
+    """
+    try:
+      response_body = response.json()
+    except ValueError:
+      response_body = {}
+
+    if not response_body.get(u'errors', False):
+      with self._lock:
+        self.number_of_documents_indexed += len(documents)
+      return []
+
+    number_of_documents_failed = 0
+    number_of_documents_indexed = 0
+    retry_documents = []
+
+    items = response_body.get(u'items', [])
+    for document_index, document in enumerate(documents):
+      try:
+        item = items[document_index]
+        result = item.get(u'index', None) or item.get(u'create', {})
+      except (AttributeError, IndexError):
+        result = {}
+
+      status = result.get(u'status', 0)
+      if status in self._RETRY_HTTP_STATUS_CODES:
+        retry_documents.append(document)
+      elif 200 <= status < 300:
+        number_of_documents_indexed += 1
+      else:
+        number_of_documents_failed += 1
+        logging.warning(u'Unable to index document with error: {0!s}'.format(
+            result.get(u'error', u'N/A')))
+
+    with self._lock:
+      self.number_of_documents_failed += number_of_documents_failed
+      self.number_of_documents_indexed += number_of_documents_indexed
+
+    return retry_documents
+
+  def _QueuePendingDocuments(self):
+    """Queues the pending documents as a bulk request.
+
+    This method blocks if the maximum number of pending bulk requests has
+    been reached.
+    """
+    if not self._pending_documents:
+      return
+
+    if not self._threads:
+      self._StartThreads()
+
+    self._request_queue.put(self._pending_documents)
+    self._pending_documents = []
+    self._pending_documents_size = 0
+
+  @classmethod
+  def _SerializeValue(cls, value):
+    """Serializes a value that is not supported by the JSON encoder.
+
+    Args:
+      value (object): value.
+
+    Returns:
+      str: string representation of the value.
+    """
+    if isinstance(value, (set, frozenset)):
+      return list(value)
+
+    return u'{0!s}'.format(value)
+
+  def _StartThreads(self):
+    """Starts the bulk request threads."""
+    self._start_time = time.time()
+    for _ in range(self._number_of_threads):
+      thread = threading.Thread(target=self._ThreadMain)
+      # The threads should never block the program from exiting.
+      thread.daemon = True
+      thread.start()
+      self._threads.append(thread)
+
+  def _ThreadMain(self):
+    """The main loop of a bulk request thread."""
+    session = requests.Session()
+    while True:
+      documents = self._request_queue.get()
+      try:
+        if documents is None:
+          break
+        self._SendBulkRequest(session, documents)
+      finally:
+        self._request_queue.task_done()
+
+    session.close()
+
+  def AddDocument(self, index_name, doc_type, document):
+    """Adds a document to be indexed.
+
+    Args:
+      index_name (str): name of the Elasticsearch index.
+      doc_type (str): Elasticsearch document type name.
+      document (dict[str, object]): document values.
+
+    Raises:
+      ValueError: if the document cannot be serialized to JSON.
+    """
+    action = {u'index': {u'_index': index_name, u'_type': doc_type}}
+    try:
+      action_line = json.dumps(action)
+      source_line = json.dumps(document, default=self._SerializeValue)
+    except (TypeError, UnicodeDecodeError) as exception:
+      raise ValueError(
+          u'Unable to serialize document with error: {0!s}'.format(exception))
+
+    document_size = len(action_line) + len(source_line) + 2
+    if (self._pending_documents and
+        self._pending_documents_size + document_size > self._bulk_size):
+      self._QueuePendingDocuments()
+
+    self._pending_documents.append((action_line, source_line))
+    self._pending_documents_size += document_size
+
+    if (self._maximum_number_of_documents and
+        len(self._pending_documents) >= self._maximum_number_of_documents):
+      self._QueuePendingDocuments()
+
+  def Close(self):
+    """Sends the pending documents and waits for the threads to finish."""
+    self.Flush()
+
+    for _ in self._threads:
+      self._request_queue.put(None)
+
+    for thread in self._threads:
+      thread.join()
+
+    self._threads = []
+
+  def Flush(self):
+    """Sends the pending documents and waits for all bulk requests."""
+    self._QueuePendingDocuments()
+    self._request_queue.join()
+
+  def GetStatistics(self):
+    """Retrieves the indexing statistics.
+
+    Returns:
+      dict[str, object]: indexing statistics.
+    """
+    with self._lock:
+      statistics = {
+          u'bulk_requests': self.number_of_bulk_requests,
+          u'bytes_sent': self.number_of_bytes_sent,
+          u'documents_failed': self.number_of_documents_failed,
+          u'documents_indexed': self.number_of_documents_indexed,
+          u'retries': self.number_of_retries}
+
+    elapsed_time = 0.0
+    if self._start_time is not None:
+      elapsed_time = time.time() - self._start_time
+
+    documents_per_second = 0.0
+    if elapsed_time > 0.0:
+      documents_per_second = (
+          statistics[u'documents_indexed'] / elapsed_time)
+
+    statistics[u'documents_per_second'] = documents_per_second
+    statistics[u'elapsed_time'] = elapsed_time
+    return statistics
+
+
 class ElasticSearchHelper(object):
   """Elasticsearch helper class."""
   def __init__(
       self, output_mediator, host, port, flush_interval, index_name, mapping,
-      doc_type):
+      doc_type, bulk_size=None, number_of_threads=None):
     """Create a Elasticsearch helper.
 
     Args:
       output_mediator (OutputMediator): The output mediator object.
       host (str): IP address or hostname for the server.
       port (int): Port number for the server.
-      flush_interval (int): How many events to queue before being indexed.
+      flush_interval (int): Maximum number of events in a bulk request.
       index_name (str): Name of the Elasticsearch index.
       mapping (dict): Elasticsearch index configuration.
       doc_type (str): Elasticsearch document type name.
+      bulk_size (Optional[int]): Maximum size of a bulk request in bytes.
+      number_of_threads (Optional[int]): Number of concurrent bulk requests.
     """
     super(ElasticSearchHelper, self).__init__()
     self.client = Elasticsearch([{u'host': host, u'port': port}])
@@ -44,8 +411,11 @@ class ElasticSearchHelper(object):
     self._index = self._EnsureIndexExists(index_name, mapping)
     self._doc_type = doc_type
     self._flush_interval = flush_interval
-    self._events = []
     self._counter = Counter()
+    self._indexer = ElasticSearchBulkIndexer(
+        u'http://{0:s}:{1:d}'.format(host, port), bulk_size=bulk_size,
+        maximum_number_of_documents=flush_interval,
+        number_of_threads=number_of_threads)
 
   def AddEvent(self, event_object, force_flush=False):
     """Index event in Elasticsearch.
@@ -55,14 +425,36 @@ class ElasticSearchHelper(object):
       force_flush (bool): Force bulk insert of events in the queue.
     """
     if event_object:
-      self._events.append(
-          {u'index': {u'_index': self._index, u'_type': self._doc_type}})
-      self._events.append(self._GetSanitizedEventValues(event_object))
-      self._counter[u'events'] += 1
+      event_values = self._GetSanitizedEventValues(event_object)
+      try:
+        self._indexer.AddDocument(self._index, self._doc_type, event_values)
+        self._counter[u'events'] += 1
+      except ValueError as exception:
+        # Ignore problematic events
+        logging.warning(u'{0!s}'.format(exception))
+
+    if force_flush:
+      self._indexer.Flush()
 
-    # Check if we need to flush the queued events
-    if force_flush or self._counter[u'events'] % self._flush_interval == 0:
-      self._FlushEventsToElasticSearch()
+  def Close(self):
+    """Sends the remaining events and waits for them to be indexed."""
+    self._indexer.Close()
+
+    statistics = self._indexer.GetStatistics()
+    logging.info((
+        u'{0:d} events added, {1:d} failed in {2:d} bulk requests with '
+        u'{3:d} retries ({4:.0f} events/s).').format(
+            statistics[u'documents_indexed'], statistics[u'documents_failed'],
+            statistics[u'bulk_requests'], statistics[u'retries'],
+            statistics[u'documents_per_second']))
+
+  def GetStatistics(self):
+    """Retrieves the indexing statistics.
+
+    Returns:
+      dict[str, object]: indexing statistics.
+    """
+    return self._indexer.GetStatistics()
 
   def _EnsureIndexExists(self, index_name, mapping):
     """Create Elasticsearch index.
@@ -112,8 +504,8 @@ class ElasticSearchHelper(object):
 
     # Add string representation of the timestamp
     attribute_value = timelib.Timestamp.RoundToSeconds(event_object.timestamp)
-    attribute_value = timelib.Timestamp.CopyToIsoFormat(
-        attribute_value, timezone=self._output_mediator.timezone)
+    attribute_value = self._output_mediator.CopyTimestampToIsoFormat(
+        attribute_value)
     event_values[u'datetime'] = attribute_value
 
     message, _ = self._output_mediator.GetFormattedMessages(event_object)
@@ -141,19 +533,6 @@ class ElasticSearchHelper(object):
 
     return event_values
 
-  def _FlushEventsToElasticSearch(self):
-    """Insert events in bulk to Elasticsearch."""
-    try:
-      self.client.bulk(
-          index=self._index, doc_type=self._doc_type, body=self._events)
-    except ValueError as e:
-      # Ignore problematic events
-      logging.warning(u'{0:s}'.format(e))
-
-    # Clear the events list
-    self._events = []
-    logging.info(u'{0:d} events added'.format(self._counter[u'events']))
-
 
 class ElasticSearchOutputModule(interface.OutputModule):
   """Output module for Elasticsearch."""
@@ -172,12 +551,14 @@ class ElasticSearchOutputModule(interface.OutputModule):
     """
     super(ElasticSearchOutputModule, self).__init__(output_mediator)
 
+    self._bulk_size = None
     self._doc_type = None
     self._elastic = None
     self._flush_interval = None
     self._host = None
     self._index_name = None
     self._mapping = None
+    self._number_of_threads = None
     self._output_mediator = output_mediator
     self._port = None
     self._raw_fields = False
@@ -187,7 +568,16 @@ class ElasticSearchOutputModule(interface.OutputModule):
 
     Sends any remaining buffered events for indexing.
     """
-    self._elastic.AddEvent(event_object=None, force_flush=True)
+    self._elastic.Close()
+
+  def SetBulkSize(self, bulk_size):
+    """Set the maximum size of a bulk request.
+
+    Args:
+      bulk_size (int): Maximum size of a bulk request in bytes.
+    """
+    self._bulk_size = bulk_size
+    logging.info(u'Bulk size: {0:d}'.format(self._bulk_size))
 
   def SetServerInformation(self, server, port):
     """Set the Elasticsearch server information.
@@ -228,6 +618,16 @@ class ElasticSearchOutputModule(interface.OutputModule):
     self._doc_type = doc_type
     logging.info(u'Document type: {0:s}'.format(self._doc_type))
 
+  def SetNumberOfThreads(self, number_of_threads):
+    """Set the number of concurrent bulk requests.
+
+    Args:
+      number_of_threads (int): Number of threads that send bulk requests.
+    """
+    self._number_of_threads = number_of_threads
+    logging.info(u'Number of indexer threads: {0:d}'.format(
+        self._number_of_threads))
+
   def SetRawFields(self, raw_fields):
     """Set raw (not analyzed) fields.
 
@@ -277,7 +677,8 @@ class ElasticSearchOutputModule(interface.OutputModule):
 
     self._elastic = ElasticSearchHelper(
         self._output_mediator, self._host, self._port, self._flush_interval,
-        self._index_name, self._mapping, self._doc_type)
+        self._index_name, self._mapping, self._doc_type,
+        bulk_size=self._bulk_size, number_of_threads=self._number_of_threads)
     logging.info(u'Adding events to Elasticsearch..')
 
 
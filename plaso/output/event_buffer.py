@@ -1,11 +1,33 @@
 # -*- coding: utf-8 -*-
 """This file contains the event buffer class."""
 
+import hashlib
 import heapq
+import io
 import logging
+import os
+import tempfile
 
+from plaso.formatters import cache as formatters_cache
 from plaso.lib import errors
 from plaso.lib import py2to3
+from plaso.serializer import json_serializer
+
+
+def _GetEventSortKey(event):
+  """Retrieves the values used to sort events within the same timestamp.
+
+  Args:
+    event (EventObject): event.
+
+  Returns:
+    tuple: timestamp, timestamp description, store number and store index.
+  """
+  # TODO: remove store number and store index once no longer exposed.
+  # Replace them by event specific attributes relevant to sorting.
+  return (
+      event.timestamp, event.timestamp_desc, event.store_number,
+      event.store_index)
 
 
 class _EventsHeap(object):
@@ -40,11 +62,7 @@ class _EventsHeap(object):
     Args:
       event (EventObject): event.
     """
-    # TODO: remove store number and store index once no longer exposed.
-    # Replace them by event specific attributes relevant to sorting.
-    heap_values = (
-        event.timestamp, event.timestamp_desc, event.store_number,
-        event.store_index, event)
+    heap_values = _GetEventSortKey(event) + (event, )
     heapq.heappush(self._heap, heap_values)
 
   def PushEvents(self, events):
@@ -57,6 +75,67 @@ class _EventsHeap(object):
       self.PushEvent(event)
 
 
+class _EventsSpillFile(object):
+  """Class that defines a temporary file containing spilled events.
+
+  Every line of the file contains the fingerprint of an event and the
+  serialized event separated by a tab character.
+  """
+
+  _SERIALIZER = json_serializer.JSONAttributeContainerSerializer
+
+  def __init__(self, temporary_directory=None):
+    """Initializes an events spill file.
+
+    Args:
+      temporary_directory (Optional[str]): path of the directory for
+          the temporary file, where None represents the default directory
+          for temporary files.
+    """
+    super(_EventsSpillFile, self).__init__()
+    file_object = tempfile.NamedTemporaryFile(
+        delete=False, dir=temporary_directory, prefix=u'plaso-',
+        suffix=u'.spill')
+    file_object.close()
+    self._path = file_object.name
+
+  def ReadEvents(self):
+    """Reads the spilled events.
+
+    Yields:
+      tuple[str, EventObject]: fingerprint and event.
+    """
+    with io.open(self._path, 'r', encoding=u'utf-8') as file_object:
+      for line in file_object:
+        fingerprint, _, serialized_event = line.rstrip(u'\n').partition(u'\t')
+        event = self._SERIALIZER.ReadSerialized(serialized_event)
+        yield fingerprint, event
+
+  def Remove(self):
+    """Removes the spill file."""
+    if os.path.exists(self._path):
+      os.remove(self._path)
+
+  def WriteEvents(self, events):
+    """Writes events.
+
+    Args:
+      events (iterable[tuple[str, EventObject]]): fingerprints and events.
+
+    Returns:
+      int: number of events written.
+    """
+    number_of_events = 0
+    with io.open(self._path, 'w', encoding=u'utf-8') as file_object:
+      for fingerprint, event in events:
+        serialized_event = self._SERIALIZER.WriteSerialized(event)
+        file_object.write(u'{0:s}\t{1:s}\n'.format(
+            fingerprint, serialized_event))
+        number_of_events += 1
+
+    return number_of_events
+
+
 # TODO: rename class and fix docstrings.
 class EventBuffer(object):
   """Buffer class for event output processing.
@@ -64,15 +143,29 @@ class EventBuffer(object):
   The event buffer is used to deduplicate events and make sure they are sorted
   before output.
 
+  Events are deduplicated by a fingerprint, which is a hash of the equality
+  string of the event, that is computed once per event. If the number of
+  events buffered for a single timestamp exceeds the maximum, the buffered
+  events are spilled to a temporary file and merged back on flush.
+
   Attributes:
     check_dedups (bool): True if the event buffer should check and merge
         duplicate events.
     duplicate_counter (int): number of duplicate events.
+    number_of_spilled_events (int): number of events that were spilled to
+        a temporary file.
+    peak_number_of_buffered_events (int): largest number of events that were
+        buffered in memory.
   """
 
   _JOIN_ATTRIBUTES = frozenset([u'display_name', u'filename', u'inode'])
 
-  def __init__(self, output_module, check_dedups=True):
+  # The default maximum number of events buffered in memory.
+  _MAXIMUM_NUMBER_OF_BUFFERED_EVENTS = 100000
+
+  def __init__(
+      self, output_module, check_dedups=True,
+      maximum_number_of_buffered_events=None, temporary_directory=None):
     """Initializes an event buffer object.
 
     This class is used for buffering up events for duplicate removals
@@ -83,15 +176,28 @@ class EventBuffer(object):
       output_module (OutputModule): output module.
       check_dedups (Optional[bool]): True if the event buffer should check and
           merge duplicate events.
+      maximum_number_of_buffered_events (Optional[int]): maximum number of
+          events buffered in memory before they are spilled to a temporary
+          file, where None represents the default.
+      temporary_directory (Optional[str]): path of the directory for
+          the temporary files, where None represents the default directory
+          for temporary files.
     """
     self._current_timestamp = 0
     self._events_per_key = {}
+    self._maximum_number_of_buffered_events = (
+        maximum_number_of_buffered_events or
+        self._MAXIMUM_NUMBER_OF_BUFFERED_EVENTS)
     self._output_module = output_module
     self._output_module.Open()
     self._output_module.WriteHeader()
+    self._spill_files = []
+    self._temporary_directory = temporary_directory
 
     self.check_dedups = check_dedups
     self.duplicate_counter = 0
+    self.number_of_spilled_events = 0
+    self.peak_number_of_buffered_events = 0
 
   def __enter__(self):
     """Make usable with "with" statement."""
@@ -101,6 +207,138 @@ class EventBuffer(object):
     """Make usable with "with" statement."""
     self.End()
 
+  def _FlushSpilledEvents(self):
+    """Flushes the buffered and spilled events.
+
+    The spilled events are merged by fingerprint to deduplicate them, after
+    which the deduplicated events are merged in sort order. Only the events
+    of a single spill file at a time are kept in memory.
+    """
+    self._SpillEvents()
+
+    spill_files = self._spill_files
+    self._spill_files = []
+
+    try:
+      sorted_spill_files = []
+      sorted_events = []
+
+      merged_events = heapq.merge(*[
+          self._ReadEventsByFingerprint(spill_file, spill_file_index)
+          for spill_file_index, spill_file in enumerate(spill_files)])
+
+      previous_fingerprint = None
+      previous_event = None
+      for fingerprint, _, _, event in merged_events:
+        if fingerprint == previous_fingerprint:
+          self.JoinEvents(event, previous_event)
+
+        elif previous_event is not None:
+          sorted_events.append((
+              _GetEventSortKey(previous_event), previous_fingerprint,
+              previous_event))
+
+        previous_fingerprint = fingerprint
+        previous_event = event
+
+        if len(sorted_events) >= self._maximum_number_of_buffered_events:
+          sorted_events.sort()
+          spill_file = _EventsSpillFile(
+              temporary_directory=self._temporary_directory)
+          spill_files.append(spill_file)
+          sorted_spill_files.append(spill_file)
+
+          spill_file.WriteEvents([
+              (sorted_fingerprint, sorted_event)
+              for _, sorted_fingerprint, sorted_event in sorted_events])
+          sorted_events = []
+
+      if previous_event is not None:
+        sorted_events.append((
+            _GetEventSortKey(previous_event), previous_fingerprint,
+            previous_event))
+
+      sorted_events.sort()
+
+      merged_events = heapq.merge(sorted_events, *[
+          self._ReadEventsBySortKey(spill_file)
+          for spill_file in sorted_spill_files])
+
+      for _, _, event in merged_events:
+        self._WriteEvent(event)
+
+    finally:
+      for spill_file in spill_files:
+        spill_file.Remove()
+
+  def _GetFingerprint(self, event):
+    """Retrieves the fingerprint of an event.
+
+    Args:
+      event (EventObject): event.
+
+    Returns:
+      str: fingerprint, which is a hexadecimal MD5 hash of the equality string
+          of the event.
+    """
+    equality_string = event.EqualityString()
+    if isinstance(equality_string, py2to3.UNICODE_TYPE):
+      equality_string = equality_string.encode(u'utf-8')
+
+    return hashlib.md5(equality_string).hexdigest()
+
+  def _ReadEventsByFingerprint(self, spill_file, spill_file_index):
+    """Reads events from a spill file ordered by fingerprint.
+
+    Args:
+      spill_file (_EventsSpillFile): spill file.
+      spill_file_index (int): index of the spill file, used to merge
+          duplicate events in the order they were appended.
+
+    Yields:
+      tuple[str, int, int, EventObject]: fingerprint, spill file index,
+          index of the event within the spill file and event.
+    """
+    for event_index, (fingerprint, event) in enumerate(spill_file.ReadEvents()):
+      yield fingerprint, spill_file_index, event_index, event
+
+  def _ReadEventsBySortKey(self, spill_file):
+    """Reads events from a spill file ordered by sort key.
+
+    Args:
+      spill_file (_EventsSpillFile): spill file.
+
+    Yields:
+      tuple[tuple, str, EventObject]: sort key, fingerprint and event.
+    """
+    for fingerprint, event in spill_file.ReadEvents():
+      yield _GetEventSortKey(event), fingerprint, event
+
+  def _SpillEvents(self):
+    """Spills the buffered events to a temporary file."""
+    if not self._events_per_key:
+      return
+
+    spill_file = _EventsSpillFile(temporary_directory=self._temporary_directory)
+    self._spill_files.append(spill_file)
+
+    self.number_of_spilled_events += spill_file.WriteEvents(
+        sorted(self._events_per_key.items()))
+    self._events_per_key = {}
+
+  def _WriteEvent(self, event):
+    """Writes an event using the output module.
+
+    Args:
+      event (EventObject): event.
+    """
+    try:
+      self._output_module.WriteEvent(event)
+    except errors.WrongFormatter as exception:
+      # TODO: store errors and report them at the end of psort.
+      logging.error(
+          u'Unable to write event with error: {0:s}'.format(exception))
+
   def Append(self, event):
     """Appends an event.
 
@@ -115,12 +353,19 @@ class EventBuffer(object):
       self._current_timestamp = event.timestamp
       self.Flush()
 
-    key = event.EqualityString()
-    if key in self._events_per_key:
-      duplicate_event = self._events_per_key.pop(key)
+    fingerprint = self._GetFingerprint(event)
+    duplicate_event = self._events_per_key.pop(fingerprint, None)
+    if duplicate_event is not None:
       self.JoinEvents(event, duplicate_event)
 
-    self._events_per_key[key] = event
+    self._events_per_key[fingerprint] = event
+
+    number_of_buffered_events = len(self._events_per_key)
+    if number_of_buffered_events > self.peak_number_of_buffered_events:
+      self.peak_number_of_buffered_events = number_of_buffered_events
+
+    if number_of_buffered_events >= self._maximum_number_of_buffered_events:
+      self._SpillEvents()
 
   def End(self):
     """Closes the buffer.
@@ -139,6 +384,10 @@ class EventBuffer(object):
 
     Buffered events are written using the output module.
     """
+    if self._spill_files:
+      self._FlushSpilledEvents()
+      return
+
     if not self._events_per_key:
       return
 
@@ -150,13 +399,7 @@ class EventBuffer(object):
 
     event = events_heap.PopEvent()
     while event:
-      try:
-        self._output_module.WriteEvent(event)
-      except errors.WrongFormatter as exception:
-        # TODO: store errors and report them at the end of psort.
-        logging.error(
-            u'Unable to write event with error: {0:s}'.format(exception))
-
+      self._WriteEvent(event)
       event = events_heap.PopEvent()
 
   def JoinEvents(self, first_event, second_event):
@@ -168,6 +411,10 @@ class EventBuffer(object):
     """
     self.duplicate_counter += 1
 
+    # The attributes of the first event are changed, hence its formatted
+    # strings need to be determined again.
+    formatters_cache.FormattedStringsCache.Invalidate(first_event)
+
     # TODO: Currently we are using the first event pathspec, perhaps that
     # is not the best approach. There is no need to have all the pathspecs
     # inside the combined event, however which one should be chosen is
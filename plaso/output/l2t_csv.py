@@ -8,7 +8,6 @@ http://forensicswiki.org/wiki/L2T_CSV
 from plaso.lib import definitions
 from plaso.lib import errors
 from plaso.lib import py2to3
-from plaso.lib import timelib
 from plaso.output import interface
 from plaso.output import manager
 
@@ -86,8 +85,7 @@ class L2TCSVOutputModule(interface.LinearOutputModule):
           u'Unable to find event formatter for: {0:s}.'.format(
               getattr(event, u'data_type', u'UNKNOWN')))
 
-    date_use = timelib.Timestamp.CopyToDatetime(
-        event.timestamp, self._output_mediator.timezone)
+    date_use = self._output_mediator.CopyTimestampToDatetime(event.timestamp)
 
     format_variables = self._output_mediator.GetFormatStringAttributeNames(
         event)
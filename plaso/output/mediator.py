@@ -1,8 +1,10 @@
 # -*- coding: utf-8 -*-
 """The output mediator object."""
 
+from plaso.formatters import cache as formatters_cache
 from plaso.formatters import manager as formatters_manager
 from plaso.lib import eventdata
+from plaso.lib import timelib
 
 import pytz  # pylint: disable=wrong-import-order
 
@@ -32,6 +34,7 @@ class OutputMediator(object):
     self._knowledge_base = knowledge_base
     self._preferred_encoding = preferred_encoding
     self._timezone = pytz.UTC
+    self._timezone_converter = timelib.TimezoneConverter(self._timezone)
 
     self.fields_filter = fields_filter
 
@@ -53,6 +56,42 @@ class OutputMediator(object):
     """The timezone."""
     return self._timezone
 
+  def CopyTimestampToDatetime(self, timestamp, raise_error=False):
+    """Copies a timestamp to a datetime object in the output timezone.
+
+    Args:
+      timestamp (int): number of micro seconds since January 1, 1970,
+          00:00:00 UTC.
+      raise_error (Optional[bool]): True if an OverflowError should be raised
+          if the timestamp is out of bounds.
+
+    Returns:
+      datetime.datetime: date and time in the output timezone.
+
+    Raises:
+      OverflowError: if raise_error is set and the timestamp is out of bounds.
+    """
+    return self._timezone_converter.CopyToDatetime(
+        timestamp, raise_error=raise_error)
+
+  def CopyTimestampToIsoFormat(self, timestamp, raise_error=False):
+    """Copies a timestamp to an ISO 8601 string in the output timezone.
+
+    Args:
+      timestamp (int): number of micro seconds since January 1, 1970,
+          00:00:00 UTC.
+      raise_error (Optional[bool]): True if an OverflowError should be raised
+          if the timestamp is out of bounds.
+
+    Returns:
+      str: ISO 8601 formatted date and time in the output timezone.
+
+    Raises:
+      OverflowError: if raise_error is set and the timestamp is out of bounds.
+    """
+    return self._timezone_converter.CopyToIsoFormat(
+        timestamp, raise_error=raise_error)
+
   def GetEventFormatter(self, event):
     """Retrieves the event formatter for a specific event type.
 
@@ -84,7 +123,8 @@ class OutputMediator(object):
     if not event_formatter:
       return None, None
 
-    return event_formatter.GetMessages(self._formatter_mediator, event)
+    return formatters_cache.FormattedStringsCache.GetMessageStrings(
+        event_formatter, self._formatter_mediator, event)
 
   def GetFormattedSources(self, event):
     """Retrieves the formatted sources related to the event.
@@ -101,7 +141,8 @@ class OutputMediator(object):
     if not event_formatter:
       return None, None
 
-    return event_formatter.GetSources(event)
+    return formatters_cache.FormattedStringsCache.GetSourceStrings(
+        event_formatter, event)
 
   def GetFormatStringAttributeNames(self, event):
     """Retrieves the attribute names in the format string.
@@ -252,3 +293,5 @@ class OutputMediator(object):
       self._timezone = pytz.timezone(timezone)
     except pytz.UnknownTimeZoneError:
       raise ValueError(u'Unsupported timezone: {0:s}'.format(timezone))
+
+    self._timezone_converter = timelib.TimezoneConverter(self._timezone)
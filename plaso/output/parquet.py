@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""Output module for the Apache Parquet columnar output format."""
+
+import logging
+import os
+
+from dfvfs.serializer.json_serializer import JsonPathSpecSerializer
+
+try:
+  import pyarrow
+  from pyarrow import parquet
+except ImportError:
+  pyarrow = None
+
+from plaso.lib import errors
+from plaso.output import interface
+from plaso.output import manager
+
+
+class ParquetOutputModule(interface.OutputModule):
+  """Output module for the Apache Parquet columnar output format.
+
+  The events are buffered per column and written as row groups. The event
+  attributes that do not have a dedicated column are stored as strings
+  in a map column.
+  """
+
+  NAME = u'parquet'
+  DESCRIPTION = u'Saves the events into an Apache Parquet file.'
+
+  _DEFAULT_ROW_GROUP_SIZE = 65536
+
+  # Attributes that are stored in dedicated columns or that should not
+  # be stored in the attributes column.
+  _RESERVED_ATTRIBUTE_NAMES = frozenset([
+      u'data_type', u'display_name', u'parser', u'regvalue', u'tag',
+      u'timestamp', u'timestamp_desc', u'uuid'])
+
+  _STRING_COLUMN_NAMES = [
+      u'timestamp_desc', u'data_type', u'parser', u'message', u'source',
+      u'source_long', u'display_name']
+
+  def __init__(self, output_mediator):
+    """Initializes the output module object.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfvfs.
+    """
+    super(ParquetOutputModule, self).__init__(output_mediator)
+    self._attributes_as_lists = False
+    self._columns = {}
+    self._compression = u'snappy'
+    self._filename = None
+    self._number_of_rows = 0
+    self._row_group_size = self._DEFAULT_ROW_GROUP_SIZE
+    self._schema = None
+    self._writer = None
+
+    self._ResetColumns()
+
+  def _GetAttributes(self, event):
+    """Retrieves the attributes that do not have a dedicated column.
+
+    Args:
+      event (EventObject): event.
+
+    Returns:
+      list[tuple[str, str]]: attribute names and values.
+    """
+    attributes = []
+    for attribute_name, attribute_value in sorted(event.GetAttributes()):
+      if attribute_name in self._RESERVED_ATTRIBUTE_NAMES:
+        continue
+
+      if attribute_name == u'pathspec':
+        try:
+          attribute_value = JsonPathSpecSerializer.WriteSerialized(
+              attribute_value)
+        except TypeError:
+          continue
+
+      if attribute_value is None:
+        continue
+
+      if isinstance(attribute_value, bytes):
+        attribute_value = attribute_value.decode(u'utf-8', u'replace')
+      else:
+        attribute_value = u'{0!s}'.format(attribute_value)
+
+      attributes.append((attribute_name, attribute_value))
+
+    return attributes
+
+  def _GetSchema(self, attributes_as_lists):
+    """Retrieves the schema.
+
+    Args:
+      attributes_as_lists (bool): True if the attributes should be stored as
+          a list of names and a list of values instead of a map.
+
+    Returns:
+      pyarrow.Schema: schema.
+    """
+    string_type = pyarrow.string()
+
+    fields = [
+        pyarrow.field(u'timestamp', pyarrow.timestamp(u'us', tz=u'UTC'))]
+    for column_name in self._STRING_COLUMN_NAMES:
+      fields.append(pyarrow.field(column_name, string_type))
+
+    fields.append(pyarrow.field(u'tag', pyarrow.list_(string_type)))
+
+    if attributes_as_lists:
+      fields.append(pyarrow.field(
+          u'attribute_names', pyarrow.list_(string_type)))
+      fields.append(pyarrow.field(
+          u'attribute_values', pyarrow.list_(string_type)))
+    else:
+      fields.append(pyarrow.field(
+          u'attributes', pyarrow.map_(string_type, string_type)))
+
+    return pyarrow.schema(fields)
+
+  def _OpenWriter(self):
+    """Opens the Parquet writer.
+
+    Older versions of pyarrow cannot write map columns to Parquet in which
+    case the attribute names and values are written as two list columns.
+    """
+    if hasattr(pyarrow, u'map_'):
+      self._attributes_as_lists = False
+      self._schema = self._GetSchema(False)
+      try:
+        self._writer = parquet.ParquetWriter(
+            self._filename, self._schema, compression=self._compression)
+        return
+
+      except pyarrow.ArrowNotImplementedError:
+        logging.debug(
+            u'Parquet map column not supported, falling back to lists.')
+
+        if os.path.isfile(self._filename):
+          os.remove(self._filename)
+
+    self._attributes_as_lists = True
+    self._schema = self._GetSchema(True)
+    self._writer = parquet.ParquetWriter(
+        self._filename, self._schema, compression=self._compression)
+
+  def _ResetColumns(self):
+    """Resets the buffered column values."""
+    self._columns = {u'attributes': [], u'tag': [], u'timestamp': []}
+    for column_name in self._STRING_COLUMN_NAMES:
+      self._columns[column_name] = []
+
+    self._number_of_rows = 0
+
+  def _WriteRowGroup(self):
+    """Writes the buffered column values as a row group."""
+    if not self._number_of_rows:
+      return
+
+    if self._attributes_as_lists:
+      attributes_column = self._columns.pop(u'attributes')
+      self._columns[u'attribute_names'] = [
+          [name for name, _ in attributes] for attributes in attributes_column]
+      self._columns[u'attribute_values'] = [
+          [value for _, value in attributes]
+          for attributes in attributes_column]
+
+    arrays = []
+    for field in self._schema:
+      arrays.append(pyarrow.array(self._columns[field.name], type=field.type))
+
+    table = pyarrow.Table.from_arrays(arrays, schema=self._schema)
+    self._writer.write_table(table)
+
+    self._ResetColumns()
+
+  def Close(self):
+    """Closes the output."""
+    if self._writer:
+      self._WriteRowGroup()
+      self._writer.close()
+
+    self._writer = None
+
+  def Open(self):
+    """Opens the output.
+
+    Raises:
+      IOError: if the specified output file already exists.
+      ValueError: if the filename is not set.
+    """
+    if not self._filename:
+      raise ValueError(u'Missing filename.')
+
+    if os.path.isfile(self._filename):
+      raise IOError((
+          u'Unable to use an already existing file for output '
+          u'[{0:s}]').format(self._filename))
+
+    self._ResetColumns()
+    self._OpenWriter()
+
+  def SetCompression(self, compression):
+    """Sets the compression.
+
+    Args:
+      compression (str): compression codec, such as "snappy", "gzip" or
+          "none".
+    """
+    self._compression = compression
+
+  def SetFilename(self, filename):
+    """Sets the filename.
+
+    Args:
+      filename (str): filename.
+    """
+    self._filename = filename
+
+  def SetRowGroupSize(self, row_group_size):
+    """Sets the number of events per row group.
+
+    Args:
+      row_group_size (int): number of events per row group.
+    """
+    self._row_group_size = row_group_size
+
+  def WriteEventBody(self, event):
+    """Writes the body of an event to the output.
+
+    Args:
+      event (EventObject): event.
+
+    Raises:
+      NoFormatterFound: if no event formatter can be found to match the data
+          type in the event.
+    """
+    data_type = getattr(event, u'data_type', u'UNKNOWN')
+
+    message, _ = self._output_mediator.GetFormattedMessages(event)
+    if message is None:
+      raise errors.NoFormatterFound(
+          u'Unable to find event formatter for: {0:s}.'.format(data_type))
+
+    source_short, source = self._output_mediator.GetFormattedSources(event)
+    if source is None or source_short is None:
+      raise errors.NoFormatterFound(
+          u'Unable to find event formatter for: {0:s}.'.format(data_type))
+
+    labels = []
+    event_tag = getattr(event, u'tag', None)
+    if event_tag:
+      labels = list(getattr(event_tag, u'labels', []))
+
+    self._columns[u'timestamp'].append(event.timestamp)
+    self._columns[u'timestamp_desc'].append(
+        getattr(event, u'timestamp_desc', None))
+    self._columns[u'data_type'].append(data_type)
+    self._columns[u'parser'].append(getattr(event, u'parser', None))
+    self._columns[u'message'].append(message)
+    self._columns[u'source'].append(source_short)
+    self._columns[u'source_long'].append(source)
+    self._columns[u'display_name'].append(
+        getattr(event, u'display_name', None))
+    self._columns[u'tag'].append(labels)
+    self._columns[u'attributes'].append(self._GetAttributes(event))
+    self._number_of_rows += 1
+
+    if self._number_of_rows >= self._row_group_size:
+      self._WriteRowGroup()
+
+
+manager.OutputManager.RegisterOutput(
+    ParquetOutputModule, disabled=pyarrow is None)
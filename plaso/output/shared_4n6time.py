@@ -3,7 +3,6 @@
 
 from plaso.lib import definitions
 from plaso.lib import errors
-from plaso.lib import timelib
 from plaso.output import interface
 
 
@@ -65,8 +64,8 @@ class Base4n6TimeOutputModule(interface.OutputModule):
 
     datetime_object = None
     if event.timestamp is not None:
-      datetime_object = timelib.Timestamp.CopyToDatetime(
-          event.timestamp, self._output_mediator.timezone)
+      datetime_object = self._output_mediator.CopyTimestampToDatetime(
+          event.timestamp)
       if not datetime_object:
         self._ReportEventError(event, (
             u'unable to copy timestamp: {0:d} to datetime object.'))
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """Defines the output module for the SQLite database used by 4n6time."""
 
+from collections import Counter
 import os
 
 try:
@@ -8,6 +9,7 @@ try:
 except ImportError:
   import sqlite3
 
+from plaso.lib import py2to3
 from plaso.output import manager
 from plaso.output import shared_4n6time
 
@@ -47,6 +49,21 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Base4n6TimeOutputModule):
       u':URL, :record_number, :event_identifier, :event_type, :source_name, '
       u':user_sid, :computer_name, :evidence)')
 
+  # The number of rows to insert with a single executemany.
+  _INSERT_BATCH_SIZE = 10000
+
+  # The number of rows to insert in a single transaction.
+  _TRANSACTION_SIZE = 100000
+
+  # The pragmas used to speed up inserting rows. The journal mode is reset
+  # to DELETE on close, so that the database remains usable by versions of
+  # SQLite that do not support write-ahead logging, such as used by 4n6time.
+  _PRAGMAS = [
+      u'PRAGMA journal_mode=WAL',
+      u'PRAGMA synchronous=OFF',
+      u'PRAGMA cache_size=-65536',
+      u'PRAGMA temp_store=MEMORY']
+
   def __init__(self, output_mediator):
     """Initializes the output module object.
 
@@ -61,6 +78,56 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Base4n6TimeOutputModule):
     self._count = 0
     self._cursor = None
     self._filename = None
+    self._meta_values = {}
+    self._rows = []
+    self._tags = []
+    self._tags_set = set()
+
+  def _FlushRows(self):
+    """Inserts the buffered rows into the database."""
+    if not self._rows:
+      return
+
+    self._cursor.executemany(self._INSERT_QUERY, self._rows)
+    self._rows = []
+
+  def _GetMetaValue(self, value):
+    """Retrieves the value of a meta field as stored in the database.
+
+    The meta fields are stored in TEXT columns, hence SQLite converts
+    numeric values to their string representation.
+
+    Args:
+      value (object): value of the meta field.
+
+    Returns:
+      object: value of the meta field as stored in the database.
+    """
+    if isinstance(value, bool):
+      value = int(value)
+
+    if isinstance(value, py2to3.INTEGER_TYPES):
+      return u'{0:d}'.format(value)
+
+    return value
+
+  def _UpdateMetaValues(self, row):
+    """Updates the meta field and tag counters with the values of a row.
+
+    Args:
+      row (dict[str, object]): row values.
+    """
+    for field in self._META_FIELDS:
+      value = self._GetMetaValue(row.get(field, None))
+      if value:
+        self._meta_values[field][value] += 1
+
+    tag_string = row.get(u'tag', None)
+    if tag_string:
+      for tag in tag_string.split(u','):
+        if tag not in self._tags_set:
+          self._tags.append(tag)
+          self._tags_set.add(tag)
 
   def _GetDistinctValues(self, field_name):
     """Query database for unique field types.
@@ -104,6 +171,8 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Base4n6TimeOutputModule):
     This method will create the necessary indices and commit outstanding
     transactions before disconnecting.
     """
+    self._FlushRows()
+
     # Build up indices for the fields specified in the args.
     # It will commit the inserts automatically before creating index.
     if not self._append:
@@ -118,21 +187,34 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Base4n6TimeOutputModule):
     if self._set_status:
       self._set_status(u'Creating metadata...')
 
+    # When appending the meta info needs to account for the rows that were
+    # already stored in the database, otherwise the meta info was maintained
+    # while the rows were written.
     for field in self._META_FIELDS:
-      values = self._GetDistinctValues(field)
+      if self._append:
+        values = self._GetDistinctValues(field)
+      else:
+        values = self._meta_values[field]
+
       self._cursor.execute(u'DELETE FROM l2t_{0:s}s'.format(field))
-      for name, frequency in iter(values.items()):
-        self._cursor.execute((
-            u'INSERT INTO l2t_{0:s}s ({1:s}s, frequency) '
-            u'VALUES("{2:s}", {3:d}) ').format(field, field, name, frequency))
+      self._cursor.executemany(
+          u'INSERT INTO l2t_{0:s}s ({0:s}s, frequency) VALUES (?, ?)'.format(
+              field), iter(values.items()))
+
+    if self._append:
+      tags = self._ListTags()
+    else:
+      tags = self._tags
+
     self._cursor.execute(u'DELETE FROM l2t_tags')
-    for tag in self._ListTags():
-      self._cursor.execute(u'INSERT INTO l2t_tags (tag) VALUES (?)', [tag])
+    self._cursor.executemany(
+        u'INSERT INTO l2t_tags (tag) VALUES (?)', [[tag] for tag in tags])
 
     if self._set_status:
       self._set_status(u'Database created.')
 
     self._connection.commit()
+    self._cursor.execute(u'PRAGMA journal_mode=DELETE')
     self._cursor.close()
     self._connection.close()
 
@@ -157,6 +239,9 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Base4n6TimeOutputModule):
     self._connection = sqlite3.connect(self._filename)
     self._cursor = self._connection.cursor()
 
+    for pragma in self._PRAGMAS:
+      self._cursor.execute(pragma)
+
     # Create table in database.
     if not self._append:
       self._cursor.execute(self._CREATE_TABLE_QUERY)
@@ -190,6 +275,10 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Base4n6TimeOutputModule):
         self._set_status(u'Created table: l2t_disk')
 
     self._count = 0
+    self._meta_values = {field: Counter() for field in self._META_FIELDS}
+    self._rows = []
+    self._tags = []
+    self._tags_set = set()
 
   def SetFilename(self, filename):
     """Sets the filename.
@@ -209,10 +298,16 @@ class SQLite4n6TimeOutputModule(shared_4n6time.Base4n6TimeOutputModule):
     # not to be used by 4n6time
     row = self._GetSanitizedEventValues(event_object)
 
-    self._cursor.execute(self._INSERT_QUERY, row)
+    self._rows.append(row)
+    if not self._append:
+      self._UpdateMetaValues(row)
+
     self._count += 1
-    # Commit the current transaction every 10000 inserts.
-    if self._count % 10000 == 0:
+    if self._count % self._INSERT_BATCH_SIZE == 0:
+      self._FlushRows()
+
+    # Commit the current transaction every _TRANSACTION_SIZE inserts.
+    if self._count % self._TRANSACTION_SIZE == 0:
       self._connection.commit()
       if self._set_status:
         self._set_status(u'Inserting event: {0:d}'.format(self._count))
@@ -36,6 +36,7 @@ class TimesketchOutputModule(interface.OutputModule):
     super(TimesketchOutputModule, self).__init__(output_mediator)
 
     self._output_mediator = output_mediator
+    self._bulk_size = None
     self._host = None
     self._port = None
     self._flush_interval = None
@@ -44,6 +45,7 @@ class TimesketchOutputModule(interface.OutputModule):
     self._username = None
     self._mapping = None
     self._elastic = None
+    self._number_of_threads = None
     self._timesketch = timesketch.create_app()
 
     hostname = self._output_mediator.GetStoredHostname()
@@ -59,7 +61,7 @@ class TimesketchOutputModule(interface.OutputModule):
     Sends the remaining events for indexing and removes the processing status on
     the Timesketch search index object.
     """
-    self._elastic.AddEvent(event_object=None, force_flush=True)
+    self._elastic.Close()
     with self._timesketch.app_context():
       search_index = SearchIndex.query.filter_by(
           index_name=self._index_name).first()
@@ -77,6 +79,15 @@ class TimesketchOutputModule(interface.OutputModule):
       return [u'timeline_name']
     return []
 
+  def SetBulkSize(self, bulk_size):
+    """Set the maximum size of a bulk request.
+
+    Args:
+      bulk_size: the maximum size of a bulk request in bytes.
+    """
+    self._bulk_size = bulk_size
+    logging.info(u'Bulk size: {0:d}'.format(self._bulk_size))
+
   def SetDocType(self, doc_type):
     """Set the Elasticsearch document type.
 
@@ -104,6 +115,16 @@ class TimesketchOutputModule(interface.OutputModule):
     self._index_name = index_name
     logging.info(u'Index name: {0:s}'.format(self._index_name))
 
+  def SetNumberOfThreads(self, number_of_threads):
+    """Set the number of concurrent bulk requests.
+
+    Args:
+      number_of_threads: the number of threads that send bulk requests.
+    """
+    self._number_of_threads = number_of_threads
+    logging.info(u'Number of indexer threads: {0:d}'.format(
+        self._number_of_threads))
+
   def SetTimelineName(self, timeline_name):
     """Set the timeline name.
 
@@ -155,7 +176,8 @@ class TimesketchOutputModule(interface.OutputModule):
 
     self._elastic = ElasticSearchHelper(
         self._output_mediator, _host, _port, self._flush_interval,
-        self._index_name, _document_mapping, self._doc_type)
+        self._index_name, _document_mapping, self._doc_type,
+        bulk_size=self._bulk_size, number_of_threads=self._number_of_threads)
 
     user = None
     if self._username:
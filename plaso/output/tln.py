@@ -30,8 +30,8 @@ class TLNBaseOutputModule(interface.LinearOutputModule):
     Returns:
       str: formatted description field.
     """
-    date_time_string = timelib.Timestamp.CopyToIsoFormat(
-        event.timestamp, timezone=self._output_mediator.timezone)
+    date_time_string = self._output_mediator.CopyTimestampToIsoFormat(
+        event.timestamp)
     timestamp_description = getattr(event, u'timestamp_desc', u'UNKNOWN')
 
     message, _ = self._output_mediator.GetFormattedMessages(event)
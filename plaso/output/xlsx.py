@@ -11,7 +11,6 @@ except ImportError:
   xlsxwriter = None
 
 from plaso.lib import py2to3
-from plaso.lib import timelib
 from plaso.output import dynamic
 from plaso.output import interface
 from plaso.output import manager
@@ -67,9 +66,8 @@ class XLSXOutputModule(interface.OutputModule):
       or a string containing 'ERROR' on OverflowError.
     """
     try:
-      timestamp = timelib.Timestamp.CopyToDatetime(
-          event_object.timestamp, self._output_mediator.timezone,
-          raise_error=True)
+      timestamp = self._output_mediator.CopyTimestampToDatetime(
+          event_object.timestamp, raise_error=True)
 
       return timestamp.replace(tzinfo=None)
 
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""Storage event predicate objects."""
+
+
+class EventPredicate(object):
+  """A class that defines an event predicate.
+
+  The event predicate defines conditions on the values of event attributes,
+  such as the data type and the parser, that an event must meet to be able
+  to match an event filter. The storage uses the event predicate to skip
+  the events of which the attribute values are known to not meet the
+  conditions, without having to read and deserialize them.
+
+  An event meets a condition if the value of the attribute equals one of
+  the values or contains one of the substrings of the condition. The
+  substrings are compared case insensitive.
+  """
+
+  def __init__(self):
+    """Initializes an event predicate."""
+    super(EventPredicate, self).__init__()
+    self._conditions = {}
+
+  @property
+  def attribute_names(self):
+    """list[str]: names of the attributes that have a condition."""
+    return sorted(self._conditions.keys())
+
+  def AddCondition(self, attribute_name, values=None, substrings=None):
+    """Adds a condition on the value of an attribute.
+
+    Only one condition per attribute is supported, a condition on an attribute
+    that already has a condition is ignored.
+
+    Args:
+      attribute_name (str): name of the attribute.
+      values (Optional[iterable[str]]): values the attribute value can equal.
+      substrings (Optional[iterable[str]]): substrings the attribute value
+          can contain.
+    """
+    if attribute_name in self._conditions:
+      return
+
+    values = frozenset(values or [])
+    substrings = frozenset([
+        substring.lower() for substring in substrings or []])
+
+    self._conditions[attribute_name] = (values, substrings)
+
+  def MatchesAttributeValues(self, attribute_values):
+    """Determines if the attribute values of a set of events can match.
+
+    Args:
+      attribute_values (dict[str, set[str]]): attribute values of a set of
+          events per attribute name. An attribute name that is not present
+          or has a value of None indicates that the values of the attribute
+          are not known.
+
+    Returns:
+      bool: False if none of the events can meet all the conditions,
+          True otherwise.
+    """
+    for attribute_name, condition in iter(self._conditions.items()):
+      values = attribute_values.get(attribute_name, None)
+      if values is None:
+        continue
+
+      condition_values, condition_substrings = condition
+      if not condition_values.isdisjoint(values):
+        continue
+
+      if not condition_substrings:
+        return False
+
+      lower_values = [value.lower() for value in values]
+      if not any(
+          substring in value
+          for substring in condition_substrings for value in lower_values):
+        return False
+
+    return True
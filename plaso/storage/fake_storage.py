@@ -129,12 +129,14 @@ class FakeStorageWriter(interface.StorageWriter):
 
     self._is_open = False
 
-  def GetEvents(self, time_range=None):
+  def GetEvents(self, time_range=None, event_predicate=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip events that cannot match.
 
     Yields:
       EventObject: event.
@@ -156,12 +156,14 @@ class GZIPStorageFile(interface.BaseFileStorage):
 
   # TODO: time_range is currently not operational, nor that events are
   # returned in chronological order. Fix this.
-  def GetEvents(self, time_range=None):
+  def GetEvents(self, time_range=None, event_predicate=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip events that cannot match.
 
     Returns:
       generator(EventObject): event generator.
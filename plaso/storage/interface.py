@@ -63,12 +63,14 @@ class BaseStorage(object):
     """
 
   @abc.abstractmethod
-  def GetEvents(self, time_range=None):
+  def GetEvents(self, time_range=None, event_predicate=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip events that cannot match.
 
     Yields:
       EventObject: event.
@@ -288,12 +290,14 @@ class StorageReader(object):
     """
 
   @abc.abstractmethod
-  def GetEvents(self, time_range=None):
+  def GetEvents(self, time_range=None, event_predicate=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip events that cannot match.
 
     Yields:
       EventObject: event.
@@ -364,17 +368,20 @@ class FileStorageReader(StorageReader):
     """
     return self._storage_file.GetErrors()
 
-  def GetEvents(self, time_range=None):
+  def GetEvents(self, time_range=None, event_predicate=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip events that cannot match.
 
     Returns:
       generator(EventObject): event generator.
     """
-    return self._storage_file.GetEvents(time_range=time_range)
+    return self._storage_file.GetEvents(
+        time_range=time_range, event_predicate=event_predicate)
 
   def GetEventSources(self):
     """Retrieves the event sources.
@@ -493,13 +500,38 @@ class StorageWriter(object):
     """
     raise NotImplementedError()
 
+  def GetAnalysisHighWaterMarks(self):
+    """Retrieves the analysis high-water marks of previous sessions.
+
+    Returns:
+      dict[str, list[int]]: number of events per event stream that were
+          analyzed per analysis plugin.
+
+    Raises:
+      NotImplementedError: since there is no implementation.
+    """
+    raise NotImplementedError()
+
+  def GetAnalysisReports(self):
+    """Retrieves the analysis reports.
+
+    Returns:
+      generator(AnalysisReport): analysis report generator.
+
+    Raises:
+      NotImplementedError: since there is no implementation.
+    """
+    raise NotImplementedError()
+
   @abc.abstractmethod
-  def GetEvents(self, time_range=None):
+  def GetEvents(self, time_range=None, event_predicate=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip events that cannot match.
 
     Yields:
       EventObject: event.
@@ -524,6 +556,29 @@ class StorageWriter(object):
       EventSource: event source or None if there are no newly written ones.
     """
 
+  def GetNumberOfEventsPerParser(self):
+    """Retrieves the number of events written per parser.
+
+    Returns:
+      dict[str, int]: number of events per parser or parser plugin, where
+          "total" contains the number of events of all parsers.
+    """
+    return dict(self._session.parsers_counter)
+
+  def GetTaskStorageData(self, unused_task_name):
+    """Retrieves the data of a task storage.
+
+    Args:
+      task_name (str): unique name of the task.
+
+    Returns:
+      bytes: task storage data.
+
+    Raises:
+      NotImplementedError: since there is no implementation.
+    """
+    raise NotImplementedError()
+
   def MergeFromStorage(self, storage_reader):
     """Merges data from a storage reader into the writer.
 
@@ -561,6 +616,19 @@ class StorageWriter(object):
     """
     raise NotImplementedError()
 
+  def PrepareMergeTaskStorageData(
+      self, unused_task_name, unused_task_storage_data):
+    """Prepares task storage data, received from another host, for merging.
+
+    Args:
+      task_name (str): unique name of the task.
+      task_storage_data (bytes): task storage data.
+
+    Raises:
+      NotImplementedError: since there is no implementation.
+    """
+    raise NotImplementedError()
+
   @abc.abstractmethod
   def ReadPreprocessingInformation(self, knowledge_base):
     """Reads preprocessing information.
@@ -574,6 +642,20 @@ class StorageWriter(object):
           information.
     """
 
+  def SetAnalysisHighWaterMarks(self, plugin_name, high_water_marks):
+    """Sets the analysis high-water marks of an analysis plugin.
+
+    The high-water marks are written with the session completion information.
+
+    Args:
+      plugin_name (str): name of the analysis plugin.
+      high_water_marks (list[int]): number of events per event stream that
+          were analyzed by the plugin, where the first number is that of
+          the first event stream. An empty list indicates that the events
+          analyzed by the plugin are not known.
+    """
+    self._session.analysis_high_water_marks[plugin_name] = high_water_marks
+
   @abc.abstractmethod
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
@@ -20,6 +20,8 @@ There are multiple types of streams:
 * event_source_index.#
   The event source index streams contain the stream offset to the serialized
   event source objects.
+* event_summary.#
+  The event summary streams contain a summary of the serialized events.
 * event_tag_data.#
   The event tag data streams contain the serialized event tag objects.
 * event_tag_index.#
@@ -85,6 +87,28 @@ An event data stream consists of an array of 64-bit integers:
 | timestamp | timestamp | ... |
 +-----------+-----------+-...-+
 
++ The event summary stream
+
+The event summary streams contain a summary of the serialized events
+stored in the corresponding event data stream, which consists of the first
+and last timestamp and the data types and parsers of the events. The summary
+is used to skip event data streams that do not contain events of interest,
+without having to read and deserialize the events.
+
+An event summary stream consists of a JSON dictionary:
+{
+  "attribute_values": {
+    "data_type": [...],
+    "parser": [...]
+  },
+  "first_timestamp": ...,
+  "last_timestamp": ...
+}
+
+Where an attribute value of null indicates that the values of the attribute
+are not known. The event summary streams were introduced after version
+20160715 and are optional.
+
 + The event tag index stream
 
 The event tag index streams contain information about the event
@@ -125,8 +149,10 @@ Deprecated in version 20160511:
   events.
 """
 
+import bisect
 import heapq
 import io
+import json
 import logging
 import os
 import shutil
@@ -144,6 +170,7 @@ import construct
 
 from plaso.containers import sessions
 from plaso.lib import definitions
+from plaso.lib import py2to3
 from plaso.serializer import json_serializer
 from plaso.storage import interface
 from plaso.storage import gzip_file
@@ -308,6 +335,107 @@ class _SerializedEventsHeap(object):
     self.data_size += len(event_data)
 
 
+class _EventStreamSummary(object):
+  """Class that defines an event stream summary.
+
+  Attributes:
+    attribute_values (dict[str, set[str]]): values of the event attributes
+        per attribute name, where None indicates that the values of
+        the attribute are not known.
+    first_timestamp (int): timestamp of the first event in the stream or None.
+    last_timestamp (int): timestamp of the last event in the stream or None.
+  """
+
+  _ATTRIBUTE_NAMES = frozenset([u'data_type', u'parser'])
+
+  def __init__(self):
+    """Initializes an event stream summary."""
+    super(_EventStreamSummary, self).__init__()
+    self.attribute_values = {
+        attribute_name: set() for attribute_name in self._ATTRIBUTE_NAMES}
+    self.first_timestamp = None
+    self.last_timestamp = None
+
+  def AddEvent(self, event):
+    """Adds the attribute values of an event to the summary.
+
+    Args:
+      event (EventObject): event.
+    """
+    for attribute_name in self._ATTRIBUTE_NAMES:
+      values = self.attribute_values.get(attribute_name, None)
+      if values is None:
+        continue
+
+      value = getattr(event, attribute_name, None)
+      if value is None:
+        continue
+
+      if isinstance(value, py2to3.STRING_TYPES):
+        values.add(value)
+      else:
+        self.attribute_values[attribute_name] = None
+
+  def AddTimestamp(self, timestamp):
+    """Adds the timestamp of an event to the summary.
+
+    Args:
+      timestamp (int): event timestamp, which contains the number of
+          micro seconds since January 1, 1970, 00:00:00 UTC.
+    """
+    if self.first_timestamp is None or timestamp < self.first_timestamp:
+      self.first_timestamp = timestamp
+
+    if self.last_timestamp is None or timestamp > self.last_timestamp:
+      self.last_timestamp = timestamp
+
+  def CopyFromStreamData(self, stream_data):
+    """Copies the summary from event summary stream data.
+
+    Args:
+      stream_data (bytes): event summary stream data.
+
+    Raises:
+      IOError: if the event summary stream data cannot be read.
+    """
+    try:
+      json_dict = json.loads(stream_data.decode(u'utf-8'))
+    except (UnicodeDecodeError, ValueError) as exception:
+      raise IOError(
+          u'Unable to read event summary with error: {0!s}'.format(exception))
+
+    attribute_values = json_dict.get(u'attribute_values', None) or {}
+
+    self.attribute_values = {}
+    for attribute_name, values in iter(attribute_values.items()):
+      if values is not None:
+        values = set(values)
+      self.attribute_values[attribute_name] = values
+
+    self.first_timestamp = json_dict.get(u'first_timestamp', None)
+    self.last_timestamp = json_dict.get(u'last_timestamp', None)
+
+  def CopyToStreamData(self):
+    """Copies the summary to event summary stream data.
+
+    Returns:
+      bytes: event summary stream data.
+    """
+    attribute_values = {}
+    for attribute_name, values in iter(self.attribute_values.items()):
+      if values is not None:
+        values = sorted(values)
+      attribute_values[attribute_name] = values
+
+    json_dict = {
+        u'attribute_values': attribute_values,
+        u'first_timestamp': self.first_timestamp,
+        u'last_timestamp': self.last_timestamp}
+
+    json_string = json.dumps(json_dict, sort_keys=True)
+    return json_string.encode(u'utf-8')
+
+
 class _EventTagIndexValue(object):
   """Class that defines the event tag index value.
 
@@ -699,6 +827,21 @@ class _SerializedDataTimestampTable(object):
     """
     return self._timestamps[entry_index]
 
+  def GetEntryIndex(self, timestamp):
+    """Retrieves the index of the first entry that is not before a timestamp.
+
+    The timestamps in the table are stored in ascending order.
+
+    Args:
+      timestamp (int): event timestamp, which contains the number of
+          micro seconds since January 1, 1970, 00:00:00 UTC.
+
+    Returns:
+      int: table entry index, which equals the number of timestamps if all
+          timestamps are before the timestamp.
+    """
+    return bisect.bisect_left(self._timestamps, timestamp)
+
   def Read(self):
     """Reads the serialized data timestamp table.
 
@@ -998,6 +1141,8 @@ class ZIPStorageFile(interface.BaseFileStorage):
     self._event_offset_tables = {}
     self._event_offset_tables_lfu = []
     self._event_stream_number = 1
+    self._event_stream_summaries = {}
+    self._event_stream_summary = _EventStreamSummary()
     self._event_streams = {}
     self._event_source_offset_tables = {}
     self._event_source_offset_tables_lfu = []
@@ -1196,6 +1341,34 @@ class ZIPStorageFile(interface.BaseFileStorage):
 
     return event_source_data, event_source_entry_index
 
+  def _GetEventStreamSummary(self, stream_number):
+    """Retrieves the summary of a specific event stream.
+
+    Args:
+      stream_number (int): number of the serialized event object stream.
+
+    Returns:
+      _EventStreamSummary: event stream summary or None if not available.
+    """
+    if stream_number in self._event_stream_summaries:
+      return self._event_stream_summaries[stream_number]
+
+    event_stream_summary = None
+
+    stream_name = u'event_summary.{0:06d}'.format(stream_number)
+    if self._HasStream(stream_name):
+      event_stream_summary = _EventStreamSummary()
+      try:
+        event_stream_summary.CopyFromStreamData(self._ReadStream(stream_name))
+      except IOError as exception:
+        logging.error((
+            u'Unable to read event summary from stream: {0:s} '
+            u'with error: {1!s}.').format(stream_name, exception))
+        event_stream_summary = None
+
+    self._event_stream_summaries[stream_number] = event_stream_summary
+    return event_stream_summary
+
   def _GetEventTagIndexValue(self, store_number, entry_index, uuid):
     """Retrieves an event tag index value.
 
@@ -1248,7 +1421,7 @@ class ZIPStorageFile(interface.BaseFileStorage):
 
     return last_stream_number + 1
 
-  def _InitializeMergeBuffer(self, time_range=None):
+  def _InitializeMergeBuffer(self, time_range=None, event_predicate=None):
     """Initializes the events into the merge buffer.
 
     This function fills the merge buffer with the first relevant event
@@ -1257,15 +1430,23 @@ class ZIPStorageFile(interface.BaseFileStorage):
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip streams that contain no events that can match.
     """
     self._event_heap = _EventsHeap()
 
     number_range = self._GetSerializedEventStreamNumbers()
     for stream_number in number_range:
+      if not self._IsEventStreamOfInterest(
+          stream_number, time_range=time_range,
+          event_predicate=event_predicate):
+        continue
+
       entry_index = -1
       if time_range:
         stream_name = u'event_timestamps.{0:06d}'.format(stream_number)
         if self._HasStream(stream_name):
+          timestamp_table = None
           try:
             timestamp_table = self._GetSerializedEventTimestampTable(
                 stream_number)
@@ -1274,17 +1455,16 @@ class ZIPStorageFile(interface.BaseFileStorage):
                 u'Unable to read timestamp table from stream: {0:s} '
                 u'with error: {1:s}.').format(stream_name, exception))
 
-          # If the start timestamp of the time range filter is larger than the
-          # last timestamp in the timestamp table skip this stream.
-          timestamp_compare = timestamp_table.GetTimestamp(-1)
-          if time_range.start_timestamp > timestamp_compare:
-            continue
+          if timestamp_table and timestamp_table.number_of_timestamps:
+            # If the start timestamp of the time range filter is larger than
+            # the last timestamp in the timestamp table skip this stream.
+            timestamp_compare = timestamp_table.GetTimestamp(-1)
+            if time_range.start_timestamp > timestamp_compare:
+              continue
 
-          for table_index in range(timestamp_table.number_of_timestamps - 1):
-            timestamp_compare = timestamp_table.GetTimestamp(table_index)
-            if time_range.start_timestamp >= timestamp_compare:
-              entry_index = table_index
-              break
+            # Seek the first event that is not before the start timestamp.
+            entry_index = timestamp_table.GetEntryIndex(
+                time_range.start_timestamp)
 
       event = self._GetEvent(stream_number, entry_index=entry_index)
       # Check the lower bound in case no timestamp table was available.
@@ -1524,18 +1704,21 @@ class ZIPStorageFile(interface.BaseFileStorage):
       for stream_name in self._zipfile.namelist():
         yield stream_name
 
-  def _GetSortedEvent(self, time_range=None):
+  def _GetSortedEvent(self, time_range=None, event_predicate=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip streams that contain no events that can match.
 
     Returns:
       EventObject: event.
     """
     if not self._event_heap:
-      self._InitializeMergeBuffer(time_range=time_range)
+      self._InitializeMergeBuffer(
+          time_range=time_range, event_predicate=event_predicate)
       if not self._event_heap:
         return
 
@@ -1583,6 +1766,43 @@ class ZIPStorageFile(interface.BaseFileStorage):
     file_object.close()
     return True
 
+  def _IsEventStreamOfInterest(
+      self, stream_number, time_range=None, event_predicate=None):
+    """Determines if an event stream can contain events of interest.
+
+    Args:
+      stream_number (int): number of the serialized event object stream.
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip streams that contain no events that can match.
+
+    Returns:
+      bool: False if the event summary of the stream indicates that none of
+          the events are of interest, True otherwise.
+    """
+    if not time_range and not event_predicate:
+      return True
+
+    event_stream_summary = self._GetEventStreamSummary(stream_number)
+    if not event_stream_summary:
+      return True
+
+    if time_range:
+      if (event_stream_summary.last_timestamp is not None and
+          event_stream_summary.last_timestamp < time_range.start_timestamp):
+        return False
+
+      if (event_stream_summary.first_timestamp is not None and
+          event_stream_summary.first_timestamp > time_range.end_timestamp):
+        return False
+
+    if event_predicate and not event_predicate.MatchesAttributeValues(
+        event_stream_summary.attribute_values):
+      return False
+
+    return True
+
   def _OpenRead(self):
     """Opens the storage file for reading."""
     has_storage_metadata = self._ReadStorageMetadata()
@@ -1910,17 +2130,23 @@ class ZIPStorageFile(interface.BaseFileStorage):
       return
 
     self._WriteSerializedEventsHeap(
-        self._serialized_events_heap, self._event_stream_number)
+        self._serialized_events_heap, self._event_stream_number,
+        event_stream_summary=self._event_stream_summary)
 
     self._event_stream_number += 1
+    self._event_stream_summary = _EventStreamSummary()
     self._serialized_events_heap.Empty()
 
-  def _WriteSerializedEventsHeap(self, serialized_events_heap, stream_number):
+  def _WriteSerializedEventsHeap(
+      self, serialized_events_heap, stream_number, event_stream_summary=None):
     """Writes the contents of an serialized events heap.
 
     Args:
       serialized_events_heap(_SerializedEventsHeap): serialized events heap.
       stream_number(int): stream number.
+      event_stream_summary(Optional[_EventStreamSummary]): summary of
+          the events on the heap, where None indicates that no event summary
+          stream should be written.
     """
     stream_name = u'event_index.{0:06d}'.format(stream_number)
     offset_table = _SerializedDataOffsetTable(self._zipfile, stream_name)
@@ -1944,6 +2170,9 @@ class ZIPStorageFile(interface.BaseFileStorage):
         timestamp_table.AddTimestamp(timestamp)
         offset_table.AddOffset(entry_data_offset)
 
+        if event_stream_summary:
+          event_stream_summary.AddTimestamp(timestamp)
+
         entry_data_offset = data_stream.WriteEntry(entry_data)
 
     except:
@@ -1958,6 +2187,10 @@ class ZIPStorageFile(interface.BaseFileStorage):
     data_stream.WriteFinalize()
     timestamp_table.Write()
 
+    if event_stream_summary:
+      stream_name = u'event_summary.{0:06d}'.format(stream_number)
+      self._WriteStream(stream_name, event_stream_summary.CopyToStreamData())
+
     if self._serializers_profiler:
       self._serializers_profiler.StopTiming(u'write')
 
@@ -2233,6 +2466,7 @@ class ZIPStorageFile(interface.BaseFileStorage):
     event_data = self._SerializeAttributeContainer(event)
 
     self._serialized_events_heap.PushEvent(event.timestamp, event_data)
+    self._event_stream_summary.AddEvent(event)
 
     if self._serialized_events_heap.data_size > self._maximum_buffer_size:
       self._WriteSerializedEvents()
@@ -2378,6 +2612,7 @@ class ZIPStorageFile(interface.BaseFileStorage):
 
     self._event_offset_tables = {}
     self._event_offset_tables_lfu = []
+    self._event_stream_summaries = {}
     self._event_streams = {}
 
     self._event_source_offset_tables = []
@@ -2470,20 +2705,25 @@ class ZIPStorageFile(interface.BaseFileStorage):
           data_stream, u'error'):
         yield error
 
-  def GetEvents(self, time_range=None):
+  def GetEvents(self, time_range=None, event_predicate=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip streams that contain no events that can match. Note that
+          the events that are returned are not guaranteed to match.
 
     Yields:
       EventObject: event.
     """
-    event = self._GetSortedEvent(time_range=time_range)
+    event = self._GetSortedEvent(
+        time_range=time_range, event_predicate=event_predicate)
     while event:
       yield event
-      event = self._GetSortedEvent(time_range=time_range)
+      event = self._GetSortedEvent(
+          time_range=time_range, event_predicate=event_predicate)
 
   def GetEventSourceByIndex(self, index):
     """Retrieves a specific event source.
@@ -3029,12 +3269,50 @@ class ZIPStorageFileWriter(interface.StorageWriter):
         self._session, storage_file_path, buffer_size=self._buffer_size,
         storage_type=definitions.STORAGE_TYPE_TASK, task=task)
 
-  def GetEvents(self, time_range=None):
+  def GetAnalysisHighWaterMarks(self):
+    """Retrieves the analysis high-water marks of previous sessions.
+
+    The high-water marks of an analysis plugin are those of the last session
+    that ran the plugin.
+
+    Returns:
+      dict[str, list[int]]: number of events per event stream that were
+          analyzed per analysis plugin.
+
+    Raises:
+      IOError: when the storage writer is closed.
+    """
+    if not self._storage_file:
+      raise IOError(u'Unable to read from closed storage writer.')
+
+    analysis_high_water_marks = {}
+    for session in self._storage_file.GetSessions():
+      analysis_high_water_marks.update(session.analysis_high_water_marks)
+
+    return analysis_high_water_marks
+
+  def GetAnalysisReports(self):
+    """Retrieves the analysis reports.
+
+    Returns:
+      generator(AnalysisReport): analysis report generator.
+
+    Raises:
+      IOError: when the storage writer is closed.
+    """
+    if not self._storage_file:
+      raise IOError(u'Unable to read from closed storage writer.')
+
+    return self._storage_file.GetAnalysisReports()
+
+  def GetEvents(self, time_range=None, event_predicate=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      event_predicate (Optional[EventPredicate]): event predicate used to
+          skip events that cannot match.
 
     Returns:
       generator(EventObject): event generator.
@@ -3045,7 +3323,8 @@ class ZIPStorageFileWriter(interface.StorageWriter):
     if not self._storage_file:
       raise IOError(u'Unable to read from closed storage writer.')
 
-    return self._storage_file.GetEvents(time_range=time_range)
+    return self._storage_file.GetEvents(
+        time_range=time_range, event_predicate=event_predicate)
 
   def GetFirstWrittenEventSource(self):
     """Retrieves the first event source that was written after open.
@@ -3088,6 +3367,38 @@ class ZIPStorageFileWriter(interface.StorageWriter):
       self._written_event_source_index += 1
     return event_source
 
+  def GetTaskStorageData(self, task_name):
+    """Retrieves the data of a task storage.
+
+    The task storage is removed after its data has been read, since the data
+    is expected to be merged by the session storage of another host.
+
+    Args:
+      task_name (str): unique name of the task.
+
+    Returns:
+      bytes: task storage data.
+
+    Raises:
+      IOError: if the storage type is not supported or
+               if the temporary path for the task storage does not exist.
+    """
+    if self._storage_type != definitions.STORAGE_TYPE_SESSION:
+      raise IOError(u'Unsupported storage type.')
+
+    if not self._task_storage_path:
+      raise IOError(u'Missing task storage path.')
+
+    storage_file_path = os.path.join(
+        self._task_storage_path, u'{0:s}.plaso'.format(task_name))
+
+    with open(storage_file_path, 'rb') as file_object:
+      task_storage_data = file_object.read()
+
+    os.remove(storage_file_path)
+
+    return task_storage_data
+
   def MergeTaskStorage(self, task_name):
     """Merges a task storage with the session storage.
 
@@ -3179,6 +3490,35 @@ class ZIPStorageFileWriter(interface.StorageWriter):
 
     os.rename(storage_file_path, merge_storage_file_path)
 
+  def PrepareMergeTaskStorageData(self, task_name, task_storage_data):
+    """Prepares task storage data, received from another host, for merging.
+
+    The data is written to the temporary path for the task storage first
+    and then moved to the merge path, so that a partially written task storage
+    is never considered ready for merge.
+
+    Args:
+      task_name (str): unique name of the task.
+      task_storage_data (bytes): task storage data.
+
+    Raises:
+      IOError: if the storage type is not supported or
+               if the temporary path for the task storage does not exist.
+    """
+    if self._storage_type != definitions.STORAGE_TYPE_SESSION:
+      raise IOError(u'Unsupported storage type.')
+
+    if not self._task_storage_path:
+      raise IOError(u'Missing task storage path.')
+
+    storage_file_path = os.path.join(
+        self._task_storage_path, u'{0:s}.plaso'.format(task_name))
+
+    with open(storage_file_path, 'wb') as file_object:
+      file_object.write(task_storage_data)
+
+    self.PrepareMergeTaskStorage(task_name)
+
   def ReadPreprocessingInformation(self, knowledge_base):
     """Reads preprocessing information.
 
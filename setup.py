@@ -40,6 +40,7 @@ def GetScripts():
   script_filenames = frozenset([
       'image_export.py',
       'log2timeline.py',
+      'log2timeline_worker.py',
       'pinfo.py',
       'preg.py',
       'psort.py'])
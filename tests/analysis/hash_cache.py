@@ -0,0 +1,100 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the hash labels cache."""
+
+import os
+import pickle
+import time
+import unittest
+
+import mock
+
+from plaso.analysis import hash_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class HashLabelsCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the hash labels cache."""
+
+  # pylint: disable=protected-access
+
+  _TEST_HASH = (
+      u'2D79FCC6B02A2E183A0CB30E0E25D103F42BADDA9FBF86BBEE06F93AA3855AFF')
+
+  def testGetAndSetLabels(self):
+    """Tests the GetLabels and SetLabels functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, u'hash_cache.db')
+
+      cache = hash_cache.HashLabelsCache(path)
+      labels = cache.GetLabels(u'virustotal', self._TEST_HASH)
+      self.assertIsNone(labels)
+
+      cache.SetLabels(
+          u'virustotal', self._TEST_HASH, [u'virustotal_detections_10'])
+      labels = cache.GetLabels(u'virustotal', self._TEST_HASH.lower())
+      self.assertEqual(labels, [u'virustotal_detections_10'])
+
+      # The labels are cached per analysis plugin.
+      labels = cache.GetLabels(u'nsrlsvr', self._TEST_HASH)
+      self.assertIsNone(labels)
+
+      self.assertEqual(cache.number_of_hits, 1)
+      self.assertEqual(cache.number_of_misses, 2)
+      cache.Close()
+
+      # The cached labels are shared between cache objects.
+      cache = hash_cache.HashLabelsCache(path)
+      labels = cache.GetLabels(u'virustotal', self._TEST_HASH)
+      self.assertEqual(labels, [u'virustotal_detections_10'])
+      cache.Close()
+
+  def testTimeToLive(self):
+    """Tests the expiration of cached labels."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, u'hash_cache.db')
+
+      cache = hash_cache.HashLabelsCache(path, time_to_live=3600)
+
+      expired_time = time.time() - 7200
+      with mock.patch(u'time.time', return_value=expired_time):
+        cache.SetLabels(u'nsrlsvr', self._TEST_HASH, [u'nsrl_present'])
+      cache.SetLabels(u'nsrlsvr', u'd41d8cd98f00b204', [u'nsrl_not_present'])
+
+      labels = cache.GetLabels(u'nsrlsvr', self._TEST_HASH)
+      self.assertIsNone(labels)
+
+      labels = cache.GetLabels(u'nsrlsvr', u'd41d8cd98f00b204')
+      self.assertEqual(labels, [u'nsrl_not_present'])
+
+      number_of_deleted_entries = cache.DeleteExpired()
+      self.assertEqual(number_of_deleted_entries, 1)
+      cache.Close()
+
+  def testPickle(self):
+    """Tests pickling an opened cache."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, u'hash_cache.db')
+
+      cache = hash_cache.HashLabelsCache(path, time_to_live=60)
+      cache.SetLabels(u'viper', self._TEST_HASH, [u'viper_not_present'])
+      cache.Close()
+
+      cache.GetLabels(u'viper', self._TEST_HASH)
+      self.assertIsNotNone(cache._connection)
+
+      unpickled_cache = pickle.loads(pickle.dumps(cache))
+      self.assertIsNone(unpickled_cache._connection)
+      self.assertEqual(unpickled_cache.path, path)
+      self.assertEqual(unpickled_cache.time_to_live, 60)
+
+      labels = unpickled_cache.GetLabels(u'viper', self._TEST_HASH)
+      self.assertEqual(labels, [u'viper_not_present'])
+
+      unpickled_cache.Close()
+      cache.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,126 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the hash set file."""
+
+import hashlib
+import os
+import unittest
+
+from plaso.analysis import hash_set
+
+from tests import test_lib as shared_test_lib
+
+
+class HashSetFileTest(shared_test_lib.BaseTestCase):
+  """Tests for the hash set file and writer."""
+
+  def _CreateTestHashSetFile(
+      self, path, number_of_hashes, bloom_filter_bits_per_digest=0):
+    """Creates a hash set file with MD5 hashes.
+
+    Args:
+      path (str): path of the hash set file.
+      number_of_hashes (int): number of hashes.
+      bloom_filter_bits_per_digest (Optional[int]): number of bits of the Bloom
+          filter per digest, where 0 represents no Bloom filter.
+
+    Returns:
+      list[str]: hashes in the hash set file.
+    """
+    hashes = [
+        hashlib.md5(u'file{0:d}'.format(index)).hexdigest()
+        for index in range(number_of_hashes)]
+
+    writer = hash_set.HashSetFileWriter(
+        16, bloom_filter_bits_per_digest=bloom_filter_bits_per_digest)
+    for hash_value in hashes:
+      self.assertTrue(writer.AddHash(hash_value))
+
+    # Duplicate and invalid hashes.
+    if hashes:
+      self.assertTrue(writer.AddHash(hashes[0].upper()))
+    self.assertFalse(writer.AddHash(u'd41d8cd9'))
+    self.assertFalse(writer.AddHash(u'x' * 32))
+
+    number_of_digests = writer.Write(path)
+    self.assertEqual(number_of_digests, number_of_hashes)
+
+    return hashes
+
+  def testContains(self):
+    """Tests the Contains function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, u'hash_set.db')
+      hashes = self._CreateTestHashSetFile(path, 2000)
+
+      with hash_set.HashSetFile() as hash_set_file:
+        hash_set_file.Open(path)
+        self.assertEqual(hash_set_file.bloom_filter_size, 0)
+        self.assertEqual(hash_set_file.digest_size, 16)
+        self.assertEqual(hash_set_file.number_of_digests, 2000)
+
+        for hash_value in hashes:
+          self.assertTrue(hash_set_file.Contains(hash_value))
+
+        self.assertTrue(hash_set_file.Contains(hashes[10].upper()))
+
+        for index in range(2000, 2100):
+          hash_value = hashlib.md5(u'file{0:d}'.format(index)).hexdigest()
+          self.assertFalse(hash_set_file.Contains(hash_value))
+
+        self.assertFalse(hash_set_file.Contains(u'00' * 16))
+        self.assertFalse(hash_set_file.Contains(u'ff' * 16))
+        self.assertFalse(hash_set_file.Contains(hashlib.sha1().hexdigest()))
+        self.assertFalse(hash_set_file.Contains(u'z' * 32))
+
+      with self.assertRaises(IOError):
+        hash_set_file.Contains(hashes[0])
+
+  def testContainsWithBloomFilter(self):
+    """Tests the Contains function with a Bloom filter."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, u'hash_set.db')
+      hashes = self._CreateTestHashSetFile(
+          path, 2000, bloom_filter_bits_per_digest=10)
+
+      with hash_set.HashSetFile() as hash_set_file:
+        hash_set_file.Open(path)
+        self.assertEqual(hash_set_file.bloom_filter_size, 2500)
+        self.assertEqual(hash_set_file.number_of_bloom_filter_hashes, 7)
+
+        for hash_value in hashes:
+          self.assertTrue(hash_set_file.Contains(hash_value))
+
+        for index in range(2000, 2100):
+          hash_value = hashlib.md5(u'file{0:d}'.format(index)).hexdigest()
+          self.assertFalse(hash_set_file.Contains(hash_value))
+
+  def testOpen(self):
+    """Tests the Open function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, u'hash_set.db')
+      self._CreateTestHashSetFile(path, 0)
+
+      with hash_set.HashSetFile() as hash_set_file:
+        hash_set_file.Open(path)
+        self.assertEqual(hash_set_file.number_of_digests, 0)
+        self.assertFalse(hash_set_file.Contains(u'00' * 16))
+
+        with self.assertRaises(IOError):
+          hash_set_file.Open(path)
+
+      path = os.path.join(temp_directory, u'invalid.db')
+      with open(path, u'wb') as file_object:
+        file_object.write(b'\x00' * 4096)
+
+      hash_set_file = hash_set.HashSetFile()
+      with self.assertRaises(IOError):
+        hash_set_file.Open(path)
+
+    test_file = self._GetTestFilePath([u'empty_file'])
+    with self.assertRaises(IOError):
+      hash_set_file.Open(test_file)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,156 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the NSRL hash set analysis plugin."""
+
+import os
+import unittest
+
+from dfvfs.path import fake_path_spec
+
+from plaso.analysis import hash_set
+from plaso.analysis import nsrl
+from plaso.lib import eventdata
+from plaso.lib import timelib
+
+from tests import test_lib as shared_test_lib
+from tests.analysis import test_lib
+
+
+class NSRLTest(test_lib.AnalysisPluginTestCase):
+  """Tests for the NSRL hash set analysis plugin."""
+
+  _EVENT_1_HASH = u'3a0cb30e0e25d103f42badda9fbf86bb'
+
+  _EVENT_2_HASH = u'aaaaaaaaaaaaaaaaaaaaaaaaaaaaaaaa'
+
+  _TEST_EVENTS = [
+      {u'timestamp': timelib.Timestamp.CopyFromString(u'2015-01-01 17:00:00'),
+       u'timestamp_desc': eventdata.EventTimestamp.CREATION_TIME,
+       u'md5_hash': _EVENT_1_HASH,
+       u'sha256_hash': (
+           u'2d79fcc6b02a2e183a0cb30e0e25d103f42badda9fbf86bbee06f93aa3855aff'),
+       u'uuid': u'8',
+       u'data_type': u'fs:stat',
+       u'pathspec': fake_path_spec.FakePathSpec(
+           location=u'C:\\WINDOWS\\system32\\good.exe')
+      },
+      {u'timestamp': timelib.Timestamp.CopyFromString(u'2016-01-01 17:00:00'),
+       u'timestamp_desc': eventdata.EventTimestamp.CREATION_TIME,
+       u'md5_hash': _EVENT_2_HASH,
+       u'uuid': u'9',
+       u'data_type': u'fs:stat:ntfs',
+       u'pathspec': fake_path_spec.FakePathSpec(
+           location=u'C:\\WINDOWS\\system32\\evil.exe')}]
+
+  def testExamineEventAndCompileReport(self):
+    """Tests the ExamineEvent and CompileReport functions."""
+    events = []
+    for event_dictionary in self._TEST_EVENTS:
+      event = self._CreateTestEventObject(event_dictionary)
+      events.append(event)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, u'nsrl.db')
+
+      writer = hash_set.HashSetFileWriter(16, bloom_filter_bits_per_digest=10)
+      writer.AddHash(self._EVENT_1_HASH)
+      writer.AddHash(u'd41d8cd98f00b204e9800998ecf8427e')
+      writer.Write(path)
+
+      plugin = nsrl.NSRLAnalysisPlugin()
+      plugin.SetHashSetPath(path)
+      self.assertEqual(plugin.REQUIRED_HASH_ATTRIBUTES, [u'md5_hash'])
+
+      storage_writer = self._AnalyzeEvents(events, plugin)
+
+    self.assertEqual(len(storage_writer.analysis_reports), 1)
+
+    analysis_report = storage_writer.analysis_reports[0]
+
+    tags = analysis_report.GetTags()
+    self.assertEqual(len(tags), 2)
+
+    tag = tags[0]
+    self.assertEqual(tag.event_uuid, u'8')
+
+    expected_labels = [u'nsrl_present']
+    self.assertEqual(tag.labels, expected_labels)
+
+    tag = tags[1]
+    self.assertEqual(tag.event_uuid, u'9')
+
+    expected_labels = [u'nsrl_not_present']
+    self.assertEqual(tag.labels, expected_labels)
+
+  def testExamineEventWithStoreIdentifiers(self):
+    """Tests the ExamineEvent function with events read from storage."""
+    path_spec = fake_path_spec.FakePathSpec(
+        location=u'C:\\WINDOWS\\system32\\good.exe')
+
+    events = []
+    for store_index, data_type in enumerate([
+        u'fs:stat', u'fs:stat', u'pe:compilation:compilation_time']):
+      event = self._CreateTestEventObject({
+          u'timestamp': timelib.Timestamp.CopyFromString(
+              u'2015-01-01 17:00:00'),
+          u'timestamp_desc': eventdata.EventTimestamp.CREATION_TIME,
+          u'md5_hash': self._EVENT_1_HASH,
+          u'data_type': data_type,
+          u'pathspec': fake_path_spec.FakePathSpec(
+              location=u'C:\\WINDOWS\\system32\\good.exe')})
+      event.store_number = 1
+      event.store_index = store_index
+      events.append(event)
+
+    # Events without hash attributes are not tracked.
+    event = self._CreateTestEventObject({
+        u'timestamp': timelib.Timestamp.CopyFromString(u'2015-01-01 17:00:00'),
+        u'timestamp_desc': eventdata.EventTimestamp.CREATION_TIME,
+        u'data_type': u'windows:registry:key_value',
+        u'pathspec': path_spec})
+    event.store_number = 1
+    event.store_index = 3
+    events.append(event)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, u'nsrl.db')
+
+      writer = hash_set.HashSetFileWriter(16)
+      writer.AddHash(self._EVENT_1_HASH)
+      writer.Write(path)
+
+      plugin = nsrl.NSRLAnalysisPlugin()
+      plugin.SetHashSetPath(path)
+
+      storage_writer = self._AnalyzeEvents(events, plugin)
+
+    # pylint: disable=protected-access
+    event_identifiers = plugin._event_identifiers
+    self.assertEqual(event_identifiers.number_of_events, 3)
+    self.assertEqual(event_identifiers.GetPathSpec(0), path_spec)
+    self.assertEqual(
+        list(event_identifiers.GetEventIdentifiers(0)),
+        [(1, 0, None), (1, 1, None), (1, 2, None)])
+
+    analysis_report = storage_writer.analysis_reports[0]
+
+    tags = analysis_report.GetTags()
+    self.assertEqual(len(tags), 3)
+
+    tag = tags[2]
+    self.assertIsNone(tag.event_uuid)
+    self.assertEqual(tag.store_number, 1)
+    self.assertEqual(tag.store_index, 2)
+    self.assertEqual(tag.labels, [u'nsrl_present'])
+
+  def testSetHashSetPath(self):
+    """Tests the SetHashSetPath function."""
+    plugin = nsrl.NSRLAnalysisPlugin()
+
+    test_file = self._GetTestFilePath([u'empty_file'])
+    with self.assertRaises(IOError):
+      plugin.SetHashSetPath(test_file)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -84,14 +84,36 @@ class TaggingTest(test_lib.AnalysisPluginTestCase):
     plugin = tagging.TaggingPlugin()
     test_path = self._GetTestFilePath([self._TEST_TAG_FILE_NAME])
 
-    tag_expression = plugin._ParseTaggingFile(test_path)
-    self.assertEqual(len(tag_expression.children), 4)
+    tagging_rules = plugin._ParseTaggingFile(test_path)
+    self.assertEqual(len(tagging_rules.labels), 4)
+    self.assertEqual(len(tagging_rules.rules), 5)
+    self.assertEqual(tagging_rules.number_of_indexed_rules, 4)
 
     plugin = tagging.TaggingPlugin()
     test_path = self._GetTestFilePath([self._INVALID_TEST_TAG_FILE_NAME])
 
-    tag_expression = plugin._ParseTaggingFile(test_path)
-    self.assertEqual(len(tag_expression.children), 2)
+    tagging_rules = plugin._ParseTaggingFile(test_path)
+    self.assertEqual(len(tagging_rules.labels), 2)
+
+  def testGetCandidateRules(self):
+    """Tests the GetCandidateRules function of the tagging rules index."""
+    plugin = tagging.TaggingPlugin()
+    test_path = self._GetTestFilePath([self._TEST_TAG_FILE_NAME])
+
+    tagging_rules = plugin._ParseTaggingFile(test_path)
+
+    event = self._CreateTestEventObject(self._TEST_EVENTS[3])
+    candidate_rules = tagging_rules.GetCandidateRules(event)
+
+    labels = [rule.label for rule in candidate_rules]
+    self.assertEqual(
+        labels, [u'file_downloaded', u'login_attempt', u'security_event'])
+
+    event = self._CreateTestEventObject(self._TEST_EVENTS[2])
+    candidate_rules = tagging_rules.GetCandidateRules(event)
+
+    labels = [rule.label for rule in candidate_rules]
+    self.assertEqual(labels, [u'file_downloaded'])
 
   def testExamineEventAndCompileReport(self):
     """Tests the ExamineEvent and CompileReport functions."""
@@ -128,6 +150,14 @@ class TaggingTest(test_lib.AnalysisPluginTestCase):
     # This is from a tag rule declared in dotty syntax.
     self.assertIn(u'login_attempt', labels)
 
+    self.assertIn(u'Tag file contains 5 rules of which 4 are indexed.',
+                  analysis_report.text)
+
+    rule = plugin._tagging_rules.rules[0]
+    self.assertEqual(rule.label, u'application_execution')
+    self.assertEqual(rule.number_of_evaluations, 1)
+    self.assertEqual(rule.number_of_matches, 1)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -5,6 +5,7 @@
 import unittest
 
 from plaso.analysis import unique_domains_visited
+from plaso.containers import reports
 from plaso.lib import timelib
 
 from tests.analysis import test_lib
@@ -54,6 +55,34 @@ class UniqueDomainsPluginTest(test_lib.AnalysisPluginTestCase):
       domain = event_dictionary.get(u'domain', u'')
       self.assertIn(domain, report_text)
 
+  def testMergeAnalysisReport(self):
+    """Tests the MergeAnalysisReport function."""
+    previous_analysis_report = reports.AnalysisReport(
+        plugin_name=u'unique_domains_visited')
+    previous_analysis_report.report_array = [
+        u'firstevent.com', u'previousevent.com']
+
+    events = []
+    for event_dictionary in self._TEST_EVENTS:
+      event_dictionary[u'url'] = u'https://{0:s}/{1:s}'.format(
+          event_dictionary[u'domain'], event_dictionary[u'path'])
+
+      event = self._CreateTestEventObject(event_dictionary)
+      events.append(event)
+
+    plugin = unique_domains_visited.UniqueDomainsVisitedPlugin()
+    plugin.MergeAnalysisReport(previous_analysis_report)
+    storage_writer = self._AnalyzeEvents(events, plugin)
+
+    self.assertEqual(len(storage_writer.analysis_reports), 1)
+
+    analysis_report = storage_writer.analysis_reports[0]
+
+    expected_domains = [
+        u'firstevent.com', u'fourthevent.co', u'previousevent.com',
+        u'secondevent.net', u'thirdevent.org']
+    self.assertEqual(analysis_report.report_array, expected_domains)
+
 
 if __name__ == '__main__':
   unittest.main()
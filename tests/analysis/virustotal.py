@@ -2,15 +2,20 @@
 # -*- coding: utf-8 -*-
 """Tests for the VirusTotal analysis plugin."""
 
+import json
+import os
 import unittest
+import urlparse
 
 import mock
 from dfvfs.path import fake_path_spec
 
+from plaso.analysis import hash_cache
 from plaso.analysis import virustotal
 from plaso.lib import timelib
 from plaso.parsers import pe
 
+from tests import test_lib as shared_test_lib
 from tests.analysis import test_lib
 
 
@@ -118,5 +123,115 @@ class VirusTotalTest(test_lib.AnalysisPluginTestCase):
     self.assertEqual(tag.labels[0], u'virustotal_detections_10')
 
 
+class VirusTotalHashCacheTest(test_lib.AnalysisPluginTestCase):
+  """Tests for the VirusTotal analysis plugin with a hash labels cache."""
+
+  _EVENT_1_HASH = u'90'
+
+  _FAKE_API_KEY = u'4'
+
+  def _CreateTestEvents(self):
+    """Creates test events.
+
+    Returns:
+      list[EventObject]: events.
+    """
+    timestamp = timelib.Timestamp.CopyFromString(u'2015-01-01 17:00:00')
+
+    events = []
+    for index, location in enumerate([
+        u'C:\\WINDOWS\\system32\\evil.exe',
+        u'C:\\Users\\user\\Downloads\\evil.exe']):
+      event = pe.PECompilationEvent(
+          timestamp, u'Executable (EXE)', [], u'')
+      event.pathspec = fake_path_spec.FakePathSpec(location=location)
+      event.sha256_hash = self._EVENT_1_HASH
+      event.uuid = u'{0:d}'.format(index + 8)
+      events.append(event)
+
+    return events
+
+  def _ResponseCallback(self, method, path, unused_body):
+    """Simulates a VirusTotal API response.
+
+    Args:
+      method (str): HTTP method of the request.
+      path (str): path and query of the request.
+      unused_body (bytes): body of the request.
+
+    Returns:
+      tuple[int, str]: HTTP status code and body of the response.
+    """
+    url = urlparse.urlparse(path)
+    self.assertEqual(method, u'GET')
+    self.assertEqual(url.path, u'/vtapi/v2/file/report')
+
+    params = urlparse.parse_qs(url.query)
+    self.assertEqual(params[u'resource'], [self._EVENT_1_HASH])
+
+    response = {
+        u'positives': 10,
+        u'resource': self._EVENT_1_HASH,
+        u'response_code': 1}
+    return 200, json.dumps(response)
+
+  def _AnalyzeEventsWithHashCache(self, http_server, path):
+    """Analyzes the test events with a hash labels cache.
+
+    Args:
+      http_server (StandInHTTPServer): stand-in VirusTotal server.
+      path (str): path of the hash labels cache database file.
+
+    Returns:
+      AnalysisReport: analysis report.
+    """
+    plugin = virustotal.VirusTotalAnalysisPlugin()
+    plugin.SetAPIKey(self._FAKE_API_KEY)
+    plugin.SetHashCache(hash_cache.HashLabelsCache(path))
+
+    # pylint: disable=protected-access
+    plugin._analyzer._VIRUSTOTAL_API_REPORT_URL = (
+        u'{0:s}/vtapi/v2/file/report'.format(http_server.url))
+
+    storage_writer = self._AnalyzeEvents(self._CreateTestEvents(), plugin)
+
+    self.assertEqual(len(storage_writer.analysis_reports), 1)
+    return storage_writer.analysis_reports[0]
+
+  def testCompileReportWithHashCache(self):
+    """Tests the CompileReport function with a hash labels cache."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      path = os.path.join(temp_directory, u'hash_cache.db')
+
+      with shared_test_lib.StandInHTTPServer(
+          self._ResponseCallback) as http_server:
+        analysis_report = self._AnalyzeEventsWithHashCache(http_server, path)
+
+      self.assertEqual(len(http_server.requests), 1)
+
+      tags = analysis_report.GetTags()
+      self.assertEqual(len(tags), 2)
+      self.assertEqual(tags[0].labels, [u'virustotal_detections_10'])
+      self.assertIn(
+          u'0 hashes were found in the hash labels cache.',
+          analysis_report.text)
+
+      # The second run is answered by the cache.
+      with shared_test_lib.StandInHTTPServer(
+          self._ResponseCallback) as http_server:
+        analysis_report = self._AnalyzeEventsWithHashCache(http_server, path)
+
+      self.assertEqual(len(http_server.requests), 0)
+
+      tags = analysis_report.GetTags()
+      self.assertEqual(len(tags), 2)
+      self.assertEqual(
+          sorted(tag.event_uuid for tag in tags), [u'8', u'9'])
+      self.assertEqual(tags[0].labels, [u'virustotal_detections_10'])
+      self.assertIn(
+          u'1 hashes were found in the hash labels cache.',
+          analysis_report.text)
+
+
 if __name__ == '__main__':
   unittest.main()
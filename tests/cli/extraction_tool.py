@@ -131,7 +131,9 @@ class ExtractionToolTest(test_lib.CLIToolTestCase):
       u'  --profiling_type TYPE, --profiling-type TYPE',
       (u'                        The profiling type: "all", "memory", '
        u'"parsers",'),
-      u'                        "processing" or "serializers".',
+      (u'                        "processing", "serializers" or '
+       u'"tracing". Tracing is'),
+      u'                        not part of "all".',
       u''])
 
   def testAddExtractionOptions(self):
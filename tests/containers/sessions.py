@@ -25,6 +25,7 @@ class SessionTest(test_lib.AttributeContainerTestCase):
 
     expected_dict = {
         u'aborted': False,
+        u'analysis_high_water_marks': session.analysis_high_water_marks,
         u'analysis_reports_counter': session.analysis_reports_counter,
         u'debug_mode': False,
         u'event_labels_counter': session.event_labels_counter,
@@ -286,6 +286,48 @@ class PathSpecExtractorTest(shared_test_lib.BaseTestCase):
     self.assertEqual(len(path_specs), len(expected_paths))
     self.assertEqual(sorted(paths), sorted(expected_paths))
 
+  def testExtractPathSpecsStorageMediaImageWithVSSDifferencing(self):
+    """Tests the ExtractPathSpecs function on an image file with VSS stores."""
+    test_file = self._GetTestFilePath([u'vsstest.qcow2'])
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file)
+    qcow_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_QCOW, parent=os_path_spec)
+
+    # The VSS stores are processed starting with the most recent one.
+    source_path_specs = []
+    for store_index in (1, 0):
+      vss_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_VSHADOW, store_index=store_index,
+          parent=qcow_path_spec)
+      source_path_specs.append(path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_TSK, location=u'/',
+          parent=vss_path_spec))
+
+    source_path_specs.append(path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location=u'/',
+        parent=qcow_path_spec))
+
+    resolver_context = context.Context()
+    test_extractor = extractors.PathSpecExtractor(resolver_context)
+    path_specs = list(test_extractor.ExtractPathSpecs(source_path_specs))
+
+    paths = self._GetFilePaths(path_specs)
+    self.assertEqual(paths.count(u'/$UpCase'), 3)
+
+    test_extractor = extractors.PathSpecExtractor(
+        resolver_context, vss_differencing=True)
+    differencing_path_specs = list(test_extractor.ExtractPathSpecs(
+        source_path_specs))
+
+    self.assertLess(len(differencing_path_specs), len(path_specs))
+
+    # The unchanged $UpCase file is only extracted from the most recent VSS
+    # store and the volume.
+    paths = self._GetFilePaths(differencing_path_specs)
+    self.assertEqual(paths.count(u'/$UpCase'), 2)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Tests for the profiler classes."""
 
+import json
+import os
 import time
 import unittest
 
@@ -55,5 +57,40 @@ class GuppyMemoryProfilerTest(shared_test_lib.BaseTestCase):
       test_profiler.Stop()
 
 
+class TracingProfilerTest(shared_test_lib.BaseTestCase):
+  """Tests for the tracing profiler."""
+
+  def testTracingProfiler(self):
+    """Tests the Start, StartSpan, StopSpan and Stop functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_profiler = profiler.TracingProfiler(
+          u'unittest', path=temp_directory)
+
+      test_profiler.Start()
+
+      for _ in range(5):
+        span = test_profiler.StartSpan(u'test_parser', u'parser')
+        time.sleep(0.01)
+        test_profiler.StopSpan(span, arguments={u'bytes': 5, u'events': 2})
+
+      test_profiler.Stop()
+
+      sample_file = os.path.join(temp_directory, u'tracing-unittest.json')
+      with open(sample_file, 'rb') as file_object:
+        trace_events = json.load(file_object)
+
+    self.assertEqual(len(trace_events), 6)
+
+    self.assertEqual(trace_events[0][u'ph'], u'M')
+    self.assertEqual(trace_events[0][u'args'], {u'name': u'unittest'})
+
+    trace_event = trace_events[1]
+    self.assertEqual(trace_event[u'args'], {u'bytes': 5, u'events': 2})
+    self.assertEqual(trace_event[u'cat'], u'parser')
+    self.assertEqual(trace_event[u'name'], u'test_parser')
+    self.assertEqual(trace_event[u'ph'], u'X')
+    self.assertGreaterEqual(trace_event[u'dur'], 10000)
+
+
 if __name__ == '__main__':
   unittest.main()
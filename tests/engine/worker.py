@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 """Tests the worker."""
 
+import json
+import os
 import unittest
 
 from dfvfs.lib import definitions as dfvfs_definitions
@@ -11,6 +13,7 @@ from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.containers import sessions
 from plaso.engine import knowledge_base
+from plaso.engine import profiler
 from plaso.engine import worker
 from plaso.parsers import mediator as parsers_mediator
 from plaso.storage import fake_storage
@@ -208,6 +211,48 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(storage_writer.number_of_events, 18)
 
+  def testProcessPathSpecWithTracingProfiler(self):
+    """Tests the ProcessPathSpec function with a tracing profiler."""
+    session = sessions.Session()
+    storage_writer = fake_storage.FakeStorageWriter(session)
+    knowledge_base_object = knowledge_base.KnowledgeBase()
+    mediator = parsers_mediator.ParserMediator(
+        storage_writer, knowledge_base_object)
+
+    resolver_context = context.Context()
+    extraction_worker = worker.EventExtractionWorker(resolver_context)
+
+    path_spec = self._GetTestFilePathSpec([u'wtmp.1'])
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      tracing_profiler = profiler.TracingProfiler(
+          u'unittest', path=temp_directory)
+      tracing_profiler.Start()
+      extraction_worker.SetTracingProfiler(tracing_profiler)
+
+      storage_writer.Open()
+      extraction_worker.ProcessPathSpec(mediator, path_spec)
+      storage_writer.Close()
+
+      extraction_worker.SetTracingProfiler(None)
+      tracing_profiler.Stop()
+
+      sample_file = os.path.join(temp_directory, u'tracing-unittest.json')
+      with open(sample_file, 'rb') as file_object:
+        trace_events = json.load(file_object)
+
+    self.assertIsNone(mediator._file_entry)
+
+    file_trace_events = [
+        trace_event for trace_event in trace_events
+        if trace_event.get(u'cat', None) == u'file']
+    self.assertEqual(len(file_trace_events), 1)
+
+    expected_arguments = {
+        u'bytes': os.path.getsize(path_spec.location),
+        u'events': storage_writer.number_of_events}
+    self.assertEqual(file_trace_events[0][u'args'], expected_arguments)
+
   def testExtractionWorkerHashing(self):
     """Test that the worker sets up and runs hashing code correctly."""
     resolver_context = context.Context()
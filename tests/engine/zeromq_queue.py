@@ -4,28 +4,14 @@
 
 import unittest
 
+from plaso.containers import tasks
+from plaso.engine import plaso_queue
 from plaso.engine import zeromq_queue
 from plaso.lib import errors
 
 from tests import test_lib as shared_test_lib
 
 
-class ZeroMQPullBindQueue(zeromq_queue.ZeroMQPullQueue):
-  """A Plaso queue backed by a ZeroMQ PULL socket that binds to a port.
-
-  This queue may only be used to pop items, not to push.
-  """
-  SOCKET_CONNECTION_TYPE = zeromq_queue.ZeroMQQueue.SOCKET_CONNECTION_BIND
-
-
-class ZeroMQPushConnectQueue(zeromq_queue.ZeroMQPushQueue):
-  """A Plaso queue backed by a ZeroMQ PUSH socket that connects to a port.
-
-  This queue may only be used to push items, not to pop.
-  """
-  SOCKET_CONNECTION_TYPE = zeromq_queue.ZeroMQQueue.SOCKET_CONNECTION_CONNECT
-
-
 class ZeroMQRequestBindQueue(zeromq_queue.ZeroMQRequestQueue):
   """A Plaso queue backed by a ZeroMQ REQ socket that binds to a port.
 
@@ -48,7 +34,7 @@ class testZeroMQQueues(shared_test_lib.BaseTestCase):
   # pylint: disable=protected-access
 
   _QUEUE_CLASSES = frozenset([
-      zeromq_queue.ZeroMQPushBindQueue, ZeroMQPullBindQueue,
+      zeromq_queue.ZeroMQPushBindQueue, zeromq_queue.ZeroMQPullBindQueue,
       ZeroMQRequestBindQueue])
 
   def _testItemTransferred(self, push_queue, pop_queue):
@@ -78,15 +64,117 @@ class testZeroMQQueues(shared_test_lib.BaseTestCase):
     self._testItemTransferred(push_queue, pull_queue)
     push_queue.Close()
     pull_queue.Close()
-    pull_queue = ZeroMQPullBindQueue(
+    pull_queue = zeromq_queue.ZeroMQPullBindQueue(
         name=u'pushpull_pullbind', delay_open=False, linger_seconds=1)
-    push_queue = ZeroMQPushConnectQueue(
+    push_queue = zeromq_queue.ZeroMQPushConnectQueue(
         name=u'pushpull_pushconnect', delay_open=False, port=pull_queue.port,
         linger_seconds=1)
     self._testItemTransferred(push_queue, pull_queue)
     push_queue.Close()
     pull_queue.Close()
 
+  def testBatchedPushPullQueues(self):
+    """Tests that batched items can be transferred via push and pull queues."""
+    pull_queue = zeromq_queue.ZeroMQPullBindQueue(
+        name=u'batched_pullbind', delay_open=False, linger_seconds=1)
+    push_queue = zeromq_queue.ZeroMQPushConnectQueue(
+        batch_latency_seconds=60, batch_size=3, delay_open=False,
+        linger_seconds=1, name=u'batched_pushconnect', port=pull_queue.port)
+
+    for item in range(5):
+      push_queue.PushItem(item)
+
+    # The first batch of 3 items is sent, the remaining 2 items are pending.
+    self.assertEqual(len(push_queue._pending_items), 2)
+    self.assertEqual(
+        [pull_queue.PopItem() for _ in range(3)], [0, 1, 2])
+
+    push_queue.PushItem(plaso_queue.QueueAbort())
+    self.assertEqual(push_queue._pending_items, [])
+
+    self.assertEqual(pull_queue.PopItem(), 3)
+    self.assertEqual(pull_queue.PopItem(), 4)
+    self.assertIsInstance(pull_queue.PopItem(), plaso_queue.QueueAbort)
+
+    push_queue.PushItem(5)
+    push_queue.Close()
+    self.assertEqual(pull_queue.PopItem(), 5)
+    pull_queue.Close()
+
+  def testBatchedPushQueueFull(self):
+    """Tests that batched items are kept when a push queue is full."""
+    push_queue = zeromq_queue.ZeroMQPushBindQueue(
+        batch_latency_seconds=60, batch_size=2, delay_open=False,
+        linger_seconds=1, name=u'batched_full_pushbind', timeout_seconds=1)
+
+    # Without a connected pull queue the items cannot be sent.
+    push_queue.PushItem(0)
+    with self.assertRaises(errors.QueueFull):
+      push_queue.PushItem(1)
+
+    self.assertEqual(push_queue._pending_items, [0, 1])
+
+    pull_queue = zeromq_queue.ZeroMQPullConnectQueue(
+        delay_open=False, linger_seconds=1, name=u'batched_full_pullconnect',
+        port=push_queue.port)
+
+    push_queue.PushItem(2)
+    self.assertEqual(push_queue._pending_items, [])
+
+    self.assertEqual([pull_queue.PopItem() for _ in range(3)], [0, 1, 2])
+
+    push_queue.Close()
+    pull_queue.Close()
+
+  def testBatchedRequestAndBufferedReplyQueues(self):
+    """Tests batched REQ and buffered REP queue pairs."""
+    reply_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
+        batch_latency_seconds=1, batch_size=2, delay_open=False,
+        linger_seconds=1, name=u'batched_replybind')
+    request_queue = zeromq_queue.ZeroMQRequestConnectQueue(
+        delay_open=False, linger_seconds=1, name=u'batched_requestconnect',
+        port=reply_queue.port)
+
+    for item in range(3):
+      reply_queue.PushItem(item)
+    reply_queue.PushItem(plaso_queue.QueueAbort())
+    reply_queue.PushItem(plaso_queue.QueueAbort())
+
+    self.assertEqual(request_queue.PopItem(), 0)
+    self.assertEqual(len(request_queue._received_items), 1)
+    self.assertEqual(request_queue.PopItem(), 1)
+    self.assertEqual(request_queue.PopItem(), 2)
+
+    # Queue abort items are not batched.
+    self.assertIsInstance(request_queue.PopItem(), plaso_queue.QueueAbort)
+    self.assertEqual(len(request_queue._received_items), 0)
+    self.assertIsInstance(request_queue.PopItem(), plaso_queue.QueueAbort)
+
+    reply_queue.Close()
+    request_queue.Close()
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    with self.assertRaises(ValueError):
+      zeromq_queue.ZeroMQPushBindQueue(batch_size=0)
+
+    with self.assertRaises(ValueError):
+      zeromq_queue.ZeroMQPushBindQueue(serializer=u'bogus')
+
+  def testQueueHost(self):
+    """Tests that an item can be transferred via a queue bound to a host."""
+    pull_queue = zeromq_queue.ZeroMQPullBindQueue(
+        name=u'queuehost_pullbind', delay_open=False, host=u'*',
+        linger_seconds=1)
+    self.assertEqual(pull_queue.host, u'*')
+
+    push_queue = zeromq_queue.ZeroMQPushConnectQueue(
+        name=u'queuehost_pushconnect', delay_open=False, host=u'127.0.0.1',
+        port=pull_queue.port, linger_seconds=1)
+    self._testItemTransferred(push_queue, pull_queue)
+    push_queue.Close()
+    pull_queue.Close()
+
   def testQueueStart(self):
     """Tests that delayed creation of ZeroMQ sockets occurs correctly."""
     for queue_class in self._QUEUE_CLASSES:
@@ -120,6 +208,37 @@ class testZeroMQQueues(shared_test_lib.BaseTestCase):
     reply_queue.Close()
     request_queue.Close()
 
+  def testSerializeItems(self):
+    """Tests the _SerializeItems and _DeserializeItems functions."""
+    task = tasks.Task(session_identifier=u'session')
+
+    for serializer in (
+        zeromq_queue.ZeroMQQueue.SERIALIZER_JSON,
+        zeromq_queue.ZeroMQQueue.SERIALIZER_PICKLE):
+      test_queue = zeromq_queue.ZeroMQPushBindQueue(serializer=serializer)
+
+      frames = test_queue._SerializeItems([task, None, (u'task', b'data')])
+      self.assertEqual(len(frames), 3)
+
+      if serializer == zeromq_queue.ZeroMQQueue.SERIALIZER_JSON:
+        self.assertEqual(frames[0][:1], b'J')
+      else:
+        self.assertEqual(frames[0][:1], b'P')
+
+      # Items that are not attribute containers are always pickled.
+      self.assertEqual(frames[1][:1], b'P')
+
+      items = test_queue._DeserializeItems(frames)
+      self.assertEqual(len(items), 3)
+      self.assertIsInstance(items[0], tasks.Task)
+      self.assertEqual(items[0].identifier, task.identifier)
+      self.assertEqual(items[0].session_identifier, u'session')
+      self.assertIsNone(items[1])
+      self.assertEqual(items[2], (u'task', b'data'))
+
+    with self.assertRaises(ValueError):
+      test_queue._DeserializeItems([b'Xbogus'])
+
   def testSocketCreation(self):
     """Tests that ZeroMQ sockets are created when a new queue is created."""
     for queue_class in self._QUEUE_CLASSES:
@@ -0,0 +1,138 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the formatted strings cache."""
+
+import gc
+import unittest
+
+from plaso.containers import events
+from plaso.formatters import cache
+from plaso.formatters import mediator
+
+from tests.formatters import test_lib
+
+
+class CountingEventFormatter(test_lib.TestEventFormatter):
+  """Event formatter that counts the number of times an event is formatted."""
+
+  def __init__(self):
+    """Initializes the event formatter."""
+    super(CountingEventFormatter, self).__init__()
+    self.number_of_messages = 0
+    self.number_of_sources = 0
+
+  def GetMessages(self, formatter_mediator, event):
+    """Determines the formatted message strings for an event object.
+
+    Args:
+      formatter_mediator (FormatterMediator): mediates the interactions between
+          formatters and other components, such as storage and Windows EventLog
+          resources.
+      event (EventObject): event.
+
+    Returns:
+      tuple(str, str): formatted message string and short message string.
+    """
+    self.number_of_messages += 1
+    return super(CountingEventFormatter, self).GetMessages(
+        formatter_mediator, event)
+
+  def GetSources(self, event):
+    """Determines the the short and long source for an event object.
+
+    Args:
+      event (EventObject): event.
+
+    Returns:
+      tuple(str, str): short and long source string.
+    """
+    self.number_of_sources += 1
+    return super(CountingEventFormatter, self).GetSources(event)
+
+
+class FormattedStringsCacheTest(unittest.TestCase):
+  """Tests for the formatted strings cache."""
+
+  # pylint: disable=protected-access
+
+  def _CreateTestEvent(self, text):
+    """Creates a test event.
+
+    Args:
+      text (str): text of the event.
+
+    Returns:
+      EventObject: event.
+    """
+    event = events.EventObject()
+    event.data_type = u'test:event'
+    event.text = text
+    event.timestamp = 0
+    return event
+
+  def testGetMessageStrings(self):
+    """Tests the GetMessageStrings function."""
+    event_formatter = CountingEventFormatter()
+    formatter_mediator = mediator.FormatterMediator()
+    event = self._CreateTestEvent(u'My text')
+
+    for _ in range(3):
+      message, _ = cache.FormattedStringsCache.GetMessageStrings(
+          event_formatter, formatter_mediator, event)
+      self.assertEqual(message, u'My text')
+
+    self.assertEqual(event_formatter.number_of_messages, 1)
+
+    # The messages are formatted again for a different formatter mediator.
+    cache.FormattedStringsCache.GetMessageStrings(
+        event_formatter, mediator.FormatterMediator(), event)
+    self.assertEqual(event_formatter.number_of_messages, 2)
+
+  def testGetSourceStrings(self):
+    """Tests the GetSourceStrings function."""
+    event_formatter = CountingEventFormatter()
+    event = self._CreateTestEvent(u'My text')
+
+    for _ in range(3):
+      sources = cache.FormattedStringsCache.GetSourceStrings(
+          event_formatter, event)
+      self.assertEqual(sources, (u'FILE', u'Weird Log File'))
+
+    self.assertEqual(event_formatter.number_of_sources, 1)
+
+  def testInvalidate(self):
+    """Tests the Invalidate function."""
+    event_formatter = CountingEventFormatter()
+    formatter_mediator = mediator.FormatterMediator()
+    event = self._CreateTestEvent(u'My text')
+
+    cache.FormattedStringsCache.GetMessageStrings(
+        event_formatter, formatter_mediator, event)
+
+    event.text = u'My other text'
+    cache.FormattedStringsCache.Invalidate(event)
+
+    message, _ = cache.FormattedStringsCache.GetMessageStrings(
+        event_formatter, formatter_mediator, event)
+    self.assertEqual(message, u'My other text')
+    self.assertEqual(event_formatter.number_of_messages, 2)
+
+  def testGarbageCollection(self):
+    """Tests that the cached strings are removed with the event."""
+    event_formatter = CountingEventFormatter()
+    event = self._CreateTestEvent(u'My text')
+
+    cache.FormattedStringsCache.GetSourceStrings(event_formatter, event)
+
+    identifier = id(event)
+    self.assertIn(identifier, cache.FormattedStringsCache._formatted_strings)
+
+    del event
+    gc.collect()
+
+    self.assertNotIn(
+        identifier, cache.FormattedStringsCache._formatted_strings)
+
+
+if __name__ == '__main__':
+  unittest.main()
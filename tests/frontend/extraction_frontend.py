@@ -9,6 +9,9 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
 from plaso.containers import sessions
+from plaso.containers import tasks
+from plaso.engine import plaso_queue
+from plaso.engine import zeromq_queue
 from plaso.frontend import extraction_frontend
 from plaso.storage import zip_file as storage_zip_file
 
@@ -106,6 +109,49 @@ class ExtractionFrontendTests(shared_test_lib.BaseTestCase):
 
     self.assertIn(u'winreg', parsers_names)
 
+  def testProcessRemoteTasks(self):
+    """Tests the ProcessRemoteTasks function."""
+    session = sessions.Session()
+    session.parser_filter_expression = u'syslog'
+    session.preferred_year = 2012
+    test_front_end = extraction_frontend.ExtractionFrontend()
+
+    # The queues represent those of the foreman.
+    task_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
+        delay_open=False, linger_seconds=0, name=u'test_task_queue',
+        timeout_seconds=10)
+    task_storage_queue = zeromq_queue.ZeroMQPullBindQueue(
+        delay_open=False, linger_seconds=0, name=u'test_task_storage_queue',
+        timeout_seconds=10)
+
+    test_file = self._GetTestFilePath([u'syslog'])
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file)
+
+    task = tasks.Task(session_identifier=session.identifier)
+    task.path_spec = path_spec
+    task_queue.PushItem(task)
+    task_queue.PushItem(plaso_queue.QueueAbort())
+
+    source_type = dfvfs_definitions.SOURCE_TYPE_FILE
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_front_end.ProcessRemoteTasks(
+          session, [path_spec], source_type, u'127.0.0.1', task_queue.port,
+          task_storage_queue.port, temporary_directory=temp_directory)
+
+    # The task storage is preceded by a heartbeat.
+    task_identifier, task_storage_data = task_storage_queue.PopItem()
+    self.assertEqual(task_identifier, task.identifier)
+    self.assertIsNone(task_storage_data)
+
+    task_identifier, task_storage_data = task_storage_queue.PopItem()
+    self.assertEqual(task_identifier, task.identifier)
+    self.assertIsNotNone(task_storage_data)
+
+    task_queue.Close(abort=True)
+    task_storage_queue.Close(abort=True)
+
   # Note: this test takes multiple seconds to complete due to
   # the behavior of the multi processing queue.
   def testProcessSources(self):
@@ -150,6 +196,12 @@ class ExtractionFrontendTests(shared_test_lib.BaseTestCase):
     test_front_end = extraction_frontend.ExtractionFrontend()
     test_front_end.SetDebugMode(enable_debug=True)
 
+  def testSetRemoteWorkers(self):
+    """Tests the SetRemoteWorkers function."""
+    test_front_end = extraction_frontend.ExtractionFrontend()
+    test_front_end.SetRemoteWorkers(
+        u'127.0.0.1', task_queue_port=5700, task_storage_queue_port=5701)
+
   def testSetShowMemoryInformation(self):
     """Tests the SetShowMemoryInformation function."""
     test_front_end = extraction_frontend.ExtractionFrontend()
@@ -4,6 +4,7 @@
 
 import os
 import shutil
+import stat
 import tempfile
 import unittest
 
@@ -293,7 +294,299 @@ class SignaturesFileEntryFilterTest(shared_test_lib.BaseTestCase):
 
 
 # TODO: add tests for FileEntryFilterCollection.
-# TODO: add tests for FileSaver.
+class ContentAddressedExportStoreTest(shared_test_lib.BaseTestCase):
+  """Tests for the content-addressed export store."""
+
+  _DIGEST_HASH = (
+      u'9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08')
+
+  def testAddContent(self):
+    """Tests the AddContent function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      export_store = image_export.ContentAddressedExportStore(temp_directory)
+      export_store.Open()
+
+      for _ in range(2):
+        temp_path = os.path.join(export_store.temporary_directory, u'test')
+        with open(temp_path, 'wb') as file_object:
+          file_object.write(b'test')
+
+        export_store.AddContent(temp_path, self._DIGEST_HASH)
+        self.assertFalse(os.path.exists(temp_path))
+
+      export_store.Close()
+
+      content_path = export_store.GetContentPath(self._DIGEST_HASH)
+      expected_content_path = os.path.join(
+          temp_directory, u'content', u'9f', self._DIGEST_HASH)
+      self.assertEqual(content_path, expected_content_path)
+      self.assertTrue(os.path.isfile(content_path))
+
+  def testAddFile(self):
+    """Tests the AddFile and GetDigestHash functions."""
+    file_information = image_export.ExportedFileInformation(
+        inode=16, mtime=1337961563, mtime_nano=0, path=u'/passwords.txt',
+        size=116, source=u'/cases/image.raw', volume=u'p1',
+        vss_store_number=1)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      export_store = image_export.ContentAddressedExportStore(temp_directory)
+      export_store.Open()
+
+      content_path = export_store.GetContentPath(self._DIGEST_HASH)
+      os.makedirs(os.path.dirname(content_path))
+      with open(content_path, 'wb') as file_object:
+        file_object.write(b'test')
+
+      digest_hash = export_store.GetDigestHash(file_information)
+      self.assertIsNone(digest_hash)
+
+      export_store.AddFile(self._DIGEST_HASH, file_information)
+      export_store.Close()
+
+      # The index is persistent.
+      export_store = image_export.ContentAddressedExportStore(temp_directory)
+      export_store.Open()
+
+      # The same file in another volume shadow snapshot store.
+      file_information.vss_store_number = 2
+      digest_hash = export_store.GetDigestHash(file_information)
+      self.assertEqual(digest_hash, self._DIGEST_HASH)
+
+      export_store.AddFile(digest_hash, file_information)
+
+      # The same path and inode in another volume.
+      file_information.volume = u'p2'
+      digest_hash = export_store.GetDigestHash(file_information)
+      self.assertIsNone(digest_hash)
+
+      export_store.AddFile(self._DIGEST_HASH, file_information)
+
+      expected_files = [
+          (u'/cases/image.raw', u'p1', u'/passwords.txt', 1, 16),
+          (u'/cases/image.raw', u'p1', u'/passwords.txt', 2, 16),
+          (u'/cases/image.raw', u'p2', u'/passwords.txt', 2, 16)]
+      self.assertEqual(export_store.GetFiles(self._DIGEST_HASH), expected_files)
+
+      file_information.mtime_nano = 1
+      digest_hash = export_store.GetDigestHash(file_information)
+      self.assertIsNone(digest_hash)
+
+      export_store.Close()
+
+
+class FileSaverTest(shared_test_lib.BaseTestCase):
+  """Tests for the file saver."""
+
+  def _GetTargetPath(self, destination_path, source_path, filename_prefix=u''):
+    """Retrieves the path of a target file.
+
+    Args:
+      destination_path (str): path of the destination directory.
+      source_path (str): path of the source file.
+      filename_prefix (Optional[str]): filename prefix.
+
+    Returns:
+      str: path of the target file.
+    """
+    directory_name, filename = os.path.split(source_path)
+    if filename_prefix:
+      filename = u'{0:s}_{1:s}'.format(filename_prefix, filename)
+    return os.path.join(
+        destination_path, directory_name.lstrip(os.path.sep), filename)
+
+  def _GetFileMode(self, path):
+    """Retrieves the mode of a file.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      int: permission bits of the mode of the file.
+    """
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+  def _GetExpectedFileMode(self):
+    """Retrieves the mode of a newly created file.
+
+    Returns:
+      int: permission bits of the mode a newly created file has under
+          the current umask.
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+  def _ReadFile(self, path):
+    """Reads the content of a file.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      bytes: content of the file.
+    """
+    with open(path, 'rb') as file_object:
+      return file_object.read()
+
+  def testGetFileInformation(self):
+    """Tests the _GetFileInformation function."""
+    test_path = self._GetTestFilePath([u'syslog'])
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
+
+    file_saver = image_export.FileSaver()
+
+    file_entry = path_spec_resolver.Resolver.OpenFileEntry(os_path_spec)
+    # pylint: disable=protected-access
+    file_information = file_saver._GetFileInformation(file_entry)
+
+    self.assertEqual(file_information.path, test_path)
+    self.assertEqual(file_information.source, test_path)
+    self.assertIsNone(file_information.volume)
+    self.assertIsNone(file_information.vss_store_number)
+
+    # The file entry is only used for its path specification here.
+    file_information_per_partition = []
+    for partition in (u'/p1', u'/p2'):
+      partition_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_TSK_PARTITION, location=partition,
+          parent=os_path_spec)
+      vshadow_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_VSHADOW, store_index=1,
+          parent=partition_path_spec)
+      file_entry.path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_TSK, inode=0, location=u'/$MFT',
+          parent=vshadow_path_spec)
+
+      file_information = file_saver._GetFileInformation(file_entry)
+      self.assertEqual(file_information.path, u'/$MFT')
+      self.assertEqual(file_information.source, test_path)
+      self.assertEqual(
+          file_information.volume, partition_path_spec.comparable)
+      self.assertEqual(file_information.vss_store_number, 2)
+
+      file_information_per_partition.append(file_information)
+
+    self.assertNotEqual(
+        file_information_per_partition[0].volume,
+        file_information_per_partition[1].volume)
+
+  def testWriteFile(self):
+    """Tests the WriteFile function."""
+    test_path = self._GetTestFilePath([u'syslog'])
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      file_saver = image_export.FileSaver(skip_duplicates=True)
+      file_saver.WriteFile(path_spec, temp_directory)
+      file_saver.WriteFile(path_spec, temp_directory, filename_prefix=u'vss_1')
+      file_saver.Close()
+
+      target_path = self._GetTargetPath(temp_directory, test_path)
+      self.assertEqual(
+          self._ReadFile(target_path), self._ReadFile(test_path))
+      self.assertEqual(
+          self._GetFileMode(target_path), self._GetExpectedFileMode())
+
+      # The second file is a duplicate and is not saved.
+      target_directory = os.path.dirname(target_path)
+      self.assertEqual(os.listdir(target_directory), [u'syslog'])
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      file_saver = image_export.FileSaver(skip_duplicates=False)
+      file_saver.WriteFile(path_spec, temp_directory)
+      file_saver.WriteFile(path_spec, temp_directory, filename_prefix=u'vss_1')
+      file_saver.Close()
+
+      target_path = self._GetTargetPath(
+          temp_directory, test_path, filename_prefix=u'vss_1')
+      self.assertEqual(
+          self._ReadFile(target_path), self._ReadFile(test_path))
+
+      target_directory = os.path.dirname(target_path)
+      self.assertEqual(
+          sorted(os.listdir(target_directory)), [u'syslog', u'vss_1_syslog'])
+
+  def testWriteFileWithWorkers(self):
+    """Tests the WriteFile function with worker processes."""
+    test_paths = [
+        self._GetTestFilePath([filename])
+        for filename in (u'syslog', u'wtmp.1', u'NTUSER.DAT')]
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      file_saver = image_export.FileSaver(
+          number_of_workers=2, skip_duplicates=True)
+
+      for test_path in test_paths:
+        path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
+        file_saver.WriteFile(path_spec, temp_directory)
+        file_saver.WriteFile(
+            path_spec, temp_directory, filename_prefix=u'vss_1')
+
+      file_saver.Close()
+
+      for test_path in test_paths:
+        target_path = self._GetTargetPath(temp_directory, test_path)
+        self.assertEqual(
+            self._ReadFile(target_path), self._ReadFile(test_path))
+
+      target_directory = os.path.dirname(
+          self._GetTargetPath(temp_directory, test_paths[0]))
+      self.assertEqual(
+          sorted(os.listdir(target_directory)),
+          [u'NTUSER.DAT', u'syslog', u'wtmp.1'])
+
+  def testWriteFileWithExportStore(self):
+    """Tests the WriteFile function with an export store."""
+    test_paths = [
+        self._GetTestFilePath([filename])
+        for filename in (u'syslog', u'wtmp.1', u'NTUSER.DAT')]
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      for number_of_workers in (0, 2):
+        export_store = image_export.ContentAddressedExportStore(
+            temp_directory)
+        export_store.Open()
+
+        file_saver = image_export.FileSaver(
+            export_store=export_store, number_of_workers=number_of_workers)
+
+        for test_path in test_paths:
+          path_spec = path_spec_factory.Factory.NewPathSpec(
+              dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path)
+          file_saver.WriteFile(path_spec, temp_directory)
+
+        file_saver.Close()
+
+        for test_path in test_paths:
+          file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+              path_spec_factory.Factory.NewPathSpec(
+                  dfvfs_definitions.TYPE_INDICATOR_OS, location=test_path))
+
+          # pylint: disable=protected-access
+          file_information = file_saver._GetFileInformation(file_entry)
+          digest_hash = export_store.GetDigestHash(file_information)
+          self.assertIsNotNone(digest_hash)
+
+          content_path = export_store.GetContentPath(digest_hash)
+          self.assertEqual(
+              self._ReadFile(content_path), self._ReadFile(test_path))
+          self.assertEqual(
+              self._GetFileMode(content_path), self._GetExpectedFileMode())
+
+          expected_files = [
+              (test_path, u'', test_path, 0, file_information.inode)]
+          self.assertEqual(export_store.GetFiles(digest_hash), expected_files)
+
+        export_store.Close()
+
+      self.assertEqual(
+          sorted(os.listdir(temp_directory)), [u'content', u'index.db', u'tmp'])
+      self.assertEqual(
+          os.listdir(os.path.join(temp_directory, u'tmp')), [])
 
 
 class ImageExportFrontendTest(shared_test_lib.BaseTestCase):
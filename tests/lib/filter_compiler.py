@@ -0,0 +1,106 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the filter compiler."""
+
+import pickle
+import unittest
+
+from plaso.containers import events
+from plaso.lib import filter_compiler
+from plaso.lib import objectfilter
+from plaso.lib import pfilter
+from plaso.lib import timelib
+
+
+class CompiledFilterTest(unittest.TestCase):
+  """Tests for the compiled filter."""
+
+  def _CreateTestEvent(self):
+    """Creates a test event.
+
+    Returns:
+      EventObject: event.
+    """
+    event = events.EventObject()
+    event.data_type = u'test:compiled_filter'
+    event.filename = u'/My Documents/goodfella/Documents/myfile.txt'
+    event.inode = 1245
+    event.mydict = {u'value': 134, u'another': u'value'}
+    event.parser = u'filestat'
+    event.timestamp = timelib.Timestamp.CopyFromString(u'2015-11-18 01:15:43')
+    event.timestamp_desc = u'Last Written'
+    event.zero = 0
+    return event
+
+  def _CompileFilter(self, query):
+    """Compiles a filter query.
+
+    Args:
+      query (str): filter query.
+
+    Returns:
+      tuple[objectfilter.Filter, CompiledFilter]: filter object and compiled
+          filter.
+    """
+    parser = pfilter.BaseParser(query).Parse()
+    filter_object = parser.Compile(pfilter.PlasoAttributeFilterImplementation)
+    return filter_object, filter_compiler.CompiledFilter(filter_object)
+
+  def testMatches(self):
+    """Tests the Matches function."""
+    event = self._CreateTestEvent()
+
+    test_queries = [
+        (u'filename contains \'GoodFella\'', True),
+        (u'filename not contains \'GoodFella\'', False),
+        (u'filename regexp \'goodfella\'', True),
+        (u'filename iregexp \'GOODFELLA\'', True),
+        (u'date >= \'2015-11-18\'', True),
+        (u'date < \'2015-11-18\'', False),
+        (u'date > \'2015-11-17\' and date < \'2015-11-19\'', True),
+        (u'timestamp_desc is \'Last Written\' or parser is \'winreg\'', True),
+        (u'inode == 1245 and inode != 1246 and inode >= 1245', True),
+        (u'inode < 1245 or inode > 1245 or inode <= 1244', False),
+        (u'zero is 0', False),
+        (u'mydict.value is 134', True),
+        (u'mydict.another is \'value\' and parser inlist \'webhist\'', False),
+        (u'parser inset \'filestat,winreg\'', True),
+        (u'missing contains \'value\'', False)]
+
+    for query, expected_result in test_queries:
+      filter_object, compiled_filter = self._CompileFilter(query)
+      self.assertIsNotNone(compiled_filter.source)
+
+      self.assertEqual(filter_object.Matches(event), expected_result)
+      self.assertEqual(compiled_filter.Matches(event), expected_result)
+
+  def testMatchesContext(self):
+    """Tests the Matches function with a context filter."""
+    filter_implementation = objectfilter.DictFilterImplementation
+
+    parser = objectfilter.Parser(
+        u'@values (name is \'one\' and size > 1)').Parse()
+    filter_object = parser.Compile(filter_implementation)
+    compiled_filter = filter_compiler.CompiledFilter(filter_object)
+
+    test_dict = {u'values': [
+        {u'name': u'one', u'size': 1}, {u'name': u'two', u'size': 2}]}
+    self.assertFalse(compiled_filter.Matches(test_dict))
+
+    test_dict[u'values'].append({u'name': u'one', u'size': 3})
+    self.assertTrue(compiled_filter.Matches(test_dict))
+
+  def testPickle(self):
+    """Tests pickling a compiled filter."""
+    event = self._CreateTestEvent()
+
+    _, compiled_filter = self._CompileFilter(
+        u'parser is \'filestat\' and filename contains \'myfile\'')
+
+    compiled_filter = pickle.loads(pickle.dumps(compiled_filter))
+    self.assertIsNotNone(compiled_filter.source)
+    self.assertTrue(compiled_filter.Matches(event))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,151 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the filter planner."""
+
+import unittest
+
+from plaso.lib import filter_planner
+from plaso.lib import pfilter
+from plaso.lib import timelib
+from plaso.storage import time_range
+
+
+class FilterPlannerTest(unittest.TestCase):
+  """Tests for the filter planner."""
+
+  def _CompileFilter(self, query):
+    """Compiles a filter query.
+
+    Args:
+      query (str): filter query.
+
+    Returns:
+      objectfilter.Filter: filter object.
+    """
+    parser = pfilter.BaseParser(query).Parse()
+    return parser.Compile(pfilter.PlasoAttributeFilterImplementation)
+
+  def _GetEventPredicate(self, query):
+    """Retrieves the event predicate of a filter query.
+
+    Args:
+      query (str): filter query.
+
+    Returns:
+      EventPredicate: event predicate or None.
+    """
+    planner = filter_planner.FilterPlanner()
+    return planner.GetEventPredicate(self._CompileFilter(query))
+
+  def _GetTimeRange(self, query, test_time_range=None):
+    """Retrieves the time range of a filter query.
+
+    Args:
+      query (str): filter query.
+      test_time_range (Optional[TimeRange]): time range to limit the time
+          range of the filter query to.
+
+    Returns:
+      TimeRange: time range or None.
+    """
+    planner = filter_planner.FilterPlanner()
+    return planner.GetTimeRange(
+        self._CompileFilter(query), time_range=test_time_range)
+
+  def testGetEventPredicate(self):
+    """Tests the GetEventPredicate function."""
+    filestat_values = {
+        u'data_type': set([u'fs:stat']), u'parser': set([u'filestat'])}
+    winreg_values = {
+        u'data_type': set([u'windows:registry:key_value']),
+        u'parser': set([u'winreg/winreg_default'])}
+
+    test_queries = [
+        (u'data_type is \'fs:stat\'', [u'data_type'], True, False),
+        (u'parser contains \'WinReg\'', [u'parser'], False, True),
+        ((u'data_type is \'fs:stat\' and parser is \'filestat\' and '
+          u'filename contains \'Users\''), [u'data_type', u'parser'], True,
+         False),
+        ((u'(data_type is \'fs:stat\' and filename contains \'Users\') or '
+          u'data_type contains \'registry\''), [u'data_type'], True, True),
+        (u'parser inlist \'webhist\'', [u'parser'], False, False)]
+
+    for query, expected_attribute_names, filestat_result, winreg_result in (
+        test_queries):
+      event_predicate = self._GetEventPredicate(query)
+      self.assertIsNotNone(event_predicate)
+      self.assertEqual(
+          event_predicate.attribute_names, expected_attribute_names)
+
+      self.assertEqual(
+          event_predicate.MatchesAttributeValues(filestat_values),
+          filestat_result)
+      self.assertEqual(
+          event_predicate.MatchesAttributeValues(winreg_values),
+          winreg_result)
+
+    # Filters without conditions on summarized attributes or with negated
+    # conditions do not have an event predicate.
+    test_queries = [
+        u'filename contains \'Users\'',
+        u'data_type is \'fs:stat\' or filename contains \'Users\'',
+        u'data_type is not \'fs:stat\'',
+        u'data_type != \'fs:stat\'',
+        u'date > \'2015-11-18\'']
+
+    for query in test_queries:
+      event_predicate = self._GetEventPredicate(query)
+      self.assertIsNone(event_predicate)
+
+  def testGetTimeRange(self):
+    """Tests the GetTimeRange function."""
+    timestamp_2015 = timelib.Timestamp.CopyFromString(u'2015-01-01 00:00:00')
+    timestamp_2016 = timelib.Timestamp.CopyFromString(u'2016-01-01 00:00:00')
+    timestamp_2017 = timelib.Timestamp.CopyFromString(u'2017-01-01 00:00:00')
+
+    minimum_timestamp = filter_planner.FilterPlanner._MINIMUM_TIMESTAMP
+    maximum_timestamp = filter_planner.FilterPlanner._MAXIMUM_TIMESTAMP
+
+    test_queries = [
+        (u'date > \'2016-01-01\' and parser is \'filestat\'',
+         timestamp_2016, maximum_timestamp),
+        (u'date < \'2016-01-01\'', minimum_timestamp, timestamp_2016),
+        (u'date >= \'2015-01-01\' and date <= \'2017-01-01\' and '
+         u'date > \'2016-01-01\'', timestamp_2016, timestamp_2017),
+        (u'timestamp == {0:d}'.format(timestamp_2016), timestamp_2016,
+         timestamp_2016),
+        (u'(date > \'2015-01-01\' and date < \'2016-01-01\') or '
+         u'(date > \'2016-01-01\' and date < \'2017-01-01\')',
+         timestamp_2015, timestamp_2017),
+        (u'(date > \'2017-01-01\' and date < \'2015-01-01\') or '
+         u'date is \'2016-01-01\'', timestamp_2016, timestamp_2016)]
+
+    for query, expected_start_timestamp, expected_end_timestamp in (
+        test_queries):
+      test_time_range = self._GetTimeRange(query)
+      self.assertIsNotNone(test_time_range)
+      self.assertEqual(
+          test_time_range.start_timestamp, expected_start_timestamp)
+      self.assertEqual(test_time_range.end_timestamp, expected_end_timestamp)
+
+    # The time range of the filter query is limited to the time slice.
+    test_time_range = self._GetTimeRange(
+        u'date > \'2015-01-01\'', test_time_range=time_range.TimeRange(
+            minimum_timestamp, timestamp_2016))
+    self.assertEqual(test_time_range.start_timestamp, timestamp_2015)
+    self.assertEqual(test_time_range.end_timestamp, timestamp_2016)
+
+    # Filters that do not bound the timestamp do not have a time range.
+    test_queries = [
+        u'parser is \'filestat\'',
+        u'date > \'2016-01-01\' or parser is \'filestat\'',
+        u'date != \'2016-01-01\'',
+        u'date is not \'2016-01-01\'']
+
+    for query in test_queries:
+      test_time_range = self._GetTimeRange(query)
+      self.assertIsNone(test_time_range)
+
+
+if __name__ == '__main__':
+  unittest.main()
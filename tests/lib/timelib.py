@@ -535,5 +535,62 @@ class TimeLibTest(unittest.TestCase):
     self.assertEqual(timestamp, expected_timestamp)
 
 
+class TimezoneConverterTest(unittest.TestCase):
+  """Tests for the timezone converter."""
+
+  def testCopyToDatetime(self):
+    """Tests the CopyToDatetime function."""
+    for timezone_name in (u'UTC', u'CET', u'EST', u'America/New_York'):
+      timezone = pytz.timezone(timezone_name)
+      timezone_converter = timelib.TimezoneConverter(timezone)
+
+      for time_string in (
+          u'1601-01-01 00:00:00', u'1970-01-01 00:00:00',
+          u'2013-03-14 20:20:08.850041', u'2013-03-31 00:59:59',
+          u'2013-03-31 01:00:00', u'2013-10-27 00:59:59',
+          u'2013-10-27 01:00:00', u'2013-11-03 06:00:00',
+          u'2100-12-31 23:59:59'):
+        timestamp = timelib.Timestamp.CopyFromString(time_string)
+
+        expected_datetime_object = timelib.Timestamp.CopyToDatetime(
+            timestamp, timezone)
+        datetime_object = timezone_converter.CopyToDatetime(timestamp)
+        self.assertEqual(datetime_object, expected_datetime_object)
+        self.assertEqual(
+            datetime_object.isoformat(), expected_datetime_object.isoformat())
+        self.assertEqual(
+            datetime_object.tzname(), expected_datetime_object.tzname())
+
+    timezone_converter = timelib.TimezoneConverter(pytz.FixedOffset(90))
+    timestamp = timelib.Timestamp.CopyFromString(u'2013-03-14 20:20:08')
+    self.assertEqual(
+        timezone_converter.CopyToIsoFormat(timestamp),
+        u'2013-03-14T21:50:08+01:30')
+
+    timezone_converter = timelib.TimezoneConverter()
+    with self.assertRaises(OverflowError):
+      timezone_converter.CopyToDatetime(
+          timelib.Timestamp.TIMESTAMP_MAX_MICRO_SECONDS, raise_error=True)
+
+    datetime_object = timezone_converter.CopyToDatetime(
+        timelib.Timestamp.TIMESTAMP_MAX_MICRO_SECONDS)
+    self.assertEqual(
+        datetime_object, datetime.datetime(1970, 1, 1, tzinfo=pytz.UTC))
+
+  def testCopyToIsoFormat(self):
+    """Tests the CopyToIsoFormat function."""
+    timezone_converter = timelib.TimezoneConverter(pytz.timezone(u'CET'))
+
+    timestamp = timelib.Timestamp.CopyFromString(u'2013-03-14 20:20:08.850041')
+    self.assertEqual(
+        timezone_converter.CopyToIsoFormat(timestamp),
+        u'2013-03-14T21:20:08.850041+01:00')
+
+    timestamp = timelib.Timestamp.CopyFromString(u'2013-07-14 20:20:08')
+    self.assertEqual(
+        timezone_converter.CopyToIsoFormat(timestamp),
+        u'2013-07-14T22:20:08+02:00')
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -4,11 +4,52 @@
 
 import unittest
 
+from plaso.analysis import interface as analysis_interface
+from plaso.containers import events
 from plaso.multi_processing import analysis_process
 
 from tests import test_lib as shared_test_lib
 
 
+class TestAnalysisPlugin(analysis_interface.AnalysisPlugin):
+  """Class that defines an analysis plugin for testing."""
+
+  def __init__(self):
+    """Initializes an analysis plugin for testing."""
+    super(TestAnalysisPlugin, self).__init__()
+    self.data_types = []
+
+  def CompileReport(self, mediator):
+    """Compiles a report of the analysis.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+
+    Returns:
+      AnalysisReport: report, which will be None for testing.
+    """
+    return
+
+  def ExamineEvent(self, mediator, event):
+    """Analyzes an event object.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between
+          analysis plugins and other components, such as storage and dfvfs.
+      event (EventObject): event.
+    """
+    self.data_types.append(event.data_type)
+
+
+class TestFileStatAnalysisPlugin(TestAnalysisPlugin):
+  """Class that defines a file stat analysis plugin for testing."""
+
+  NAME = u'test_file_stat'
+
+  EVENT_DATA_TYPES = frozenset([u'fs:stat'])
+
+
 class AnalysisProcessTest(shared_test_lib.BaseTestCase):
   """Tests the multi-processing analysis process."""
 
@@ -29,8 +70,40 @@ class AnalysisProcessTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(status_attributes)
     self.assertEqual(status_attributes[u'identifier'], u'TestAnalysis')
 
+  def testGetAnalysisPluginsForDataType(self):
+    """Tests the _GetAnalysisPluginsForDataType function."""
+    analysis_plugin = TestAnalysisPlugin()
+    file_stat_analysis_plugin = TestFileStatAnalysisPlugin()
+    test_process = analysis_process.AnalysisProcess(
+        None, None, None, [analysis_plugin, file_stat_analysis_plugin],
+        name=u'TestAnalysis')
+
+    analysis_plugins = test_process._GetAnalysisPluginsForDataType(u'fs:stat')
+    self.assertEqual(
+        analysis_plugins, [analysis_plugin, file_stat_analysis_plugin])
+
+    analysis_plugins = test_process._GetAnalysisPluginsForDataType(
+        u'windows:registry:key_value')
+    self.assertEqual(analysis_plugins, [analysis_plugin])
+
   # TODO: add test for _Main.
-  # TODO: add test for _ProcessEvent.
+
+  def testProcessEvent(self):
+    """Tests the _ProcessEvent function."""
+    analysis_plugin = TestAnalysisPlugin()
+    file_stat_analysis_plugin = TestFileStatAnalysisPlugin()
+    test_process = analysis_process.AnalysisProcess(
+        None, None, None, [analysis_plugin, file_stat_analysis_plugin],
+        name=u'TestAnalysis')
+
+    for data_type in (u'fs:stat', u'windows:registry:key_value'):
+      event = events.EventObject()
+      event.data_type = data_type
+      test_process._ProcessEvent(None, event)
+
+    self.assertEqual(
+        analysis_plugin.data_types, [u'fs:stat', u'windows:registry:key_value'])
+    self.assertEqual(file_stat_analysis_plugin.data_types, [u'fs:stat'])
 
   def testSignalAbort(self):
     """Tests the SignalAbort function."""
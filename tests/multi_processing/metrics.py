@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests the processing metrics and the metrics HTTP server."""
+
+import unittest
+import urllib2
+
+from plaso.engine import processing_status
+from plaso.multi_processing import metrics
+
+from tests import test_lib as shared_test_lib
+
+
+class ProcessingMetricsTest(shared_test_lib.BaseTestCase):
+  """Tests the processing metrics."""
+
+  # pylint: disable=protected-access
+
+  def _CreateProcessingStatus(self):
+    """Creates a processing status.
+
+    Returns:
+      ProcessingStatus: processing status.
+    """
+    status = processing_status.ProcessingStatus()
+    status.UpdateWorkerStatus(
+        u'Worker_00', u'running', 1234, u'/tmp/test.txt', 2, 0, 0, 10, 0, 0,
+        0, 0)
+    return status
+
+  def testEscapeLabelValue(self):
+    """Tests the _EscapeLabelValue function."""
+    processing_metrics = metrics.ProcessingMetrics()
+
+    label_value = processing_metrics._EscapeLabelValue(u'a"b\\c\nd')
+    self.assertEqual(label_value, u'a\\"b\\\\c\\nd')
+
+  def testUpdate(self):
+    """Tests the Update and GetText functions."""
+    processing_metrics = metrics.ProcessingMetrics()
+    self.assertEqual(processing_metrics.GetText(), u'')
+
+    status = self._CreateProcessingStatus()
+
+    processing_metrics.Update(
+        status, events_per_parser={u'filestat': 10, u'total': 10},
+        memory_per_pid={1234: 4096}, number_of_processing_tasks=1,
+        number_of_queued_tasks=3, number_of_tasks_ready_for_merge=2,
+        timestamp=0.0)
+    processing_metrics.Update(
+        status, events_per_parser={u'filestat': 30, u'total': 30},
+        memory_per_pid={1234: 4096}, number_of_processing_tasks=1,
+        number_of_queued_tasks=3, number_of_tasks_ready_for_merge=2,
+        timestamp=10.0)
+
+    lines = processing_metrics.GetText().split(u'\n')
+
+    self.assertIn(
+        u'# TYPE plaso_parser_events_total counter', lines)
+    self.assertIn(
+        u'plaso_parser_events_total{parser="filestat"} 30.0', lines)
+    self.assertIn(
+        u'plaso_parser_events_per_second{parser="filestat"} 2.0', lines)
+    self.assertIn(
+        u'plaso_process_produced_events_total{process="Worker_00"} 10.0',
+        lines)
+    self.assertIn(
+        u'plaso_process_resident_memory_bytes{process="Worker_00"} 4096.0',
+        lines)
+    self.assertIn(u'plaso_tasks_queued 3.0', lines)
+    self.assertIn(u'plaso_tasks_processing 1.0', lines)
+    self.assertIn(u'plaso_merge_backlog_tasks 2.0', lines)
+
+    # The total is not exposed as a parser.
+    self.assertNotIn(
+        u'plaso_parser_events_total{parser="total"} 30.0', lines)
+
+
+class MetricsHTTPServerTest(shared_test_lib.BaseTestCase):
+  """Tests the metrics HTTP server."""
+
+  def testServeMetrics(self):
+    """Tests serving the metrics."""
+    processing_metrics = metrics.ProcessingMetrics()
+    processing_metrics.Update(
+        processing_status.ProcessingStatus(), number_of_queued_tasks=1)
+
+    http_server = metrics.MetricsHTTPServer(processing_metrics)
+    result = http_server.Start(u'localhost', 0)
+    self.assertTrue(result)
+
+    try:
+      url = u'http://localhost:{0:d}/metrics'.format(http_server.port)
+      response = urllib2.urlopen(url)
+      data = response.read()
+
+      self.assertEqual(
+          response.info().getheader(u'Content-Type'),
+          processing_metrics.content_type)
+      self.assertEqual(data, processing_metrics.GetText().encode(u'utf-8'))
+
+      url = u'http://localhost:{0:d}/unknown'.format(http_server.port)
+      with self.assertRaises(urllib2.HTTPError):
+        urllib2.urlopen(url)
+
+    finally:
+      http_server.Stop()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -9,6 +9,7 @@ import unittest
 from plaso.analysis import interface as analysis_interface
 from plaso.analysis import tagging
 from plaso.containers import events
+from plaso.containers import reports
 from plaso.containers import sessions
 from plaso.engine import knowledge_base
 from plaso.formatters import interface as formatters_interface
@@ -57,6 +58,33 @@ class TestAnalysisPlugin(analysis_interface.AnalysisPlugin):
     pass
 
 
+class TestSharedAnalysisPlugin(TestAnalysisPlugin):
+  """Class that defines a shared process analysis plugin for testing."""
+
+  ENABLE_IN_SHARED_PROCESS = True
+
+
+class TestIncrementalAnalysisPlugin(TestSharedAnalysisPlugin):
+  """Class that defines an incremental analysis plugin for testing."""
+
+  NAME = u'test_incremental'
+
+  ENABLE_INCREMENTAL_ANALYSIS = True
+
+  def __init__(self):
+    """Initializes an incremental analysis plugin for testing."""
+    super(TestIncrementalAnalysisPlugin, self).__init__()
+    self.merged_analysis_reports = []
+
+  def MergeAnalysisReport(self, analysis_report):
+    """Merges the report of a previous run into the state of the plugin.
+
+    Args:
+      analysis_report (AnalysisReport): report of a previous run.
+    """
+    self.merged_analysis_reports.append(analysis_report)
+
+
 class TestEvent(events.EventObject):
   """Class that defines an event for testing."""
 
@@ -237,6 +265,52 @@ class PsortMultiProcessEngineTest(shared_test_lib.BaseTestCase):
 
   # TODO: add test for _CheckStatusAnalysisProcess.
 
+  def testGetAnalysisPluginGroups(self):
+    """Tests the _GetAnalysisPluginGroups function."""
+    analysis_plugin = TestAnalysisPlugin()
+    shared_analysis_plugin1 = TestSharedAnalysisPlugin()
+    shared_analysis_plugin2 = TestSharedAnalysisPlugin()
+    analysis_plugins = [
+        shared_analysis_plugin1, analysis_plugin, shared_analysis_plugin2]
+
+    test_engine = psort.PsortMultiProcessEngine()
+    analysis_plugin_groups = test_engine._GetAnalysisPluginGroups(
+        analysis_plugins)
+
+    expected_analysis_plugin_groups = [
+        [shared_analysis_plugin1], [analysis_plugin],
+        [shared_analysis_plugin2]]
+    self.assertEqual(analysis_plugin_groups, expected_analysis_plugin_groups)
+
+    test_engine = psort.PsortMultiProcessEngine(
+        use_shared_analysis_process=True)
+    analysis_plugin_groups = test_engine._GetAnalysisPluginGroups(
+        analysis_plugins)
+
+    expected_analysis_plugin_groups = [
+        [shared_analysis_plugin1, shared_analysis_plugin2], [analysis_plugin]]
+    self.assertEqual(analysis_plugin_groups, expected_analysis_plugin_groups)
+
+    incremental_analysis_plugin = TestIncrementalAnalysisPlugin()
+    analysis_plugins.append(incremental_analysis_plugin)
+
+    test_engine._analysis_high_water_marks = {u'test_incremental': [6]}
+    analysis_plugin_groups = test_engine._GetAnalysisPluginGroups(
+        analysis_plugins)
+
+    expected_analysis_plugin_groups = [
+        [shared_analysis_plugin1, shared_analysis_plugin2],
+        [incremental_analysis_plugin], [analysis_plugin]]
+    self.assertEqual(analysis_plugin_groups, expected_analysis_plugin_groups)
+
+  def testGetAnalysisTaskIdentifier(self):
+    """Tests the _GetAnalysisTaskIdentifier function."""
+    test_engine = psort.PsortMultiProcessEngine()
+
+    task_identifier = test_engine._GetAnalysisTaskIdentifier([
+        TestAnalysisPlugin(), TestSharedAnalysisPlugin()])
+    self.assertEqual(task_identifier, u'analysis_plugin+analysis_plugin')
+
   def testInternalExportEvents(self):
     """Tests the _ExportEvents function."""
     knowledge_base_object = knowledge_base.KnowledgeBase()
@@ -283,6 +357,54 @@ class PsortMultiProcessEngineTest(shared_test_lib.BaseTestCase):
         b'date,time,timezone,MACB,source,sourcetype,type,user,host,short,desc,'
         b'version,filename,inode,notes,format,extra'))
 
+  def testReadAnalysisHighWaterMarks(self):
+    """Tests the _ReadAnalysisHighWaterMarks function."""
+    analysis_plugin = TestAnalysisPlugin()
+    incremental_analysis_plugin = TestIncrementalAnalysisPlugin()
+    analysis_plugins = [analysis_plugin, incremental_analysis_plugin]
+
+    test_engine = psort.PsortMultiProcessEngine()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, u'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      session = sessions.Session()
+      storage_writer = storage_zip_file.ZIPStorageFileWriter(
+          session, temp_file)
+
+      analysis_high_water_marks = test_engine._ReadAnalysisHighWaterMarks(
+          storage_writer, analysis_plugins)
+      self.assertEqual(analysis_high_water_marks, {})
+      self.assertEqual(incremental_analysis_plugin.merged_analysis_reports, [])
+
+      storage_writer.Open()
+      storage_writer.WriteSessionStart()
+
+      for plugin_name in (u'analysis_plugin', u'test_incremental'):
+        analysis_report = reports.AnalysisReport(
+            plugin_name=plugin_name, text=u'test report')
+        storage_writer.AddAnalysisReport(analysis_report)
+        storage_writer.SetAnalysisHighWaterMarks(plugin_name, [6])
+
+      storage_writer.WriteSessionCompletion()
+      storage_writer.Close()
+
+      session = sessions.Session()
+      storage_writer = storage_zip_file.ZIPStorageFileWriter(
+          session, temp_file)
+
+      analysis_high_water_marks = test_engine._ReadAnalysisHighWaterMarks(
+          storage_writer, analysis_plugins)
+
+    self.assertEqual(analysis_high_water_marks, {u'test_incremental': [6]})
+
+    merged_analysis_reports = (
+        incremental_analysis_plugin.merged_analysis_reports)
+    self.assertEqual(len(merged_analysis_reports), 1)
+    self.assertEqual(
+        merged_analysis_reports[0].plugin_name, u'test_incremental')
+
   # TODO: add test for _StartAnalysisProcesses.
   # TODO: add test for _StatusUpdateThreadMain.
   # TODO: add test for _StopAnalysisProcesses.
@@ -0,0 +1,104 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the remote worker host."""
+
+import os
+import unittest
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import sessions
+from plaso.containers import tasks
+from plaso.engine import knowledge_base
+from plaso.engine import plaso_queue
+from plaso.engine import zeromq_queue
+from plaso.lib import errors
+from plaso.multi_processing import remote_worker
+from plaso.storage import zip_file as storage_zip_file
+
+from tests import test_lib as shared_test_lib
+
+
+class RemoteWorkerHostTest(shared_test_lib.BaseTestCase):
+  """Tests for the remote worker host."""
+
+  _NUMBER_OF_WORKER_PROCESSES = 2
+
+  def testProcessTasks(self):
+    """Tests the ProcessTasks function with worker processes on localhost."""
+    session = sessions.Session()
+
+    # The queues represent those of the foreman.
+    task_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
+        delay_open=False, linger_seconds=0, name=u'test_task_queue',
+        timeout_seconds=10)
+    task_storage_queue = zeromq_queue.ZeroMQPullBindQueue(
+        delay_open=False, linger_seconds=0, name=u'test_task_storage_queue',
+        timeout_seconds=10)
+
+    task_identifiers = set()
+    for filename in (u'syslog', u'syslog_copy', u'syslog_rsyslog'):
+      test_file = self._GetTestFilePath([filename])
+      path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file)
+
+      task = tasks.Task(session_identifier=session.identifier)
+      task.path_spec = path_spec
+      task_queue.PushItem(task)
+      task_identifiers.add(task.identifier)
+
+    for _ in range(self._NUMBER_OF_WORKER_PROCESSES):
+      task_queue.PushItem(plaso_queue.QueueAbort())
+
+    test_host = remote_worker.RemoteWorkerHost(
+        u'127.0.0.1', task_queue.port, task_storage_queue.port)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_host.ProcessTasks(
+          session.identifier, knowledge_base.KnowledgeBase(),
+          number_of_worker_processes=self._NUMBER_OF_WORKER_PROCESSES,
+          parser_filter_expression=u'syslog', preferred_year=2012,
+          temporary_directory=temp_directory)
+
+      # No task storage should remain on the worker host.
+      self.assertEqual(os.listdir(temp_directory), [])
+
+      temp_file = os.path.join(temp_directory, u'storage.plaso')
+      storage_writer = storage_zip_file.ZIPStorageFileWriter(
+          session, temp_file)
+      storage_writer.Open()
+      storage_writer.StartTaskStorage()
+
+      heartbeat_task_identifiers = set()
+      received_task_identifiers = set()
+      while len(received_task_identifiers) < len(task_identifiers):
+        try:
+          task_identifier, task_storage_data = task_storage_queue.PopItem()
+        except errors.QueueEmpty:
+          break
+
+        # A heartbeat is sent when a worker process starts processing a task.
+        if task_storage_data is None:
+          heartbeat_task_identifiers.add(task_identifier)
+          continue
+
+        self.assertIn(task_identifier, heartbeat_task_identifiers)
+
+        storage_writer.PrepareMergeTaskStorageData(
+            task_identifier, task_storage_data)
+        self.assertTrue(storage_writer.MergeTaskStorage(task_identifier))
+        received_task_identifiers.add(task_identifier)
+
+      storage_writer.StopTaskStorage()
+      storage_writer.Close()
+
+    task_queue.Close(abort=True)
+    task_storage_queue.Close(abort=True)
+
+    self.assertEqual(received_task_identifiers, task_identifiers)
+    self.assertEqual(storage_writer.number_of_events, 34)
+
+
+if __name__ == '__main__':
+  unittest.main()
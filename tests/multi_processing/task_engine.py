@@ -8,14 +8,82 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
 from plaso.containers import sessions
+from plaso.engine import plaso_queue
+from plaso.lib import errors
 from plaso.multi_processing import task_engine
 from plaso.storage import zip_file as storage_zip_file
 from tests import test_lib as shared_test_lib
 
 
+class TestTaskStorageQueue(plaso_queue.Queue):
+  """Task storage queue for testing the task storage receiver thread."""
+
+  def __init__(self, test_engine, items):
+    """Initializes a task storage queue.
+
+    Args:
+      test_engine (TaskMultiProcessEngine): engine that receives the items.
+      items (list[tuple[str, bytes]]): task identifier and task storage data
+          items.
+    """
+    super(TestTaskStorageQueue, self).__init__()
+    self._items = list(items)
+    self._test_engine = test_engine
+
+  def Close(self, abort=False):
+    """Closes the queue."""
+    return
+
+  def IsEmpty(self):
+    """Determines if the queue is empty."""
+    return not self._items
+
+  def Open(self):
+    """Opens the queue."""
+    return
+
+  def PopItem(self):
+    """Pops an item off the queue and stops the receiver when empty."""
+    if not self._items:
+      self._test_engine._task_storage_receiver_active = False
+      raise errors.QueueEmpty()
+
+    return self._items.pop(0)
+
+  def PushItem(self, item, block=True):
+    """Pushes an item on to the queue."""
+    self._items.append(item)
+
+
+class TestStorageWriter(object):
+  """Storage writer for testing the task storage receiver thread."""
+
+  def __init__(self):
+    """Initializes a storage writer."""
+    super(TestStorageWriter, self).__init__()
+    self.prepared_task_identifiers = []
+
+  def PrepareMergeTaskStorageData(self, task_identifier, task_storage_data):
+    """Prepares task storage data for merging.
+
+    Args:
+      task_identifier (str): identifier of the task.
+      task_storage_data (bytes): task storage data.
+
+    Raises:
+      IOError: if the task storage data is not valid.
+    """
+    if task_storage_data == b'invalid':
+      raise IOError(u'Invalid task storage data.')
+
+    self.prepared_task_identifiers.append(task_identifier)
+
+
 class TaskMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task multi-process engine."""
 
+  # pylint: disable=protected-access
+
   def testProcessSources(self):
     """Tests the PreprocessSources and ProcessSources function."""
     test_engine = task_engine.TaskMultiProcessEngine(
@@ -45,6 +113,63 @@ class TaskMultiProcessEngineTest(shared_test_lib.BaseTestCase):
     # on multi-process primitives e.g. by writing to a file.
     # self.assertEqual(len(storage_writer.events), 15)
 
+  def testRescheduleTaskOfWorkerProcess(self):
+    """Tests the _RescheduleTaskOfWorkerProcess function."""
+    test_engine = task_engine.TaskMultiProcessEngine(
+        maximum_number_of_tasks=100)
+
+    session = sessions.Session()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, u'storage.plaso')
+      storage_writer = storage_zip_file.ZIPStorageFileWriter(
+          session, temp_file)
+      storage_writer.StartTaskStorage()
+
+      test_engine._storage_writer = storage_writer
+
+      task = test_engine._task_manager.CreateTask(session.identifier)
+      test_engine._task_manager.ScheduleTask(task.identifier)
+
+      # A worker process without a task.
+      test_engine._RescheduleTaskOfWorkerProcess(1)
+      self.assertEqual(len(test_engine._tasks_to_reschedule), 0)
+
+      test_engine._task_identifier_per_pid[1] = task.identifier
+      test_engine._RescheduleTaskOfWorkerProcess(1)
+      self.assertEqual(len(test_engine._tasks_to_reschedule), 1)
+      self.assertEqual(
+          test_engine._tasks_to_reschedule[0].identifier, task.identifier)
+      self.assertNotIn(1, test_engine._task_identifier_per_pid)
+
+      storage_writer.StopTaskStorage(abort=True)
+
+  def testTaskStorageReceiverThreadMain(self):
+    """Tests the _TaskStorageReceiverThreadMain function."""
+    test_engine = task_engine.TaskMultiProcessEngine(
+        maximum_number_of_tasks=100)
+
+    session = sessions.Session()
+    first_task = test_engine._task_manager.CreateTask(session.identifier)
+    test_engine._task_manager.ScheduleTask(first_task.identifier)
+    second_task = test_engine._task_manager.CreateTask(session.identifier)
+    test_engine._task_manager.ScheduleTask(second_task.identifier)
+
+    storage_writer = TestStorageWriter()
+    test_engine._storage_writer = storage_writer
+    test_engine._task_storage_queue = TestTaskStorageQueue(test_engine, [
+        (first_task.identifier, None),
+        (first_task.identifier, b'invalid'),
+        (u'untracked', b'data'),
+        (second_task.identifier, b'data')])
+
+    # The receiver keeps running after failing to prepare task storage.
+    test_engine._task_storage_receiver_active = True
+    test_engine._TaskStorageReceiverThreadMain()
+
+    self.assertEqual(
+        storage_writer.prepared_task_identifiers, [second_task.identifier])
+
 
 if __name__ == '__main__':
   unittest.main()
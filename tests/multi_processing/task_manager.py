@@ -0,0 +1,64 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the task manager."""
+
+import unittest
+
+from plaso.multi_processing import task_manager
+
+from tests import test_lib as shared_test_lib
+
+
+class TaskManagerTest(shared_test_lib.BaseTestCase):
+  """Tests for the task manager."""
+
+  # pylint: disable=protected-access
+
+  _TEST_SESSION_IDENTIFIER = u'4cc4ba4c12fd4b1a93f3bca4e1e4fe3d'
+
+  def testCompleteTask(self):
+    """Tests the CompleteTask function."""
+    manager = task_manager.TaskManager()
+
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    manager.ScheduleTask(task.identifier)
+    self.assertTrue(manager.HasScheduledTasks())
+
+    manager.CompleteTask(task.identifier)
+    self.assertFalse(manager.HasScheduledTasks())
+
+    with self.assertRaises(KeyError):
+      manager.CompleteTask(task.identifier)
+
+  def testUpdateTask(self):
+    """Tests the UpdateTask function."""
+    manager = task_manager.TaskManager()
+
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+
+    with self.assertRaises(KeyError):
+      manager.UpdateTask(task.identifier)
+
+    manager.ScheduleTask(task.identifier)
+    manager.UpdateTask(task.identifier)
+    self.assertEqual(manager.GetScheduledTask(task.identifier), task)
+
+    # Abandon the task by considering every task inactive.
+    manager._TASK_INACTIVE_TIME = 0
+    self.assertFalse(manager.HasScheduledTasks())
+    self.assertIsNone(manager.GetScheduledTask(task.identifier))
+    self.assertEqual(manager.GetAbandonedTasks(), [task])
+
+    # Updating an abandoned task schedules it again.
+    manager._TASK_INACTIVE_TIME = task_manager.TaskManager._TASK_INACTIVE_TIME
+    manager.UpdateTask(task.identifier)
+    self.assertEqual(manager.GetScheduledTask(task.identifier), task)
+    self.assertEqual(manager.GetAbandonedTasks(), [])
+    self.assertTrue(manager.HasScheduledTasks())
+
+    manager.CompleteTask(task.identifier)
+    self.assertFalse(manager.HasScheduledTasks())
+
+
+if __name__ == '__main__':
+  unittest.main()
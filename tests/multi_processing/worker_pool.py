@@ -0,0 +1,162 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the adaptive worker pool controller."""
+
+import unittest
+
+from plaso.multi_processing import worker_pool
+
+from tests import test_lib as shared_test_lib
+
+
+class WorkerPoolControllerTest(shared_test_lib.BaseTestCase):
+  """Tests for the adaptive worker pool controller."""
+
+  # pylint: disable=protected-access
+
+  def _SampleWorkerProcesses(
+      self, controller, number_of_worker_processes, number_of_produced_events,
+      memory_usage, timestamp):
+    """Samples worker processes with the same status.
+
+    Args:
+      controller (WorkerPoolController): worker pool controller.
+      number_of_worker_processes (int): number of worker processes.
+      number_of_produced_events (int): number of events produced by every
+          worker process.
+      memory_usage (float): memory usage of every worker process.
+      timestamp (float): POSIX timestamp of the sample.
+    """
+    for worker_number in range(number_of_worker_processes):
+      controller.SampleWorkerProcess(
+          u'Worker_{0:02d}'.format(worker_number), number_of_produced_events,
+          memory_usage, timestamp=timestamp)
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    controller = worker_pool.WorkerPoolController(
+        2, maximum_number_of_worker_processes=4)
+    self.assertEqual(controller.number_of_worker_processes, 2)
+
+    with self.assertRaises(ValueError):
+      worker_pool.WorkerPoolController(0)
+
+    with self.assertRaises(ValueError):
+      worker_pool.WorkerPoolController(
+          4, maximum_number_of_worker_processes=2)
+
+  def testGetNumberOfWorkerProcessesScaleUp(self):
+    """Tests the GetNumberOfWorkerProcesses function scaling up."""
+    controller = worker_pool.WorkerPoolController(
+        2, maximum_number_of_worker_processes=3, maximum_memory_usage=50.0)
+    interval = controller._ADJUSTMENT_INTERVAL
+
+    self._SampleWorkerProcesses(controller, 2, 0, 10.0, 0.0)
+    self.assertEqual(controller.GetNumberOfWorkerProcesses(timestamp=0.0), 2)
+
+    # No adjustment within the adjustment interval.
+    self._SampleWorkerProcesses(controller, 2, 1000, 10.0, interval / 2)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval / 2), 2)
+
+    self._SampleWorkerProcesses(controller, 2, 2000, 10.0, interval)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval), 3)
+
+    # The event rate improved, but the maximum has been reached.
+    self._SampleWorkerProcesses(controller, 3, 6000, 10.0, interval * 2)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval * 2), 3)
+
+  def testGetNumberOfWorkerProcessesIdle(self):
+    """Tests the GetNumberOfWorkerProcesses function with idle workers."""
+    controller = worker_pool.WorkerPoolController(
+        2, maximum_number_of_worker_processes=4)
+    interval = controller._ADJUSTMENT_INTERVAL
+
+    self._SampleWorkerProcesses(controller, 2, 0, 10.0, 0.0)
+    controller.GetNumberOfWorkerProcesses(timestamp=0.0)
+
+    self._SampleWorkerProcesses(controller, 2, 0, 10.0, interval)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval), 2)
+
+  def testGetNumberOfWorkerProcessesMemoryUsage(self):
+    """Tests the GetNumberOfWorkerProcesses function with memory usage."""
+    controller = worker_pool.WorkerPoolController(
+        3, maximum_number_of_worker_processes=4, maximum_memory_usage=50.0)
+    interval = controller._ADJUSTMENT_INTERVAL
+
+    self._SampleWorkerProcesses(controller, 3, 0, 15.0, 0.0)
+    controller.GetNumberOfWorkerProcesses(timestamp=0.0)
+
+    # An additional worker process is expected to exceed the maximum.
+    self._SampleWorkerProcesses(controller, 3, 1000, 15.0, interval)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval), 3)
+
+    self._SampleWorkerProcesses(controller, 3, 2000, 20.0, interval * 2)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval * 2), 2)
+
+    controller.RemoveWorkerProcess(u'Worker_02')
+    self._SampleWorkerProcesses(controller, 2, 3000, 30.0, interval * 3)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval * 3), 1)
+
+    # The minimum number of worker processes is not exceeded.
+    controller.RemoveWorkerProcess(u'Worker_01')
+    self._SampleWorkerProcesses(controller, 1, 4000, 60.0, interval * 4)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval * 4), 1)
+
+  def testGetNumberOfWorkerProcessesNoImprovement(self):
+    """Tests the GetNumberOfWorkerProcesses function without improvement."""
+    controller = worker_pool.WorkerPoolController(
+        2, maximum_number_of_worker_processes=4)
+    interval = controller._ADJUSTMENT_INTERVAL
+
+    self._SampleWorkerProcesses(controller, 2, 0, 10.0, 0.0)
+    controller.GetNumberOfWorkerProcesses(timestamp=0.0)
+
+    self._SampleWorkerProcesses(controller, 2, 3000, 10.0, interval)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval), 3)
+
+    # The additional worker process did not improve the combined event rate.
+    self._SampleWorkerProcesses(controller, 3, 5000, 10.0, interval * 2)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval * 2), 2)
+
+    # The increase is not retried immediately.
+    controller.RemoveWorkerProcess(u'Worker_02')
+    self._SampleWorkerProcesses(controller, 2, 8000, 10.0, interval * 3)
+    self.assertEqual(
+        controller.GetNumberOfWorkerProcesses(timestamp=interval * 3), 2)
+
+  def testSampleWorkerProcess(self):
+    """Tests the SampleWorkerProcess function."""
+    controller = worker_pool.WorkerPoolController(1)
+
+    controller.SampleWorkerProcess(u'Worker_00', None, 10.0, timestamp=0.0)
+    controller.SampleWorkerProcess(u'Worker_00', 1000, 12.0, timestamp=10.0)
+
+    event_rate, memory_usage, number_of_samples = (
+        controller._GetEventRateAndMemoryUsage())
+    self.assertEqual(event_rate, 100.0)
+    self.assertEqual(memory_usage, 12.0)
+    self.assertEqual(number_of_samples, 1)
+
+    # The event rate is determined over the samples since the previous
+    # determination.
+    controller.SampleWorkerProcess(u'Worker_00', 1500, 12.0, timestamp=20.0)
+    event_rate, _, _ = controller._GetEventRateAndMemoryUsage()
+    self.assertEqual(event_rate, 50.0)
+
+    controller.RemoveWorkerProcess(u'Worker_00')
+    _, _, number_of_samples = controller._GetEventRateAndMemoryUsage()
+    self.assertEqual(number_of_samples, 0)
+
+
+if __name__ == '__main__':
+  unittest.main()
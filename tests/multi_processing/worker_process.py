@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the multi-processing worker process."""
 
+import os
 import unittest
 
 from plaso.multi_processing import worker_process
@@ -29,6 +30,18 @@ class WorkerProcessTest(shared_test_lib.BaseTestCase):
     self.assertIsNotNone(status_attributes)
     self.assertEqual(status_attributes[u'identifier'], u'TestWorker')
 
+  def testIsMemoryLimitExceeded(self):
+    """Tests the _IsMemoryLimitExceeded function."""
+    test_process = worker_process.WorkerProcess(
+        None, None, None, None, memory_limit=1, name=u'TestWorker')
+    test_process._pid = os.getpid()
+    self.assertTrue(test_process._IsMemoryLimitExceeded())
+
+    test_process = worker_process.WorkerProcess(
+        None, None, None, None, memory_limit=2 ** 62, name=u'TestWorker')
+    test_process._pid = os.getpid()
+    self.assertFalse(test_process._IsMemoryLimitExceeded())
+
   # TODO: add test for _Main.
   # TODO: add test for _ProcessPathSpec.
   # TODO: add test for _ProcessTask.
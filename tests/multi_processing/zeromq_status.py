@@ -0,0 +1,111 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests the ZeroMQ process status publisher and subscriber."""
+
+import time
+import unittest
+
+from plaso.multi_processing import zeromq_status
+
+from tests import test_lib as shared_test_lib
+
+
+class ZeroMQProcessStatusTest(shared_test_lib.BaseTestCase):
+  """Tests the ZeroMQ process status publisher and subscriber."""
+
+  # pylint: disable=protected-access
+
+  _PID = 1234
+
+  def _GetStatus(self):
+    """Retrieves the status.
+
+    Returns:
+      dict[str, object]: status attributes, indexed by name.
+    """
+    return {
+        u'number_of_produced_events': 5,
+        u'processing_status': u'running'}
+
+  def _WaitForStatus(self, subscriber, pid):
+    """Waits for the status of a process to be received.
+
+    Args:
+      subscriber (ZeroMQProcessStatusSubscriber): process status subscriber.
+      pid (int): process identifier (PID).
+
+    Returns:
+      dict[str, object]: status attributes, indexed by name, or None if
+          no status was received within 5 seconds.
+    """
+    for _ in range(50):
+      status = subscriber.GetStatus(pid)
+      if status:
+        return status
+      time.sleep(0.1)
+
+  def testPublishStatus(self):
+    """Tests publishing and receiving the status."""
+    subscriber = zeromq_status.ZeroMQProcessStatusSubscriber()
+    subscriber.Start()
+
+    try:
+      self.assertIsNotNone(subscriber.port)
+      self.assertIsNone(subscriber.GetStatus(self._PID))
+
+      publisher = zeromq_status.ZeroMQProcessStatusPublisher(
+          self._GetStatus, self._PID)
+      result = publisher.Start(u'localhost', subscriber.port)
+      self.assertTrue(result)
+
+      try:
+        status = self._WaitForStatus(subscriber, self._PID)
+      finally:
+        publisher.Stop()
+
+      expected_status = {
+          u'number_of_produced_events': 5,
+          u'processing_status': u'running'}
+      self.assertEqual(status, expected_status)
+
+      subscriber.RemoveStatus(self._PID)
+      self.assertIsNone(subscriber.GetStatus(self._PID))
+
+    finally:
+      subscriber.Stop()
+
+  def testResetStatus(self):
+    """Tests the ResetStatus function and the maximum status age."""
+    subscriber = zeromq_status.ZeroMQProcessStatusSubscriber()
+    subscriber._MAXIMUM_STATUS_AGE = 0.5
+    subscriber.Start()
+
+    try:
+      self.assertIsNone(subscriber.GetStatus(self._PID))
+
+      # A process that has not published its status yet has an empty status.
+      subscriber.ResetStatus(self._PID)
+      self.assertEqual(subscriber.GetStatus(self._PID), {})
+
+      publisher = zeromq_status.ZeroMQProcessStatusPublisher(
+          self._GetStatus, self._PID)
+      result = publisher.Start(u'localhost', subscriber.port)
+      self.assertTrue(result)
+
+      try:
+        status = self._WaitForStatus(subscriber, self._PID)
+      finally:
+        publisher.Stop()
+
+      self.assertIsNotNone(status)
+
+      # The status of a process that stopped publishing becomes outdated.
+      time.sleep(1.0)
+      self.assertIsNone(subscriber.GetStatus(self._PID))
+
+    finally:
+      subscriber.Stop()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the Elasticsearch output module."""
 
+import json
 import unittest
 
 from mock import MagicMock
@@ -11,6 +12,7 @@ from plaso.lib import eventdata
 from plaso.lib import timelib
 from plaso.output import elastic
 
+from tests import test_lib as shared_test_lib
 from tests.output import test_lib
 
 
@@ -37,6 +39,130 @@ class ElasticTestEvent(events.EventObject):
     self.timestamp = event_timestamp
 
 
+class ElasticSearchBulkIndexerTest(shared_test_lib.BaseTestCase):
+  """Tests for the Elasticsearch bulk indexer."""
+
+  def _CreateBulkResponse(self, body, rejected_status=None):
+    """Creates a bulk API response.
+
+    Args:
+      body (bytes): body of the bulk request.
+      rejected_status (Optional[int]): HTTP status of the first document,
+          where None indicates that all documents were indexed.
+
+    Returns:
+      str: JSON serialized bulk API response.
+    """
+    lines = body.decode(u'utf-8').split(u'\n')
+    number_of_documents = len([line for line in lines if line]) // 2
+
+    items = []
+    for document_index in range(number_of_documents):
+      status = 201
+      if document_index == 0 and rejected_status:
+        status = rejected_status
+      items.append({u'index': {u'status': status}})
+
+    return json.dumps({u'errors': bool(rejected_status), u'items': items})
+
+  def testAddDocument(self):
+    """Tests the AddDocument and Close functions."""
+    def ResponseCallback(unused_method, unused_path, body):
+      """Accepts all documents."""
+      return 200, self._CreateBulkResponse(body)
+
+    with shared_test_lib.StandInHTTPServer(ResponseCallback) as http_server:
+      indexer = elastic.ElasticSearchBulkIndexer(
+          http_server.url, bulk_size=512, number_of_threads=2)
+
+      for number in range(0, 100):
+        indexer.AddDocument(
+            u'test', u'test_type', {u'number': number, u'text': u'x' * 32})
+      indexer.Close()
+
+    statistics = indexer.GetStatistics()
+    self.assertEqual(statistics[u'documents_indexed'], 100)
+    self.assertEqual(statistics[u'documents_failed'], 0)
+    self.assertEqual(statistics[u'retries'], 0)
+    self.assertGreater(statistics[u'bulk_requests'], 1)
+
+    for method, path, body in http_server.requests:
+      self.assertEqual(method, u'POST')
+      self.assertEqual(path, u'/_bulk')
+      self.assertLessEqual(len(body), 512)
+
+  def testAddDocumentWithMaximumNumberOfDocuments(self):
+    """Tests the AddDocument function with a maximum number of documents."""
+    def ResponseCallback(unused_method, unused_path, body):
+      """Accepts all documents."""
+      return 200, self._CreateBulkResponse(body)
+
+    with shared_test_lib.StandInHTTPServer(ResponseCallback) as http_server:
+      indexer = elastic.ElasticSearchBulkIndexer(
+          http_server.url, maximum_number_of_documents=10)
+
+      for number in range(0, 25):
+        indexer.AddDocument(u'test', u'test_type', {u'number': number})
+      indexer.Close()
+
+    statistics = indexer.GetStatistics()
+    self.assertEqual(statistics[u'documents_indexed'], 25)
+    self.assertEqual(statistics[u'bulk_requests'], 3)
+
+  def testRetry(self):
+    """Tests retrying rejected bulk requests and documents."""
+    responses = [u'too_many_requests', u'rejected_document']
+
+    def ResponseCallback(unused_method, unused_path, body):
+      """Rejects the first request and the first document of the second."""
+      if not responses:
+        return 200, self._CreateBulkResponse(body)
+
+      response = responses.pop(0)
+      if response == u'too_many_requests':
+        return 429, u'{}'
+
+      return 200, self._CreateBulkResponse(body, rejected_status=429)
+
+    with shared_test_lib.StandInHTTPServer(ResponseCallback) as http_server:
+      indexer = elastic.ElasticSearchBulkIndexer(
+          http_server.url, number_of_threads=1, retry_delay=0.01)
+
+      for number in range(0, 5):
+        indexer.AddDocument(u'test', u'test_type', {u'number': number})
+      indexer.Close()
+
+    statistics = indexer.GetStatistics()
+    self.assertEqual(statistics[u'documents_indexed'], 5)
+    self.assertEqual(statistics[u'documents_failed'], 0)
+    self.assertEqual(statistics[u'retries'], 2)
+
+    # The third request should only contain the rejected document.
+    _, _, body = http_server.requests[2]
+    self.assertEqual(len(body.splitlines()), 2)
+
+  def testRetryMaximum(self):
+    """Tests giving up after the maximum number of retries."""
+    def ResponseCallback(unused_method, unused_path, unused_body):
+      """Rejects all requests."""
+      return 429, u'{}'
+
+    with shared_test_lib.StandInHTTPServer(ResponseCallback) as http_server:
+      indexer = elastic.ElasticSearchBulkIndexer(
+          http_server.url, maximum_retries=2, number_of_threads=1,
+          retry_delay=0.01)
+
+      for number in range(0, 5):
+        indexer.AddDocument(u'test', u'test_type', {u'number': number})
+      indexer.Close()
+
+    statistics = indexer.GetStatistics()
+    self.assertEqual(statistics[u'documents_indexed'], 0)
+    self.assertEqual(statistics[u'documents_failed'], 5)
+    self.assertEqual(statistics[u'retries'], 2)
+    self.assertEqual(len(http_server.requests), 3)
+
+
 class ElasticSearchHelperTest(test_lib.OutputModuleTestCase):
   """Tests for the Elasticsearch helper class."""
 
@@ -2,10 +2,14 @@
 # -*- coding: utf-8 -*-
 """Tests for the event buffer."""
 
+import os
 import unittest
 
+from plaso.containers import events
 from plaso.output import event_buffer
+from plaso.output import interface
 
+from tests import test_lib as shared_test_lib
 from tests.cli import test_lib as cli_test_lib
 from tests.output import test_lib
 
@@ -33,6 +37,31 @@ class TestEvent(object):
     return u';'.join(map(str, [self.timestamp, self.entry]))
 
 
+class TestEventsOutputModule(interface.OutputModule):
+  """Test output module that stores the events it writes."""
+
+  NAME = u'test_events'
+  DESCRIPTION = u'Test output that stores the events.'
+
+  def __init__(self, output_mediator):
+    """Initializes the output module object.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfvfs.
+    """
+    super(TestEventsOutputModule, self).__init__(output_mediator)
+    self.events = []
+
+  def WriteEventBody(self, event):
+    """Writes the body of an event to the output.
+
+    Args:
+      event (EventObject): event.
+    """
+    self.events.append(event)
+
+
 class EventBufferTest(test_lib.OutputModuleTestCase):
   """Tests the event buffer."""
 
@@ -50,6 +79,102 @@ class EventBufferTest(test_lib.OutputModuleTestCase):
 
     self.assertEqual(len(event_buffer_object._events_per_key), expected_length)
 
+  def _CreateTestEvent(self, timestamp, store_index, text, filename):
+    """Creates a test event.
+
+    Args:
+      timestamp (int): timestamp of the event.
+      store_index (int): store index of the event.
+      text (str): text of the event.
+      filename (str): name of the file related to the event.
+
+    Returns:
+      EventObject: event.
+    """
+    event = events.EventObject()
+    event.data_type = u'test:event'
+    event.filename = filename
+    event.store_index = store_index
+    event.store_number = 1
+    event.text = text
+    event.timestamp = timestamp
+    event.timestamp_desc = u'Test Time'
+    return event
+
+  def testAppendWithSpill(self):
+    """Tests the Append function with events spilled to a temporary file."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = TestEventsOutputModule(output_mediator)
+
+    with shared_test_lib.TempDirectory() as temporary_directory:
+      event_buffer_object = event_buffer.EventBuffer(
+          output_module, maximum_number_of_buffered_events=2,
+          temporary_directory=temporary_directory)
+
+      test_values = [
+          (5, u'first', u'/a'), (4, u'second', u'/b'), (3, u'first', u'/c'),
+          (2, u'third', u'/d'), (1, u'second', u'/e')]
+      for store_index, text, filename in test_values:
+        event = self._CreateTestEvent(123456, store_index, text, filename)
+        event_buffer_object.Append(event)
+
+      self.assertEqual(event_buffer_object.peak_number_of_buffered_events, 2)
+      self.assertEqual(event_buffer_object.number_of_spilled_events, 4)
+      self.assertEqual(len(os.listdir(temporary_directory)), 2)
+
+      event = self._CreateTestEvent(123457, 6, u'fourth', u'/f')
+      event_buffer_object.Append(event)
+
+      self.assertEqual(event_buffer_object.duplicate_counter, 2)
+      self.assertEqual(event_buffer_object.number_of_spilled_events, 5)
+      self.assertEqual(os.listdir(temporary_directory), [])
+
+      event_buffer_object.End()
+
+    self.assertEqual(len(output_module.events), 4)
+
+    event = output_module.events[0]
+    self.assertEqual(event.store_index, 1)
+    self.assertEqual(event.text, u'second')
+    self.assertEqual(event.filename, u'/b;/e')
+
+    event = output_module.events[1]
+    self.assertEqual(event.store_index, 2)
+    self.assertEqual(event.text, u'third')
+
+    event = output_module.events[2]
+    self.assertEqual(event.store_index, 3)
+    self.assertEqual(event.text, u'first')
+    self.assertEqual(event.filename, u'/a;/c')
+
+    event = output_module.events[3]
+    self.assertEqual(event.store_index, 6)
+    self.assertEqual(event.text, u'fourth')
+
+  def testAppendWithDuplicates(self):
+    """Tests the Append function with duplicate events."""
+    output_mediator = self._CreateOutputMediator()
+    output_module = TestEventsOutputModule(output_mediator)
+    event_buffer_object = event_buffer.EventBuffer(output_module)
+
+    event_buffer_object.Append(
+        self._CreateTestEvent(123456, 2, u'first', u'/a'))
+    event_buffer_object.Append(
+        self._CreateTestEvent(123456, 1, u'first', u'/b'))
+    event_buffer_object.Append(
+        self._CreateTestEvent(123456, 3, u'second', u'/c'))
+    self._CheckBufferLength(event_buffer_object, 2)
+
+    event_buffer_object.End()
+
+    self.assertEqual(event_buffer_object.duplicate_counter, 1)
+    self.assertEqual(event_buffer_object.number_of_spilled_events, 0)
+    self.assertEqual(event_buffer_object.peak_number_of_buffered_events, 2)
+
+    self.assertEqual(len(output_module.events), 2)
+    self.assertEqual(output_module.events[0].filename, u'/a;/b')
+    self.assertEqual(output_module.events[1].filename, u'/c')
+
   def testFlush(self):
     """Tests the Flush function."""
     output_mediator = self._CreateOutputMediator()
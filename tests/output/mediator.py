@@ -48,6 +48,25 @@ class OutputMediatorTest(unittest.TestCase):
     self._output_mediator = mediator.OutputMediator(
         knowledge_base_object, None)
 
+  def testCopyTimestampToDatetime(self):
+    """Tests the CopyTimestampToDatetime function."""
+    timestamp = timelib.Timestamp.CopyFromString(u'2013-03-14 20:20:08')
+
+    datetime_object = self._output_mediator.CopyTimestampToDatetime(timestamp)
+    self.assertEqual(datetime_object.isoformat(), u'2013-03-14T20:20:08+00:00')
+
+    self._output_mediator.SetTimezone(u'CET')
+    datetime_object = self._output_mediator.CopyTimestampToDatetime(timestamp)
+    self.assertEqual(datetime_object.isoformat(), u'2013-03-14T21:20:08+01:00')
+
+  def testCopyTimestampToIsoFormat(self):
+    """Tests the CopyTimestampToIsoFormat function."""
+    timestamp = timelib.Timestamp.CopyFromString(u'2013-03-14 20:20:08')
+
+    self._output_mediator.SetTimezone(u'Europe/Amsterdam')
+    iso_string = self._output_mediator.CopyTimestampToIsoFormat(timestamp)
+    self.assertEqual(iso_string, u'2013-03-14T21:20:08+01:00')
+
   def testGetEventFormatter(self):
     """Tests the GetEventFormatter function."""
     event_object = TestEvent()
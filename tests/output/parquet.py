@@ -0,0 +1,110 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the Parquet output module."""
+
+import os
+import unittest
+
+from plaso.containers import events
+from plaso.formatters import interface as formatters_interface
+from plaso.formatters import manager as formatters_manager
+from plaso.lib import eventdata
+from plaso.lib import timelib
+from plaso.output import parquet
+
+from tests import test_lib as shared_test_lib
+from tests.output import test_lib
+
+
+class ParquetTestEvent(events.EventObject):
+  """Event object used for testing."""
+  DATA_TYPE = u'test:parquet'
+
+  def __init__(self, timestamp):
+    """Initializes an event object used for testing.
+
+    Args:
+      timestamp (int): timestamp.
+    """
+    super(ParquetTestEvent, self).__init__()
+    self.timestamp = timestamp
+    self.timestamp_desc = eventdata.EventTimestamp.CHANGE_TIME
+    self.hostname = u'ubuntu'
+    self.my_number = 123
+    self.parser = u'syslog'
+    self.text = u'Reporter <CRON> PID: 8442 (pam_unix(cron:session))'
+
+
+class ParquetTestEventFormatter(formatters_interface.EventFormatter):
+  """Event object formatter used for testing."""
+
+  DATA_TYPE = u'test:parquet'
+  FORMAT_STRING = u'{text}'
+
+  SOURCE_SHORT = u'LOG'
+  SOURCE_LONG = u'Syslog'
+
+
+@unittest.skipIf(parquet.pyarrow is None, 'missing pyarrow')
+class ParquetOutputModuleTest(test_lib.OutputModuleTestCase):
+  """Tests for the Parquet output module."""
+
+  def testWriteEventBody(self):
+    """Tests the WriteEventBody function."""
+    formatters_manager.FormattersManager.RegisterFormatter(
+        ParquetTestEventFormatter)
+
+    timestamp = timelib.Timestamp.CopyFromString(u'2012-06-27 18:17:01')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_mediator = self._CreateOutputMediator()
+      output_module = parquet.ParquetOutputModule(output_mediator)
+
+      filename = os.path.join(temp_directory, u'plaso.parquet')
+      output_module.SetFilename(filename)
+      output_module.SetRowGroupSize(2)
+
+      output_module.Open()
+      output_module.WriteHeader()
+      for index in range(0, 5):
+        event = ParquetTestEvent(timestamp + index)
+        output_module.WriteEventBody(event)
+      output_module.WriteFooter()
+      output_module.Close()
+
+      parquet_file = parquet.parquet.ParquetFile(filename)
+      self.assertEqual(parquet_file.metadata.num_rows, 5)
+      self.assertEqual(parquet_file.metadata.num_row_groups, 3)
+
+      table = parquet_file.read()
+      rows = table.to_pydict()
+
+    formatters_manager.FormattersManager.DeregisterFormatter(
+        ParquetTestEventFormatter)
+
+    self.assertEqual(rows[u'data_type'][0], u'test:parquet')
+    self.assertEqual(rows[u'parser'][0], u'syslog')
+    self.assertEqual(rows[u'source'][0], u'LOG')
+    self.assertEqual(rows[u'source_long'][0], u'Syslog')
+    self.assertEqual(
+        rows[u'message'][0],
+        u'Reporter <CRON> PID: 8442 (pam_unix(cron:session))')
+    self.assertEqual(rows[u'tag'][0], [])
+
+    if u'attributes' in rows:
+      attributes = rows[u'attributes'][0]
+    else:
+      attributes = zip(
+          rows[u'attribute_names'][0], rows[u'attribute_values'][0])
+
+    self.assertEqual(dict(attributes), {
+        u'hostname': u'ubuntu',
+        u'my_number': u'123',
+        u'text': u'Reporter <CRON> PID: 8442 (pam_unix(cron:session))'})
+
+    timestamp_column = table.column(u'timestamp')
+    self.assertEqual(str(timestamp_column.type), u'timestamp[us, tz=UTC]')
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -106,6 +106,42 @@ class SqliteOutputModuleTest(test_lib.OutputModuleTestCase):
       row_dict = dict_from_row(res.fetchone())
       self.assertDictContainsSubset(expected_dict, row_dict)
 
+  def testOutputMetadata(self):
+    """Tests the metadata tables of the sqlite output."""
+    timestamp = timelib.Timestamp.CopyFromString(
+        u'2012-06-27 18:17:01+00:00')
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      output_mediator = self._CreateOutputMediator()
+      sqlite_output = sqlite_4n6time.SQLite4n6TimeOutputModule(
+          output_mediator)
+
+      sqlite_file = os.path.join(temp_directory, u'4n6time.db')
+      sqlite_output.SetFilename(sqlite_file)
+
+      sqlite_output.Open()
+      for hostname in (u'ubuntu', u'ubuntu', u'debian'):
+        event_object = SQLiteTestEvent(timestamp)
+        event_object.hostname = hostname
+        sqlite_output.WriteEventBody(event_object)
+      sqlite_output.Close()
+
+      sqlite_connection = sqlite3.connect(sqlite_file)
+
+      cursor = sqlite_connection.execute(u'SELECT COUNT(*) FROM log2timeline')
+      self.assertEqual(cursor.fetchone()[0], 3)
+
+      cursor = sqlite_connection.execute(
+          u'SELECT hosts, frequency FROM l2t_hosts ORDER BY hosts')
+      self.assertEqual(cursor.fetchall(), [(u'debian', 1), (u'ubuntu', 2)])
+
+      cursor = sqlite_connection.execute(
+          u'SELECT record_numbers, frequency FROM l2t_record_numbers')
+      self.assertEqual(cursor.fetchall(), [(u'0', 3)])
+
+      cursor = sqlite_connection.execute(u'PRAGMA journal_mode')
+      self.assertEqual(cursor.fetchone()[0], u'delete')
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -308,6 +308,7 @@ class JSONAttributeContainerSerializerTest(JSONSerializerTestCase):
 
     expected_session_dict = {
         u'aborted': False,
+        u'analysis_high_water_marks': {},
         u'analysis_reports_counter': session.analysis_reports_counter,
         u'debug_mode': False,
         u'event_labels_counter': session.event_labels_counter,
@@ -335,6 +336,7 @@ class JSONAttributeContainerSerializerTest(JSONSerializerTestCase):
     expected_session_completion = sessions.SessionCompletion(
         identifier=session_identifier)
     expected_session_completion.timestamp = timestamp
+    expected_session_completion.analysis_high_water_marks = {u'test': [3, 0]}
     expected_session_completion.parsers_counter = parsers_counter
 
     json_string = (
@@ -352,6 +354,7 @@ class JSONAttributeContainerSerializerTest(JSONSerializerTestCase):
 
     expected_session_completion_dict = {
         u'aborted': False,
+        u'analysis_high_water_marks': {u'test': [3, 0]},
         u'identifier': session_identifier,
         u'parsers_counter': parsers_counter,
         u'timestamp': timestamp
@@ -0,0 +1,64 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the storage event predicate."""
+
+import unittest
+
+from plaso.storage import event_predicate
+
+
+class EventPredicateTest(unittest.TestCase):
+  """Tests for the event predicate."""
+
+  def testAddCondition(self):
+    """Tests the AddCondition function."""
+    test_event_predicate = event_predicate.EventPredicate()
+    test_event_predicate.AddCondition(u'parser', values=[u'filestat'])
+    test_event_predicate.AddCondition(u'data_type', substrings=[u'fs:'])
+
+    self.assertEqual(
+        test_event_predicate.attribute_names, [u'data_type', u'parser'])
+
+  def testMatchesAttributeValues(self):
+    """Tests the MatchesAttributeValues function."""
+    test_event_predicate = event_predicate.EventPredicate()
+    test_event_predicate.AddCondition(
+        u'data_type', values=[u'fs:stat'], substrings=[u'Registry'])
+    test_event_predicate.AddCondition(u'parser', values=[u'filestat'])
+
+    attribute_values = {
+        u'data_type': set([u'fs:stat', u'text:entry']),
+        u'parser': set([u'filestat'])}
+    self.assertTrue(
+        test_event_predicate.MatchesAttributeValues(attribute_values))
+
+    attribute_values = {
+        u'data_type': set([u'windows:registry:key_value']),
+        u'parser': set([u'filestat'])}
+    self.assertTrue(
+        test_event_predicate.MatchesAttributeValues(attribute_values))
+
+    attribute_values = {
+        u'data_type': set([u'text:entry']),
+        u'parser': set([u'filestat'])}
+    self.assertFalse(
+        test_event_predicate.MatchesAttributeValues(attribute_values))
+
+    attribute_values = {
+        u'data_type': set([u'fs:stat']),
+        u'parser': set([u'winreg'])}
+    self.assertFalse(
+        test_event_predicate.MatchesAttributeValues(attribute_values))
+
+    # Attribute values that are not known cannot be used to skip events.
+    attribute_values = {
+        u'data_type': None,
+        u'parser': set([u'filestat'])}
+    self.assertTrue(
+        test_event_predicate.MatchesAttributeValues(attribute_values))
+
+    self.assertTrue(test_event_predicate.MatchesAttributeValues({}))
+
+
+if __name__ == '__main__':
+  unittest.main()
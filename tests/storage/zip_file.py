@@ -16,6 +16,7 @@ from plaso.formatters import mediator as formatters_mediator
 from plaso.lib import definitions
 from plaso.lib import timelib
 from plaso.formatters import winreg   # pylint: disable=unused-import
+from plaso.storage import event_predicate
 from plaso.storage import time_range
 from plaso.storage import zip_file
 
@@ -23,6 +24,53 @@ from tests import test_lib as shared_test_lib
 from tests.storage import test_lib
 
 
+class EventStreamSummary(test_lib.StorageTestCase):
+  """Tests for the event stream summary object."""
+
+  # pylint: disable=protected-access
+
+  def testAddEvent(self):
+    """Tests the AddEvent function."""
+    event_objects = self._CreateTestEventObjects()
+
+    event_stream_summary = zip_file._EventStreamSummary()
+    for event_object in event_objects:
+      event_stream_summary.AddEvent(event_object)
+
+    expected_attribute_values = {
+        u'data_type': set([u'text:entry', u'windows:registry:key_value']),
+        u'parser': set([u'UNKNOWN'])}
+    self.assertEqual(
+        event_stream_summary.attribute_values, expected_attribute_values)
+
+    event_objects[0].parser = [u'UNKNOWN']
+    event_stream_summary.AddEvent(event_objects[0])
+    self.assertIsNone(event_stream_summary.attribute_values[u'parser'])
+
+  def testCopyFromAndToStreamData(self):
+    """Tests the CopyFromStreamData and CopyToStreamData functions."""
+    event_objects = self._CreateTestEventObjects()
+
+    event_stream_summary = zip_file._EventStreamSummary()
+    for event_object in event_objects:
+      event_stream_summary.AddEvent(event_object)
+      event_stream_summary.AddTimestamp(event_object.timestamp)
+
+    stream_data = event_stream_summary.CopyToStreamData()
+
+    test_event_stream_summary = zip_file._EventStreamSummary()
+    test_event_stream_summary.CopyFromStreamData(stream_data)
+
+    self.assertEqual(
+        test_event_stream_summary.attribute_values,
+        event_stream_summary.attribute_values)
+    self.assertEqual(test_event_stream_summary.first_timestamp, 1238934459000000)
+    self.assertEqual(test_event_stream_summary.last_timestamp, 1335966206929596)
+
+    with self.assertRaises(IOError):
+      test_event_stream_summary.CopyFromStreamData(b'bogus')
+
+
 class SerializedDataStream(test_lib.StorageTestCase):
   """Tests for the serialized data stream object."""
 
@@ -162,6 +210,27 @@ class SerializedDataTimestampTable(test_lib.StorageTestCase):
     with self.assertRaises(IndexError):
       offset_table.GetTimestamp(-99)
 
+  def testGetEntryIndex(self):
+    """Tests the GetEntryIndex function."""
+    test_file = self._GetTestFilePath([u'psort_test.json.plaso'])
+    zip_file_object = zipfile.ZipFile(
+        test_file, 'r', zipfile.ZIP_DEFLATED, allowZip64=True)
+
+    stream_name = u'event_timestamps.000002'
+    timestamp_table = zip_file._SerializedDataTimestampTable(
+        zip_file_object, stream_name)
+    timestamp_table.Read()
+
+    self.assertEqual(timestamp_table.GetEntryIndex(0), 0)
+    self.assertEqual(timestamp_table.GetEntryIndex(1453449153000000), 0)
+    self.assertEqual(timestamp_table.GetEntryIndex(1453449153000001), 2)
+    self.assertEqual(
+        timestamp_table.GetEntryIndex(1483206872000000),
+        timestamp_table.number_of_timestamps - 1)
+    self.assertEqual(
+        timestamp_table.GetEntryIndex(1483206872000001),
+        timestamp_table.number_of_timestamps)
+
   def testRead(self):
     """Tests the Read function."""
     test_file = self._GetTestFilePath([u'psort_test.json.plaso'])
@@ -208,6 +277,28 @@ class ZIPStorageFileTest(test_lib.StorageTestCase):
 
     storage_file.Close()
 
+  def _CreateTestStorageFileWithSummaries(self, path):
+    """Creates a storage file with event summaries for testing.
+
+    The Windows Registry events are stored in the first and the text event
+    in the second event data stream.
+
+    Args:
+      path (str): path of the storage file.
+    """
+    event_objects = self._CreateTestEventObjects()
+
+    storage_file = zip_file.ZIPStorageFile()
+    storage_file.Open(path=path, read_only=False)
+    for event_object in event_objects[:-1]:
+      storage_file.AddEvent(event_object)
+
+    storage_file._WriteSerializedEvents()
+
+    storage_file.AddEvent(event_objects[-1])
+
+    storage_file.Close()
+
   def _GetEventsFromGroup(self, storage_file, event_group):
     """Return a generator with all EventObjects from a group.
 
@@ -440,6 +531,45 @@ class ZIPStorageFileTest(test_lib.StorageTestCase):
 
     storage_file.Close()
 
+  def testGetEventStreamSummary(self):
+    """Tests the _GetEventStreamSummary function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, u'storage.plaso')
+      self._CreateTestStorageFileWithSummaries(temp_file)
+
+      storage_file = zip_file.ZIPStorageFile()
+      storage_file.Open(path=temp_file)
+
+      event_stream_summary = storage_file._GetEventStreamSummary(1)
+      self.assertIsNotNone(event_stream_summary)
+      self.assertEqual(
+          event_stream_summary.attribute_values[u'data_type'],
+          set([u'windows:registry:key_value']))
+      self.assertEqual(event_stream_summary.first_timestamp, 1334940286000000)
+      self.assertEqual(event_stream_summary.last_timestamp, 1335966206929596)
+
+      event_stream_summary = storage_file._GetEventStreamSummary(2)
+      self.assertIsNotNone(event_stream_summary)
+      self.assertEqual(
+          event_stream_summary.attribute_values[u'data_type'],
+          set([u'text:entry']))
+
+      event_stream_summary = storage_file._GetEventStreamSummary(3)
+      self.assertIsNone(event_stream_summary)
+
+      storage_file.Close()
+
+    # Storage files written before the introduction of the event summary
+    # streams do not contain event summaries.
+    test_file = self._GetTestFilePath([u'psort_test.json.plaso'])
+    storage_file = zip_file.ZIPStorageFile()
+    storage_file.Open(path=test_file)
+
+    event_stream_summary = storage_file._GetEventStreamSummary(1)
+    self.assertIsNone(event_stream_summary)
+
+    storage_file.Close()
+
   def testGetLastStreamNumber(self):
     """Tests the _GetLastStreamNumber function."""
     test_file = self._GetTestFilePath([u'psort_test.json.plaso'])
@@ -664,6 +794,43 @@ class ZIPStorageFileTest(test_lib.StorageTestCase):
 
     storage_file.Close()
 
+  def testIsEventStreamOfInterest(self):
+    """Tests the _IsEventStreamOfInterest function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, u'storage.plaso')
+      self._CreateTestStorageFileWithSummaries(temp_file)
+
+      storage_file = zip_file.ZIPStorageFile()
+      storage_file.Open(path=temp_file)
+
+      self.assertTrue(storage_file._IsEventStreamOfInterest(1))
+
+      test_event_predicate = event_predicate.EventPredicate()
+      test_event_predicate.AddCondition(
+          u'data_type', values=[u'text:entry'])
+
+      result = storage_file._IsEventStreamOfInterest(
+          1, event_predicate=test_event_predicate)
+      self.assertFalse(result)
+
+      result = storage_file._IsEventStreamOfInterest(
+          2, event_predicate=test_event_predicate)
+      self.assertTrue(result)
+
+      test_time_range = time_range.TimeRange(
+          timelib.Timestamp.CopyFromString(u'2012-05-01 00:00:00'),
+          timelib.Timestamp.CopyFromString(u'2030-12-31 23:59:59'))
+
+      result = storage_file._IsEventStreamOfInterest(
+          1, time_range=test_time_range)
+      self.assertTrue(result)
+
+      result = storage_file._IsEventStreamOfInterest(
+          2, time_range=test_time_range)
+      self.assertFalse(result)
+
+      storage_file.Close()
+
   def testOpenStream(self):
     """Tests the _OpenStream function."""
     test_file = self._GetTestFilePath([u'psort_test.json.plaso'])
@@ -1049,6 +1216,23 @@ class ZIPStorageFileTest(test_lib.StorageTestCase):
 
     storage_file.Close()
 
+    test_event_predicate = event_predicate.EventPredicate()
+    test_event_predicate.AddCondition(
+        u'data_type', substrings=[u'Windows:Registry'])
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, u'storage.plaso')
+      self._CreateTestStorageFileWithSummaries(temp_file)
+
+      storage_file = zip_file.ZIPStorageFile()
+      storage_file.Open(path=temp_file)
+
+      test_events = list(storage_file.GetEvents(
+          event_predicate=test_event_predicate))
+      self.assertEqual(len(test_events), 3)
+
+      storage_file.Close()
+
   def testGetEventSourceByIndex(self):
     """Tests the GetEventSourceByIndex function."""
     test_file = self._GetTestFilePath([u'psort_test.json.plaso'])
@@ -1460,6 +1644,70 @@ class ZIPStorageFileWriterTest(test_lib.StorageTestCase):
 
       storage_writer.Close()
 
+  def testGetAnalysisHighWaterMarks(self):
+    """Tests the GetAnalysisHighWaterMarks function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, u'storage.plaso')
+
+      session = sessions.Session()
+      storage_writer = zip_file.ZIPStorageFileWriter(session, temp_file)
+      storage_writer.Open()
+
+      storage_writer.WriteSessionStart()
+      storage_writer.SetAnalysisHighWaterMarks(u'first', [5, 3])
+      storage_writer.SetAnalysisHighWaterMarks(u'second', [5])
+      storage_writer.WriteSessionCompletion()
+
+      storage_writer.Close()
+
+      session = sessions.Session()
+      storage_writer = zip_file.ZIPStorageFileWriter(session, temp_file)
+      storage_writer.Open()
+
+      storage_writer.WriteSessionStart()
+      storage_writer.SetAnalysisHighWaterMarks(u'second', [5, 3])
+      storage_writer.WriteSessionCompletion()
+
+      storage_writer.Close()
+
+      storage_writer.Open()
+
+      analysis_high_water_marks = storage_writer.GetAnalysisHighWaterMarks()
+
+      storage_writer.Close()
+
+    expected_analysis_high_water_marks = {
+        u'first': [5, 3],
+        u'second': [5, 3]}
+    self.assertEqual(
+        analysis_high_water_marks, expected_analysis_high_water_marks)
+
+  def testGetNumberOfEventsPerParser(self):
+    """Tests the GetNumberOfEventsPerParser function."""
+    session = sessions.Session()
+    event_objects = self._CreateTestEventObjects()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, u'storage.plaso')
+      storage_writer = zip_file.ZIPStorageFileWriter(session, temp_file)
+      storage_writer.Open()
+
+      events_per_parser = storage_writer.GetNumberOfEventsPerParser()
+      self.assertEqual(events_per_parser, {})
+
+      for event_object in event_objects:
+        storage_writer.AddEvent(event_object)
+
+      events_per_parser = storage_writer.GetNumberOfEventsPerParser()
+
+      storage_writer.Close()
+
+    number_of_events = len(event_objects)
+    expected_events_per_parser = {
+        u'total': number_of_events,
+        u'UNKNOWN': number_of_events}
+    self.assertEqual(events_per_parser, expected_events_per_parser)
+
   def testOpenClose(self):
     """Tests the Open and Close functions."""
     session = sessions.Session()
@@ -1642,6 +1890,67 @@ class ZIPStorageFileWriterTest(test_lib.StorageTestCase):
 
       session_storage_writer.Close()
 
+  def testPrepareMergeTaskStorageData(self):
+    """Tests the GetTaskStorageData and PrepareMergeTaskStorageData functions."""
+    session = sessions.Session()
+    event_objects = self._CreateTestEventObjects()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, u'storage.plaso')
+      session_storage_writer = zip_file.ZIPStorageFileWriter(session, temp_file)
+      session_storage_writer.Open()
+
+      session_storage_writer.WriteSessionStart()
+
+      session_storage_writer.StartTaskStorage()
+
+      # The remote storage writer represents the task storage of a worker
+      # on another host.
+      remote_temp_file = os.path.join(temp_directory, u'remote.plaso')
+      remote_storage_writer = zip_file.ZIPStorageFileWriter(
+          session, remote_temp_file)
+      remote_storage_writer.StartTaskStorage()
+
+      task = tasks.Task(session_identifier=session.identifier)
+      task_storage_writer = remote_storage_writer.CreateTaskStorage(task)
+      task_storage_writer.Open()
+      task_storage_writer.WriteTaskStart()
+
+      for event_object in event_objects:
+        task_storage_writer.AddEvent(event_object)
+
+      task_storage_writer.WriteTaskCompletion()
+      task_storage_writer.Close()
+
+      task_storage_data = remote_storage_writer.GetTaskStorageData(
+          task.identifier)
+      self.assertIsNotNone(task_storage_data)
+
+      remote_storage_writer.StopTaskStorage()
+
+      ready_for_merge = session_storage_writer.CheckTaskStorageReadyForMerge(
+          task.identifier)
+      self.assertFalse(ready_for_merge)
+
+      session_storage_writer.PrepareMergeTaskStorageData(
+          task.identifier, task_storage_data)
+
+      ready_for_merge = session_storage_writer.CheckTaskStorageReadyForMerge(
+          task.identifier)
+      self.assertTrue(ready_for_merge)
+
+      merge_successful = session_storage_writer.MergeTaskStorage(
+          task.identifier)
+      self.assertTrue(merge_successful)
+
+      self.assertEqual(session_storage_writer.number_of_events, 4)
+
+      session_storage_writer.StopTaskStorage()
+
+      session_storage_writer.WriteSessionCompletion()
+
+      session_storage_writer.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
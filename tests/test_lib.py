@@ -4,8 +4,15 @@
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 
+# The 'BaseHTTPServer' module was renamed to 'http.server' in Python 3
+try:
+  import BaseHTTPServer
+except ImportError:
+  import http.server as BaseHTTPServer  # pylint: disable=import-error
+
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 from dfvfs.resolver import resolver as path_spec_resolver
@@ -65,3 +72,97 @@ class TempDirectory(object):
   def __exit__(self, unused_type, unused_value, unused_traceback):
     """Make this work with the 'with' statement."""
     shutil.rmtree(self.name, True)
+
+
+class _StandInHTTPRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+  """Class that implements a request handler of the stand-in HTTP server."""
+
+  def _HandleRequest(self):
+    """Passes the request to the response callback of the server."""
+    content_length = int(self.headers.get(u'Content-Length', 0) or 0)
+    body = b''
+    if content_length:
+      body = self.rfile.read(content_length)
+
+    self.server.requests.append((self.command, self.path, body))
+    status_code, response_body = self.server.response_callback(
+        self.command, self.path, body)
+
+    if not isinstance(response_body, bytes):
+      response_body = response_body.encode(u'utf-8')
+
+    self.send_response(status_code)
+    self.send_header(u'Content-Type', u'application/json')
+    self.send_header(u'Content-Length', u'{0:d}'.format(len(response_body)))
+    self.end_headers()
+    self.wfile.write(response_body)
+
+  # Note that the following methods are part of the BaseHTTPRequestHandler
+  # interface, hence their names do not follow the style guide.
+
+  # pylint: disable=invalid-name
+  def do_GET(self):
+    """Handles a GET request."""
+    self._HandleRequest()
+
+  def do_POST(self):
+    """Handles a POST request."""
+    self._HandleRequest()
+
+  def do_PUT(self):
+    """Handles a PUT request."""
+    self._HandleRequest()
+
+  def log_message(self, unused_format, *unused_args):
+    """Suppresses logging of the requests."""
+    return
+
+
+class StandInHTTPServer(object):
+  """Class that implements a local stand-in HTTP server.
+
+  The server runs in a separate thread and passes every request to a
+  response callback, that is invoked as:
+
+    response_callback(method, path, body) -> (status_code, response_body)
+
+  Attributes:
+    requests (list[tuple[str, str, bytes]]): method, path and body of
+        the requests received by the server.
+    url (str): URL of the server.
+  """
+
+  def __init__(self, response_callback):
+    """Initializes the stand-in HTTP server.
+
+    Args:
+      response_callback (function): callback that determines the response
+          of a request.
+    """
+    super(StandInHTTPServer, self).__init__()
+    self._http_server = None
+    self._response_callback = response_callback
+    self._thread = None
+    self.requests = []
+    self.url = u''
+
+  def __enter__(self):
+    """Make this work with the 'with' statement."""
+    self._http_server = BaseHTTPServer.HTTPServer(
+        (u'127.0.0.1', 0), _StandInHTTPRequestHandler)
+    self._http_server.requests = self.requests
+    self._http_server.response_callback = self._response_callback
+
+    _, port = self._http_server.server_address
+    self.url = u'http://127.0.0.1:{0:d}'.format(port)
+
+    self._thread = threading.Thread(target=self._http_server.serve_forever)
+    self._thread.daemon = True
+    self._thread.start()
+    return self
+
+  def __exit__(self, unused_type, unused_value, unused_traceback):
+    """Make this work with the 'with' statement."""
+    self._http_server.shutdown()
+    self._http_server.server_close()
+    self._thread.join()
@@ -44,10 +44,13 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
     """
     super(ImageExportTool, self).__init__(
         input_reader=input_reader, output_writer=output_writer)
+    self._content_addressed = False
     self._destination_path = None
     self._filter_file = None
     self._front_end = image_export.ImageExportFrontend()
+    self._number_of_workers = 0
     self._remove_duplicates = True
+    self._vss_differencing = False
     self.has_filters = False
     self.list_signature_identifiers = False
 
@@ -145,6 +148,15 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
             u'Use "list" to show an overview of the supported file format '
             u'signatures.'))
 
+    argument_parser.add_argument(
+        u'--content_addressed', u'--content-addressed',
+        dest=u'content_addressed', action=u'store_true', default=False, help=(
+            u'Store the content of the extracted files once, named after its '
+            u'SHA-256 hash, together with an index of the paths, VSS stores '
+            u'and inodes of the extracted files. The index is kept in the '
+            u'export directory, so that repeated exports into the same '
+            u'directory skip content that was stored before.'))
+
     argument_parser.add_argument(
         u'--include_duplicates', dest=u'include_duplicates',
         action=u'store_true', default=False, help=(
@@ -153,6 +165,20 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
             u'previously exported files and duplicates are skipped. Use '
             u'this option to include duplicate files in the export.'))
 
+    argument_parser.add_argument(
+        u'--vss_differencing', u'--vss-differencing',
+        dest=u'vss_differencing', action=u'store_true', default=False, help=(
+            u'Only export the files of a VSS store of which the MFT entry, '
+            u'sequence number, timestamps or size differ from the previously '
+            u'processed VSS store, starting with the most recent VSS store. '
+            u'This option does not apply when a filter file is used.'))
+
+    argument_parser.add_argument(
+        u'--workers', dest=u'workers', action=u'store', type=int, default=0,
+        metavar=u'NUMBER', help=(
+            u'The number of worker processes that export files concurrently. '
+            u'By default files are exported by a single process.'))
+
     self.AddStorageMediaImageOptions(argument_parser)
     self.AddVSSProcessingOptions(argument_parser)
 
@@ -222,10 +248,19 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     self._ParseFilterOptions(options)
 
+    self._content_addressed = getattr(options, u'content_addressed', False)
+
     if (getattr(options, u'no_vss', False) or
         getattr(options, u'include_duplicates', False)):
       self._remove_duplicates = False
 
+    self._vss_differencing = getattr(options, u'vss_differencing', False)
+
+    self._number_of_workers = getattr(options, u'workers', 0)
+    if self._number_of_workers < 0:
+      raise errors.BadConfigOption(
+          u'Invalid number of workers: {0:d}.'.format(self._number_of_workers))
+
     date_filters = getattr(options, u'date_filters', None)
     try:
       self._front_end.ParseDateFilters(date_filters)
@@ -271,8 +306,11 @@ class ImageExportTool(storage_media_tool.StorageMediaTool):
 
     self._front_end.ProcessSources(
         self._source_path_specs, self._destination_path,
+        content_addressed=self._content_addressed,
         filter_file=self._filter_file,
-        remove_duplicates=self._remove_duplicates)
+        number_of_workers=self._number_of_workers,
+        remove_duplicates=self._remove_duplicates,
+        vss_differencing=self._vss_differencing)
 
     self._output_writer.Write(u'Export completed.\n')
     self._output_writer.Write(u'\n')
@@ -24,6 +24,7 @@ from plaso.cli import views as cli_views
 from plaso.frontend import log2timeline
 from plaso.lib import definitions
 from plaso.lib import errors
+from plaso.lib import filter_compiler
 from plaso.lib import pfilter
 
 
@@ -82,13 +83,16 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
     self._filter_expression = None
     self._foreman_verbose = False
     self._front_end = log2timeline.Log2TimelineFrontend()
+    self._maximum_number_of_extraction_workers = 0
     self._number_of_extraction_workers = 0
+    self._number_of_remote_extraction_workers = 0
     self._output = None
     self._source_type = None
     self._source_type_string = u'UNKNOWN'
     self._status_view_mode = u'linear'
     self._stdout_output_writer = isinstance(
         self._output_writer, cli_tools.StdoutOutputWriter)
+    self._worker_memory_limit = None
 
     self.dependencies_check = True
     self.list_output_modules = False
@@ -143,11 +147,12 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
       filter_expression (str): filter expression.
 
     Returns:
-      A filter object (instance of objectfilter.TODO) or None.
+      CompiledFilter: compiled filter or None.
     """
     try:
       parser = pfilter.BaseParser(filter_expression).Parse()
-      return parser.Compile(pfilter.PlasoAttributeFilterImplementation)
+      filter_object = parser.Compile(pfilter.PlasoAttributeFilterImplementation)
+      return filter_compiler.CompiledFilter(filter_object)
 
     except errors.ParseError as exception:
       logging.error(
@@ -159,10 +164,54 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
 
     Args:
       options (argparse.Namespace): command line arguments.
+
+    Raises:
+      BadConfigOption: if the options are invalid.
     """
+    metrics_port = getattr(options, u'metrics_port', None)
+    if metrics_port is not None and not 0 <= metrics_port <= 65535:
+      raise errors.BadConfigOption(
+          u'Invalid metrics port: {0:d}.'.format(metrics_port))
+
+    self._front_end.SetMetricsPort(metrics_port)
+
     use_zeromq = getattr(options, u'use_zeromq', u'true')
     self._front_end.SetUseZeroMQ(use_zeromq == u'true')
 
+    remote_workers_host = self.ParseStringOption(
+        options, u'remote_workers_host')
+
+    self._number_of_remote_extraction_workers = getattr(
+        options, u'remote_workers', 0)
+    if self._number_of_remote_extraction_workers < 0:
+      raise errors.BadConfigOption(
+          u'Invalid number of remote workers: {0:d}.'.format(
+              self._number_of_remote_extraction_workers))
+
+    if bool(remote_workers_host) != bool(
+        self._number_of_remote_extraction_workers):
+      raise errors.BadConfigOption(
+          u'Remote workers require both a host and a number of workers.')
+
+    if remote_workers_host and use_zeromq != u'true':
+      raise errors.BadConfigOption(u'Remote workers require ZeroMQ.')
+
+    task_queue_port = getattr(options, u'task_queue_port', None)
+    if task_queue_port is not None and not 0 < task_queue_port <= 65535:
+      raise errors.BadConfigOption(
+          u'Invalid task queue port: {0:d}.'.format(task_queue_port))
+
+    task_storage_queue_port = getattr(options, u'task_storage_queue_port', None)
+    if (task_storage_queue_port is not None and
+        not 0 < task_storage_queue_port <= 65535):
+      raise errors.BadConfigOption(
+          u'Invalid task storage queue port: {0:d}.'.format(
+              task_storage_queue_port))
+
+    self._front_end.SetRemoteWorkers(
+        remote_workers_host, task_queue_port=task_queue_port,
+        task_storage_queue_port=task_storage_queue_port)
+
   def _ParseOutputOptions(self, options):
     """Parses the output options.
 
@@ -191,10 +240,31 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
     """
     self._single_process_mode = getattr(options, u'single_process', False)
 
+    if self._single_process_mode and self._number_of_remote_extraction_workers:
+      raise errors.BadConfigOption(
+          u'Remote workers cannot be used in single process mode.')
+
     self._foreman_verbose = getattr(options, u'foreman_verbose', False)
 
     self._number_of_extraction_workers = getattr(options, u'workers', 0)
 
+    self._maximum_number_of_extraction_workers = getattr(
+        options, u'maximum_workers', 0)
+    if self._maximum_number_of_extraction_workers < 0:
+      raise errors.BadConfigOption(
+          u'Invalid maximum number of workers: {0:d}.'.format(
+              self._maximum_number_of_extraction_workers))
+
+    worker_memory_limit = getattr(options, u'worker_memory_limit', 0)
+    if worker_memory_limit < 0:
+      raise errors.BadConfigOption(
+          u'Invalid worker memory limit: {0:d}.'.format(worker_memory_limit))
+
+    if worker_memory_limit:
+      self._worker_memory_limit = worker_memory_limit * self._BYTES_IN_A_MIB
+    else:
+      self._worker_memory_limit = None
+
     # TODO: add code to parse the worker options.
 
   def _PrintStatusHeader(self):
@@ -278,11 +348,44 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
     Args:
       argument_group (argparse._ArgumentGroup): argparse argument group.
     """
+    argument_group.add_argument(
+        u'--metrics_port', u'--metrics-port', dest=u'metrics_port',
+        action=u'store', type=int, default=None, metavar=u'PORT', help=(
+            u'Port of a local HTTP server that exposes processing metrics, '
+            u'such as the number of events per parser, in the Prometheus '
+            u'text format on /metrics. Use 0 for a random port.'))
+
     argument_group.add_argument(
         u'--use_zeromq', action=u'store', dest=u'use_zeromq',
         metavar=u'CHOICE', choices=[u'false', u'true'], default=u'true',
         help=(u'Enables or disables queueing using ZeroMQ'))
 
+    argument_group.add_argument(
+        u'--remote_workers_host', u'--remote-workers-host',
+        dest=u'remote_workers_host', action=u'store', type=str, default=None,
+        metavar=u'HOST', help=(
+            u'Host name or IP address the task queues bind to, so that '
+            u'log2timeline_worker.py on remote hosts can process tasks. Use '
+            u'"*" for all interfaces. Requires ZeroMQ and --remote_workers.'))
+
+    argument_group.add_argument(
+        u'--remote_workers', u'--remote-workers', dest=u'remote_workers',
+        action=u'store', type=int, default=0, metavar=u'NUMBER', help=(
+            u'The total number of worker processes on remote hosts.'))
+
+    argument_group.add_argument(
+        u'--task_queue_port', u'--task-queue-port', dest=u'task_queue_port',
+        action=u'store', type=int, default=None, metavar=u'PORT', help=(
+            u'Port of the task queue remote workers connect to, by default '
+            u'a random port is used.'))
+
+    argument_group.add_argument(
+        u'--task_storage_queue_port', u'--task-storage-queue-port',
+        dest=u'task_storage_queue_port', action=u'store', type=int,
+        default=None, metavar=u'PORT', help=(
+            u'Port of the task storage queue remote workers connect to, by '
+            u'default a random port is used.'))
+
   def AddOutputOptions(self, argument_group):
     """Adds the output options to the argument group.
 
@@ -329,6 +432,22 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
         help=(u'The number of worker threads [defaults to available system '
               u'CPUs minus three].'))
 
+    argument_group.add_argument(
+        u'--maximum_workers', u'--maximum-workers', dest=u'maximum_workers',
+        action=u'store', type=int, default=0, metavar=u'NUMBER', help=(
+            u'The maximum number of worker processes. If larger than the '
+            u'number of workers, the number of workers is adjusted during '
+            u'processing based on the event rate and memory usage of '
+            u'the workers.'))
+
+    argument_group.add_argument(
+        u'--worker_memory_limit', u'--worker-memory-limit',
+        dest=u'worker_memory_limit', action=u'store', type=int, default=0,
+        metavar=u'SIZE', help=(
+            u'The maximum amount of memory in MiB a worker process can use. '
+            u'A worker process that exceeds the limit is replaced by a new '
+            u'worker process after completing its current task.'))
+
   def ListHashers(self):
     """Lists information about the available hashers."""
     hashers_information = self._front_end.GetHashersInformation()
@@ -672,11 +791,16 @@ class Log2TimelineTool(extraction_tool.ExtractionTool):
         enable_sigsegv_handler=self._enable_sigsegv_handler,
         force_preprocessing=self._force_preprocessing,
         hasher_names_string=self._hasher_names_string,
+        maximum_number_of_extraction_workers=(
+            self._maximum_number_of_extraction_workers),
         number_of_extraction_workers=self._number_of_extraction_workers,
+        number_of_remote_extraction_workers=(
+            self._number_of_remote_extraction_workers),
         process_archive_files=self._process_archive_files,
         single_process_mode=self._single_process_mode,
         status_update_callback=status_update_callback,
-        timezone=self._timezone, yara_rules_string=self._yara_rules_string)
+        timezone=self._timezone, worker_memory_limit=self._worker_memory_limit,
+        yara_rules_string=self._yara_rules_string)
 
     if not processing_status:
       self._output_writer.Write(
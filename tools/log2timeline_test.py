@@ -21,17 +21,51 @@ class Log2TimelineToolTest(cli_test_lib.CLIToolTestCase):
   _BDE_PASSWORD = u'bde-TEST'
 
   _EXPECTED_EXPERIMENTAL_OPTIONS = u'\n'.join([
-      u'usage: log2timeline_test.py [--use_zeromq CHOICE]',
+      (u'usage: log2timeline_test.py [--metrics_port PORT] '
+       u'[--use_zeromq CHOICE]'),
+      u'                            [--remote_workers_host HOST]',
+      (u'                            [--remote_workers NUMBER] '
+       u'[--task_queue_port PORT]'),
+      u'                            [--task_storage_queue_port PORT]',
       u'',
       u'Test argument parser.',
       u'',
       u'optional arguments:',
-      u'  --use_zeromq CHOICE  Enables or disables queueing using ZeroMQ',
+      u'  --metrics_port PORT, --metrics-port PORT',
+      (u'                        Port of a local HTTP server that exposes '
+       u'processing'),
+      (u'                        metrics, such as the number of events per '
+       u'parser, in'),
+      (u'                        the Prometheus text format on /metrics. Use '
+       u'0 for a'),
+      u'                        random port.',
+      u'  --use_zeromq CHOICE   Enables or disables queueing using ZeroMQ',
+      u'  --remote_workers_host HOST, --remote-workers-host HOST',
+      (u'                        Host name or IP address the task queues '
+       u'bind to, so'),
+      (u'                        that log2timeline_worker.py on remote hosts '
+       u'can'),
+      (u'                        process tasks. Use "*" for all interfaces. '
+       u'Requires'),
+      u'                        ZeroMQ and --remote_workers.',
+      u'  --remote_workers NUMBER, --remote-workers NUMBER',
+      (u'                        The total number of worker processes on '
+       u'remote hosts.'),
+      u'  --task_queue_port PORT, --task-queue-port PORT',
+      (u'                        Port of the task queue remote workers '
+       u'connect to, by'),
+      u'                        default a random port is used.',
+      u'  --task_storage_queue_port PORT, --task-storage-queue-port PORT',
+      (u'                        Port of the task storage queue remote '
+       u'workers connect'),
+      u'                        to, by default a random port is used.',
       u''])
 
   _EXPECTED_PROCESSING_OPTIONS = u'\n'.join([
       u'usage: log2timeline_test.py [--single_process] [--show_memory_usage]',
-      u'                            [--workers WORKERS]',
+      (u'                            [--workers WORKERS] [--maximum_workers '
+       u'NUMBER]'),
+      u'                            [--worker_memory_limit SIZE]',
       u'',
       u'Test argument parser.',
       u'',
@@ -50,6 +84,22 @@ class Log2TimelineToolTest(cli_test_lib.CLIToolTestCase):
       (u'  --workers WORKERS     The number of worker threads [defaults to '
        u'available'),
       u'                        system CPUs minus three].',
+      u'  --maximum_workers NUMBER, --maximum-workers NUMBER',
+      (u'                        The maximum number of worker processes. If '
+       u'larger than'),
+      (u'                        the number of workers, the number of '
+       u'workers is'),
+      (u'                        adjusted during processing based on the '
+       u'event rate and'),
+      u'                        memory usage of the workers.',
+      u'  --worker_memory_limit SIZE, --worker-memory-limit SIZE',
+      (u'                        The maximum amount of memory in MiB a worker '
+       u'process'),
+      (u'                        can use. A worker process that exceeds the '
+       u'limit is'),
+      (u'                        replaced by a new worker process after '
+       u'completing its'),
+      u'                        current task.',
       u''])
 
   # TODO: add test for _FormatStatusTableRow.
@@ -0,0 +1,298 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""The log2timeline remote worker command line tool."""
+
+import argparse
+import logging
+import multiprocessing
+import sys
+import textwrap
+
+from plaso import dependencies
+from plaso.cli import extraction_tool
+from plaso.frontend import log2timeline
+from plaso.lib import errors
+
+
+class Log2TimelineWorkerTool(extraction_tool.ExtractionTool):
+  """Class that implements the log2timeline remote worker CLI tool.
+
+  Attributes:
+    dependencies_check (bool): True if the availability and versions of
+        dependencies should be checked.
+  """
+
+  NAME = u'log2timeline_worker'
+  DESCRIPTION = textwrap.dedent(u'\n'.join([
+      u'',
+      (u'log2timeline_worker is a command line tool that runs extraction '
+       u'worker'),
+      u'processes for a log2timeline instance on another host, that was ',
+      u'started with --remote_workers_host. The source must be available ',
+      u'on the same path as on the host that runs log2timeline.',
+      u'']))
+
+  EPILOG = textwrap.dedent(u'\n'.join([
+      u'',
+      u'Example usage:',
+      u'',
+      u'Run log2timeline on the host named "foreman":',
+      (u'    log2timeline.py --remote_workers_host "*" --remote_workers 4 '
+       u'--task_queue_port 5700 --task_storage_queue_port 5701 '
+       u'/cases/mycase/storage.plaso /mnt/evidence/image.E01'),
+      u'',
+      u'Run 4 extraction workers on another host:',
+      (u'    log2timeline_worker.py --workers 4 --task_queue_port 5700 '
+       u'--task_storage_queue_port 5701 foreman /mnt/evidence/image.E01'),
+      u'']))
+
+  def __init__(self, input_reader=None, output_writer=None):
+    """Initializes the CLI tool object.
+
+    Args:
+      input_reader (Optional[InputReader]): input reader, where None indicates
+          that the stdin input reader should be used.
+      output_writer (Optional[OutputWriter]): output writer, where None
+          indicates that the stdout output writer should be used.
+    """
+    super(Log2TimelineWorkerTool, self).__init__(
+        input_reader=input_reader, output_writer=output_writer)
+    self._command_line_arguments = None
+    self._foreman_host = None
+    self._front_end = log2timeline.Log2TimelineFrontend()
+    self._number_of_extraction_workers = 1
+    self._task_queue_port = None
+    self._task_storage_queue_port = None
+
+    self.dependencies_check = True
+
+  def _ParseWorkerOptions(self, options):
+    """Parses the worker options.
+
+    Args:
+      options (argparse.Namespace): command line arguments.
+
+    Raises:
+      BadConfigOption: if the options are invalid.
+    """
+    self._foreman_host = self.ParseStringOption(options, u'foreman_host')
+    if not self._foreman_host:
+      raise errors.BadConfigOption(u'Missing foreman host.')
+
+    self._number_of_extraction_workers = getattr(options, u'workers', 1)
+    if self._number_of_extraction_workers < 1:
+      raise errors.BadConfigOption(
+          u'Invalid number of workers: {0:d}.'.format(
+              self._number_of_extraction_workers))
+
+    self._task_queue_port = getattr(options, u'task_queue_port', None)
+    if self._task_queue_port is None:
+      raise errors.BadConfigOption(u'Missing task queue port.')
+
+    if not 0 < self._task_queue_port <= 65535:
+      raise errors.BadConfigOption(
+          u'Invalid task queue port: {0:d}.'.format(self._task_queue_port))
+
+    self._task_storage_queue_port = getattr(
+        options, u'task_storage_queue_port', None)
+    if self._task_storage_queue_port is None:
+      raise errors.BadConfigOption(u'Missing task storage queue port.')
+
+    if not 0 < self._task_storage_queue_port <= 65535:
+      raise errors.BadConfigOption(
+          u'Invalid task storage queue port: {0:d}.'.format(
+              self._task_storage_queue_port))
+
+  def AddWorkerOptions(self, argument_group):
+    """Adds the worker options to the argument group.
+
+    Args:
+      argument_group (argparse._ArgumentGroup): argparse argument group.
+    """
+    argument_group.add_argument(
+        u'--workers', dest=u'workers', action=u'store', type=int, default=1,
+        help=u'The number of worker processes [defaults to 1].')
+
+    argument_group.add_argument(
+        u'--task_queue_port', u'--task-queue-port', dest=u'task_queue_port',
+        action=u'store', type=int, default=None, metavar=u'PORT', help=(
+            u'Port of the task queue of log2timeline.'))
+
+    argument_group.add_argument(
+        u'--task_storage_queue_port', u'--task-storage-queue-port',
+        dest=u'task_storage_queue_port', action=u'store', type=int,
+        default=None, metavar=u'PORT', help=(
+            u'Port of the task storage queue of log2timeline.'))
+
+  def ParseArguments(self):
+    """Parses the command line arguments.
+
+    Returns:
+      bool: True if the arguments were successfully parsed.
+    """
+    self._ConfigureLogging()
+
+    argument_parser = argparse.ArgumentParser(
+        description=self.DESCRIPTION, epilog=self.EPILOG, add_help=False,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    self.AddBasicOptions(argument_parser)
+
+    extraction_group = argument_parser.add_argument_group(
+        u'Extraction Arguments')
+
+    self.AddExtractionOptions(extraction_group)
+    self.AddStorageMediaImageOptions(extraction_group)
+    self.AddTimezoneOption(extraction_group)
+    self.AddVSSProcessingOptions(extraction_group)
+    self.AddCredentialOptions(extraction_group)
+
+    info_group = argument_parser.add_argument_group(u'Informational Arguments')
+
+    self.AddInformationalOptions(info_group)
+
+    info_group.add_argument(
+        u'--no_dependencies_check', u'--no-dependencies-check',
+        dest=u'dependencies_check', action=u'store_false', default=True,
+        help=u'Disable the dependencies check.')
+
+    self.AddLogFileOptions(info_group)
+
+    worker_group = argument_parser.add_argument_group(u'Worker Arguments')
+
+    self.AddDataLocationOption(worker_group)
+    self.AddWorkerOptions(worker_group)
+
+    argument_parser.add_argument(
+        u'foreman_host', action=u'store', metavar=u'FOREMAN_HOST',
+        nargs=u'?', default=None, type=str, help=(
+            u'The host name or IP address of the host that runs '
+            u'log2timeline.'))
+
+    argument_parser.add_argument(
+        self._SOURCE_OPTION, action=u'store', metavar=u'SOURCE', nargs=u'?',
+        default=None, type=str, help=(
+            u'The path to the source device, file or directory, which must '
+            u'be the same as the source of log2timeline.'))
+
+    try:
+      options = argument_parser.parse_args()
+    except UnicodeEncodeError:
+      # If we get here we are attempting to print help in a non-Unicode
+      # terminal.
+      self._output_writer.Write(u'\n')
+      self._output_writer.Write(argument_parser.format_help())
+      return False
+
+    try:
+      self.ParseOptions(options)
+    except errors.BadConfigOption as exception:
+      self._output_writer.Write(u'ERROR: {0:s}'.format(exception))
+      self._output_writer.Write(u'\n')
+      self._output_writer.Write(argument_parser.format_usage())
+      return False
+
+    self._command_line_arguments = self.GetCommandLineArguments()
+
+    return True
+
+  def ParseOptions(self, options):
+    """Parses the options.
+
+    Args:
+      options (argparse.Namespace): command line arguments.
+
+    Raises:
+      BadConfigOption: if the options are invalid.
+    """
+    self._ParseExtractionOptions(options)
+    self._ParseTimezoneOption(options)
+
+    self.dependencies_check = getattr(options, u'dependencies_check', True)
+
+    super(Log2TimelineWorkerTool, self).ParseOptions(options)
+    self._ParseWorkerOptions(options)
+
+    format_string = (
+        u'%(asctime)s [%(levelname)s] (%(processName)-10s) PID:%(process)d '
+        u'<%(module)s> %(message)s')
+
+    if self._debug_mode:
+      logging_level = logging.DEBUG
+    elif self._quiet_mode:
+      logging_level = logging.WARNING
+    else:
+      logging_level = logging.INFO
+
+    self.ParseLogFileOptions(options)
+    self._ConfigureLogging(
+        filename=self._log_file, format_string=format_string,
+        log_level=logging_level)
+
+  def ProcessTasks(self):
+    """Processes tasks of log2timeline until it signals completion.
+
+    Raises:
+      SourceScannerError: if the source scanner could not find a supported
+                          file system.
+      UserAbort: if the user initiated an abort.
+    """
+    self._front_end.SetDebugMode(self._debug_mode)
+
+    scan_context = self.ScanSource()
+
+    session = self._front_end.CreateSession(
+        command_line_arguments=self._command_line_arguments,
+        parser_filter_expression=self._parser_filter_expression,
+        preferred_encoding=self.preferred_encoding,
+        preferred_year=self._preferred_year)
+
+    self._output_writer.Write(
+        u'Processing tasks of: {0:s}.\n'.format(self._foreman_host))
+
+    self._front_end.ProcessRemoteTasks(
+        session, self._source_path_specs, scan_context.source_type,
+        self._foreman_host, self._task_queue_port,
+        self._task_storage_queue_port,
+        force_preprocessing=self._force_preprocessing,
+        hasher_names_string=self._hasher_names_string,
+        number_of_extraction_workers=self._number_of_extraction_workers,
+        process_archive_files=self._process_archive_files,
+        temporary_directory=self._temporary_directory,
+        timezone=self._timezone, yara_rules_string=self._yara_rules_string)
+
+    self._output_writer.Write(u'Processing completed.\n')
+
+
+def Main():
+  """The main function."""
+  multiprocessing.freeze_support()
+
+  tool = Log2TimelineWorkerTool()
+
+  if not tool.ParseArguments():
+    return False
+
+  if tool.dependencies_check and not dependencies.CheckDependencies(
+      verbose_output=False):
+    return False
+
+  try:
+    tool.ProcessTasks()
+
+  except (KeyboardInterrupt, errors.UserAbort):
+    logging.warning(u'Aborted by user.')
+    return False
+
+  except errors.SourceScannerError as exception:
+    logging.warning(exception)
+    return False
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
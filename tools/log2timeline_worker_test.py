@@ -0,0 +1,85 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Tests for the log2timeline remote worker CLI tool."""
+
+import argparse
+import unittest
+
+from plaso.lib import errors
+
+from tests.cli import test_lib as cli_test_lib
+
+from tools import log2timeline_worker
+
+
+class Log2TimelineWorkerToolTest(cli_test_lib.CLIToolTestCase):
+  """Tests for the log2timeline remote worker CLI tool."""
+
+  _EXPECTED_WORKER_OPTIONS = u'\n'.join([
+      u'usage: log2timeline_worker_test.py [--workers WORKERS]',
+      u'                                   [--task_queue_port PORT]',
+      u'                                   [--task_storage_queue_port PORT]',
+      u'',
+      u'Test argument parser.',
+      u'',
+      u'optional arguments:',
+      (u'  --workers WORKERS     The number of worker processes [defaults '
+       u'to 1].'),
+      u'  --task_queue_port PORT, --task-queue-port PORT',
+      u'                        Port of the task queue of log2timeline.',
+      u'  --task_storage_queue_port PORT, --task-storage-queue-port PORT',
+      (u'                        Port of the task storage queue of '
+       u'log2timeline.'),
+      u''])
+
+  def testAddWorkerOptions(self):
+    """Tests the AddWorkerOptions function."""
+    argument_parser = argparse.ArgumentParser(
+        prog=u'log2timeline_worker_test.py',
+        description=u'Test argument parser.', add_help=False,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+
+    test_tool = log2timeline_worker.Log2TimelineWorkerTool()
+    test_tool.AddWorkerOptions(argument_parser)
+
+    output = self._RunArgparseFormatHelp(argument_parser)
+    self.assertEqual(output, self._EXPECTED_WORKER_OPTIONS)
+
+  def testParseOptions(self):
+    """Tests the ParseOptions function."""
+    output_writer = cli_test_lib.TestOutputWriter(encoding=u'utf-8')
+    test_tool = log2timeline_worker.Log2TimelineWorkerTool(
+        output_writer=output_writer)
+
+    options = cli_test_lib.TestOptions()
+    options.foreman_host = u'127.0.0.1'
+    options.source = self._GetTestFilePath([u'testdir'])
+    options.task_queue_port = 5700
+    options.task_storage_queue_port = 5701
+    options.workers = 2
+
+    test_tool.ParseOptions(options)
+
+    options = cli_test_lib.TestOptions()
+    options.source = self._GetTestFilePath([u'testdir'])
+    options.task_queue_port = 5700
+    options.task_storage_queue_port = 5701
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool.ParseOptions(options)
+
+    options.foreman_host = u'127.0.0.1'
+    options.task_queue_port = None
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool.ParseOptions(options)
+
+    options.task_queue_port = 5700
+    options.workers = 0
+
+    with self.assertRaises(errors.BadConfigOption):
+      test_tool.ParseOptions(options)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -161,6 +161,10 @@ class PsortTool(analysis_tool.AnalysisTool):
     Args:
       options (argparse.Namespace): command line arguments.
     """
+    use_shared_analysis_process = getattr(
+        options, u'use_shared_analysis_process', False)
+    self._front_end.SetUseSharedAnalysisProcess(use_shared_analysis_process)
+
     use_zeromq = getattr(options, u'use_zeromq', u'false')
     self._front_end.SetUseZeroMQ(use_zeromq == u'true')
 
@@ -238,6 +242,21 @@ class PsortTool(analysis_tool.AnalysisTool):
     else:
       self._front_end.SetPreferredLanguageIdentifier(preferred_language)
 
+  def _PrintEventsStatus(self, events_status):
+    """Prints the status of the events.
+
+    Args:
+      events_status (EventsStatus): events status.
+    """
+    self._output_writer.Write((
+        u'Events: {0:d} processed, {1:d} filtered, {2:d} duplicates removed, '
+        u'{3:d} spilled to disk, {4:d} peak buffered\n').format(
+            events_status.total_number_of_events,
+            events_status.number_of_filtered_events,
+            events_status.number_of_duplicate_events,
+            events_status.number_of_spilled_events,
+            events_status.peak_number_of_buffered_events))
+
   def _PrintStatusHeader(self):
     """Prints the processing status header."""
     self._output_writer.Write(
@@ -269,8 +288,9 @@ class PsortTool(analysis_tool.AnalysisTool):
 
     status_table = [status_header]
 
-    status_row = self._FormatStatusTableRow(processing_status.foreman_status)
-    status_table.append(status_row)
+    if processing_status.foreman_status:
+      status_row = self._FormatStatusTableRow(processing_status.foreman_status)
+      status_table.append(status_row)
 
     for worker_status in processing_status.workers_status:
       status_row = self._FormatStatusTableRow(worker_status)
@@ -280,6 +300,9 @@ class PsortTool(analysis_tool.AnalysisTool):
     self._output_writer.Write(u'\n'.join(status_table))
     self._output_writer.Write(u'\n')
 
+    if processing_status.events_status:
+      self._PrintEventsStatus(processing_status.events_status)
+
     if processing_status.aborted:
       self._output_writer.Write(
           u'Processing aborted - waiting for clean up.\n\n')
@@ -306,6 +329,9 @@ class PsortTool(analysis_tool.AnalysisTool):
               worker_status.status not in definitions.PROCESSING_ERROR_STATUS)
       self._output_writer.Write(status_line)
 
+    if processing_status.events_status:
+      self._PrintEventsStatus(processing_status.events_status)
+
   def _PromptUserForInput(self, input_text):
     """Prompts user for an input and return back read data.
 
@@ -340,6 +366,13 @@ class PsortTool(analysis_tool.AnalysisTool):
     Args:
       argument_group (argparse._ArgumentGroup): argparse argument group.
     """
+    argument_group.add_argument(
+        u'--shared_analysis_process', u'--shared-analysis-process',
+        dest=u'use_shared_analysis_process', action=u'store_true',
+        default=False, help=(
+            u'Run the analysis plugins that support it in a single shared '
+            u'analysis process instead of a process per plugin.'))
+
     # TODO: make default True when issue #822 is fixed.
     argument_group.add_argument(
         u'--use_zeromq', action=u'store', dest=u'use_zeromq',
@@ -760,6 +793,7 @@ class PsortTool(analysis_tool.AnalysisTool):
       events_counter = self._front_end.ExportEvents(
           storage_reader, output_module,
           deduplicate_events=self._deduplicate_events,
+          status_update_callback=status_update_callback,
           time_slice=self._time_slice, use_time_slicer=self._use_time_slicer)
 
       counter += events_counter
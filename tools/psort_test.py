@@ -94,9 +94,10 @@ class PsortToolTest(cli_test_lib.CLIToolTestCase):
       u'                     [--virustotal-api-key VIRUSTOTAL_API_KEY]',
       u'                     [--virustotal-free-rate-limit]',
       u'                     [--windows-services-output {text,yaml}]',
-      (u'                     [--viper-host VIPER_HOST] [--viper-protocol '
-       u'{http,https}]'),
-      u'                     [--tagging-file TAGGING_FILE]',
+      u'                     [--nsrl-hash-set PATH] [--viper-host VIPER_HOST]',
+      u'                     [--viper-protocol {http,https}]',
+      u'                     [--tagging-file TAGGING_FILE] [--hash-cache PATH]',
+      u'                     [--hash-cache-ttl DAYS]',
       u'',
       u'Test argument parser.',
       u'',
@@ -117,21 +118,43 @@ class PsortToolTest(cli_test_lib.CLIToolTestCase):
       (u'                        Specify how the results should be displayed. '
        u'Options'),
       u'                        are text and yaml.',
+      (u'  --nsrl-hash-set PATH  Path of the NSRL hash set file, as created '
+       u'by'),
+      (u'                        utils/create_hash_set.py from the NSRL '
+       u'RDS.'),
       u'  --viper-host VIPER_HOST',
       u'                        Specify the host to query Viper on.',
       u'  --viper-protocol {http,https}',
       u'                        Protocol to use to query Viper.',
       u'  --tagging-file TAGGING_FILE, --tagging_file TAGGING_FILE',
       u'                        Specify a file to read tagging criteria from.',
+      (u'  --hash-cache PATH     Path of a SQLite database file to cache the '
+       u'results of'),
+      (u'                        hash lookups in. The cache is consulted '
+       u'before a hash'),
+      (u'                        is looked up and can be shared between runs '
+       u'and'),
+      u'                        storage files.',
+      u'  --hash-cache-ttl DAYS',
+      (u'                        Number of days a cached hash lookup result is '
+       u'valid,'),
+      u'                        the default is 30 days.',
       u''])
 
   _EXPECTED_EXPERIMENTAL_OPTIONS = u'\n'.join([
-      u'usage: psort_test.py [--use_zeromq CHOICE]',
+      (u'usage: psort_test.py [--shared_analysis_process] '
+       u'[--use_zeromq CHOICE]'),
       u'',
       u'Test argument parser.',
       u'',
       u'optional arguments:',
-      u'  --use_zeromq CHOICE  Enables or disables queueing using ZeroMQ',
+      u'  --shared_analysis_process, --shared-analysis-process',
+      (u'                        Run the analysis plugins that support it in '
+       u'a single'),
+      (u'                        shared analysis process instead of a process '
+       u'per'),
+      u'                        plugin.',
+      u'  --use_zeromq CHOICE   Enables or disables queueing using ZeroMQ',
       u''])
 
   _EXPECTED_FILTER_OPTIONS = u'\n'.join([
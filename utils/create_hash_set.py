@@ -0,0 +1,123 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to create a hash set file for the NSRL analysis plugin.
+
+The hashes are read from a NSRL reference data set (RDS) NSRLFile.txt file
+or from a text file that contains one hash per line.
+"""
+
+from __future__ import print_function
+import argparse
+import csv
+import logging
+import sys
+import time
+
+# Change PYTHONPATH to include plaso.
+sys.path.insert(0, u'.')
+
+from plaso.analysis import hash_set
+
+
+# The digest size and NSRL RDS column name per hash type.
+HASH_TYPES = {
+    u'md5': (16, u'MD5'),
+    u'sha1': (20, u'SHA-1'),
+    u'sha256': (32, None)}
+
+
+def ReadHashes(file_object, column_name):
+  """Reads the hashes from a NSRL RDS file or a hash per line text file.
+
+  Args:
+    file_object (file): file-like object.
+    column_name (str): name of the column that contains the hashes in
+        a NSRL RDS file or None if the hash type is not stored in the RDS.
+
+  Yields:
+    str: hash, formatted as a hexadecimal string.
+  """
+  first_line = file_object.readline()
+  if first_line.startswith(b'"SHA-1"'):
+    if not column_name:
+      logging.error(u'Hash type not stored in NSRL RDS file.')
+      return
+
+    header = next(csv.reader([first_line]))
+    column_index = header.index(column_name)
+    for row in csv.reader(file_object):
+      if len(row) > column_index:
+        yield row[column_index]
+
+  else:
+    yield first_line.strip()
+    for line in file_object:
+      yield line.strip()
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Creates a hash set file from a NSRL RDS file or a text file that '
+      u'contains one hash per line.'))
+
+  argument_parser.add_argument(
+      u'--bloom_filter', u'--bloom-filter', dest=u'bloom_filter_bits',
+      type=int, default=10, metavar=u'BITS', help=(
+          u'number of Bloom filter bits per hash, where 0 represents no '
+          u'Bloom filter. The default of 10 bits results in a false positive '
+          u'rate of about 1 percent.'))
+
+  argument_parser.add_argument(
+      u'--hash_type', u'--hash-type', dest=u'hash_type', action=u'store',
+      choices=sorted(HASH_TYPES.keys()), default=u'md5', help=(
+          u'type of the hashes to store in the hash set file.'))
+
+  argument_parser.add_argument(
+      u'source', nargs=u'?', action=u'store', metavar=u'PATH', default=None,
+      help=u'path of the NSRL RDS NSRLFile.txt or hash per line text file.')
+
+  argument_parser.add_argument(
+      u'destination', nargs=u'?', action=u'store', metavar=u'PATH',
+      default=None, help=u'path of the hash set file.')
+
+  options = argument_parser.parse_args()
+
+  if not options.source or not options.destination:
+    print(u'Source or destination missing.')
+    print(u'')
+    argument_parser.print_help()
+    return False
+
+  logging.basicConfig(
+      level=logging.INFO, format=u'[%(levelname)s] %(message)s')
+
+  digest_size, column_name = HASH_TYPES[options.hash_type]
+  writer = hash_set.HashSetFileWriter(
+      digest_size, bloom_filter_bits_per_digest=options.bloom_filter_bits)
+
+  start_time = time.time()
+  number_of_invalid_hashes = 0
+  with open(options.source, u'rb') as file_object:
+    for hash_value in ReadHashes(file_object, column_name):
+      if hash_value and not writer.AddHash(hash_value):
+        number_of_invalid_hashes += 1
+
+  number_of_digests = writer.Write(options.destination)
+
+  print(u'Number of hashes written: {0:d}'.format(number_of_digests))
+  print(u'Number of invalid hashes: {0:d}'.format(number_of_invalid_hashes))
+  print(u'Time spent: {0:.3f}s'.format(time.time() - start_time))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,377 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to create a storage file with synthetic events.
+
+The events are written in multiple event streams, one per session, and
+a configurable part of the events is duplicated in a next stream, similar
+to the same file being processed in multiple volume shadow snapshots.
+The events are tagged in a separate session, similar to running the tagging
+analysis plugin.
+"""
+
+from __future__ import print_function
+import argparse
+import logging
+import random
+import sys
+import time
+
+# Change PYTHONPATH to include plaso.
+sys.path.insert(0, u'.')
+
+from plaso.containers import events
+from plaso.containers import sessions
+from plaso.lib import timelib
+from plaso.storage import zip_file as storage_zip_file
+
+
+# The labels of the event tags.
+LABELS = [u'application_execution', u'browser_search', u'file_download']
+
+# Number of micro seconds in the time span of the events, which is a year.
+TIME_SPAN = 365 * 24 * 60 * 60 * 1000000
+
+
+def _GetChromeHistoryEventValues(random_generator, index):
+  """Retrieves the values of a synthetic Chrome history event.
+
+  Args:
+    random_generator (random.Random): random number generator.
+    index (int): index of the event.
+
+  Returns:
+    dict[str, object]: event values.
+  """
+  host = u'www{0:d}.example.com'.format(random_generator.randint(0, 99))
+  return {
+      u'extra': u'',
+      u'filename': u'/Users/user/Library/Chrome/Default/History',
+      u'from_visit': u'',
+      u'host': host,
+      u'parser': u'sqlite/chrome_history',
+      u'timestamp_desc': u'Last Visited Time',
+      u'title': u'Page {0:d}'.format(index),
+      u'typed_count': random_generator.randint(0, 10),
+      u'url': u'https://{0:s}/{1:d}.html'.format(host, index),
+      u'visit_source': u'SYNCED'}
+
+
+def _GetFileStatEventValues(random_generator, index):
+  """Retrieves the values of a synthetic file stat event.
+
+  Args:
+    random_generator (random.Random): random number generator.
+    index (int): index of the event.
+
+  Returns:
+    dict[str, object]: event values.
+  """
+  filename = u'/Windows/System32/file{0:d}.dll'.format(index)
+  return {
+      u'display_name': u'OS:{0:s}'.format(filename),
+      u'file_entry_type': 5,
+      u'file_size': random_generator.randint(0, 1024 * 1024),
+      u'file_system_type': u'NTFS',
+      u'filename': filename,
+      u'inode': index,
+      u'is_allocated': True,
+      u'parser': u'filestat',
+      u'timestamp_desc': random_generator.choice([
+          u'Content Modification Time', u'Creation Time',
+          u'Last Access Time', u'Metadata Modification Time'])}
+
+
+def _GetSyslogEventValues(random_generator, index):
+  """Retrieves the values of a synthetic syslog line event.
+
+  Args:
+    random_generator (random.Random): random number generator.
+    index (int): index of the event.
+
+  Returns:
+    dict[str, object]: event values.
+  """
+  return {
+      u'body': u'Connection {0:d} closed by 10.0.0.{1:d}'.format(
+          index, random_generator.randint(1, 254)),
+      u'filename': u'/var/log/syslog',
+      u'hostname': u'myhost',
+      u'parser': u'syslog',
+      u'pid': random_generator.randint(1, 32768),
+      u'reporter': random_generator.choice([u'CRON', u'kernel', u'sshd']),
+      u'timestamp_desc': u'Content Modification Time'}
+
+
+def _GetWindowsEventLogEventValues(random_generator, index):
+  """Retrieves the values of a synthetic Windows XML EventLog event.
+
+  Args:
+    random_generator (random.Random): random number generator.
+    index (int): index of the event.
+
+  Returns:
+    dict[str, object]: event values.
+  """
+  return {
+      u'computer_name': u'WKS-WIN7',
+      u'event_identifier': random_generator.choice([4624, 4634, 7036]),
+      u'event_level': 4,
+      u'filename': u'/Windows/System32/winevt/Logs/System.evtx',
+      u'parser': u'winevtx',
+      u'record_number': index,
+      u'source_name': u'Service Control Manager',
+      u'strings': [u'Service{0:d}'.format(index), u'running'],
+      u'timestamp_desc': u'Content Modification Time'}
+
+
+def _GetWindowsRegistryEventValues(random_generator, index):
+  """Retrieves the values of a synthetic Windows Registry event.
+
+  Args:
+    random_generator (random.Random): random number generator.
+    index (int): index of the event.
+
+  Returns:
+    dict[str, object]: event values.
+  """
+  return {
+      u'filename': u'/Users/user/NTUSER.DAT',
+      u'key_path': (
+          u'HKEY_CURRENT_USER\\Software\\Vendor{0:d}\\Key{1:d}').format(
+              random_generator.randint(0, 99), index),
+      u'parser': u'winreg/winreg_default',
+      u'regvalue': {u'Value': u'value {0:d}'.format(index)},
+      u'timestamp_desc': u'Last Written Time'}
+
+
+# The functions that retrieve the event values per data type.
+DATA_TYPES = {
+    u'chrome:history:page_visited': _GetChromeHistoryEventValues,
+    u'fs:stat': _GetFileStatEventValues,
+    u'syslog:line': _GetSyslogEventValues,
+    u'windows:evtx:record': _GetWindowsEventLogEventValues,
+    u'windows:registry:key_value': _GetWindowsRegistryEventValues}
+
+
+def CreateEvent(random_generator, index, data_type, timestamp):
+  """Creates a synthetic event.
+
+  Args:
+    random_generator (random.Random): random number generator.
+    index (int): index of the event.
+    data_type (str): data type of the event.
+    timestamp (int): timestamp of the event.
+
+  Returns:
+    EventObject: event.
+  """
+  event = events.EventObject()
+  event.data_type = data_type
+  event.timestamp = timestamp
+
+  event_values_function = DATA_TYPES[data_type]
+  for name, value in event_values_function(random_generator, index).items():
+    setattr(event, name, value)
+
+  return event
+
+
+def CreateStorageFile(
+    path, data_types, number_of_events=10000, number_of_streams=1,
+    number_of_tags=0, percentage_of_duplicates=0, seed=0):
+  """Creates a storage file with synthetic events.
+
+  The event tags are added to random events in the storage file, which
+  includes the events of a previous run if the storage file already exists.
+
+  Args:
+    path (str): path of the storage file.
+    data_types (list[str]): data types of the events, where the data type of
+        every event is chosen at random.
+    number_of_events (Optional[int]): number of events, including
+        the duplicate events.
+    number_of_streams (Optional[int]): number of event streams, where
+        a large event stream can be split by the storage writer.
+    number_of_tags (Optional[int]): number of event tags.
+    percentage_of_duplicates (Optional[int]): percentage of the events that
+        is a duplicate of an event in the previous stream.
+    seed (Optional[int]): seed of the random number generator, so that
+        the same storage file is created for the same arguments.
+
+  Returns:
+    int: number of event tags written, which is smaller than the requested
+        number of event tags if there are less events.
+  """
+  random_generator = random.Random(seed)
+  start_timestamp = timelib.Timestamp.CopyFromString(u'2016-01-01 00:00:00')
+
+  events_per_stream = [[] for _ in range(number_of_streams)]
+
+  for index in range(number_of_events):
+    stream_index = index % number_of_streams
+    stream_events = events_per_stream[stream_index]
+
+    previous_stream_events = events_per_stream[stream_index - 1]
+    if (stream_index > 0 and previous_stream_events and
+        random_generator.randint(1, 100) <= percentage_of_duplicates):
+      # The duplicate event differs only in attributes that are ignored
+      # when events are compared, such as the display name.
+      original_event = random_generator.choice(previous_stream_events)
+      event = CreateEvent(
+          random.Random(original_event.inode), original_event.inode,
+          original_event.data_type, original_event.timestamp)
+      event.display_name = u'VSS{0:d}:{1:s}'.format(
+          stream_index, getattr(event, u'display_name', event.filename))
+      event.inode = original_event.inode
+
+    else:
+      data_type = random_generator.choice(data_types)
+      timestamp = start_timestamp + random_generator.randint(0, TIME_SPAN)
+
+      # The inode is used to recreate the same event values for duplicates.
+      event = CreateEvent(random.Random(index), index, data_type, timestamp)
+      event.inode = index
+
+    stream_events.append(event)
+
+  for stream_events in events_per_stream:
+    if not stream_events:
+      continue
+
+    storage_writer = storage_zip_file.ZIPStorageFileWriter(
+        sessions.Session(), path)
+    storage_writer.Open()
+    storage_writer.WriteSessionStart()
+
+    for event in stream_events:
+      storage_writer.AddEvent(event)
+
+    storage_writer.WriteSessionCompletion()
+    storage_writer.Close()
+
+  event_tag_identifiers = []
+  if number_of_tags:
+    # The storage writer can split a session into multiple event streams and
+    # the storage file can contain event streams of a previous run, hence
+    # the stream number and index of the events are read back.
+    storage_file = storage_zip_file.ZIPStorageFile()
+    storage_file.Open(path=path)
+
+    try:
+      for event in storage_file.GetEvents():
+        event_tag_identifiers.append((event.store_number, event.store_index))
+    finally:
+      storage_file.Close()
+
+    event_tag_identifiers.sort()
+
+  number_of_tags = min(number_of_tags, len(event_tag_identifiers))
+  if number_of_tags:
+    storage_writer = storage_zip_file.ZIPStorageFileWriter(
+        sessions.Session(), path)
+    storage_writer.Open()
+    storage_writer.WriteSessionStart()
+
+    for store_number, store_index in sorted(random_generator.sample(
+        event_tag_identifiers, number_of_tags)):
+      event_tag = events.EventTag()
+      event_tag.store_number = store_number
+      event_tag.store_index = store_index
+      event_tag.AddLabel(random_generator.choice(LABELS))
+      storage_writer.AddEventTag(event_tag)
+
+    storage_writer.WriteSessionCompletion()
+    storage_writer.Close()
+
+  return number_of_tags
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Creates a storage file with synthetic events.'))
+
+  argument_parser.add_argument(
+      u'--data_types', u'--data-types', dest=u'data_types', action=u'store',
+      metavar=u'NAMES', default=None, help=(
+          u'comma separated data types of the events. Defaults to all '
+          u'supported data types: {0:s}.').format(
+              u', '.join(sorted(DATA_TYPES.keys()))))
+
+  argument_parser.add_argument(
+      u'--duplicates', dest=u'percentage_of_duplicates', type=int, default=0,
+      metavar=u'PERCENTAGE', help=(
+          u'percentage of the events that is a duplicate of an event in '
+          u'the previous event stream.'))
+
+  argument_parser.add_argument(
+      u'--events', dest=u'number_of_events', type=int, default=10000,
+      metavar=u'NUMBER', help=u'number of events.')
+
+  argument_parser.add_argument(
+      u'--seed', dest=u'seed', type=int, default=0, metavar=u'NUMBER',
+      help=u'seed of the random number generator.')
+
+  argument_parser.add_argument(
+      u'--streams', dest=u'number_of_streams', type=int, default=1,
+      metavar=u'NUMBER', help=u'number of event streams.')
+
+  argument_parser.add_argument(
+      u'--tags', dest=u'number_of_tags', type=int, default=0,
+      metavar=u'NUMBER', help=u'number of event tags.')
+
+  argument_parser.add_argument(
+      u'storage_file', nargs=u'?', action=u'store', metavar=u'PATH',
+      default=None, help=u'path of the storage file.')
+
+  options = argument_parser.parse_args()
+
+  if not options.storage_file:
+    print(u'Storage file missing.')
+    print(u'')
+    argument_parser.print_help()
+    return False
+
+  if options.number_of_streams < 1:
+    print(u'Number of event streams must be 1 or more.')
+    return False
+
+  if options.data_types:
+    data_types = [
+        data_type.strip() for data_type in options.data_types.split(u',')]
+  else:
+    data_types = sorted(DATA_TYPES.keys())
+
+  for data_type in data_types:
+    if data_type not in DATA_TYPES:
+      print(u'Unsupported data type: {0:s}.'.format(data_type))
+      return False
+
+  logging.basicConfig(
+      level=logging.INFO, format=u'[%(levelname)s] %(message)s')
+
+  start_time = time.time()
+  number_of_tags = CreateStorageFile(
+      options.storage_file, data_types,
+      number_of_events=options.number_of_events,
+      number_of_streams=options.number_of_streams,
+      number_of_tags=options.number_of_tags,
+      percentage_of_duplicates=options.percentage_of_duplicates,
+      seed=options.seed)
+
+  print(u'Number of events written: {0:d}'.format(options.number_of_events))
+  print(u'Number of event tags written: {0:d}'.format(number_of_tags))
+  print(u'Time spent: {0:.3f}s'.format(time.time() - start_time))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
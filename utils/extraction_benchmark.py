@@ -0,0 +1,469 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the extraction of events from the test data.
+
+Every benchmark extracts events from a set of test data files with a single
+parser, using the single process or multi process engine. The files can be
+scaled up by extracting events from multiple copies of the files. The results
+are written in JSON and can be compared against the results of a previous
+run, the baseline, to detect regressions.
+"""
+
+from __future__ import print_function
+import argparse
+import glob
+import json
+import logging
+import multiprocessing
+import os
+import platform
+import Queue
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+from dfvfs.resolver import context as dfvfs_context
+
+# Change PYTHONPATH to include plaso.
+sys.path.insert(0, u'.')
+
+from plaso.containers import sessions
+from plaso.engine import single_process
+from plaso.multi_processing import task_engine
+from plaso.storage import zip_file as storage_zip_file
+
+
+# The test data files per parser filter expression.
+DEFAULT_BENCHMARKS = {
+    u'lnk': [u'example.lnk', u'NeroInfoTool.lnk'],
+    u'mactime': [u'mactime.body'],
+    u'msiecf': [u'index.dat'],
+    u'olecf': [u'Document.doc'],
+    u'prefetch': [
+        u'CMD.EXE-087B4001.pf', u'PING.EXE-B29F6629.pf',
+        u'TASKHOST.EXE-3AE259FC.pf', u'WUAUCLT.EXE-830BCC14.pf'],
+    u'sqlite': [u'History', u'cookies.db', u'places.sqlite'],
+    u'syslog': [u'syslog'],
+    u'winevtx': [u'System.evtx'],
+    u'winreg': [u'NTUSER.DAT', u'SAM'],
+    u'utmp': [u'wtmp.1']}
+
+ENGINE_TYPES = frozenset([u'multi', u'single'])
+
+# The metrics that are compared against the baseline, as a tuple of
+# the name of the metric and a boolean that indicates if a higher value
+# is better.
+COMPARED_METRICS = [
+    (u'events_per_second', True),
+    (u'bytes_per_second', True),
+    (u'peak_rss_bytes', False),
+    (u'serializer_time', False)]
+
+
+def _GetPeakRSS():
+  """Retrieves the peak resident memory size of the process and its children.
+
+  Returns:
+    int: peak resident memory size in bytes.
+  """
+  maximum_rss = max(
+      resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+      resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+  # ru_maxrss is in bytes on Mac OS X and in kilobytes on other platforms.
+  if platform.system() == u'Darwin':
+    return maximum_rss
+  return maximum_rss * 1024
+
+
+def _GetSerializerTime(profiling_directory):
+  """Retrieves the time spent by the serializers from the profiling files.
+
+  Args:
+    profiling_directory (str): path of the directory with the serializers
+        profiling files of the engine and the worker processes.
+
+  Returns:
+    float: number of seconds spent by the serializers.
+  """
+  serializer_time = 0.0
+  for path in glob.glob(os.path.join(profiling_directory, u'serializers-*')):
+    with open(path, 'rb') as file_object:
+      # Skip the header.
+      file_object.readline()
+      for line in file_object:
+        values = line.rstrip().split(b'\t')
+        if len(values) == 4:
+          serializer_time += float(values[3])
+
+  return serializer_time
+
+
+def _RunBenchmark(
+    source_directory, parser_filter_expression, engine_type,
+    number_of_worker_processes, result_queue):
+  """Extracts events from a source directory and measures the extraction.
+
+  This function runs in a separate process so that the peak resident memory
+  size of the benchmark is not influenced by previous benchmarks.
+
+  Args:
+    source_directory (str): path of the directory with the source files.
+    parser_filter_expression (str): parser filter expression.
+    engine_type (str): engine type, either "multi" or "single".
+    number_of_worker_processes (int): number of worker processes of the
+        multi process engine.
+    result_queue (multiprocessing.Queue): queue to put the result on.
+  """
+  temporary_directory = tempfile.mkdtemp()
+  try:
+    profiling_directory = os.path.join(temporary_directory, u'profiling')
+    os.mkdir(profiling_directory)
+
+    session = sessions.Session()
+    storage_file_path = os.path.join(temporary_directory, u'storage.plaso')
+    storage_writer = storage_zip_file.ZIPStorageFileWriter(
+        session, storage_file_path)
+
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=source_directory)
+
+    start_time = time.time()
+
+    if engine_type == u'single':
+      engine = single_process.SingleProcessEngine(
+          enable_profiling=True, profiling_directory=profiling_directory,
+          profiling_type=u'serializers')
+      engine.ProcessSources(
+          [source_path_spec], storage_writer, dfvfs_context.Context(),
+          parser_filter_expression=parser_filter_expression,
+          temporary_directory=temporary_directory)
+
+    else:
+      engine = task_engine.TaskMultiProcessEngine(
+          enable_profiling=True, profiling_directory=profiling_directory,
+          profiling_type=u'serializers')
+      engine.ProcessSources(
+          session.identifier, [source_path_spec], storage_writer,
+          number_of_worker_processes=number_of_worker_processes,
+          parser_filter_expression=parser_filter_expression,
+          temporary_directory=temporary_directory)
+
+    elapsed_time = time.time() - start_time
+
+    result_queue.put({
+        u'elapsed_time': elapsed_time,
+        u'number_of_events': storage_writer.number_of_events,
+        u'peak_rss_bytes': _GetPeakRSS(),
+        u'serializer_time': _GetSerializerTime(profiling_directory)})
+
+  finally:
+    shutil.rmtree(temporary_directory, True)
+
+
+def CreateSourceDirectory(paths, scale, directory):
+  """Creates a source directory with scaled copies of the source files.
+
+  Args:
+    paths (list[str]): paths of the source files.
+    scale (int): number of copies of each source file.
+    directory (str): path of the source directory.
+
+  Returns:
+    tuple[int, int]: number of files and bytes in the source directory.
+  """
+  number_of_bytes = 0
+  number_of_files = 0
+  for index in range(scale):
+    copy_directory = os.path.join(directory, u'{0:d}'.format(index))
+    os.mkdir(copy_directory)
+
+    for path in paths:
+      shutil.copy(path, copy_directory)
+      number_of_bytes += os.path.getsize(path)
+      number_of_files += 1
+
+  return number_of_files, number_of_bytes
+
+
+def BenchmarkExtraction(
+    parser_filter_expression, paths, scale, engine_type,
+    number_of_worker_processes, number_of_iterations):
+  """Benchmarks the extraction of events from source files.
+
+  Args:
+    parser_filter_expression (str): parser filter expression.
+    paths (list[str]): paths of the source files.
+    scale (int): number of copies of each source file.
+    engine_type (str): engine type, either "multi" or "single".
+    number_of_worker_processes (int): number of worker processes of the
+        multi process engine.
+    number_of_iterations (int): number of times the extraction is run,
+        where the fastest run is reported.
+
+  Returns:
+    dict[str, object]: result of the benchmark or None if the extraction
+        failed.
+  """
+  source_directory = tempfile.mkdtemp()
+  try:
+    number_of_files, number_of_bytes = CreateSourceDirectory(
+        paths, scale, source_directory)
+
+    fastest_run = None
+    for _ in range(number_of_iterations):
+      result_queue = multiprocessing.Queue()
+      process = multiprocessing.Process(
+          target=_RunBenchmark, args=(
+              source_directory, parser_filter_expression, engine_type,
+              number_of_worker_processes, result_queue))
+      process.start()
+
+      run = None
+      try:
+        while run is None:
+          try:
+            run = result_queue.get(timeout=1)
+          except Queue.Empty:
+            # The benchmark process exited without a result.
+            if not process.is_alive():
+              break
+
+      except KeyboardInterrupt:
+        process.terminate()
+        raise
+
+      finally:
+        process.join()
+
+      if not run:
+        logging.error(
+            u'Extraction with parser: {0:s} failed.'.format(
+                parser_filter_expression))
+        return
+
+      if not fastest_run or run[u'elapsed_time'] < fastest_run[
+          u'elapsed_time']:
+        fastest_run = run
+
+  finally:
+    shutil.rmtree(source_directory, True)
+
+  elapsed_time = max(fastest_run[u'elapsed_time'], 0.000001)
+
+  result = {
+      u'engine': engine_type,
+      u'number_of_bytes': number_of_bytes,
+      u'number_of_files': number_of_files,
+      u'parser': parser_filter_expression,
+      u'scale': scale}
+  result.update(fastest_run)
+  result[u'bytes_per_second'] = number_of_bytes / elapsed_time
+  result[u'events_per_second'] = fastest_run[u'number_of_events'] / (
+      elapsed_time)
+
+  return result
+
+
+def CompareResults(results, baseline_results, threshold):
+  """Compares benchmark results against baseline results.
+
+  Args:
+    results (list[dict[str, object]]): results of the benchmarks.
+    baseline_results (list[dict[str, object]]): results of the baseline.
+    threshold (float): relative change, such as 0.1 for 10%, at which
+        a difference with the baseline is considered a regression.
+
+  Returns:
+    list[str]: descriptions of the regressions.
+  """
+  baseline_results_per_key = {}
+  for baseline_result in baseline_results:
+    key = (
+        baseline_result[u'parser'], baseline_result[u'engine'],
+        baseline_result[u'scale'])
+    baseline_results_per_key[key] = baseline_result
+
+  regressions = []
+  for result in results:
+    key = (result[u'parser'], result[u'engine'], result[u'scale'])
+    baseline_result = baseline_results_per_key.get(key, None)
+    if not baseline_result:
+      continue
+
+    if result[u'number_of_events'] != baseline_result[u'number_of_events']:
+      regressions.append((
+          u'{0:s} ({1:s} engine, scale {2:d}): number of events changed from '
+          u'{3:d} to {4:d}').format(
+              result[u'parser'], result[u'engine'], result[u'scale'],
+              baseline_result[u'number_of_events'],
+              result[u'number_of_events']))
+
+    for metric_name, higher_is_better in COMPARED_METRICS:
+      baseline_value = baseline_result.get(metric_name, None)
+      value = result.get(metric_name, None)
+      if not baseline_value or value is None:
+        continue
+
+      change = (value - baseline_value) / float(baseline_value)
+      if higher_is_better:
+        change = -change
+
+      if change > threshold:
+        regressions.append((
+            u'{0:s} ({1:s} engine, scale {2:d}): {3:s} regressed by {4:.1f}% '
+            u'from {5:.2f} to {6:.2f}').format(
+                result[u'parser'], result[u'engine'], result[u'scale'],
+                metric_name, change * 100.0, baseline_value, value))
+
+  return regressions
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks the extraction of events from the test data per parser.'))
+
+  argument_parser.add_argument(
+      u'--baseline', dest=u'baseline', action=u'store', metavar=u'PATH',
+      default=None, help=(
+          u'path of a results file of a previous run to compare the results '
+          u'against.'))
+
+  argument_parser.add_argument(
+      u'--engine', dest=u'engine_types', action=u'append',
+      choices=sorted(ENGINE_TYPES), default=None, help=(
+          u'engine to benchmark, can be specified multiple times. Defaults '
+          u'to the single process engine.'))
+
+  argument_parser.add_argument(
+      u'--iterations', dest=u'number_of_iterations', type=int, default=1,
+      metavar=u'NUMBER', help=(
+          u'number of times every benchmark is run, where the fastest run is '
+          u'reported.'))
+
+  argument_parser.add_argument(
+      u'--output', dest=u'output', action=u'store', metavar=u'PATH',
+      default=None, help=u'path of the file to write the results to.')
+
+  argument_parser.add_argument(
+      u'--parsers', dest=u'parsers', action=u'store', metavar=u'NAMES',
+      default=None, help=(
+          u'comma separated names of the parsers to benchmark. Defaults to '
+          u'all the parsers with test data files: {0:s}.').format(
+              u', '.join(sorted(DEFAULT_BENCHMARKS.keys()))))
+
+  argument_parser.add_argument(
+      u'--scale', dest=u'scales', action=u'append', type=int, default=None,
+      metavar=u'NUMBER', help=(
+          u'number of copies of the test data files to extract events from, '
+          u'can be specified multiple times. Defaults to 1.'))
+
+  argument_parser.add_argument(
+      u'--test_data', u'--test-data', dest=u'test_data', action=u'store',
+      metavar=u'PATH', default=u'test_data', help=(
+          u'path of the test data directory.'))
+
+  argument_parser.add_argument(
+      u'--threshold', dest=u'threshold', type=float, default=10.0,
+      metavar=u'PERCENTAGE', help=(
+          u'percentage a metric can differ from the baseline before it is '
+          u'considered a regression.'))
+
+  argument_parser.add_argument(
+      u'--workers', dest=u'number_of_worker_processes', type=int, default=0,
+      metavar=u'NUMBER', help=(
+          u'number of worker processes of the multi process engine, where 0 '
+          u'represents the number of CPUs.'))
+
+  options = argument_parser.parse_args()
+
+  if options.parsers:
+    parser_names = [
+        parser_name.strip() for parser_name in options.parsers.split(u',')]
+  else:
+    parser_names = sorted(DEFAULT_BENCHMARKS.keys())
+
+  for parser_name in parser_names:
+    if parser_name not in DEFAULT_BENCHMARKS:
+      print(u'Unsupported parser: {0:s}.'.format(parser_name))
+      print(u'')
+      argument_parser.print_help()
+      return False
+
+  baseline_results = None
+  if options.baseline:
+    try:
+      with open(options.baseline, 'rb') as file_object:
+        baseline_results = json.load(file_object)[u'results']
+    except (IOError, KeyError, ValueError) as exception:
+      print(u'Unable to read baseline: {0:s} with error: {1!s}'.format(
+          options.baseline, exception))
+      return False
+
+  logging.basicConfig(
+      level=logging.ERROR, format=u'[%(levelname)s] %(message)s')
+
+  results = []
+  print(u'Parser\t\tEngine\tScale\tEvents\tEvents/s\tMiB/s\tPeak RSS\t'
+        u'Serializers')
+
+  for engine_type in options.engine_types or [u'single']:
+    for scale in options.scales or [1]:
+      for parser_name in parser_names:
+        paths = [
+            os.path.join(options.test_data, filename)
+            for filename in DEFAULT_BENCHMARKS[parser_name]]
+
+        result = BenchmarkExtraction(
+            parser_name, paths, scale, engine_type,
+            options.number_of_worker_processes,
+            options.number_of_iterations)
+        if not result:
+          return False
+
+        results.append(result)
+        print((
+            u'{0:s}\t{1:s}\t{2:d}\t{3:d}\t{4:.1f}\t\t{5:.2f}\t{6:d} MiB\t'
+            u'{7:.3f}s').format(
+                parser_name.ljust(8), engine_type, scale,
+                result[u'number_of_events'], result[u'events_per_second'],
+                result[u'bytes_per_second'] / (1024 * 1024),
+                result[u'peak_rss_bytes'] // (1024 * 1024),
+                result[u'serializer_time']))
+
+  if options.output:
+    with open(options.output, 'wb') as file_object:
+      json.dump({u'results': results}, file_object, indent=2, sort_keys=True)
+
+  if baseline_results is not None:
+    regressions = CompareResults(
+        results, baseline_results, options.threshold / 100.0)
+
+    print(u'')
+    if not regressions:
+      print(u'No regressions compared to baseline: {0:s}'.format(
+          options.baseline))
+    else:
+      print(u'Regressions compared to baseline: {0:s}'.format(
+          options.baseline))
+      for regression in regressions:
+        print(u'  {0:s}'.format(regression))
+      return False
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,150 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the compiled filters against the object filters.
+
+The events are read from a plaso storage file into memory after which every
+filter expression is matched against all events by both the object filter
+and the compiled filter.
+"""
+
+from __future__ import print_function
+import argparse
+import logging
+import sys
+import time
+
+# Change PYTHONPATH to include plaso.
+sys.path.insert(0, u'.')
+
+# The filters need to be imported before pfilter to prevent a circular import.
+import plaso.filters  # pylint: disable=unused-import
+
+from plaso.lib import filter_compiler
+from plaso.lib import pfilter
+from plaso.storage import zip_file as storage_zip_file
+
+
+# Filter expressions typically used with psort.
+DEFAULT_FILTER_EXPRESSIONS = [
+    u'parser is \'filestat\'',
+    u'parser is \'winreg\' and message contains \'Run\'',
+    u'date > \'2010-01-01 00:00:00\' and date < \'2016-01-01 00:00:00\'',
+    u'filename contains \'Users\' and timestamp_desc is \'Content Modification '
+    u'Time\'',
+    u'data_type is \'fs:stat\' or data_type is \'windows:registry:key_value\'',
+    u'message iregexp \'(password|secret|confidential)\'',
+    u'parser inlist \'webhist\' and url contains \'google\'',
+    u'source is \'LOG\' and message not contains \'cron\'']
+
+
+def BenchmarkFilter(events, filter_expression, number_of_iterations):
+  """Benchmarks a filter expression.
+
+  Args:
+    events (list[EventObject]): events.
+    filter_expression (str): filter expression.
+    number_of_iterations (int): number of times the events are matched.
+
+  Returns:
+    tuple[int, float, float]: number of matching events and the number of
+        seconds spent by the object filter and by the compiled filter.
+  """
+  parser = pfilter.BaseParser(filter_expression).Parse()
+  filter_object = parser.Compile(pfilter.PlasoAttributeFilterImplementation)
+  compiled_filter = filter_compiler.CompiledFilter(filter_object)
+
+  number_of_matches = 0
+  for event in events:
+    if filter_object.Matches(event) != compiled_filter.Matches(event):
+      logging.warning(
+          u'Compiled filter: {0:s} result differs for event: {1!s}'.format(
+              filter_expression, getattr(event, u'uuid', None)))
+
+    if compiled_filter.Matches(event):
+      number_of_matches += 1
+
+  results = []
+  for matches_function in (filter_object.Matches, compiled_filter.Matches):
+    start_time = time.time()
+    for _ in range(number_of_iterations):
+      for event in events:
+        matches_function(event)
+
+    results.append(time.time() - start_time)
+
+  return number_of_matches, results[0], results[1]
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks the compiled filters against the object filters.'))
+
+  argument_parser.add_argument(
+      u'-f', u'--filter', dest=u'filter_expressions', action=u'append',
+      metavar=u'EXPRESSION', default=None, help=(
+          u'filter expression to benchmark, can be specified multiple times. '
+          u'Defaults to a set of filter expressions typically used with '
+          u'psort.'))
+
+  argument_parser.add_argument(
+      u'--iterations', dest=u'number_of_iterations', type=int, default=1,
+      metavar=u'NUMBER', help=u'number of times the events are matched.')
+
+  argument_parser.add_argument(
+      u'--maximum_number_of_events', u'--maximum-number-of-events',
+      dest=u'maximum_number_of_events', type=int, default=0,
+      metavar=u'NUMBER', help=(
+          u'maximum number of events to read from the storage file, where 0 '
+          u'represents no limit.'))
+
+  argument_parser.add_argument(
+      u'storage_file', nargs=u'?', action=u'store', metavar=u'PATH',
+      default=None, help=u'path of the plaso storage file.')
+
+  options = argument_parser.parse_args()
+
+  if not options.storage_file:
+    print(u'Storage file missing.')
+    print(u'')
+    argument_parser.print_help()
+    return False
+
+  logging.basicConfig(
+      level=logging.INFO, format=u'[%(levelname)s] %(message)s')
+
+  events = []
+  with storage_zip_file.ZIPStorageFileReader(options.storage_file) as reader:
+    for event in reader.GetEvents():
+      events.append(event)
+      if (options.maximum_number_of_events and
+          len(events) >= options.maximum_number_of_events):
+        break
+
+  print(u'Number of events: {0:d}'.format(len(events)))
+  print(u'')
+  print(u'Matches\tObject filter\tCompiled filter\tSpeedup\tFilter')
+
+  for filter_expression in (
+      options.filter_expressions or DEFAULT_FILTER_EXPRESSIONS):
+    number_of_matches, object_filter_time, compiled_filter_time = (
+        BenchmarkFilter(
+            events, filter_expression, options.number_of_iterations))
+
+    speedup = object_filter_time / max(compiled_filter_time, 0.000001)
+    print(u'{0:d}\t{1:.3f}s\t\t{2:.3f}s\t\t{3:.1f}x\t{4:s}'.format(
+        number_of_matches, object_filter_time, compiled_filter_time, speedup,
+        filter_expression))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,193 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark the throughput of the ZeroMQ queues.
+
+Items are pushed on a queue by the main process and popped by a consumer
+process, for every combination of queue type, batch size and serializer.
+"""
+
+from __future__ import print_function
+import argparse
+import logging
+import multiprocessing
+import sys
+import time
+
+# Change PYTHONPATH to include plaso.
+sys.path.insert(0, u'.')
+
+from plaso.containers import events
+from plaso.engine import plaso_queue
+from plaso.engine import zeromq_queue
+
+
+# The queue types, as a tuple of the producer and consumer queue class.
+QUEUE_TYPES = {
+    u'push_pull': (
+        zeromq_queue.ZeroMQPushBindQueue, zeromq_queue.ZeroMQPullConnectQueue),
+    u'request_reply': (
+        zeromq_queue.ZeroMQBufferedReplyBindQueue,
+        zeromq_queue.ZeroMQRequestConnectQueue)}
+
+DEFAULT_BATCH_SIZES = [1, 10, 100]
+
+
+def CreateTestEvent(index):
+  """Creates an event similar to those produced by the parsers.
+
+  Args:
+    index (int): index of the event.
+
+  Returns:
+    EventObject: event.
+  """
+  event = events.EventObject()
+  event.data_type = u'fs:stat'
+  event.display_name = u'OS:/tmp/test/file{0:d}.txt'.format(index)
+  event.filename = u'/tmp/test/file{0:d}.txt'.format(index)
+  event.inode = index
+  event.parser = u'filestat'
+  event.timestamp = 1480000000000000 + index
+  event.timestamp_desc = u'Content Modification Time'
+  return event
+
+
+def ConsumeItems(queue_object, result_queue):
+  """Pops items of the queue until a queue abort item is popped.
+
+  Args:
+    queue_object (ZeroMQQueue): queue to pop the items from.
+    result_queue (multiprocessing.Queue): queue to report the number of
+        popped items to.
+  """
+  number_of_items = 0
+  while True:
+    item = queue_object.PopItem()
+    if isinstance(item, plaso_queue.QueueAbort):
+      break
+
+    number_of_items += 1
+
+  queue_object.Close()
+  result_queue.put(number_of_items)
+
+
+def BenchmarkQueue(queue_type, batch_size, serializer, items):
+  """Benchmarks a queue type.
+
+  Args:
+    queue_type (str): queue type.
+    batch_size (int): maximum number of items sent in a single message.
+    serializer (str): serializer of the items.
+    items (list[object]): items to transfer.
+
+  Returns:
+    float: number of items transferred per second.
+
+  Raises:
+    RuntimeError: if the number of transferred items does not match.
+  """
+  producer_class, consumer_class = QUEUE_TYPES[queue_type]
+
+  producer_queue = producer_class(
+      batch_size=batch_size, delay_open=False, linger_seconds=1,
+      name=u'{0:s}_producer'.format(queue_type), serializer=serializer,
+      timeout_seconds=60)
+  consumer_queue = consumer_class(
+      delay_open=True, linger_seconds=1,
+      name=u'{0:s}_consumer'.format(queue_type), port=producer_queue.port,
+      timeout_seconds=60)
+
+  result_queue = multiprocessing.Queue()
+  process = multiprocessing.Process(
+      target=ConsumeItems, args=(consumer_queue, result_queue))
+  process.start()
+
+  start_time = time.time()
+  for item in items:
+    producer_queue.PushItem(item)
+
+  producer_queue.PushItem(plaso_queue.QueueAbort())
+
+  number_of_items = result_queue.get()
+  elapsed_time = time.time() - start_time
+
+  process.join()
+  producer_queue.Close(abort=True)
+
+  if number_of_items != len(items):
+    raise RuntimeError(u'Transferred {0:d} of {1:d} items.'.format(
+        number_of_items, len(items)))
+
+  return len(items) / max(elapsed_time, 0.000001)
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks the throughput of the ZeroMQ queues.'))
+
+  argument_parser.add_argument(
+      u'--batch_size', u'--batch-size', dest=u'batch_sizes', type=int,
+      action=u'append', metavar=u'NUMBER', default=None, help=(
+          u'maximum number of items sent in a single message, can be '
+          u'specified multiple times. Defaults to: {0:s}.').format(
+              u', '.join([
+                  u'{0:d}'.format(batch_size)
+                  for batch_size in DEFAULT_BATCH_SIZES])))
+
+  argument_parser.add_argument(
+      u'--number_of_items', u'--number-of-items', dest=u'number_of_items',
+      type=int, default=10000, metavar=u'NUMBER', help=(
+          u'number of items to transfer per benchmark.'))
+
+  argument_parser.add_argument(
+      u'--queue_type', u'--queue-type', dest=u'queue_types',
+      action=u'append', choices=sorted(QUEUE_TYPES.keys()), default=None,
+      help=(
+          u'queue type to benchmark, can be specified multiple times. '
+          u'Defaults to all queue types.'))
+
+  argument_parser.add_argument(
+      u'--serializer', dest=u'serializers', action=u'append', choices=[
+          zeromq_queue.ZeroMQQueue.SERIALIZER_JSON,
+          zeromq_queue.ZeroMQQueue.SERIALIZER_PICKLE], default=None, help=(
+              u'serializer to benchmark, can be specified multiple times. '
+              u'Defaults to all serializers.'))
+
+  options = argument_parser.parse_args()
+
+  logging.basicConfig(
+      level=logging.ERROR, format=u'[%(levelname)s] %(message)s')
+
+  items = [CreateTestEvent(index) for index in range(options.number_of_items)]
+
+  serializers = options.serializers or [
+      zeromq_queue.ZeroMQQueue.SERIALIZER_PICKLE,
+      zeromq_queue.ZeroMQQueue.SERIALIZER_JSON]
+
+  print(u'Number of items: {0:d}'.format(len(items)))
+  print(u'')
+  print(u'Queue type\tBatch size\tSerializer\tItems per second')
+
+  for queue_type in options.queue_types or sorted(QUEUE_TYPES.keys()):
+    for batch_size in options.batch_sizes or DEFAULT_BATCH_SIZES:
+      for serializer in serializers:
+        items_per_second = BenchmarkQueue(
+            queue_type, batch_size, serializer, items)
+
+        print(u'{0:s}\t{1:d}\t\t{2:s}\t\t{3:.0f}'.format(
+            queue_type, batch_size, serializer, items_per_second))
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
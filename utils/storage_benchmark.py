@@ -0,0 +1,375 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+"""Script to benchmark reading and outputting the events of a storage file.
+
+The benchmark measures the steps psort and pinfo spend their time on:
+reading all events, reading the events of a time slice, building the event
+tag index, deduplicating events with the event buffer and writing events
+with every output module that does not require a server. If no storage file
+is specified, a storage file with synthetic events is created.
+"""
+
+from __future__ import print_function
+import argparse
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+# Change PYTHONPATH to include plaso.
+sys.path.insert(0, u'.')
+
+from plaso import formatters  # pylint: disable=unused-import
+from plaso import output  # pylint: disable=unused-import
+
+from plaso.cli import tools as cli_tools
+from plaso.engine import knowledge_base
+from plaso.formatters import mediator as formatters_mediator
+from plaso.output import event_buffer as output_event_buffer
+from plaso.output import interface as output_interface
+from plaso.output import manager as output_manager
+from plaso.output import mediator as output_mediator
+from plaso.storage import time_range as storage_time_range
+from plaso.storage import zip_file as storage_zip_file
+
+from utils import create_storage_file
+
+
+def _CreateOutputModule(name):
+  """Creates an output module.
+
+  Args:
+    name (str): name of the output module.
+
+  Returns:
+    OutputModule: output module.
+  """
+  output_mediator_object = output_mediator.OutputMediator(
+      knowledge_base.KnowledgeBase(),
+      formatters_mediator.FormatterMediator())
+  return output_manager.OutputManager.NewOutputModule(
+      name, output_mediator_object)
+
+
+def ReadEvents(storage_file_path, time_range=None):
+  """Reads the events from a storage file.
+
+  Args:
+    storage_file_path (str): path of the storage file.
+    time_range (Optional[TimeRange]): time range of the events to read.
+
+  Returns:
+    list[EventObject]: events sorted by timestamp.
+  """
+  with storage_zip_file.ZIPStorageFileReader(storage_file_path) as reader:
+    return list(reader.GetEvents(time_range=time_range))
+
+
+def BenchmarkGetEvents(storage_file_path, time_range=None):
+  """Benchmarks reading the events from a storage file.
+
+  Args:
+    storage_file_path (str): path of the storage file.
+    time_range (Optional[TimeRange]): time range of the events to read.
+
+  Returns:
+    tuple[int, float, int, int]: number of events, number of seconds spent,
+        timestamp of the first event and timestamp of the last event.
+  """
+  first_timestamp = None
+  last_timestamp = None
+  number_of_events = 0
+
+  start_time = time.time()
+  with storage_zip_file.ZIPStorageFileReader(storage_file_path) as reader:
+    for event in reader.GetEvents(time_range=time_range):
+      if first_timestamp is None:
+        first_timestamp = event.timestamp
+      last_timestamp = event.timestamp
+      number_of_events += 1
+
+  return (
+      number_of_events, time.time() - start_time, first_timestamp,
+      last_timestamp)
+
+
+def BenchmarkBuildTagIndex(storage_file_path, number_of_iterations):
+  """Benchmarks building the event tag index of a storage file.
+
+  Args:
+    storage_file_path (str): path of the storage file.
+    number_of_iterations (int): number of times the index is built.
+
+  Returns:
+    tuple[int, float]: number of event tags and number of seconds spent
+        per iteration.
+  """
+  storage_file = storage_zip_file.ZIPStorageFile()
+  storage_file.Open(path=storage_file_path)
+
+  try:
+    start_time = time.time()
+    for _ in range(number_of_iterations):
+      # pylint: disable=protected-access
+      storage_file._BuildTagIndex()
+
+    elapsed_time = (time.time() - start_time) / number_of_iterations
+
+    # pylint: disable=protected-access
+    number_of_event_tags = len(storage_file._event_tag_index)
+
+  finally:
+    storage_file.Close()
+
+  return number_of_event_tags, elapsed_time
+
+
+def BenchmarkEventBuffer(events):
+  """Benchmarks deduplicating events with the event buffer.
+
+  Args:
+    events (list[EventObject]): events sorted by timestamp.
+
+  Returns:
+    tuple[int, float]: number of duplicate events and number of seconds
+        spent.
+  """
+  output_module = _CreateOutputModule(u'null')
+
+  start_time = time.time()
+  event_buffer = output_event_buffer.EventBuffer(output_module)
+  for event in events:
+    event_buffer.Append(event)
+  event_buffer.End()
+
+  return event_buffer.duplicate_counter, time.time() - start_time
+
+
+def BenchmarkOutputModule(name, events, temporary_directory):
+  """Benchmarks writing events with an output module.
+
+  Args:
+    name (str): name of the output module.
+    events (list[EventObject]): events.
+    temporary_directory (str): path of the directory for output files.
+
+  Returns:
+    float: number of seconds spent or None if the output module requires
+        a server or is not supported.
+  """
+  try:
+    output_module = _CreateOutputModule(name)
+  except (IOError, RuntimeError, ValueError) as exception:
+    logging.warning(
+        u'Unable to create output module: {0:s} with error: {1!s}'.format(
+            name, exception))
+    return
+
+  output_file_object = None
+  if isinstance(output_module, output_interface.LinearOutputModule):
+    # Write to the null device so that disk throughput is not measured.
+    output_file_object = open(os.devnull, 'wb')
+    output_module.SetOutputWriter(
+        cli_tools.FileObjectOutputWriter(output_file_object))
+
+  elif hasattr(output_module, u'SetFilename'):
+    output_module.SetFilename(os.path.join(
+        temporary_directory, u'output.{0:s}'.format(name)))
+
+  elif name != u'null':
+    return
+
+  try:
+    start_time = time.time()
+    output_module.Open()
+    output_module.WriteHeader()
+    for event in events:
+      output_module.WriteEvent(event)
+    output_module.WriteFooter()
+    output_module.Close()
+
+    elapsed_time = time.time() - start_time
+
+  finally:
+    if output_file_object:
+      output_file_object.close()
+
+  return elapsed_time
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      u'Benchmarks reading and outputting the events of a storage file.'))
+
+  argument_parser.add_argument(
+      u'--duplicates', dest=u'percentage_of_duplicates', type=int, default=10,
+      metavar=u'PERCENTAGE', help=(
+          u'percentage of duplicate events of the synthetic storage file.'))
+
+  argument_parser.add_argument(
+      u'--events', dest=u'number_of_events', type=int, default=100000,
+      metavar=u'NUMBER', help=(
+          u'number of events of the synthetic storage file.'))
+
+  argument_parser.add_argument(
+      u'--iterations', dest=u'number_of_iterations', type=int, default=10,
+      metavar=u'NUMBER', help=(
+          u'number of times the event tag index is built.'))
+
+  argument_parser.add_argument(
+      u'--output', dest=u'output', action=u'store', metavar=u'PATH',
+      default=None, help=u'path of the file to write the results to.')
+
+  argument_parser.add_argument(
+      u'--output_modules', u'--output-modules', dest=u'output_modules',
+      action=u'store', metavar=u'NAMES', default=None, help=(
+          u'comma separated names of the output modules to benchmark. '
+          u'Defaults to all output modules that do not require a server.'))
+
+  argument_parser.add_argument(
+      u'--streams', dest=u'number_of_streams', type=int, default=4,
+      metavar=u'NUMBER', help=(
+          u'number of event streams of the synthetic storage file.'))
+
+  argument_parser.add_argument(
+      u'--tags', dest=u'number_of_tags', type=int, default=1000,
+      metavar=u'NUMBER', help=(
+          u'number of event tags of the synthetic storage file.'))
+
+  argument_parser.add_argument(
+      u'--time_slice', u'--time-slice', dest=u'time_slice', type=int,
+      default=10, metavar=u'PERCENTAGE', help=(
+          u'size of the time slice, as a percentage of the time span of '
+          u'the events, to read from the middle of the time span.'))
+
+  argument_parser.add_argument(
+      u'storage_file', nargs=u'?', action=u'store', metavar=u'PATH',
+      default=None, help=(
+          u'path of the storage file. If not specified, a storage file with '
+          u'synthetic events is created.'))
+
+  options = argument_parser.parse_args()
+
+  if options.number_of_iterations < 1 or options.number_of_streams < 1:
+    print(u'Number of iterations and event streams must be 1 or more.')
+    return False
+
+  logging.basicConfig(
+      level=logging.ERROR, format=u'[%(levelname)s] %(message)s')
+
+  temporary_directory = tempfile.mkdtemp()
+  try:
+    storage_file_path = options.storage_file
+    if not storage_file_path:
+      storage_file_path = os.path.join(temporary_directory, u'storage.plaso')
+      create_storage_file.CreateStorageFile(
+          storage_file_path, sorted(create_storage_file.DATA_TYPES.keys()),
+          number_of_events=options.number_of_events,
+          number_of_streams=options.number_of_streams,
+          number_of_tags=options.number_of_tags,
+          percentage_of_duplicates=options.percentage_of_duplicates)
+
+    results = {}
+
+    number_of_events, elapsed_time, first_timestamp, last_timestamp = (
+        BenchmarkGetEvents(storage_file_path))
+    results[u'get_events'] = {
+        u'elapsed_time': elapsed_time,
+        u'number_of_events': number_of_events}
+
+    print(u'Step\t\t\tItems\tTime\t\tItems/s')
+    print(u'GetEvents\t\t{0:d}\t{1:.3f}s\t\t{2:.1f}'.format(
+        number_of_events, elapsed_time,
+        number_of_events / max(elapsed_time, 0.000001)))
+
+    if number_of_events:
+      time_span = last_timestamp - first_timestamp
+      slice_size = time_span * options.time_slice // 100
+      start_timestamp = first_timestamp + (time_span - slice_size) // 2
+      time_range = storage_time_range.TimeRange(
+          start_timestamp, start_timestamp + slice_size)
+
+      number_of_events, elapsed_time, _, _ = BenchmarkGetEvents(
+          storage_file_path, time_range=time_range)
+      results[u'get_events_time_slice'] = {
+          u'elapsed_time': elapsed_time,
+          u'number_of_events': number_of_events}
+
+      print(u'GetEvents time slice\t{0:d}\t{1:.3f}s\t\t{2:.1f}'.format(
+          number_of_events, elapsed_time,
+          number_of_events / max(elapsed_time, 0.000001)))
+
+    number_of_event_tags, elapsed_time = BenchmarkBuildTagIndex(
+        storage_file_path, options.number_of_iterations)
+    results[u'build_tag_index'] = {
+        u'elapsed_time': elapsed_time,
+        u'number_of_event_tags': number_of_event_tags}
+
+    print(u'Build tag index\t\t{0:d}\t{1:.3f}s\t\t{2:.1f}'.format(
+        number_of_event_tags, elapsed_time,
+        number_of_event_tags / max(elapsed_time, 0.000001)))
+
+    events = ReadEvents(storage_file_path)
+    number_of_duplicates, elapsed_time = BenchmarkEventBuffer(events)
+    results[u'event_buffer'] = {
+        u'elapsed_time': elapsed_time,
+        u'number_of_duplicates': number_of_duplicates,
+        u'number_of_events': len(events)}
+
+    print((
+        u'Event buffer\t\t{0:d}\t{1:.3f}s\t\t{2:.1f}\t'
+        u'({3:d} duplicates)').format(
+            len(events), elapsed_time,
+            len(events) / max(elapsed_time, 0.000001), number_of_duplicates))
+
+    if options.output_modules:
+      output_module_names = [
+          name.strip() for name in options.output_modules.split(u',')]
+    else:
+      output_module_names = sorted([
+          name for name, _ in output_manager.OutputManager.GetOutputClasses()])
+
+    results[u'output_modules'] = {}
+    for name in output_module_names:
+      if not output_manager.OutputManager.HasOutputClass(name):
+        print(u'Unsupported output module: {0:s}.'.format(name))
+        continue
+
+      # The events are read for every output module, since the formatted
+      # strings of an event are cached.
+      events = ReadEvents(storage_file_path)
+      elapsed_time = BenchmarkOutputModule(name, events, temporary_directory)
+      if elapsed_time is None:
+        continue
+
+      results[u'output_modules'][name] = {
+          u'elapsed_time': elapsed_time,
+          u'number_of_events': len(events)}
+
+      print(u'Output: {0:s}\t{1:d}\t{2:.3f}s\t\t{3:.1f}'.format(
+          name.ljust(15), len(events), elapsed_time,
+          len(events) / max(elapsed_time, 0.000001)))
+
+  finally:
+    shutil.rmtree(temporary_directory, True)
+
+  if options.output:
+    with open(options.output, 'wb') as file_object:
+      json.dump(results, file_object, indent=2, sort_keys=True)
+
+  return True
+
+
+if __name__ == u'__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)